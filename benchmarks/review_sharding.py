@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Sharded vs Unsharded Code Review Latency
+
+Reviews synthetic projects of 5, 20 and 50 files with CodeReviewOrchestrator,
+once with every specialist seeing all files in one prompt and once sharded
+(max_shard_tokens), and reports the wall time of each review.
+
+Cassette replays (run_benchmarks.py) cannot show the effect of sharding:
+recorded prompts change when files are sharded, and their latency models do
+not depend on payload size. This benchmark uses a synthetic client whose
+latency follows the shape of a real provider instead:
+
+    latency = TTFT + input_tokens / prefill rate + output_tokens / decode rate
+
+Each specialist reports one finding per file it sees, so output, and with it
+decode time, grows with the number of files in the prompt. Sleeps are
+multiplied by --time-scale to keep runs short; reported times are divided
+by it again, i.e. shown at provider scale.
+
+Usage:
+    uv run python benchmarks/review_sharding.py
+    uv run python benchmarks/review_sharding.py --files 5 20 50 100 --shard-tokens 15000
+    uv run python benchmarks/review_sharding.py --time-scale 0.05 --json sharding.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from run_benchmarks import isolated_workdir  # noqa: E402
+
+from asp.agents.code_review_orchestrator import (  # noqa: E402
+    DEFAULT_MAX_SHARD_TOKENS,
+    CodeReviewOrchestrator,
+)
+from asp.models.code import GeneratedCode, GeneratedFile  # noqa: E402
+from asp.utils.review_fanout import shard_generated_code  # noqa: E402
+
+FILES_PER_COMPONENT = 5
+LINES_PER_FILE = 120
+
+MODULE_LINE = "    total = sum(item.amount for item in items if item.active)  # {n}\n"
+
+
+class LatencyModelClient:
+    """Synthetic LLM client with latency proportional to tokens in and out."""
+
+    provider_name = "synthetic"
+    DEFAULT_MODEL = "synthetic"
+
+    def __init__(
+        self,
+        ttft_s: float,
+        prefill_tps: float,
+        decode_tps: float,
+        time_scale: float,
+    ):
+        self.ttft_s = ttft_s
+        self.prefill_tps = prefill_tps
+        self.decode_tps = decode_tps
+        self.time_scale = time_scale
+        self.calls = 0
+        self.max_input_tokens = 0
+        self._lock = threading.Lock()
+
+    def call_with_retry(
+        self,
+        prompt: str,
+        model: str | None = None,
+        cached_prefix: str | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Answer a specialist prompt with one Low finding per file."""
+        text = (cached_prefix or "") + prompt
+        paths = dict.fromkeys(re.findall(r'"file_path": "([^"]+)"', text))
+        content = {
+            "issues_found": [
+                {
+                    "issue_id": f"SPEC-{i:03d}",
+                    "category": "Code Quality",
+                    "severity": "Low",
+                    "description": "Aggregation loop could use a generator helper",
+                    "evidence": f"{path}:3 repeats the filtered sum inline",
+                    "impact": "Minor duplication across modules",
+                    "affected_phase": "Code",
+                    "file_path": path,
+                    "line_number": 3,
+                }
+                for i, path in enumerate(paths, start=1)
+            ],
+            "improvement_suggestions": [],
+        }
+        raw_content = json.dumps(content, indent=2)
+        input_tokens = len(text) // 4
+        output_tokens = len(raw_content) // 4
+        with self._lock:
+            self.calls += 1
+            self.max_input_tokens = max(self.max_input_tokens, input_tokens)
+
+        latency = (
+            self.ttft_s
+            + input_tokens / self.prefill_tps
+            + output_tokens / self.decode_tps
+        )
+        time.sleep(latency * self.time_scale)
+        return {
+            "content": content,
+            "raw_content": raw_content,
+            "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens},
+            "cost": 0.0,
+            "model": model or self.DEFAULT_MODEL,
+            "stop_reason": "end_turn",
+            "continuations": 0,
+        }
+
+
+def make_project(num_files: int) -> GeneratedCode:
+    """Synthetic project: num_files modules, five per component."""
+    files = []
+    for i in range(num_files):
+        component = f"COMP-{i // FILES_PER_COMPONENT + 1:03d}"
+        body = "".join(MODULE_LINE.format(n=n) for n in range(LINES_PER_FILE - 2))
+        files.append(
+            GeneratedFile(
+                file_path=f"src/{component.lower()}/module_{i:03d}.py",
+                content=f"def summarize_{i}(items):\n{body}    return total\n",
+                file_type="source",
+                component_id=component,
+                description=f"Module {i} of component {component}, sums active items",
+            )
+        )
+    structure: dict[str, list[str]] = {}
+    for file in files:
+        directory, name = file.file_path.rsplit("/", 1)
+        structure.setdefault(directory, []).append(name)
+    return GeneratedCode(
+        task_id="BENCH-SHARD-001",
+        files=files,
+        file_structure=structure,
+        implementation_notes=(
+            "Synthetic project for the review sharding benchmark; each component "
+            "groups five modules that sum active items."
+        ),
+        total_files=num_files,
+    )
+
+
+def time_review(code: GeneratedCode, shard_tokens: int, args) -> dict[str, Any]:
+    """Run one code review and return its provider-scale wall time."""
+    client = LatencyModelClient(
+        args.ttft, args.prefill_tps, args.decode_tps, args.time_scale
+    )
+    orchestrator = CodeReviewOrchestrator(
+        llm_client=client,
+        early_exit="off",
+        review_cache=False,
+        max_shard_tokens=shard_tokens,
+    )
+    start = time.perf_counter()
+    report = orchestrator.execute(code)
+    elapsed = (time.perf_counter() - start) / args.time_scale
+    return {
+        "wall_s": elapsed,
+        "calls": client.calls,
+        "max_input_tokens": client.max_input_tokens,
+        "issues": report.total_issues,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--files", type=int, nargs="+", default=[5, 20, 50])
+    parser.add_argument("--shard-tokens", type=int, default=DEFAULT_MAX_SHARD_TOKENS)
+    parser.add_argument("--ttft", type=float, default=0.8, help="Seconds")
+    parser.add_argument("--prefill-tps", type=float, default=5000.0)
+    parser.add_argument("--decode-tps", type=float, default=60.0)
+    parser.add_argument("--time-scale", type=float, default=0.01)
+    parser.add_argument("--json", type=Path, help="Also write results as JSON")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR)
+    os.environ["ASP_TELEMETRY_PROVIDER"] = "none"
+    for var in ("ASP_LLM_CASSETTE", "ASP_LLM_CACHE"):
+        os.environ.pop(var, None)
+
+    print(
+        f"Latency model: TTFT {args.ttft}s, prefill {args.prefill_tps:.0f} tok/s, "
+        f"decode {args.decode_tps:.0f} tok/s; shard size {args.shard_tokens} tokens"
+    )
+    print(
+        f"{'files':>5} {'shards':>6} {'calls':>11} {'max prompt tok':>16} "
+        f"{'unsharded s':>12} {'sharded s':>10} {'speedup':>8}"
+    )
+    results = []
+    for num_files in args.files:
+        code = make_project(num_files)
+        shards = len(shard_generated_code(code, args.shard_tokens))
+        with isolated_workdir(args.verbose):
+            unsharded = time_review(code, 0, args)
+            sharded = time_review(code, args.shard_tokens, args)
+        if sharded["issues"] != unsharded["issues"]:
+            raise RuntimeError(
+                f"Sharded review found {sharded['issues']} issues, "
+                f"unsharded {unsharded['issues']}"
+            )
+        speedup = unsharded["wall_s"] / sharded["wall_s"]
+        print(
+            f"{num_files:>5} {shards:>6} "
+            f"{unsharded['calls']:>5}/{sharded['calls']:<5} "
+            f"{unsharded['max_input_tokens']:>7}/{sharded['max_input_tokens']:<8} "
+            f"{unsharded['wall_s']:>12.1f} {sharded['wall_s']:>10.1f} "
+            f"{speedup:>7.2f}x"
+        )
+        results.append(
+            {
+                "files": num_files,
+                "shards": shards,
+                "unsharded": unsharded,
+                "sharded": sharded,
+                "speedup": speedup,
+            }
+        )
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Offline Benchmarks: Pipeline, Repair Loop and Review Fan-Out
+
+Runs the real orchestrators against LLM cassettes (asp.utils.llm_cassette),
+so end-to-end performance can be measured without an API key and compared
+across commits. For every scenario it reports, per phase, the number of
+calls, wall time, CPU time (all threads of this process) and peak traced
+Python memory:
+
+- pipeline: TSPOrchestrator.execute (planning, design, design review, code,
+  code review, testing, postmortem)
+- repair: RepairOrchestrator.repair on a calculator with one bug (test runs
+  spawn pytest, whose CPU time is not included)
+- review: design and code review fan-out across all specialists
+
+Cassettes live in benchmarks/cassettes/<scenario>.json. A missing cassette is
+recorded first from the scripted synthetic responses (benchmarks/
+scripted_llm.py); --record live records one from the real provider instead
+(requires ANTHROPIC_API_KEY). Replays can simulate provider latency so that
+concurrency in the review fan-out shows up in wall time.
+
+Artifacts and telemetry are written to a temporary directory, never to the
+repository.
+
+Usage:
+    uv run python benchmarks/run_benchmarks.py
+    uv run python benchmarks/run_benchmarks.py --scenario review --latency recorded
+    uv run python benchmarks/run_benchmarks.py --latency lognormal:800,0.5 --runs 5
+    uv run python benchmarks/run_benchmarks.py --record live --scenario pipeline
+    uv run python benchmarks/run_benchmarks.py --json results.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import functools
+import io
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import scripted_llm  # noqa: E402
+
+from asp.agents.code_review_orchestrator import CodeReviewOrchestrator  # noqa: E402
+from asp.agents.design_review_orchestrator import (  # noqa: E402
+    DesignReviewOrchestrator,
+)
+from asp.models.code import GeneratedCode  # noqa: E402
+from asp.models.design import DesignSpecification  # noqa: E402
+from asp.models.planning import TaskRequirements  # noqa: E402
+from asp.orchestrators.hitl_config import AUTONOMOUS_CONFIG  # noqa: E402
+from asp.orchestrators.repair_orchestrator import (  # noqa: E402
+    RepairOrchestrator,
+    RepairRequest,
+)
+from asp.orchestrators.tsp_orchestrator import TSPOrchestrator  # noqa: E402
+from asp.telemetry import telemetry  # noqa: E402
+from asp.telemetry.writer import flush_telemetry  # noqa: E402
+from asp.utils.llm_cassette import (  # noqa: E402
+    Cassette,
+    CassetteLLMClient,
+    LatencyModel,
+)
+from services.sandbox_executor import SubprocessSandboxExecutor  # noqa: E402
+from services.surgical_editor import SurgicalEditor  # noqa: E402
+from services.test_executor import TestExecutor  # noqa: E402
+from services.workspace_manager import Workspace  # noqa: E402
+
+# ============================================================================
+# Configuration
+# ============================================================================
+
+CASSETTE_DIR = Path(__file__).resolve().parent / "cassettes"
+SCHEMA_PATH = ROOT / "database" / "sqlite" / "create_tables.sql"
+SCENARIOS = ("pipeline", "repair", "review")
+
+# Text that differs between runs of the same scenario
+SCRUB = [
+    (r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d(\.\d+)?", "<timestamp>"),
+    (r"\d{8}-\d{6}", "<timestamp>"),
+    (r"\d+(\.\d+)?s\b", "<duration>"),
+    (r'"duration_seconds": [\d.]+', '"duration_seconds": 0'),
+    (r"/[^\s'\"]*asp-bench-[^/\s'\"]+", "<workdir>"),
+]
+
+
+# ============================================================================
+# Phase Profiler
+# ============================================================================
+
+
+class PhaseProfiler:
+    """Accumulates wall time, CPU time and peak memory per named phase."""
+
+    def __init__(self, trace_memory: bool = True):
+        self.trace_memory = trace_memory
+        self.phases: dict[str, dict[str, float]] = {}
+        self.peak_bytes = 0
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Measure one execution of a phase (phases must not nest)."""
+        if self.trace_memory:
+            self._update_peak()
+            tracemalloc.reset_peak()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            stats = self.phases.setdefault(
+                name, {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0, "peak_mb": 0.0}
+            )
+            stats["calls"] += 1
+            stats["wall_s"] += time.perf_counter() - wall_start
+            stats["cpu_s"] += time.process_time() - cpu_start
+            if self.trace_memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                self.peak_bytes = max(self.peak_bytes, peak)
+                stats["peak_mb"] = max(stats["peak_mb"], peak / 2**20)
+
+    def wrap(self, obj: Any, method: str, name: str) -> None:
+        """Time every call of obj.method as phase name."""
+        original = getattr(obj, method)
+
+        if asyncio.iscoroutinefunction(original):
+
+            @functools.wraps(original)
+            async def timed_async(*args, **kwargs):
+                with self.phase(name):
+                    return await original(*args, **kwargs)
+
+            setattr(obj, method, timed_async)
+        else:
+
+            @functools.wraps(original)
+            def timed(*args, **kwargs):
+                with self.phase(name):
+                    return original(*args, **kwargs)
+
+            setattr(obj, method, timed)
+
+    def _update_peak(self) -> None:
+        self.peak_bytes = max(self.peak_bytes, tracemalloc.get_traced_memory()[1])
+
+    def total_peak_mb(self) -> float:
+        """Peak traced memory over the whole run."""
+        if self.trace_memory:
+            self._update_peak()
+        return self.peak_bytes / 2**20
+
+
+# ============================================================================
+# Scenarios
+# ============================================================================
+
+
+def run_pipeline(client: Any, profiler: PhaseProfiler, workdir: Path) -> None:
+    """Full TSP pipeline; each agent call is a phase."""
+    orchestrator = TSPOrchestrator(llm_client=client)
+    for attr, name in (
+        ("planning_agent", "planning"),
+        ("design_agent", "design"),
+        ("design_review_orchestrator", "design_review"),
+        ("code_agent", "code"),
+        ("code_review_orchestrator", "code_review"),
+        ("test_agent", "testing"),
+        ("postmortem_agent", "postmortem"),
+    ):
+        profiler.wrap(getattr(orchestrator, attr), "execute", name)
+
+    requirements = TaskRequirements(
+        project_id=scripted_llm.PROJECT_ID,
+        task_id=scripted_llm.TASK_ID,
+        description="Calculator module with add and multiply",
+        requirements="Implement add(a, b) and multiply(a, b) with unit tests.",
+    )
+    orchestrator.execute(requirements)
+
+
+def run_review(client: Any, profiler: PhaseProfiler, workdir: Path) -> None:
+    """Design and code review fan-out across all specialists."""
+    design = DesignSpecification(**scripted_llm.DESIGN)
+    code = GeneratedCode(**scripted_llm.GENERATED_CODE)
+
+    with profiler.phase("design_review_fanout"):
+        DesignReviewOrchestrator(llm_client=client).execute(design)
+    with profiler.phase("code_review_fanout"):
+        CodeReviewOrchestrator(llm_client=client).execute(code)
+
+
+def run_repair(client: Any, profiler: PhaseProfiler, workdir: Path) -> None:
+    """Repair loop on a calculator with a failing test."""
+    repo = workdir / "repo"
+    (repo / "tests").mkdir(parents=True)
+    (repo / "conftest.py").write_text("")
+    (repo / "calculator.py").write_text(scripted_llm.BUGGY_SOURCE)
+    (repo / "tests" / "test_calculator.py").write_text(scripted_llm.TEST_SOURCE)
+    workspace = Workspace(
+        task_id=scripted_llm.REPAIR_TASK_ID,
+        path=workdir,
+        target_repo_path=repo,
+        asp_path=workdir / ".asp",
+        created_at=datetime.now(),
+    )
+
+    sandbox = SubprocessSandboxExecutor()
+    orchestrator = RepairOrchestrator(
+        sandbox=sandbox,
+        test_executor=TestExecutor(sandbox),
+        surgical_editor=SurgicalEditor(repo),
+        llm_client=client,
+    )
+    for method, name in (
+        ("_run_tests", "run_tests"),
+        ("_diagnose", "diagnose"),
+        ("_generate_repair", "repair"),
+        ("_apply_repair", "apply"),
+    ):
+        profiler.wrap(orchestrator, method, name)
+
+    request = RepairRequest(
+        task_id=scripted_llm.REPAIR_TASK_ID,
+        workspace=workspace,
+        max_iterations=2,
+        hitl_config=AUTONOMOUS_CONFIG,
+    )
+    result = asyncio.run(orchestrator.repair(request))
+    if not result.success:
+        raise RuntimeError(f"Repair scenario failed: {result.escalation_reason}")
+
+
+SCENARIO_RUNNERS: dict[str, Callable[[Any, PhaseProfiler, Path], None]] = {
+    "pipeline": run_pipeline,
+    "repair": run_repair,
+    "review": run_review,
+}
+
+
+# ============================================================================
+# Harness
+# ============================================================================
+
+
+@contextlib.contextmanager
+def isolated_workdir(verbose: bool = False) -> Iterator[Path]:
+    """Temporary working directory with its own telemetry database."""
+    workdir = Path(tempfile.mkdtemp(prefix="asp-bench-"))
+    db_path = workdir / "telemetry.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript(SCHEMA_PATH.read_text())
+
+    previous_cwd, previous_db = Path.cwd(), telemetry.DEFAULT_DB_PATH
+    os.chdir(workdir)
+    telemetry.DEFAULT_DB_PATH = db_path
+    # Telemetry warnings are printed; keep them out of the report
+    stdout = (
+        contextlib.nullcontext()
+        if verbose
+        else contextlib.redirect_stdout(io.StringIO())
+    )
+    try:
+        with stdout:
+            yield workdir
+    finally:
+        flush_telemetry()
+        telemetry.DEFAULT_DB_PATH = previous_db
+        os.chdir(previous_cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def record(scenario: str, path: Path, source: str, verbose: bool = False) -> int:
+    """Record a scenario's cassette; returns the number of interactions."""
+    if path.exists():
+        path.unlink()
+    if source == "live":
+        from asp.utils.llm_client import LLMClient
+
+        inner: Any = LLMClient()
+    else:
+        inner = scripted_llm.ScriptedLLMClient()
+
+    cassette = Cassette(path)
+    client = CassetteLLMClient(cassette, mode="record", inner=inner, scrub=SCRUB)
+    with isolated_workdir(verbose) as workdir:
+        SCENARIO_RUNNERS[scenario](client, PhaseProfiler(trace_memory=False), workdir)
+    return len(cassette)
+
+
+def replay(
+    scenario: str,
+    path: Path,
+    latency: str,
+    runs: int,
+    trace_memory: bool,
+    verbose: bool = False,
+) -> dict[str, Any]:
+    """Replay a scenario's cassette runs times and profile every phase."""
+    profiler = PhaseProfiler(trace_memory=trace_memory)
+    cassette = Cassette(path)
+    latency_model = LatencyModel(latency)
+    if trace_memory:
+        tracemalloc.start()
+
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        for _ in range(runs):
+            cassette.rewind()
+            client = CassetteLLMClient(
+                cassette, mode="replay", latency=latency_model, scrub=SCRUB
+            )
+            with isolated_workdir(verbose) as workdir:
+                SCENARIO_RUNNERS[scenario](client, profiler, workdir)
+        total = {
+            "wall_s": (time.perf_counter() - wall_start) / runs,
+            "cpu_s": (time.process_time() - cpu_start) / runs,
+            "peak_mb": profiler.total_peak_mb(),
+        }
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+
+    phases = {
+        name: {
+            "calls": stats["calls"] / runs,
+            "wall_s": stats["wall_s"] / runs,
+            "cpu_s": stats["cpu_s"] / runs,
+            "peak_mb": stats["peak_mb"],
+        }
+        for name, stats in profiler.phases.items()
+    }
+    return {
+        "interactions": len(cassette),
+        "latency": latency,
+        "runs": runs,
+        "phases": phases,
+        "total": total,
+    }
+
+
+def print_report(scenario: str, result: dict[str, Any]) -> None:
+    """Print one scenario's per-phase table."""
+    print(
+        f"\n{scenario}: {result['interactions']} recorded LLM calls, "
+        f"latency={result['latency']}, mean of {result['runs']} run(s)"
+    )
+    print(f"{'phase':<22} {'calls':>6} {'wall ms':>10} {'cpu ms':>10} {'peak MB':>8}")
+    rows = list(result["phases"].items()) + [("TOTAL", result["total"])]
+    for name, stats in rows:
+        calls = f"{stats['calls']:.0f}" if "calls" in stats else ""
+        print(
+            f"{name:<22} {calls:>6} {stats['wall_s'] * 1000:>10.1f} "
+            f"{stats['cpu_s'] * 1000:>10.1f} {stats['peak_mb']:>8.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scenario", choices=(*SCENARIOS, "all"), default="all")
+    parser.add_argument(
+        "--record",
+        choices=("synthetic", "live"),
+        help="Re-record cassettes before replaying (default: only if missing)",
+    )
+    parser.add_argument(
+        "--latency",
+        default="none",
+        help="Simulated latency: none, recorded, fixed:MS, lognormal:MEDIAN_MS,SIGMA",
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Replays per scenario")
+    parser.add_argument("--cassette-dir", type=Path, default=CASSETTE_DIR)
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Skip tracemalloc (faster, no peak memory column)",
+    )
+    parser.add_argument("--json", type=Path, help="Also write results as JSON")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR)
+    # Cassette clients are injected explicitly; ignore the environment
+    for var in ("ASP_LLM_CASSETTE", "ASP_LLM_CACHE"):
+        os.environ.pop(var, None)
+    # Measure the pipeline, not a remote telemetry backend
+    os.environ["ASP_TELEMETRY_PROVIDER"] = "none"
+
+    scenarios = SCENARIOS if args.scenario == "all" else (args.scenario,)
+    results = {}
+    for scenario in scenarios:
+        path = args.cassette_dir / f"{scenario}.json"
+        if args.record or not path.exists():
+            count = record(scenario, path, args.record or "synthetic", args.verbose)
+            print(f"Recorded {count} LLM calls to {path}")
+        results[scenario] = replay(
+            scenario,
+            path,
+            args.latency,
+            args.runs,
+            trace_memory=not args.no_memory,
+            verbose=args.verbose,
+        )
+        print_report(scenario, results[scenario])
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
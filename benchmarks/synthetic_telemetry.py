@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Synthetic Telemetry Database Generator
+
+Builds a telemetry database with the full schema (database/sqlite) and
+fills it with the same synthetic executions in both telemetry layouts:
+
+- agent_cost_vector: four metric rows (Latency, Tokens_In, Tokens_Out,
+  API_Cost) per execution
+- agent_execution: one wide row per execution; its insert trigger keeps
+  the agent_execution_hourly / agent_execution_daily rollups current
+
+Executions are spread evenly over the last --days days, ending now, so
+dashboard ranges like "last 7 days" hit realistic volumes. Generation is
+seeded and deterministic apart from the anchoring to the current time.
+
+Usage:
+    uv run python benchmarks/synthetic_telemetry.py --db /tmp/telemetry-4m.db
+    uv run python benchmarks/synthetic_telemetry.py --rows 8000000 --days 90 \\
+        --db /tmp/telemetry-8m.db
+"""
+
+import argparse
+import random
+import sqlite3
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+SQL_DIR = ROOT / "database" / "sqlite"
+METRICS_PER_EXECUTION = 4
+HISTORY_DAYS = 30
+
+AGENT_ROLES = [
+    "Planning",
+    "Design",
+    "DesignReview",
+    "Code",
+    "CodeReview",
+    "Test",
+    "Postmortem",
+]
+MODELS = ["claude-sonnet-4", "claude-haiku-4-5", "claude-opus-4"]
+PROJECTS = ["asp-core", "asp-web", "asp-cli", None]
+USERS = [f"dev{i}@example.com" for i in range(8)]
+
+
+def synthetic_executions(
+    count: int, days: int = HISTORY_DAYS, seed: int = 0
+) -> Iterator[dict[str, Any]]:
+    """Executions spread evenly over the last `days` days."""
+    rng = random.Random(seed)
+    now = datetime.now(UTC)
+    step = timedelta(days=days) / max(count, 1)
+    for i in range(count):
+        tokens_in = rng.randint(500, 20000)
+        tokens_out = rng.randint(100, 4000)
+        yield {
+            "timestamp": (now - step * (count - i)).isoformat(),
+            "task_id": f"TASK-{i // 12:06d}",
+            "project_id": rng.choice(PROJECTS),
+            "user_id": rng.choice(USERS),
+            "agent_role": rng.choice(AGENT_ROLES),
+            "llm_model": rng.choice(MODELS),
+            "status": "error" if rng.random() < 0.03 else "success",
+            "latency_ms": rng.uniform(200, 60000),
+            "tokens_in": tokens_in,
+            "tokens_out": tokens_out,
+            "api_cost_usd": (tokens_in * 3 + tokens_out * 15) / 1_000_000,
+        }
+
+
+def build_synthetic_db(
+    db_path: Path,
+    eav_rows: int,
+    days: int = HISTORY_DAYS,
+    batch: int = 50_000,
+) -> None:
+    """Create the schema and fill both telemetry layouts with the same data."""
+    conn = sqlite3.connect(db_path)
+    conn.executescript((SQL_DIR / "create_tables.sql").read_text())
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=OFF")
+
+    eav_batch: list[tuple] = []
+    wide_batch: list[tuple] = []
+
+    def flush() -> None:
+        conn.executemany(
+            """
+            INSERT INTO agent_cost_vector (
+                timestamp, execution_date, task_id, project_id, user_id,
+                agent_role, metric_type, metric_value, metric_unit,
+                llm_model, llm_provider
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'anthropic')
+            """,
+            eav_batch,
+        )
+        conn.executemany(
+            """
+            INSERT INTO agent_execution (
+                timestamp, execution_date, task_id, project_id, user_id,
+                agent_role, status, latency_ms, tokens_in, tokens_out,
+                api_cost_usd, llm_model, llm_provider
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'anthropic')
+            """,
+            wide_batch,
+        )
+        conn.commit()
+        eav_batch.clear()
+        wide_batch.clear()
+
+    for e in synthetic_executions(eav_rows // METRICS_PER_EXECUTION, days):
+        context = (
+            e["timestamp"],
+            e["timestamp"][:10],
+            e["task_id"],
+            e["project_id"],
+            e["user_id"],
+            e["agent_role"],
+        )
+        for metric_type, key, unit in (
+            ("Latency", "latency_ms", "ms"),
+            ("Tokens_In", "tokens_in", "tokens"),
+            ("Tokens_Out", "tokens_out", "tokens"),
+            ("API_Cost", "api_cost_usd", "USD"),
+        ):
+            eav_batch.append((*context, metric_type, e[key], unit, e["llm_model"]))
+        wide_batch.append(
+            (
+                *context,
+                e["status"],
+                e["latency_ms"],
+                e["tokens_in"],
+                e["tokens_out"],
+                e["api_cost_usd"],
+                e["llm_model"],
+            )
+        )
+        if len(wide_batch) >= batch:
+            flush()
+    flush()
+
+    conn.executescript((SQL_DIR / "create_indexes.sql").read_text())
+    conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=4_000_000,
+        help="agent_cost_vector rows (executions = rows / 4)",
+    )
+    parser.add_argument("--days", type=int, default=HISTORY_DAYS)
+    parser.add_argument("--db", type=Path, required=True)
+    args = parser.parse_args()
+
+    if args.db.exists():
+        parser.error(f"{args.db} already exists")
+
+    print(f"Building {args.db} with {args.rows:,} agent_cost_vector rows...")
+    start = time.perf_counter()
+    build_synthetic_db(args.db, args.rows, args.days)
+    print(f"  built in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Per-Call Overhead of @track_agent_cost
+
+Calls a no-op agent method decorated with @track_agent_cost many times and
+reports the time each call adds, for both SQLite writer modes
+(ASP_TELEMETRY_WRITER):
+
+- sync: every metric row opens a connection, inserts, commits and closes
+  on the calling thread (the behaviour before the background writer)
+- background: rows are queued to the batching writer thread
+
+Each call logs Latency, Tokens_In, Tokens_Out and API_Cost rows. The sync
+and async wrappers are measured separately; for the async wrapper the time
+is what the call holds the event loop. The background writer's remaining
+drain time after the last call is reported as well, and every mode is
+checked to have written all of its rows.
+
+The git user lookup is resolved once per process and cloud telemetry is
+disabled, so the numbers are the decorator's own bookkeeping plus the
+SQLite write path. With --budget-us the script exits non-zero when the
+background mode exceeds that per-call budget in either wrapper.
+
+Usage:
+    uv run python benchmarks/telemetry_overhead.py
+    uv run python benchmarks/telemetry_overhead.py --calls 2000
+    uv run python benchmarks/telemetry_overhead.py --budget-us 150
+"""
+
+import argparse
+import asyncio
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from asp.telemetry import telemetry  # noqa: E402
+from asp.telemetry.telemetry import track_agent_cost  # noqa: E402
+from asp.telemetry.writer import flush_telemetry  # noqa: E402
+
+SCHEMA_PATH = ROOT / "database" / "sqlite" / "create_tables.sql"
+ROWS_PER_CALL = 4
+
+
+class NoOpAgent:
+    """Agent whose executions do no work but report LLM usage."""
+
+    agent_version = "1.0.0"
+
+    def __init__(self):
+        self._last_llm_usage = {
+            "input_tokens": 1200,
+            "output_tokens": 300,
+            "cost": 0.0021,
+            "model": "claude-haiku-4-5",
+        }
+
+    @track_agent_cost(agent_role="Code", task_id_param="task_id")
+    def execute(self, task_id: str) -> None:
+        """Sync execution."""
+
+    @track_agent_cost(agent_role="Code", task_id_param="task_id")
+    async def execute_async(self, task_id: str) -> None:
+        """Async execution."""
+
+
+def count_rows(db_path: Path) -> int:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM agent_cost_vector").fetchone()[0]
+
+
+def measure(mode: str, calls: int, db_path: Path) -> dict[str, float]:
+    """Per-call overhead (µs) of both wrappers in one writer mode."""
+    os.environ["ASP_TELEMETRY_WRITER"] = mode
+    agent = NoOpAgent()
+    before = count_rows(db_path)
+
+    start = time.perf_counter()
+    for i in range(calls):
+        agent.execute(f"BENCH-{i:05d}")
+    sync_us = (time.perf_counter() - start) / calls * 1e6
+
+    async def run_async() -> float:
+        start = time.perf_counter()
+        for i in range(calls):
+            await agent.execute_async(f"BENCH-{i:05d}")
+        return (time.perf_counter() - start) / calls * 1e6
+
+    async_us = asyncio.run(run_async())
+
+    start = time.perf_counter()
+    flush_telemetry()
+    drain_ms = (time.perf_counter() - start) * 1000
+
+    written = count_rows(db_path) - before
+    expected = 2 * calls * ROWS_PER_CALL
+    if written != expected:
+        raise RuntimeError(f"{mode}: wrote {written} rows, expected {expected}")
+    return {"sync_us": sync_us, "async_us": async_us, "drain_ms": drain_ms}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument(
+        "--budget-us",
+        type=float,
+        default=None,
+        help="Fail if background-mode overhead per call exceeds this (µs)",
+    )
+    args = parser.parse_args()
+
+    os.environ["ASP_TELEMETRY_PROVIDER"] = "none"
+
+    with tempfile.TemporaryDirectory(prefix="asp-bench-") as workdir:
+        db_path = Path(workdir) / "telemetry.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.executescript(SCHEMA_PATH.read_text())
+        telemetry.DEFAULT_DB_PATH = db_path
+
+        results = {
+            mode: measure(mode, args.calls, db_path) for mode in ("sync", "background")
+        }
+
+    print(
+        f"@track_agent_cost overhead, {args.calls} calls per wrapper, "
+        f"{ROWS_PER_CALL} metric rows per call"
+    )
+    print(f"{'writer':>10} {'sync µs/call':>13} {'async µs/call':>14} {'drain ms':>9}")
+    for mode, result in results.items():
+        print(
+            f"{mode:>10} {result['sync_us']:>13.1f} {result['async_us']:>14.1f} "
+            f"{result['drain_ms']:>9.1f}"
+        )
+    sync, background = results["sync"], results["background"]
+    print(
+        f"\nSpeedup: {sync['sync_us'] / background['sync_us']:.1f}x (sync wrapper), "
+        f"{sync['async_us'] / background['async_us']:.1f}x (async wrapper)"
+    )
+
+    if args.budget_us is not None:
+        worst = max(background["sync_us"], background["async_us"])
+        if worst > args.budget_us:
+            print(f"FAIL: {worst:.1f} µs/call exceeds budget of {args.budget_us} µs")
+            sys.exit(1)
+        print(f"OK: {worst:.1f} µs/call within budget of {args.budget_us} µs")
+
+
+if __name__ == "__main__":
+    main()
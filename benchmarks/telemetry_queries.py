@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Dashboard Query Latency, Raw vs Rolled-Up Telemetry
+
+Builds a synthetic telemetry database with benchmarks/synthetic_telemetry.py
+(default: 1M agent_cost_vector rows, i.e. 250k executions of four metric
+rows each, plus the matching 250k agent_execution rows and their rollups)
+and times the web dashboard queries in asp.web.data and asp.web.api on
+each layout:
+
+- eav: the per-metric agent_cost_vector rows, pivoted with
+  CASE WHEN metric_type = ... (the path used by databases without
+  migration 016)
+- wide: one raw agent_execution row per execution (migration 016)
+- rollup: the hourly/daily agent_execution rollups (migration 017), with
+  raw rows only for the partial hour or day at the start of the range
+
+All paths run against the same file; the older paths are selected by
+hiding the newer tables from the dashboard code. Their results are
+compared so the speedup is not bought with different answers. Queries
+without a rollup path report the wide timing twice.
+
+Usage:
+    uv run python benchmarks/telemetry_queries.py
+    uv run python benchmarks/telemetry_queries.py --rows 200000 --repeat 5
+    uv run python benchmarks/telemetry_queries.py --db /tmp/telemetry-1m.db
+
+Without --db the database is built in the temp directory and reused by
+later runs with the same --rows.
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic_telemetry import build_synthetic_db  # noqa: E402
+
+import asp.web.api as web_api  # noqa: E402
+import asp.web.data as web_data  # noqa: E402
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() is fixed, so every layout sees the same range."""
+
+    frozen = datetime.now(UTC)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.frozen.astimezone(tz) if tz else cls.frozen
+
+
+@contextmanager
+def frozen_now() -> Iterator[None]:
+    """Pin "now" in the dashboard code; new rows arrive every few seconds."""
+    _FrozenDatetime.frozen = datetime.now(UTC)
+    with (
+        patch.object(web_data, "datetime", _FrozenDatetime),
+        patch.object(web_api, "datetime", _FrozenDatetime),
+    ):
+        yield
+
+
+@contextmanager
+def raw_only() -> Iterator[None]:
+    """Make the dashboards believe the rollup tables do not exist."""
+    with (
+        patch.object(web_data, "has_rollups", return_value=False),
+        patch.object(web_api, "has_rollups", return_value=False),
+    ):
+        yield
+
+
+@contextmanager
+def eav_only() -> Iterator[None]:
+    """Make the dashboards believe agent_execution does not exist either."""
+    with (
+        raw_only(),
+        patch.object(web_data, "_has_agent_execution", return_value=False),
+        patch.object(web_api, "_has_agent_execution", return_value=False),
+    ):
+        yield
+
+
+DASHBOARD_QUERIES: dict[str, Callable[[], Any]] = {
+    "data.get_cost_breakdown(7)": lambda: web_data.get_cost_breakdown(days=7),
+    "data.get_daily_metrics(7)": lambda: web_data.get_daily_metrics(days=7),
+    "data.get_agent_stats()": web_data.get_agent_stats,
+    "data.get_agent_health()": web_data.get_agent_health,
+    "api.get_cost_summary(30)": lambda: web_api.get_cost_summary(days=30),
+    "api.get_user_performance()": web_api.get_user_performance,
+    "api.get_recent_agent_activity()": web_api.get_recent_agent_activity,
+}
+
+# Results that legitimately differ between the layouts
+_LAYOUT_SPECIFIC = {
+    # EAV counted metric rows as executions
+    "data.get_agent_health()",
+    "api.get_user_performance()",
+}
+
+
+def time_call(fn: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    """Median wall time (ms) over repeat calls, and the last result."""
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+def _normalized(result: Any) -> Any:
+    """Result with numbers rounded (REAL metric_value vs INTEGER columns)."""
+    if isinstance(result, dict):
+        return {key: _normalized(value) for key, value in result.items()}
+    if isinstance(result, list):
+        return [_normalized(value) for value in result]
+    if isinstance(result, (int, float)) and not isinstance(result, bool):
+        return round(float(result), 6)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=None,
+        help="Database file to build (or reuse if it exists)",
+    )
+    args = parser.parse_args()
+
+    default_db = Path(tempfile.gettempdir()) / f"asp-telemetry-rollup-{args.rows}.db"
+    db_path = args.db or default_db
+    if not db_path.exists():
+        print(f"Building {db_path} with {args.rows:,} agent_cost_vector rows...")
+        start = time.perf_counter()
+        build_synthetic_db(db_path, args.rows)
+        print(f"  built in {time.perf_counter() - start:.1f}s")
+
+    web_data.TELEMETRY_DB = db_path
+    web_api.DEFAULT_DB_PATH = db_path
+
+    print(f"\nDashboard query latency, median of {args.repeat} (ms)")
+    print(f"{'query':<34} {'eav':>9} {'wide':>9} {'rollup':>9} {'speedup':>8}")
+    for name, fn in DASHBOARD_QUERIES.items():
+        with frozen_now():
+            with eav_only():
+                eav_ms, eav_result = time_call(fn, args.repeat)
+            with raw_only():
+                wide_ms, wide_result = time_call(fn, args.repeat)
+            rollup_ms, rollup_result = time_call(fn, args.repeat)
+        note = ""
+        if name not in _LAYOUT_SPECIFIC and not (
+            _normalized(eav_result)
+            == _normalized(wide_result)
+            == _normalized(rollup_result)
+        ):
+            note = "  (results differ)"
+        print(
+            f"{name:<34} {eav_ms:>9.1f} {wide_ms:>9.1f} {rollup_ms:>9.1f} "
+            f"{eav_ms / rollup_ms:>7.1f}x{note}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+-- Migration 009: Add LLM response cache metric types to CHECK constraint
+-- Date: 2026-10-16
+-- Description: Extends metric_type CHECK constraint with Cache_Hits, Cache_Misses
+--              and Tokens_Saved, recorded when agents consult the LLM response cache
+
+-- SQLite doesn't support ALTER TABLE to modify CHECK constraints directly,
+-- so we need to:
+-- 1. Create a new table with the updated constraint
+-- 2. Copy data from old table
+-- 3. Drop old table
+-- 4. Rename new table
+
+-- Step 1: Create new table with updated CHECK constraint
+CREATE TABLE agent_cost_vector_new (
+    -- Primary Key (SQLite AUTOINCREMENT)
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+
+    -- Temporal Data (ISO 8601 format: YYYY-MM-DD HH:MM:SS)
+    timestamp TEXT NOT NULL DEFAULT (datetime('now')),
+    execution_date TEXT NOT NULL DEFAULT (date('now')),
+
+    -- Task Context
+    task_id TEXT NOT NULL,
+    subtask_id TEXT,
+    project_id TEXT,
+    user_id TEXT,
+
+    -- Agent Identification
+    agent_role TEXT NOT NULL,
+    agent_version TEXT,
+    agent_iteration INTEGER DEFAULT 1,
+
+    -- Metric Data
+    metric_type TEXT NOT NULL,
+    metric_value REAL NOT NULL,
+    metric_unit TEXT NOT NULL,
+
+    -- Model Context
+    llm_model TEXT,
+    llm_provider TEXT,
+
+    -- Additional Metadata (JSON as TEXT)
+    metadata TEXT,
+
+    -- Constraints
+    CHECK (metric_value >= 0),
+    CHECK (agent_role IN (
+        'Planning',
+        'Design',
+        'DesignReview',
+        'SecurityReview',
+        'PerformanceReview',
+        'DataIntegrityReview',
+        'MaintainabilityReview',
+        'ArchitectureReview',
+        'APIDesignReview',
+        'Code',
+        'CodeReview',
+        'CodeQualityReview',
+        'CodeSecurityReview',
+        'BestPracticesReview',
+        'TestCoverageReview',
+        'CodePerformanceReview',
+        'DocumentationReview',
+        'Test',
+        'Postmortem'
+    )),
+    CHECK (metric_type IN (
+        'Latency', 'Tokens_In', 'Tokens_Out', 'API_Cost', 'Memory_Usage', 'Tool_Calls', 'Retries',
+        'Cache_Hits', 'Cache_Misses', 'Tokens_Saved'
+    ))
+);
+
+-- Step 2: Copy data from old table
+INSERT INTO agent_cost_vector_new (
+    id, timestamp, execution_date, task_id, subtask_id, project_id, user_id,
+    agent_role, agent_version, agent_iteration, metric_type, metric_value,
+    metric_unit, llm_model, llm_provider, metadata
+)
+SELECT
+    id, timestamp, execution_date, task_id, subtask_id, project_id, user_id,
+    agent_role, agent_version, agent_iteration, metric_type, metric_value,
+    metric_unit, llm_model, llm_provider, metadata
+FROM agent_cost_vector;
+
+-- Step 3: Drop old table
+DROP TABLE agent_cost_vector;
+
+-- Step 4: Rename new table
+ALTER TABLE agent_cost_vector_new RENAME TO agent_cost_vector;
+
+-- Recreate indexes (they were dropped with the old table)
+CREATE INDEX IF NOT EXISTS idx_acv_task_id ON agent_cost_vector(task_id);
+CREATE INDEX IF NOT EXISTS idx_acv_timestamp ON agent_cost_vector(timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_acv_agent_role ON agent_cost_vector(agent_role);
+CREATE INDEX IF NOT EXISTS idx_acv_metric_type ON agent_cost_vector(metric_type);
+CREATE INDEX IF NOT EXISTS idx_acv_execution_date ON agent_cost_vector(execution_date DESC);
+CREATE INDEX IF NOT EXISTS idx_acv_project_id ON agent_cost_vector(project_id);
+CREATE INDEX IF NOT EXISTS idx_acv_estimation
+    ON agent_cost_vector(agent_role, metric_type, timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_acv_cost_analysis
+    ON agent_cost_vector(agent_role, timestamp DESC)
+    WHERE metric_type = 'API_Cost';
+
+-- Migration complete
+-- Added LLM response cache metric types:
+--   - Cache_Hits, Cache_Misses (count)
+--   - Tokens_Saved (tokens)
@@ -0,0 +1,185 @@
+-- Migration 016: Add agent_execution wide-row table
+-- Date: 2026-10-16
+-- Description: Adds agent_execution, one row per agent invocation (latency,
+--              tokens in/out, cost, prompt cache tokens, model, provider,
+--              iteration, status), written by @track_agent_cost alongside
+--              the per-metric agent_cost_vector rows. Dashboards aggregate
+--              it directly instead of pivoting with CASE WHEN metric_type.
+--              Existing agent_cost_vector rows are backfilled, and the
+--              agent_execution_metrics view exposes the new table in the
+--              agent_cost_vector (metric_type/metric_value) shape.
+
+-- Step 1: Create the table and the compatibility view
+CREATE TABLE IF NOT EXISTS agent_execution (
+    -- Primary Key (SQLite AUTOINCREMENT)
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+
+    -- Temporal Data (ISO 8601 format: YYYY-MM-DD HH:MM:SS)
+    timestamp TEXT NOT NULL DEFAULT (datetime('now')),
+    execution_date TEXT NOT NULL DEFAULT (date('now')),
+
+    -- Task Context
+    task_id TEXT NOT NULL,
+    subtask_id TEXT,
+    project_id TEXT,
+    user_id TEXT,
+
+    -- Agent Identification
+    agent_role TEXT NOT NULL,
+    agent_version TEXT,
+    agent_iteration INTEGER DEFAULT 1,
+    function_name TEXT,
+
+    -- Outcome
+    status TEXT NOT NULL DEFAULT 'success',
+    error_type TEXT,
+
+    -- Metrics
+    latency_ms REAL NOT NULL,
+    tokens_in INTEGER NOT NULL DEFAULT 0,
+    tokens_out INTEGER NOT NULL DEFAULT 0,
+    api_cost_usd REAL NOT NULL DEFAULT 0,
+    cache_read_tokens INTEGER NOT NULL DEFAULT 0,
+    cache_write_tokens INTEGER NOT NULL DEFAULT 0,
+
+    -- Model Context
+    llm_model TEXT,
+    llm_provider TEXT,
+
+    -- Additional Metadata (JSON as TEXT)
+    metadata TEXT,
+
+    -- Constraints
+    CHECK (status IN ('success', 'error')),
+    CHECK (latency_ms >= 0 AND tokens_in >= 0 AND tokens_out >= 0 AND api_cost_usd >= 0),
+    CHECK (cache_read_tokens >= 0 AND cache_write_tokens >= 0),
+    CHECK (agent_role IN (
+        'Planning',
+        'Design',
+        'DesignReview',
+        'SecurityReview',
+        'PerformanceReview',
+        'DataIntegrityReview',
+        'MaintainabilityReview',
+        'ArchitectureReview',
+        'APIDesignReview',
+        'Code',
+        'CodeReview',
+        'CodeQualityReview',
+        'CodeSecurityReview',
+        'BestPracticesReview',
+        'TestCoverageReview',
+        'CodePerformanceReview',
+        'DocumentationReview',
+        'Test',
+        'Postmortem'
+    ))
+);
+
+-- Compatibility view: agent_execution in the per-metric shape of
+-- agent_cost_vector, for queries written against the EAV layout
+CREATE VIEW IF NOT EXISTS agent_execution_metrics AS
+    SELECT id AS execution_id, timestamp, execution_date, task_id, subtask_id,
+           project_id, user_id, agent_role, agent_version, agent_iteration,
+           'Latency' AS metric_type, latency_ms AS metric_value, 'ms' AS metric_unit,
+           llm_model, llm_provider, metadata
+    FROM agent_execution
+    UNION ALL
+    SELECT id, timestamp, execution_date, task_id, subtask_id,
+           project_id, user_id, agent_role, agent_version, agent_iteration,
+           'Tokens_In', tokens_in, 'tokens', llm_model, llm_provider, metadata
+    FROM agent_execution WHERE tokens_in > 0
+    UNION ALL
+    SELECT id, timestamp, execution_date, task_id, subtask_id,
+           project_id, user_id, agent_role, agent_version, agent_iteration,
+           'Tokens_Out', tokens_out, 'tokens', llm_model, llm_provider, metadata
+    FROM agent_execution WHERE tokens_out > 0
+    UNION ALL
+    SELECT id, timestamp, execution_date, task_id, subtask_id,
+           project_id, user_id, agent_role, agent_version, agent_iteration,
+           'API_Cost', api_cost_usd, 'USD', llm_model, llm_provider, metadata
+    FROM agent_execution WHERE api_cost_usd > 0
+    UNION ALL
+    SELECT id, timestamp, execution_date, task_id, subtask_id,
+           project_id, user_id, agent_role, agent_version, agent_iteration,
+           'Prompt_Cache_Read_Tokens', cache_read_tokens, 'tokens',
+           llm_model, llm_provider, metadata
+    FROM agent_execution WHERE cache_read_tokens > 0
+    UNION ALL
+    SELECT id, timestamp, execution_date, task_id, subtask_id,
+           project_id, user_id, agent_role, agent_version, agent_iteration,
+           'Prompt_Cache_Write_Tokens', cache_write_tokens, 'tokens',
+           llm_model, llm_provider, metadata
+    FROM agent_execution WHERE cache_write_tokens > 0;
+
+-- Step 2: Indexes
+CREATE INDEX IF NOT EXISTS idx_ae_task_id ON agent_execution(task_id);
+CREATE INDEX IF NOT EXISTS idx_ae_timestamp ON agent_execution(timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_ae_user_id ON agent_execution(user_id);
+CREATE INDEX IF NOT EXISTS idx_ae_role_timestamp
+    ON agent_execution(agent_role, timestamp DESC);
+
+-- Step 3: Backfill from agent_cost_vector
+-- Every execution logged exactly one Latency row, followed by its other
+-- metric rows for the same task and agent. Each metric row is attributed
+-- to the closest preceding Latency row (by id) with the same task_id and
+-- agent_role; that Latency row supplies the execution's context columns.
+WITH execution_metrics AS (
+    SELECT
+        (
+            SELECT MAX(lat.id)
+            FROM agent_cost_vector lat
+            WHERE lat.metric_type = 'Latency'
+              AND lat.task_id = m.task_id
+              AND lat.agent_role = m.agent_role
+              AND lat.id <= m.id
+        ) AS execution_id,
+        m.metric_type,
+        m.metric_value
+    FROM agent_cost_vector m
+    WHERE m.metric_type IN (
+        'Tokens_In', 'Tokens_Out', 'API_Cost',
+        'Prompt_Cache_Read_Tokens', 'Prompt_Cache_Write_Tokens'
+    )
+)
+INSERT INTO agent_execution (
+    timestamp, execution_date, task_id, subtask_id, project_id, user_id,
+    agent_role, agent_version, agent_iteration, function_name,
+    status, error_type, latency_ms, tokens_in, tokens_out, api_cost_usd,
+    cache_read_tokens, cache_write_tokens, llm_model, llm_provider, metadata
+)
+SELECT
+    lat.timestamp,
+    lat.execution_date,
+    lat.task_id,
+    lat.subtask_id,
+    lat.project_id,
+    lat.user_id,
+    lat.agent_role,
+    lat.agent_version,
+    lat.agent_iteration,
+    json_extract(lat.metadata, '$.function'),
+    CASE WHEN json_extract(lat.metadata, '$.success') = 0 THEN 'error' ELSE 'success' END,
+    json_extract(lat.metadata, '$.error_type'),
+    lat.metric_value,
+    CAST(COALESCE(SUM(CASE WHEN em.metric_type = 'Tokens_In' THEN em.metric_value END), 0) AS INTEGER),
+    CAST(COALESCE(SUM(CASE WHEN em.metric_type = 'Tokens_Out' THEN em.metric_value END), 0) AS INTEGER),
+    COALESCE(SUM(CASE WHEN em.metric_type = 'API_Cost' THEN em.metric_value END), 0),
+    CAST(COALESCE(SUM(CASE WHEN em.metric_type = 'Prompt_Cache_Read_Tokens' THEN em.metric_value END), 0) AS INTEGER),
+    CAST(COALESCE(SUM(CASE WHEN em.metric_type = 'Prompt_Cache_Write_Tokens' THEN em.metric_value END), 0) AS INTEGER),
+    lat.llm_model,
+    lat.llm_provider,
+    lat.metadata
+FROM agent_cost_vector lat
+LEFT JOIN execution_metrics em ON em.execution_id = lat.id
+WHERE lat.metric_type = 'Latency'
+GROUP BY lat.id
+ORDER BY lat.id;
+
+ANALYZE agent_execution;
+
+-- Migration complete
+-- Added table: agent_execution (one row per agent invocation)
+-- Added view:  agent_execution_metrics (agent_execution in agent_cost_vector shape)
+-- agent_cost_vector is unchanged and still written, so existing queries
+-- (e.g. scripts/query_telemetry.py) keep working.
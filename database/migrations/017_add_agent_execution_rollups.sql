@@ -0,0 +1,151 @@
+-- Migration 017: Add incrementally maintained agent_execution rollups
+-- Date: 2026-10-16
+-- Description: Adds hourly and daily rollups of agent_execution per
+--              agent_role, model, provider and project
+--              (agent_execution_hourly, agent_execution_daily) and the set
+--              of tasks seen per day (agent_execution_daily_tasks). The
+--              trg_agent_execution_rollup trigger updates them on every
+--              agent_execution insert, in the same transaction, so web
+--              dashboards can aggregate a few rollup rows per hour or day
+--              instead of scanning raw executions on every page load.
+-- Requires: Migration 016 (agent_execution)
+
+-- Step 1: Create rollup tables
+CREATE TABLE IF NOT EXISTS agent_execution_hourly (
+    bucket TEXT NOT NULL,
+    agent_role TEXT NOT NULL,
+    llm_model TEXT NOT NULL DEFAULT '',
+    llm_provider TEXT NOT NULL DEFAULT '',
+    project_id TEXT NOT NULL DEFAULT '',
+
+    executions INTEGER NOT NULL DEFAULT 0,
+    errors INTEGER NOT NULL DEFAULT 0,
+    latency_ms_sum REAL NOT NULL DEFAULT 0,
+    tokens_in INTEGER NOT NULL DEFAULT 0,
+    tokens_out INTEGER NOT NULL DEFAULT 0,
+    api_cost_usd REAL NOT NULL DEFAULT 0,
+    cache_read_tokens INTEGER NOT NULL DEFAULT 0,
+    cache_write_tokens INTEGER NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (bucket, agent_role, llm_model, llm_provider, project_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS agent_execution_daily (
+    bucket TEXT NOT NULL,
+    agent_role TEXT NOT NULL,
+    llm_model TEXT NOT NULL DEFAULT '',
+    llm_provider TEXT NOT NULL DEFAULT '',
+    project_id TEXT NOT NULL DEFAULT '',
+
+    executions INTEGER NOT NULL DEFAULT 0,
+    errors INTEGER NOT NULL DEFAULT 0,
+    latency_ms_sum REAL NOT NULL DEFAULT 0,
+    tokens_in INTEGER NOT NULL DEFAULT 0,
+    tokens_out INTEGER NOT NULL DEFAULT 0,
+    api_cost_usd REAL NOT NULL DEFAULT 0,
+    cache_read_tokens INTEGER NOT NULL DEFAULT 0,
+    cache_write_tokens INTEGER NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (bucket, agent_role, llm_model, llm_provider, project_id)
+) WITHOUT ROWID;
+
+-- Distinct tasks per day (COUNT(DISTINCT task_id) does not roll up)
+CREATE TABLE IF NOT EXISTS agent_execution_daily_tasks (
+    bucket TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    PRIMARY KEY (bucket, task_id)
+) WITHOUT ROWID;
+
+-- Step 2: Backfill from existing agent_execution rows (before the trigger
+-- exists, so nothing is counted twice)
+INSERT INTO agent_execution_hourly (
+    bucket, agent_role, llm_model, llm_provider, project_id,
+    executions, errors, latency_ms_sum, tokens_in, tokens_out,
+    api_cost_usd, cache_read_tokens, cache_write_tokens
+)
+SELECT
+    replace(substr(timestamp, 1, 13), ' ', 'T') AS rollup_bucket, agent_role,
+    COALESCE(llm_model, '') AS rollup_model,
+    COALESCE(llm_provider, '') AS rollup_provider,
+    COALESCE(project_id, '') AS rollup_project,
+    COUNT(*), SUM(status = 'error'), SUM(latency_ms), SUM(tokens_in), SUM(tokens_out),
+    SUM(api_cost_usd), SUM(cache_read_tokens), SUM(cache_write_tokens)
+FROM agent_execution
+GROUP BY rollup_bucket, agent_role, rollup_model, rollup_provider, rollup_project;
+
+INSERT INTO agent_execution_daily (
+    bucket, agent_role, llm_model, llm_provider, project_id,
+    executions, errors, latency_ms_sum, tokens_in, tokens_out,
+    api_cost_usd, cache_read_tokens, cache_write_tokens
+)
+SELECT
+    substr(timestamp, 1, 10) AS rollup_bucket, agent_role,
+    COALESCE(llm_model, '') AS rollup_model,
+    COALESCE(llm_provider, '') AS rollup_provider,
+    COALESCE(project_id, '') AS rollup_project,
+    COUNT(*), SUM(status = 'error'), SUM(latency_ms), SUM(tokens_in), SUM(tokens_out),
+    SUM(api_cost_usd), SUM(cache_read_tokens), SUM(cache_write_tokens)
+FROM agent_execution
+GROUP BY rollup_bucket, agent_role, rollup_model, rollup_provider, rollup_project;
+
+INSERT OR IGNORE INTO agent_execution_daily_tasks (bucket, task_id)
+SELECT DISTINCT substr(timestamp, 1, 10), task_id
+FROM agent_execution;
+
+-- Step 3: Keep the rollups current on every insert
+CREATE TRIGGER IF NOT EXISTS trg_agent_execution_rollup
+AFTER INSERT ON agent_execution
+BEGIN
+    INSERT INTO agent_execution_hourly (
+        bucket, agent_role, llm_model, llm_provider, project_id,
+        executions, errors, latency_ms_sum, tokens_in, tokens_out,
+        api_cost_usd, cache_read_tokens, cache_write_tokens
+    ) VALUES (
+        replace(substr(NEW.timestamp, 1, 13), ' ', 'T'), NEW.agent_role,
+        COALESCE(NEW.llm_model, ''), COALESCE(NEW.llm_provider, ''),
+        COALESCE(NEW.project_id, ''),
+        1, NEW.status = 'error', NEW.latency_ms, NEW.tokens_in, NEW.tokens_out,
+        NEW.api_cost_usd, NEW.cache_read_tokens, NEW.cache_write_tokens
+    )
+    ON CONFLICT (bucket, agent_role, llm_model, llm_provider, project_id) DO UPDATE SET
+        executions = executions + excluded.executions,
+        errors = errors + excluded.errors,
+        latency_ms_sum = latency_ms_sum + excluded.latency_ms_sum,
+        tokens_in = tokens_in + excluded.tokens_in,
+        tokens_out = tokens_out + excluded.tokens_out,
+        api_cost_usd = api_cost_usd + excluded.api_cost_usd,
+        cache_read_tokens = cache_read_tokens + excluded.cache_read_tokens,
+        cache_write_tokens = cache_write_tokens + excluded.cache_write_tokens;
+
+    INSERT INTO agent_execution_daily (
+        bucket, agent_role, llm_model, llm_provider, project_id,
+        executions, errors, latency_ms_sum, tokens_in, tokens_out,
+        api_cost_usd, cache_read_tokens, cache_write_tokens
+    ) VALUES (
+        substr(NEW.timestamp, 1, 10), NEW.agent_role,
+        COALESCE(NEW.llm_model, ''), COALESCE(NEW.llm_provider, ''),
+        COALESCE(NEW.project_id, ''),
+        1, NEW.status = 'error', NEW.latency_ms, NEW.tokens_in, NEW.tokens_out,
+        NEW.api_cost_usd, NEW.cache_read_tokens, NEW.cache_write_tokens
+    )
+    ON CONFLICT (bucket, agent_role, llm_model, llm_provider, project_id) DO UPDATE SET
+        executions = executions + excluded.executions,
+        errors = errors + excluded.errors,
+        latency_ms_sum = latency_ms_sum + excluded.latency_ms_sum,
+        tokens_in = tokens_in + excluded.tokens_in,
+        tokens_out = tokens_out + excluded.tokens_out,
+        api_cost_usd = api_cost_usd + excluded.api_cost_usd,
+        cache_read_tokens = cache_read_tokens + excluded.cache_read_tokens,
+        cache_write_tokens = cache_write_tokens + excluded.cache_write_tokens;
+
+    INSERT OR IGNORE INTO agent_execution_daily_tasks (bucket, task_id)
+    VALUES (substr(NEW.timestamp, 1, 10), NEW.task_id);
+END;
+
+ANALYZE agent_execution_hourly;
+ANALYZE agent_execution_daily;
+
+-- Migration complete
+-- Added tables: agent_execution_hourly, agent_execution_daily,
+--               agent_execution_daily_tasks
+-- Added trigger: trg_agent_execution_rollup (AFTER INSERT ON agent_execution)
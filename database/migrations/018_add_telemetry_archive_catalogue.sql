@@ -0,0 +1,30 @@
+-- Migration 018: Add telemetry archive catalogue
+-- Date: 2026-10-16
+-- Description: Adds telemetry_archive, the catalogue of per-month SQLite
+--              archive files written by `asp-cli telemetry compact`.
+--              Compaction moves raw agent_execution and agent_cost_vector
+--              rows older than the retention window into those files and
+--              records each month here; the web data layer reads the
+--              catalogue to attach an archive only when a query range
+--              starts before archived_until.
+-- Requires: Migration 017 (agent_execution rollups), which keeps the
+--           aggregates of archived rows in this database
+
+CREATE TABLE IF NOT EXISTS telemetry_archive (
+    -- Archive month ('YYYY-MM') and file, relative to this database's directory
+    month TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+
+    -- Archived rows have first_timestamp <= timestamp < archived_until
+    first_timestamp TEXT,
+    archived_until TEXT NOT NULL,
+
+    -- Raw rows moved into the archive so far
+    agent_execution_rows INTEGER NOT NULL DEFAULT 0,
+    agent_cost_vector_rows INTEGER NOT NULL DEFAULT 0,
+
+    compacted_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
+-- Migration complete
+-- Added table: telemetry_archive
@@ -91,6 +91,19 @@ CREATE INDEX IF NOT EXISTS idx_bootstrap_dashboard
 CREATE INDEX IF NOT EXISTS idx_bootstrap_trends
     ON bootstrap_metrics(capability_name, capability_mode, measured_at DESC);
 
+-- ==============================================================================
+-- Indexes for agent_execution
+-- ==============================================================================
+
+-- Basic indexes for filtering
+CREATE INDEX IF NOT EXISTS idx_ae_task_id ON agent_execution(task_id);
+CREATE INDEX IF NOT EXISTS idx_ae_timestamp ON agent_execution(timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_ae_user_id ON agent_execution(user_id);
+
+-- Composite index for per-agent dashboards (health, cost by role)
+CREATE INDEX IF NOT EXISTS idx_ae_role_timestamp
+    ON agent_execution(agent_role, timestamp DESC);
+
 -- ==============================================================================
 -- Analyze Tables for Query Optimizer
 -- ==============================================================================
@@ -100,3 +113,6 @@ ANALYZE agent_cost_vector;
 ANALYZE defect_log;
 ANALYZE task_metadata;
 ANALYZE bootstrap_metrics;
+ANALYZE agent_execution;
+ANALYZE agent_execution_hourly;
+ANALYZE agent_execution_daily;
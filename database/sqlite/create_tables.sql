@@ -1,7 +1,8 @@
 -- ASP Telemetry Database - Core Tables (SQLite)
 -- Version: 1.0
 -- Date: 2025-11-12
--- Description: Creates core tables for Agent Cost Vector, Defect Log, Task Metadata, and Bootstrap Metrics
+-- Description: Creates core tables for Agent Cost Vector, Defect Log, Task Metadata, Bootstrap Metrics,
+--              Agent Execution, Agent Execution rollups, and the telemetry archive catalogue
 -- Database: SQLite 3.x (requires JSON1 extension for JSON functions)
 
 -- ==============================================================================
@@ -63,7 +64,16 @@ CREATE TABLE IF NOT EXISTS agent_cost_vector (
         'Test',
         'Postmortem'
     )),
-    CHECK (metric_type IN ('Latency', 'Tokens_In', 'Tokens_Out', 'API_Cost', 'Memory_Usage', 'Tool_Calls', 'Retries'))
+    CHECK (metric_type IN (
+        'Latency', 'Tokens_In', 'Tokens_Out', 'API_Cost', 'Memory_Usage', 'Tool_Calls', 'Retries',
+        'Cache_Hits', 'Cache_Misses', 'Tokens_Saved',
+        'Prompt_Cache_Read_Tokens', 'Prompt_Cache_Write_Tokens',
+        'Route_Latency_P50', 'Route_Latency_P95', 'Route_Errors',
+        'Hedges_Fired', 'Hedges_Won', 'Continuations', 'Parse_Failures',
+        'Coalesced_Calls',
+        'Speculation_Hits', 'Speculation_Misses',
+        'Speculation_Wasted_Tokens', 'Speculation_Wasted_Cost'
+    ))
 );
 
 -- ==============================================================================
@@ -227,6 +237,244 @@ CREATE TABLE IF NOT EXISTS bootstrap_metrics (
     CHECK (graduation_criteria_met IN (0, 1))
 );
 
+-- ==============================================================================
+-- Table 5: agent_execution
+-- One wide row per agent invocation (latency, tokens, cost, cache tokens),
+-- written alongside the per-metric agent_cost_vector rows so dashboards can
+-- aggregate without pivoting on metric_type
+-- ==============================================================================
+
+CREATE TABLE IF NOT EXISTS agent_execution (
+    -- Primary Key (SQLite AUTOINCREMENT)
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+
+    -- Temporal Data (ISO 8601 format: YYYY-MM-DD HH:MM:SS)
+    timestamp TEXT NOT NULL DEFAULT (datetime('now')),
+    execution_date TEXT NOT NULL DEFAULT (date('now')),
+
+    -- Task Context
+    task_id TEXT NOT NULL,
+    subtask_id TEXT,
+    project_id TEXT,
+    user_id TEXT,
+
+    -- Agent Identification
+    agent_role TEXT NOT NULL,
+    agent_version TEXT,
+    agent_iteration INTEGER DEFAULT 1,
+    function_name TEXT,
+
+    -- Outcome
+    status TEXT NOT NULL DEFAULT 'success',
+    error_type TEXT,
+
+    -- Metrics
+    latency_ms REAL NOT NULL,
+    tokens_in INTEGER NOT NULL DEFAULT 0,
+    tokens_out INTEGER NOT NULL DEFAULT 0,
+    api_cost_usd REAL NOT NULL DEFAULT 0,
+    cache_read_tokens INTEGER NOT NULL DEFAULT 0,
+    cache_write_tokens INTEGER NOT NULL DEFAULT 0,
+
+    -- Model Context
+    llm_model TEXT,
+    llm_provider TEXT,
+
+    -- Additional Metadata (JSON as TEXT)
+    metadata TEXT,
+
+    -- Constraints
+    CHECK (status IN ('success', 'error')),
+    CHECK (latency_ms >= 0 AND tokens_in >= 0 AND tokens_out >= 0 AND api_cost_usd >= 0),
+    CHECK (cache_read_tokens >= 0 AND cache_write_tokens >= 0),
+    CHECK (agent_role IN (
+        'Planning',
+        'Design',
+        'DesignReview',
+        'SecurityReview',
+        'PerformanceReview',
+        'DataIntegrityReview',
+        'MaintainabilityReview',
+        'ArchitectureReview',
+        'APIDesignReview',
+        'Code',
+        'CodeReview',
+        'CodeQualityReview',
+        'CodeSecurityReview',
+        'BestPracticesReview',
+        'TestCoverageReview',
+        'CodePerformanceReview',
+        'DocumentationReview',
+        'Test',
+        'Postmortem'
+    ))
+);
+
+-- Compatibility view: agent_execution in the per-metric shape of
+-- agent_cost_vector, for queries written against the EAV layout
+CREATE VIEW IF NOT EXISTS agent_execution_metrics AS
+    SELECT id AS execution_id, timestamp, execution_date, task_id, subtask_id,
+           project_id, user_id, agent_role, agent_version, agent_iteration,
+           'Latency' AS metric_type, latency_ms AS metric_value, 'ms' AS metric_unit,
+           llm_model, llm_provider, metadata
+    FROM agent_execution
+    UNION ALL
+    SELECT id, timestamp, execution_date, task_id, subtask_id,
+           project_id, user_id, agent_role, agent_version, agent_iteration,
+           'Tokens_In', tokens_in, 'tokens', llm_model, llm_provider, metadata
+    FROM agent_execution WHERE tokens_in > 0
+    UNION ALL
+    SELECT id, timestamp, execution_date, task_id, subtask_id,
+           project_id, user_id, agent_role, agent_version, agent_iteration,
+           'Tokens_Out', tokens_out, 'tokens', llm_model, llm_provider, metadata
+    FROM agent_execution WHERE tokens_out > 0
+    UNION ALL
+    SELECT id, timestamp, execution_date, task_id, subtask_id,
+           project_id, user_id, agent_role, agent_version, agent_iteration,
+           'API_Cost', api_cost_usd, 'USD', llm_model, llm_provider, metadata
+    FROM agent_execution WHERE api_cost_usd > 0
+    UNION ALL
+    SELECT id, timestamp, execution_date, task_id, subtask_id,
+           project_id, user_id, agent_role, agent_version, agent_iteration,
+           'Prompt_Cache_Read_Tokens', cache_read_tokens, 'tokens',
+           llm_model, llm_provider, metadata
+    FROM agent_execution WHERE cache_read_tokens > 0
+    UNION ALL
+    SELECT id, timestamp, execution_date, task_id, subtask_id,
+           project_id, user_id, agent_role, agent_version, agent_iteration,
+           'Prompt_Cache_Write_Tokens', cache_write_tokens, 'tokens',
+           llm_model, llm_provider, metadata
+    FROM agent_execution WHERE cache_write_tokens > 0;
+
+-- ==============================================================================
+-- Tables 6-8: agent_execution rollups
+-- Hourly and daily aggregates of agent_execution per agent_role, model,
+-- provider and project, plus the set of tasks seen per day. Maintained by the
+-- trg_agent_execution_rollup trigger in the same transaction as each
+-- agent_execution insert, so they are always current (including the current
+-- hour). Dimensions are stored as '' rather than NULL so upserts match.
+-- Bucket keys: 'YYYY-MM-DDTHH' (hourly), 'YYYY-MM-DD' (daily).
+-- ==============================================================================
+
+CREATE TABLE IF NOT EXISTS agent_execution_hourly (
+    bucket TEXT NOT NULL,
+    agent_role TEXT NOT NULL,
+    llm_model TEXT NOT NULL DEFAULT '',
+    llm_provider TEXT NOT NULL DEFAULT '',
+    project_id TEXT NOT NULL DEFAULT '',
+
+    executions INTEGER NOT NULL DEFAULT 0,
+    errors INTEGER NOT NULL DEFAULT 0,
+    latency_ms_sum REAL NOT NULL DEFAULT 0,
+    tokens_in INTEGER NOT NULL DEFAULT 0,
+    tokens_out INTEGER NOT NULL DEFAULT 0,
+    api_cost_usd REAL NOT NULL DEFAULT 0,
+    cache_read_tokens INTEGER NOT NULL DEFAULT 0,
+    cache_write_tokens INTEGER NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (bucket, agent_role, llm_model, llm_provider, project_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS agent_execution_daily (
+    bucket TEXT NOT NULL,
+    agent_role TEXT NOT NULL,
+    llm_model TEXT NOT NULL DEFAULT '',
+    llm_provider TEXT NOT NULL DEFAULT '',
+    project_id TEXT NOT NULL DEFAULT '',
+
+    executions INTEGER NOT NULL DEFAULT 0,
+    errors INTEGER NOT NULL DEFAULT 0,
+    latency_ms_sum REAL NOT NULL DEFAULT 0,
+    tokens_in INTEGER NOT NULL DEFAULT 0,
+    tokens_out INTEGER NOT NULL DEFAULT 0,
+    api_cost_usd REAL NOT NULL DEFAULT 0,
+    cache_read_tokens INTEGER NOT NULL DEFAULT 0,
+    cache_write_tokens INTEGER NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (bucket, agent_role, llm_model, llm_provider, project_id)
+) WITHOUT ROWID;
+
+-- Distinct tasks per day (COUNT(DISTINCT task_id) does not roll up)
+CREATE TABLE IF NOT EXISTS agent_execution_daily_tasks (
+    bucket TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    PRIMARY KEY (bucket, task_id)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS trg_agent_execution_rollup
+AFTER INSERT ON agent_execution
+BEGIN
+    INSERT INTO agent_execution_hourly (
+        bucket, agent_role, llm_model, llm_provider, project_id,
+        executions, errors, latency_ms_sum, tokens_in, tokens_out,
+        api_cost_usd, cache_read_tokens, cache_write_tokens
+    ) VALUES (
+        replace(substr(NEW.timestamp, 1, 13), ' ', 'T'), NEW.agent_role,
+        COALESCE(NEW.llm_model, ''), COALESCE(NEW.llm_provider, ''),
+        COALESCE(NEW.project_id, ''),
+        1, NEW.status = 'error', NEW.latency_ms, NEW.tokens_in, NEW.tokens_out,
+        NEW.api_cost_usd, NEW.cache_read_tokens, NEW.cache_write_tokens
+    )
+    ON CONFLICT (bucket, agent_role, llm_model, llm_provider, project_id) DO UPDATE SET
+        executions = executions + excluded.executions,
+        errors = errors + excluded.errors,
+        latency_ms_sum = latency_ms_sum + excluded.latency_ms_sum,
+        tokens_in = tokens_in + excluded.tokens_in,
+        tokens_out = tokens_out + excluded.tokens_out,
+        api_cost_usd = api_cost_usd + excluded.api_cost_usd,
+        cache_read_tokens = cache_read_tokens + excluded.cache_read_tokens,
+        cache_write_tokens = cache_write_tokens + excluded.cache_write_tokens;
+
+    INSERT INTO agent_execution_daily (
+        bucket, agent_role, llm_model, llm_provider, project_id,
+        executions, errors, latency_ms_sum, tokens_in, tokens_out,
+        api_cost_usd, cache_read_tokens, cache_write_tokens
+    ) VALUES (
+        substr(NEW.timestamp, 1, 10), NEW.agent_role,
+        COALESCE(NEW.llm_model, ''), COALESCE(NEW.llm_provider, ''),
+        COALESCE(NEW.project_id, ''),
+        1, NEW.status = 'error', NEW.latency_ms, NEW.tokens_in, NEW.tokens_out,
+        NEW.api_cost_usd, NEW.cache_read_tokens, NEW.cache_write_tokens
+    )
+    ON CONFLICT (bucket, agent_role, llm_model, llm_provider, project_id) DO UPDATE SET
+        executions = executions + excluded.executions,
+        errors = errors + excluded.errors,
+        latency_ms_sum = latency_ms_sum + excluded.latency_ms_sum,
+        tokens_in = tokens_in + excluded.tokens_in,
+        tokens_out = tokens_out + excluded.tokens_out,
+        api_cost_usd = api_cost_usd + excluded.api_cost_usd,
+        cache_read_tokens = cache_read_tokens + excluded.cache_read_tokens,
+        cache_write_tokens = cache_write_tokens + excluded.cache_write_tokens;
+
+    INSERT OR IGNORE INTO agent_execution_daily_tasks (bucket, task_id)
+    VALUES (substr(NEW.timestamp, 1, 10), NEW.task_id);
+END;
+
+-- ==============================================================================
+-- Table 9: telemetry_archive
+-- Catalogue of per-month archive files written by `asp-cli telemetry compact`.
+-- Raw agent_execution and agent_cost_vector rows older than the retention
+-- window are moved into one SQLite file per month; their rollups (Tables 6-8)
+-- stay here. Readers attach an archive only when a range starts before
+-- archived_until.
+-- ==============================================================================
+
+CREATE TABLE IF NOT EXISTS telemetry_archive (
+    -- Archive month ('YYYY-MM') and file, relative to this database's directory
+    month TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+
+    -- Archived rows have first_timestamp <= timestamp < archived_until
+    first_timestamp TEXT,
+    archived_until TEXT NOT NULL,
+
+    -- Raw rows moved into the archive so far
+    agent_execution_rows INTEGER NOT NULL DEFAULT 0,
+    agent_cost_vector_rows INTEGER NOT NULL DEFAULT 0,
+
+    compacted_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
 -- ==============================================================================
 -- Enable Foreign Key Constraints (Optional)
 -- SQLite requires explicit enabling of foreign keys
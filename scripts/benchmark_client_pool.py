@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: Connection Setup Avoided by the Shared LLM Client Pool
+
+Simulates the LLM traffic of one TSP pipeline run (7 agents plus 6 design
+review and 6 code review specialists) against a local keep-alive HTTP
+server that mimics the Anthropic Messages API, and compares:
+
+- per-agent clients: every agent builds its own Anthropic() client, as
+  agents did before asp.utils.client_pool
+- pooled clients: every agent uses get_anthropic_client()
+
+For each mode it reports client construction time, TCP connections opened,
+and total wall time. The local server has no TLS or network latency, so the
+script also projects the savings for a real endpoint with --handshake-ms
+(TCP + TLS setup cost per new connection).
+
+Usage:
+    uv run python scripts/benchmark_client_pool.py
+    uv run python scripts/benchmark_client_pool.py --agents 19 --calls 3
+    uv run python scripts/benchmark_client_pool.py --handshake-ms 120
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from anthropic import Anthropic  # noqa: E402
+
+from asp.utils.client_pool import (  # noqa: E402
+    close_client_pool,
+    get_anthropic_client,
+)
+
+# ============================================================================
+# Configuration
+# ============================================================================
+
+PIPELINE_AGENTS = 7 + 6 + 6  # Core agents + design and code review specialists
+
+FAKE_MESSAGE = {
+    "id": "msg_benchmark",
+    "type": "message",
+    "role": "assistant",
+    "model": "claude-haiku-4-5",
+    "content": [{"type": "text", "text": "ok"}],
+    "stop_reason": "end_turn",
+    "stop_sequence": None,
+    "usage": {"input_tokens": 10, "output_tokens": 1},
+}
+
+
+# ============================================================================
+# Local Messages API Server
+# ============================================================================
+
+
+class MessagesHandler(BaseHTTPRequestHandler):
+    """Keep-alive handler answering every POST with a canned message."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # Avoid delayed-ACK stalls on reused sockets
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with MessagesHandler.lock:
+            MessagesHandler.connections += 1
+
+    def do_POST(self):  # noqa: N802 - http.server naming
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        body = json.dumps(FAKE_MESSAGE).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server() -> ThreadingHTTPServer:
+    """Start the local server on a free port in a daemon thread."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MessagesHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# ============================================================================
+# Benchmark
+# ============================================================================
+
+
+def run_pipeline(pooled: bool, agents: int, calls: int) -> dict[str, float]:
+    """
+    Simulate one pipeline run and measure client setup and connections.
+
+    Args:
+        pooled: Use the shared client pool instead of per-agent clients
+        agents: Number of agents making LLM calls
+        calls: LLM calls per agent
+
+    Returns:
+        Dict with construct_ms, connections, and wall_ms
+    """
+    close_client_pool()
+    MessagesHandler.connections = 0
+    construct_seconds = 0.0
+    clients = []
+
+    start = time.perf_counter()
+    for _ in range(agents):
+        t0 = time.perf_counter()
+        if pooled:
+            client = get_anthropic_client("benchmark-key")
+        else:
+            client = Anthropic(api_key="benchmark-key")
+        construct_seconds += time.perf_counter() - t0
+        clients.append(client)
+
+        for _ in range(calls):
+            client.messages.create(
+                model="claude-haiku-4-5",
+                max_tokens=16,
+                messages=[{"role": "user", "content": "ping"}],
+            )
+    wall_seconds = time.perf_counter() - start
+
+    if not pooled:
+        for client in clients:
+            client.close()
+    close_client_pool()
+
+    return {
+        "construct_ms": construct_seconds * 1000,
+        "connections": MessagesHandler.connections,
+        "wall_ms": wall_seconds * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--agents", type=int, default=PIPELINE_AGENTS)
+    parser.add_argument("--calls", type=int, default=1, help="LLM calls per agent")
+    parser.add_argument("--runs", type=int, default=5, help="Repetitions per mode")
+    parser.add_argument(
+        "--handshake-ms",
+        type=float,
+        default=60.0,
+        help="Assumed TCP+TLS setup cost per new connection on a real endpoint",
+    )
+    args = parser.parse_args()
+
+    server = start_server()
+    os.environ["ANTHROPIC_BASE_URL"] = f"http://127.0.0.1:{server.server_port}"
+
+    results = {}
+    for label, pooled in (("per-agent", False), ("pooled", True)):
+        runs = [run_pipeline(pooled, args.agents, args.calls) for _ in range(args.runs)]
+        results[label] = {
+            key: sum(run[key] for run in runs) / len(runs) for key in runs[0]
+        }
+
+    server.shutdown()
+
+    print(
+        f"Pipeline: {args.agents} agents x {args.calls} calls, "
+        f"{args.runs} runs per mode\n"
+    )
+    print(f"{'mode':<10} {'construct ms':>13} {'connections':>12} {'wall ms':>9}")
+    for label, result in results.items():
+        print(
+            f"{label:<10} {result['construct_ms']:>13.1f} "
+            f"{result['connections']:>12.0f} {result['wall_ms']:>9.1f}"
+        )
+
+    avoided = results["per-agent"]["connections"] - results["pooled"]["connections"]
+    construct_saved = (
+        results["per-agent"]["construct_ms"] - results["pooled"]["construct_ms"]
+    )
+    print(f"\nConnections avoided per run: {avoided:.0f}")
+    print(f"Client construction saved per run: {construct_saved:.1f} ms")
+    print(
+        f"Projected setup saved per run at {args.handshake_ms:.0f} ms/handshake: "
+        f"{construct_saved + avoided * args.handshake_ms:.0f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -62,6 +62,11 @@ def verify_database_schema(conn: sqlite3.Connection) -> bool:
         "defect_log",
         "task_metadata",
         "bootstrap_metrics",
+        "agent_execution",
+        "agent_execution_hourly",
+        "agent_execution_daily",
+        "agent_execution_daily_tasks",
+        "telemetry_archive",
     ]
 
     cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
@@ -85,7 +90,13 @@ def print_database_stats(conn: sqlite3.Connection):
     print("-" * 50)
 
     # Count rows in each table
-    tables = ["task_metadata", "agent_cost_vector", "defect_log", "bootstrap_metrics"]
+    tables = [
+        "task_metadata",
+        "agent_cost_vector",
+        "agent_execution",
+        "defect_log",
+        "bootstrap_metrics",
+    ]
 
     for table in tables:
         cursor.execute(f"SELECT COUNT(*) FROM {table}")
@@ -10,6 +10,8 @@ Usage:
     uv run python scripts/query_telemetry.py --query agent-costs
     uv run python scripts/query_telemetry.py --query defects
     uv run python scripts/query_telemetry.py --query summary
+    uv run python scripts/query_telemetry.py --query parse-reliability
+    uv run python scripts/query_telemetry.py --query speculation
 """
 
 import argparse
@@ -248,6 +250,73 @@ def query_probe_ai_data(
     return cursor.fetchall()
 
 
+def query_parse_reliability(conn: sqlite3.Connection) -> list[sqlite3.Row]:
+    """
+    Compare response parse failures and retries per agent role.
+
+    Executions are split by whether structured output (ASP_STRUCTURED_OUTPUT)
+    was enabled, giving before/after rates for schema-constrained output.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        SELECT
+            agent_role,
+            CASE
+                WHEN json_extract(metadata, '$.structured_output') = 1
+                THEN 'structured' ELSE 'free-form'
+            END as output_mode,
+            SUM(CASE WHEN metric_type = 'Latency' THEN 1 ELSE 0 END) as executions,
+            SUM(CASE WHEN metric_type = 'Parse_Failures' THEN metric_value ELSE 0 END)
+                as parse_failures,
+            SUM(CASE WHEN metric_type = 'Retries' THEN metric_value ELSE 0 END)
+                as retries
+        FROM agent_cost_vector
+        WHERE metric_type IN ('Latency', 'Parse_Failures', 'Retries')
+        GROUP BY agent_role, output_mode
+        ORDER BY agent_role, output_mode
+        """
+    )
+    return cursor.fetchall()
+
+
+def query_speculation(conn: sqlite3.Connection) -> list[sqlite3.Row]:
+    """
+    Summarize speculative code generation (ASP_SPECULATIVE_CODEGEN) per project.
+
+    A hit is code generated during design review that the code phase used;
+    a miss was cancelled or discarded, and its tokens and cost were wasted.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        SELECT
+            COALESCE(project_id, '(none)') as project_id,
+            SUM(CASE WHEN metric_type = 'Speculation_Hits'
+                THEN metric_value ELSE 0 END) as hits,
+            SUM(CASE WHEN metric_type = 'Speculation_Misses'
+                THEN metric_value ELSE 0 END) as misses,
+            ROUND(
+                SUM(CASE WHEN metric_type = 'Speculation_Hits'
+                    THEN metric_value ELSE 0 END) * 1.0
+                / SUM(CASE WHEN metric_type IN
+                    ('Speculation_Hits', 'Speculation_Misses')
+                    THEN metric_value ELSE 0 END),
+                3
+            ) as hit_rate,
+            SUM(CASE WHEN metric_type = 'Speculation_Wasted_Tokens'
+                THEN metric_value ELSE 0 END) as wasted_tokens,
+            ROUND(SUM(CASE WHEN metric_type = 'Speculation_Wasted_Cost'
+                THEN metric_value ELSE 0 END), 4) as wasted_cost_usd
+        FROM agent_cost_vector
+        WHERE metric_type LIKE 'Speculation_%'
+        GROUP BY COALESCE(project_id, '(none)')
+        ORDER BY project_id
+        """
+    )
+    return cursor.fetchall()
+
+
 def query_database_stats(conn: sqlite3.Connection) -> dict:
     """
     Get overall database statistics.
@@ -360,6 +429,8 @@ def main():
             "defect-phases",
             "tasks",
             "probe-ai",
+            "parse-reliability",
+            "speculation",
             "stats",
         ],
         default="all",
@@ -422,6 +493,14 @@ def main():
             rows = query_probe_ai_data(conn)
             print_rows(rows, "PROBE-AI Training Data (Planning Agent)")
 
+        if args.query in ("all", "parse-reliability"):
+            rows = query_parse_reliability(conn)
+            print_rows(rows, "Parse Failures and Retries by Output Mode")
+
+        if args.query in ("all", "speculation"):
+            rows = query_speculation(conn)
+            print_rows(rows, "Speculative Code Generation by Project")
+
         print()
         print("=" * 80)
         print()
@@ -15,13 +15,30 @@ Date: November 13, 2025
 import asyncio
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel
 
+from asp.utils.json_extraction import JSONExtractionError, extract_json_from_response
+from asp.utils.llm_budget import budget_model, budgeted_call, budgeted_call_async
+from asp.utils.structured_output import (
+    StructuredOutputError,
+    parse_structured_output,
+    structured_output_enabled,
+    structured_output_kwargs,
+)
+
 logger = logging.getLogger(__name__)
 
+# Cache entry of the last deterministic response handed out in this context,
+# dropped again if the calling agent rejects the response
+_last_cached_response: ContextVar[tuple["BaseAgent", Any, str] | None] = ContextVar(
+    "asp_last_cached_response", default=None
+)
+
 
 class BaseAgent(ABC):
     """
@@ -60,6 +77,10 @@ class BaseAgent(ABC):
         self.agent_name = self.__class__.__name__
         self.agent_version = "1.0.0"  # Override in subclasses
         self._last_llm_usage = {}  # Track last LLM call usage for telemetry
+        self._llm_cache = None  # Optional LLMResponseCache override (tests)
+        # Schema-constrained output for calls that declare a response_model
+        self.structured_output = structured_output_enabled()
+        self.reset_llm_call_stats()
 
     @property
     def llm_client(self):
@@ -67,15 +88,280 @@ class BaseAgent(ABC):
         Lazy-load LLM client.
 
         This allows for dependency injection in tests while maintaining
-        convenience in production.
+        convenience in production. When ASP_LLM_CASSETTE is set, calls are
+        recorded to or replayed from that cassette instead.
         """
         if self._llm_client is None:
             # Import here to avoid circular dependencies
+            from asp.utils.llm_cassette import get_cassette_client
             from asp.utils.llm_client import LLMClient
 
-            self._llm_client = LLMClient()
+            self._llm_client = get_cassette_client() or LLMClient()
         return self._llm_client
 
+    @property
+    def llm_cache(self):
+        """
+        LLM response cache used by call_llm/call_llm_async.
+
+        Returns the injected cache if one was set, otherwise the process-wide
+        cache configured via ASP_LLM_CACHE (None when caching is off).
+        """
+        if self._llm_cache is not None:
+            return self._llm_cache
+
+        from asp.utils.llm_cache import get_llm_cache
+
+        return get_llm_cache()
+
+    def reset_llm_call_stats(self) -> None:
+        """
+        Reset per-execution LLM cache counters.
+
+        Called by the telemetry decorator at the start of each tracked
+        execution so response cache hits/misses, Anthropic prompt cache
+        read/write tokens, max_tokens continuations, response parse failures,
+        agent-level retries and coalesced in-flight calls are attributed to
+        that execution.
+        """
+        self._llm_call_stats = {
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "tokens_saved": 0,
+            "prompt_cache_read_tokens": 0,
+            "prompt_cache_write_tokens": 0,
+            "continuations": 0,
+            "parse_failures": 0,
+            "retries": 0,
+            "coalesced_calls": 0,
+        }
+
+    def record_parse_failure(self) -> None:
+        """Count an LLM response that could not be parsed or validated."""
+        self._increment_call_stat("parse_failures")
+        self._discard_cached_response()
+
+    def record_retry(self) -> None:
+        """Count an agent-level retry of a failed LLM call or parse."""
+        self._increment_call_stat("retries")
+        self._discard_cached_response()
+
+    def _discard_cached_response(self) -> None:
+        """
+        Remove the cache entry of the response this agent received last.
+
+        A rejected response must not be cached: deterministic retries send
+        the same prompt and would otherwise be served the same bad response.
+        """
+        last = _last_cached_response.get()
+        if last is None or last[0] is not self:
+            return
+        _last_cached_response.set(None)
+        _, cache, key = last
+        if cache.delete(key):
+            logger.info(
+                f"{self.agent_name}: Dropped rejected LLM response ({key[:12]})"
+            )
+
+    def _increment_call_stat(self, key: str) -> None:
+        """Increment a counter recorded after the LLM call it belongs to."""
+        self._llm_call_stats[key] += 1
+        if self._last_llm_usage:
+            self._last_llm_usage[key] = self._llm_call_stats[key]
+
+    def parse_json_response(
+        self, response: dict[str, Any], required_fields: list[str] | None = None
+    ) -> dict[str, Any]:
+        """
+        Extract JSON from an LLM response, counting parse failures.
+
+        Wraps extract_json_from_response(); structured responses already
+        carry parsed content and pass straight through.
+
+        Args:
+            response: LLM response dict with 'content' key
+            required_fields: Optional fields that must be present
+
+        Returns:
+            Parsed JSON as a dictionary
+
+        Raises:
+            JSONExtractionError: If JSON extraction or validation fails
+        """
+        try:
+            return extract_json_from_response(response, required_fields)
+        except JSONExtractionError:
+            self.record_parse_failure()
+            raise
+
+    def _llm_provider_name(self) -> str:
+        """Provider name of the LLM client (selects the structured output form)."""
+        client = self.llm_client
+        name = getattr(type(client), "provider_name", None) or getattr(
+            client, "name", None
+        )
+        return name if isinstance(name, str) else "anthropic"
+
+    def _structured_call_kwargs(
+        self, response_model: type[BaseModel] | None, kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Add schema-constraining parameters when structured output applies."""
+        if response_model is None or not self.structured_output:
+            return kwargs
+        return {
+            **kwargs,
+            **structured_output_kwargs(response_model, self._llm_provider_name()),
+        }
+
+    def _validate_structured_response(
+        self, response: dict[str, Any], response_model: type[BaseModel]
+    ) -> dict[str, Any]:
+        """
+        Validate a structured response's raw content against its model.
+
+        The validated model is dumped back into response["content"], so
+        callers keep consuming a dict as in unstructured mode.
+
+        Raises:
+            StructuredOutputError: If the response does not match the schema
+        """
+        try:
+            parsed = parse_structured_output(
+                response.get("raw_content"), response_model
+            )
+        except StructuredOutputError:
+            self.record_parse_failure()
+            raise
+        response["content"] = parsed.model_dump(mode="json")
+        return response
+
+    def _lookup_cached_response(
+        self,
+        prompt: str,
+        model: str | None,
+        max_tokens: int,
+        temperature: float,
+        kwargs: dict[str, Any],
+    ) -> tuple[Any, str | None, dict[str, Any] | None]:
+        """
+        Check the response cache for an identical deterministic request.
+
+        The cache key doubles as the single-flight key, so it is computed
+        for deterministic requests whenever caching or coalescing is on.
+        Lookups are skipped inside cache_refresh(). The key is remembered
+        so that record_parse_failure()/record_retry() can drop the entry.
+
+        Returns:
+            Tuple of (cache, cache_key, cached_response). cache_key is None
+            when the request is not deterministic; cache is None when
+            caching is off.
+        """
+        from asp.utils.llm_cache import (
+            cache_refresh_active,
+            is_cacheable,
+            make_cache_key,
+        )
+        from asp.utils.single_flight import single_flight_enabled
+
+        _last_cached_response.set(None)
+        if not is_cacheable(temperature):
+            return None, None, None
+        cache = self.llm_cache
+        if cache is None and not single_flight_enabled():
+            return None, None, None
+
+        client_type = type(self.llm_client)
+        extra = {k: v for k, v in kwargs.items() if k != "system"}
+        key = make_cache_key(
+            provider=getattr(client_type, "provider_name", client_type.__name__),
+            model=model or getattr(client_type, "DEFAULT_MODEL", "default"),
+            system=kwargs.get("system"),
+            prompt=prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            extra=extra,
+        )
+        if cache is None:
+            return None, key, None
+
+        _last_cached_response.set((self, cache, key))
+        cached = None if cache_refresh_active() else cache.get(key)
+        if cached is not None:
+            usage = cached.get("usage", {})
+            self._llm_call_stats["cache_hits"] += 1
+            self._llm_call_stats["tokens_saved"] += usage.get(
+                "input_tokens", 0
+            ) + usage.get("output_tokens", 0)
+            cached["cached"] = True
+            logger.info(f"{self.agent_name}: LLM cache hit ({key[:12]})")
+        else:
+            self._llm_call_stats["cache_misses"] += 1
+        return cache, key, cached
+
+    def _single_flight_call(
+        self, key: str | None, fn: Callable[[], dict[str, Any]]
+    ) -> tuple[dict[str, Any], bool]:
+        """
+        Run an LLM call, joining an identical call already in flight.
+
+        Returns:
+            Tuple of (response, coalesced)
+        """
+        from asp.utils.single_flight import get_single_flight
+
+        flight = get_single_flight() if key else None
+        if flight is None:
+            return fn(), False
+        response, coalesced = flight.do(key, fn)
+        if coalesced:
+            self._mark_coalesced(response, key)
+        return response, coalesced
+
+    async def _single_flight_call_async(
+        self, key: str | None, fn: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> tuple[dict[str, Any], bool]:
+        """Async variant of _single_flight_call()."""
+        from asp.utils.single_flight import get_single_flight
+
+        flight = get_single_flight() if key else None
+        if flight is None:
+            return await fn(), False
+        response, coalesced = await flight.do_async(key, fn)
+        if coalesced:
+            self._mark_coalesced(response, key)
+        return response, coalesced
+
+    def _mark_coalesced(self, response: dict[str, Any], key: str) -> None:
+        """Count a response shared from another caller's in-flight request."""
+        self._llm_call_stats["coalesced_calls"] += 1
+        response["coalesced"] = True
+        logger.info(f"{self.agent_name}: Joined in-flight LLM call ({key[:12]})")
+
+    def _record_llm_usage(
+        self, response: dict[str, Any], model: str | None, cached: bool = False
+    ) -> None:
+        """Store usage data from the last LLM call for telemetry."""
+        usage = response.get("usage", {})
+        input_tokens = 0 if cached else usage.get("input_tokens", 0)
+        output_tokens = 0 if cached else usage.get("output_tokens", 0)
+        if not cached:
+            self._llm_call_stats["prompt_cache_read_tokens"] += usage.get(
+                "cache_read_input_tokens", 0
+            )
+            self._llm_call_stats["prompt_cache_write_tokens"] += usage.get(
+                "cache_creation_input_tokens", 0
+            )
+            self._llm_call_stats["continuations"] += response.get("continuations", 0)
+        self._last_llm_usage = {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+            "cost": 0.0 if cached else response.get("cost", 0.0),
+            "model": response.get("model", model or "unknown"),
+            "structured_output": self.structured_output,
+            **self._llm_call_stats,
+        }
+
     def load_prompt(self, prompt_name: str) -> str:
         """
         Load prompt template from file.
@@ -145,50 +431,73 @@ class BaseAgent(ABC):
         model: str | None = None,
         max_tokens: int = 4096,
         temperature: float = 0.0,
+        response_model: type[BaseModel] | None = None,
         **kwargs,
     ) -> dict[str, Any]:
         """
         Call LLM with retry logic and telemetry.
 
         This method wraps the LLM client's call_with_retry method and provides
-        consistent error handling and logging.
+        consistent error handling and logging. Deterministic calls
+        (temperature == 0) are served from the LLM response cache when
+        ASP_LLM_CACHE is enabled. A response the caller rejects via
+        record_parse_failure() or record_retry() is dropped from the cache.
 
         Args:
             prompt: Formatted prompt string
             model: Optional model name (overrides default)
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature (0.0 = deterministic)
+            response_model: Optional Pydantic model the response must match.
+                When structured output is enabled (ASP_STRUCTURED_OUTPUT),
+                the model's JSON schema constrains the LLM output and the
+                raw response is validated with model_validate_json()
             **kwargs: Additional arguments passed to LLM client
 
         Returns:
             Dict containing LLM response (format depends on client)
 
         Raises:
-            AgentExecutionError: If LLM call fails after retries
+            AgentExecutionError: If LLM call fails after retries, or a
+                structured response does not match response_model
         """
+        # A tight run budget switches to its fallback model
+        model = budget_model(model)
         try:
             logger.info(
                 f"{self.agent_name}: Calling LLM "
                 f"(model={model or 'default'}, max_tokens={max_tokens}, temp={temperature})"
             )
 
-            response = self.llm_client.call_with_retry(
-                prompt=prompt,
-                model=model,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                **kwargs,
+            kwargs = self._structured_call_kwargs(response_model, kwargs)
+            cache, cache_key, cached = self._lookup_cached_response(
+                prompt, model, max_tokens, temperature, kwargs
             )
+            if cached is not None:
+                self._record_llm_usage(cached, model, cached=True)
+                return cached
+
+            response, coalesced = self._single_flight_call(
+                cache_key,
+                lambda: budgeted_call(
+                    lambda: self.llm_client.call_with_retry(
+                        prompt=prompt,
+                        model=model,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        **kwargs,
+                    )
+                ),
+            )
+
+            # Store usage data for telemetry (a coalesced call is not billed)
+            self._record_llm_usage(response, model, cached=coalesced)
+
+            if response_model is not None and self.structured_output:
+                response = self._validate_structured_response(response, response_model)
 
-            # Store usage data for telemetry
-            self._last_llm_usage = {
-                "input_tokens": response.get("usage", {}).get("input_tokens", 0),
-                "output_tokens": response.get("usage", {}).get("output_tokens", 0),
-                "total_tokens": response.get("usage", {}).get("input_tokens", 0)
-                + response.get("usage", {}).get("output_tokens", 0),
-                "cost": response.get("cost", 0.0),
-                "model": response.get("model", model or "unknown"),
-            }
+            if cache is not None and not coalesced:
+                cache.set(cache_key, response, model=model)
 
             logger.info(f"{self.agent_name}: LLM call successful")
             return response
@@ -205,6 +514,7 @@ class BaseAgent(ABC):
         model: str | None = None,
         max_tokens: int = 4096,
         temperature: float = 0.0,
+        response_model: type[BaseModel] | None = None,
         **kwargs,
     ) -> dict[str, Any]:
         """
@@ -219,37 +529,55 @@ class BaseAgent(ABC):
             model: Optional model name (overrides default)
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature (0.0 = deterministic)
+            response_model: Optional Pydantic model the response must match.
+                When structured output is enabled (ASP_STRUCTURED_OUTPUT),
+                the model's JSON schema constrains the LLM output and the
+                raw response is validated with model_validate_json()
             **kwargs: Additional arguments passed to LLM client
 
         Returns:
             Dict containing LLM response (format depends on client)
 
         Raises:
-            AgentExecutionError: If LLM call fails after retries
+            AgentExecutionError: If LLM call fails after retries, or a
+                structured response does not match response_model
         """
+        model = budget_model(model)
         try:
             logger.info(
                 f"{self.agent_name}: Async calling LLM "
                 f"(model={model or 'default'}, max_tokens={max_tokens}, temp={temperature})"
             )
 
-            response = await self.llm_client.call_with_retry_async(
-                prompt=prompt,
-                model=model,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                **kwargs,
+            kwargs = self._structured_call_kwargs(response_model, kwargs)
+            cache, cache_key, cached = self._lookup_cached_response(
+                prompt, model, max_tokens, temperature, kwargs
             )
+            if cached is not None:
+                self._record_llm_usage(cached, model, cached=True)
+                return cached
+
+            response, coalesced = await self._single_flight_call_async(
+                cache_key,
+                lambda: budgeted_call_async(
+                    lambda: self.llm_client.call_with_retry_async(
+                        prompt=prompt,
+                        model=model,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        **kwargs,
+                    )
+                ),
+            )
+
+            # Store usage data for telemetry (a coalesced call is not billed)
+            self._record_llm_usage(response, model, cached=coalesced)
+
+            if response_model is not None and self.structured_output:
+                response = self._validate_structured_response(response, response_model)
 
-            # Store usage data for telemetry
-            self._last_llm_usage = {
-                "input_tokens": response.get("usage", {}).get("input_tokens", 0),
-                "output_tokens": response.get("usage", {}).get("output_tokens", 0),
-                "total_tokens": response.get("usage", {}).get("input_tokens", 0)
-                + response.get("usage", {}).get("output_tokens", 0),
-                "cost": response.get("cost", 0.0),
-                "model": response.get("model", model or "unknown"),
-            }
+            if cache is not None and not coalesced:
+                cache.set(cache_key, response, model=model)
 
             logger.info(f"{self.agent_name}: Async LLM call successful")
             return response
@@ -260,6 +588,90 @@ class BaseAgent(ABC):
                 f"{self.agent_name} failed during async LLM call: {e}"
             ) from e
 
+    async def call_llm_streaming_async(
+        self,
+        prompt: str,
+        on_text: Callable[[str], None],
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """
+        Asynchronous streaming LLM call with telemetry.
+
+        Text deltas are forwarded to on_text as they arrive, so callers can
+        parse partial output incrementally. Response-cache hits, and clients
+        without streaming support, deliver the whole response to on_text in
+        a single call.
+
+        Args:
+            prompt: Formatted prompt string
+            on_text: Callback invoked with each text delta
+            model: Optional model name (overrides default)
+            max_tokens: Maximum tokens in response
+            temperature: Sampling temperature (0.0 = deterministic)
+            **kwargs: Additional arguments passed to LLM client
+
+        Returns:
+            Dict containing the complete LLM response
+
+        Raises:
+            AgentExecutionError: If LLM call fails
+        """
+        model = budget_model(model)
+        try:
+            logger.info(
+                f"{self.agent_name}: Streaming LLM call "
+                f"(model={model or 'default'}, max_tokens={max_tokens}, temp={temperature})"
+            )
+
+            cache, cache_key, cached = self._lookup_cached_response(
+                prompt, model, max_tokens, temperature, kwargs
+            )
+            if cached is not None:
+                self._record_llm_usage(cached, model, cached=True)
+                on_text(cached.get("raw_content") or "")
+                return cached
+
+            streaming_call = getattr(self.llm_client, "call_streaming_async", None)
+            if asyncio.iscoroutinefunction(streaming_call):
+                response = await budgeted_call_async(
+                    lambda: streaming_call(
+                        prompt=prompt,
+                        on_text=on_text,
+                        model=model,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        **kwargs,
+                    )
+                )
+            else:
+                response = await budgeted_call_async(
+                    lambda: self.llm_client.call_with_retry_async(
+                        prompt=prompt,
+                        model=model,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        **kwargs,
+                    )
+                )
+                on_text(response.get("raw_content") or "")
+
+            if cache is not None:
+                cache.set(cache_key, response, model=model)
+
+            self._record_llm_usage(response, model)
+
+            logger.info(f"{self.agent_name}: Streaming LLM call successful")
+            return response
+
+        except Exception as e:
+            logger.error(f"{self.agent_name}: Streaming LLM call failed: {e}")
+            raise AgentExecutionError(
+                f"{self.agent_name} failed during streaming LLM call: {e}"
+            ) from e
+
     def validate_output(
         self,
         data: dict[str, Any],
@@ -350,9 +762,9 @@ class BaseAgent(ABC):
         Raises:
             AgentExecutionError: If execution fails
         """
-        # Default: run sync version in thread pool (backward compatible)
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self.execute, input_data)
+        # Default: run sync version in thread pool (backward compatible);
+        # to_thread carries context (e.g. the LLM budget scope) into the worker
+        return await asyncio.to_thread(self.execute, input_data)
 
 
 class AgentExecutionError(Exception):
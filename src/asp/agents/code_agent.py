@@ -13,8 +13,10 @@ Author: ASP Development Team
 Date: November 17, 2025
 """
 
+import asyncio
 import logging
 import os
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -27,6 +29,9 @@ from asp.models.code import (
     GeneratedCode,
     GeneratedFile,
 )
+from asp.models.code_review import CodeIssue
+from asp.models.test import TestDefect
+from asp.parsers.incremental import IncrementalJSONArrayParser
 from asp.telemetry import track_agent_cost
 from asp.utils.artifact_io import (
     write_artifact_json,
@@ -75,6 +80,7 @@ class CodeAgent(BaseAgent):
         db_path: Path | None = None,
         llm_client: Any | None = None,
         use_multi_stage: bool | None = None,
+        use_streaming: bool | None = None,
     ):
         """
         Initialize Code Agent.
@@ -86,6 +92,10 @@ class CodeAgent(BaseAgent):
                 If None, checks ASP_MULTI_STAGE_CODE_GEN environment variable.
                 If True, uses multi-stage generation (manifest + individual files).
                 If False, uses legacy single-call generation.
+            use_streaming: Optional flag to stream the manifest in async
+                multi-stage generation, starting each file as soon as its
+                manifest entry is complete. If None, checks
+                ASP_STREAMING_CODE_GEN environment variable.
         """
         super().__init__(db_path=db_path, llm_client=llm_client)
         self.agent_version = "1.0.0"
@@ -98,6 +108,13 @@ class CodeAgent(BaseAgent):
                 os.getenv("ASP_MULTI_STAGE_CODE_GEN", "false").lower() == "true"
             )
 
+        if use_streaming is not None:
+            self.use_streaming = use_streaming
+        else:
+            self.use_streaming = (
+                os.getenv("ASP_STREAMING_CODE_GEN", "false").lower() == "true"
+            )
+
         mode = "multi-stage" if self.use_multi_stage else "single-call"
         logger.info(f"CodeAgent initialized (mode: {mode})")
 
@@ -151,67 +168,74 @@ class CodeAgent(BaseAgent):
             )
 
             # Write artifacts to filesystem (if enabled)
-            try:
-                artifact_files = []
+            self._write_artifacts(generated_code)
 
-                # Write code manifest as JSON (GeneratedCode metadata only)
-                manifest_path = write_artifact_json(
-                    task_id=generated_code.task_id,
-                    artifact_type="code_manifest",
-                    data=generated_code,
-                )
-                logger.debug(f"Wrote code manifest JSON: {manifest_path}")
-                artifact_files.append(str(manifest_path))
+            return generated_code
 
-                # Write code manifest as Markdown (human-readable overview)
-                markdown_content = render_code_manifest_markdown(generated_code)
-                md_path = write_artifact_markdown(
-                    task_id=generated_code.task_id,
-                    artifact_type="code_manifest",
-                    markdown_content=markdown_content,
-                )
-                logger.debug(f"Wrote code manifest Markdown: {md_path}")
-                artifact_files.append(str(md_path))
+        except Exception as e:
+            logger.error(f"CodeAgent execution failed: {e}")
+            raise AgentExecutionError(f"Code generation failed: {e}") from e
 
-                # Write each generated file to artifacts/{task_id}/generated_code/
-                from pathlib import Path
+    def _write_artifacts(self, generated_code: GeneratedCode) -> None:
+        """
+        Write the code manifest and generated files to artifacts/{task_id}/.
 
-                generated_code_base = (
-                    Path("artifacts") / generated_code.task_id / "generated_code"
-                )
+        Failures are logged and never raised: artifact persistence is not
+        critical to code generation.
+        """
+        try:
+            artifact_files = []
 
-                for file in generated_code.files:
-                    file_path = write_generated_file(
-                        task_id=generated_code.task_id,
-                        file=file,
-                        base_path=str(generated_code_base),
-                    )
-                    logger.debug(f"Wrote generated file: {file_path}")
-                    artifact_files.append(str(file_path))
-
-                # Commit to git (if in repository)
-                if is_git_repository():
-                    commit_hash = git_commit_artifact(
-                        task_id=generated_code.task_id,
-                        agent_name="Code Agent",
-                        artifact_files=artifact_files,
-                    )
-                    if commit_hash:
-                        logger.info(
-                            f"Committed {len(artifact_files)} artifacts: {commit_hash}"
-                        )
-                else:
-                    logger.warning("Not in git repository, skipping commit")
+            # Write code manifest as JSON (GeneratedCode metadata only)
+            manifest_path = write_artifact_json(
+                task_id=generated_code.task_id,
+                artifact_type="code_manifest",
+                data=generated_code,
+            )
+            logger.debug(f"Wrote code manifest JSON: {manifest_path}")
+            artifact_files.append(str(manifest_path))
+
+            # Write code manifest as Markdown (human-readable overview)
+            markdown_content = render_code_manifest_markdown(generated_code)
+            md_path = write_artifact_markdown(
+                task_id=generated_code.task_id,
+                artifact_type="code_manifest",
+                markdown_content=markdown_content,
+            )
+            logger.debug(f"Wrote code manifest Markdown: {md_path}")
+            artifact_files.append(str(md_path))
 
-            except Exception as e:
-                # Log but don't fail - artifact persistence is not critical
-                logger.warning(f"Failed to write artifacts: {e}", exc_info=True)
+            # Write each generated file to artifacts/{task_id}/generated_code/
+            generated_code_base = (
+                Path("artifacts") / generated_code.task_id / "generated_code"
+            )
 
-            return generated_code
+            for file in generated_code.files:
+                file_path = write_generated_file(
+                    task_id=generated_code.task_id,
+                    file=file,
+                    base_path=str(generated_code_base),
+                )
+                logger.debug(f"Wrote generated file: {file_path}")
+                artifact_files.append(str(file_path))
+
+            # Commit to git (if in repository)
+            if is_git_repository():
+                commit_hash = git_commit_artifact(
+                    task_id=generated_code.task_id,
+                    agent_name="Code Agent",
+                    artifact_files=artifact_files,
+                )
+                if commit_hash:
+                    logger.info(
+                        f"Committed {len(artifact_files)} artifacts: {commit_hash}"
+                    )
+            else:
+                logger.warning("Not in git repository, skipping commit")
 
         except Exception as e:
-            logger.error(f"CodeAgent execution failed: {e}")
-            raise AgentExecutionError(f"Code generation failed: {e}") from e
+            # Log but don't fail - artifact persistence is not critical
+            logger.warning(f"Failed to write artifacts: {e}", exc_info=True)
 
     def _generate_code(self, input_data: CodeInput) -> GeneratedCode:
         """
@@ -305,6 +329,7 @@ class CodeAgent(BaseAgent):
                     content = json.loads(json_str)
                     logger.debug("Successfully extracted JSON from markdown code fence")
                 except json.JSONDecodeError as e:
+                    self.record_parse_failure()
                     # Provide more helpful error message with the actual JSON string attempted
                     json_preview = json_match.group(1).strip()[:500]
                     raise AgentExecutionError(
@@ -317,12 +342,14 @@ class CodeAgent(BaseAgent):
                     content = json.loads(content)
                     logger.debug("Successfully parsed string content as JSON")
                 except json.JSONDecodeError as e:
+                    self.record_parse_failure()
                     raise AgentExecutionError(
                         f"LLM returned non-JSON response: {content[:500]}...\n"
                         f"Expected JSON matching GeneratedCode schema"
                     ) from e
 
         if not isinstance(content, dict):
+            self.record_parse_failure()
             raise AgentExecutionError(
                 f"LLM returned non-dict response after parsing: {type(content)}\n"
                 f"Expected JSON matching GeneratedCode schema"
@@ -489,6 +516,32 @@ class CodeAgent(BaseAgent):
         Raises:
             AgentExecutionError: If LLM call fails or response is invalid
         """
+        formatted_prompt = self._build_manifest_prompt(input_data)
+
+        # Call LLM to generate manifest
+        # Manifest is small, so use lower token limit
+        response = self.call_llm(
+            prompt=formatted_prompt,
+            max_tokens=4000,  # Sufficient for manifest (no code content)
+            temperature=0.0,  # Deterministic for manifest generation
+            response_model=FileManifest,
+        )
+
+        return self._parse_manifest_response(response)
+
+    def _build_manifest_prompt(self, input_data: CodeInput) -> str:
+        """
+        Format the manifest generation prompt for a task.
+
+        Args:
+            input_data: CodeInput with design specification and standards
+
+        Returns:
+            Formatted manifest prompt
+
+        Raises:
+            AgentExecutionError: If the prompt template is missing
+        """
         # Load manifest generation prompt template
         try:
             prompt_template = self.load_prompt("code_agent_v2_manifest")
@@ -511,14 +564,24 @@ class CodeAgent(BaseAgent):
 
         logger.debug(f"Generated manifest prompt ({len(formatted_prompt)} chars)")
 
-        # Call LLM to generate manifest
-        # Manifest is small, so use lower token limit
-        response = self.call_llm(
-            prompt=formatted_prompt,
-            max_tokens=4000,  # Sufficient for manifest (no code content)
-            temperature=0.0,  # Deterministic for manifest generation
-        )
+        return formatted_prompt
+
+    def _parse_manifest_response(self, response: dict[str, Any]) -> FileManifest:
+        """
+        Parse and validate a manifest LLM response into a FileManifest.
+
+        Accepts parsed JSON content, a bare JSON string, or JSON wrapped in
+        a markdown code fence.
 
+        Args:
+            response: LLM response dict
+
+        Returns:
+            Validated FileManifest
+
+        Raises:
+            AgentExecutionError: If the response is not a valid manifest
+        """
         # Parse response
         content = response.get("content")
 
@@ -535,6 +598,7 @@ class CodeAgent(BaseAgent):
                     content = json.loads(json_str)
                     logger.debug("Successfully extracted JSON from markdown code fence")
                 except json.JSONDecodeError as e:
+                    self.record_parse_failure()
                     json_preview = json_match.group(1).strip()[:500]
                     raise AgentExecutionError(
                         f"Failed to parse manifest JSON from markdown fence: {e}\n"
@@ -546,12 +610,14 @@ class CodeAgent(BaseAgent):
                     content = json.loads(content)
                     logger.debug("Successfully parsed string content as JSON")
                 except json.JSONDecodeError as e:
+                    self.record_parse_failure()
                     raise AgentExecutionError(
                         f"LLM returned non-JSON response: {content[:500]}...\n"
                         f"Expected JSON matching FileManifest schema"
                     ) from e
 
         if not isinstance(content, dict):
+            self.record_parse_failure()
             raise AgentExecutionError(
                 f"LLM returned non-dict response after parsing: {type(content)}\n"
                 f"Expected JSON matching FileManifest schema"
@@ -598,48 +664,54 @@ class CodeAgent(BaseAgent):
             )
             raise AgentExecutionError(f"Manifest validation failed: {e}") from e
 
-    def _generate_file_content(
+    def _build_file_generation_prompts(
         self,
         file_meta: FileMetadata,
         input_data: CodeInput,
-        max_retries: int = 3,
-    ) -> str:
+        feedback: str | None = None,
+        previous_content: str | None = None,
+    ) -> tuple[str, str]:
         """
-        Generate content for a single file using LLM (Phase 2 of multi-stage generation).
+        Build the shared design context and per-file prompt for file generation.
 
-        This is Phase 2 of the multi-stage code generation process. It generates
-        the actual code content for a single file based on the file metadata and
-        design specification.
-
-        The LLM returns RAW CODE CONTENT (no JSON wrapping), which avoids the
-        JSON escaping issues that occur with large code blocks.
+        The design context (generation instructions, design specification and
+        coding standards) is identical for every file in the manifest and is
+        sent as a cached prompt prefix, so only the short per-file prompt is
+        processed fresh for each file.
 
         Args:
             file_meta: FileMetadata with file path, type, description, etc.
             input_data: CodeInput with design specification and standards
-            max_retries: Maximum number of retry attempts if generation fails
+            feedback: Optional issues to fix; switches to the revision prompt
+            previous_content: Content of the file being revised
 
         Returns:
-            str: Raw file content (code, documentation, config, etc.)
+            Tuple of (design_context, file_prompt)
 
         Raises:
-            AgentExecutionError: If LLM call fails after retries or content is invalid
+            AgentExecutionError: If a prompt template is missing
         """
-        # Load file generation prompt template
+        task_prompt = (
+            "code_agent_v2_file_revision" if feedback else "code_agent_v2_file_task"
+        )
         try:
-            prompt_template = self.load_prompt("code_agent_v2_file_generation")
+            context_template = self.load_prompt("code_agent_v2_file_generation")
+            task_template = self.load_prompt(task_prompt)
         except FileNotFoundError as e:
             raise AgentExecutionError(
                 f"File generation prompt template not found: {e}"
             ) from e
 
-        # Format prompt with file metadata and design specification
-        # Escape curly braces in design specification JSON to avoid format() issues
-        design_spec_json = input_data.design_specification.model_dump_json(indent=2)
-        design_spec_escaped = design_spec_json.replace("{", "{{").replace("}", "}}")
-
-        formatted_prompt = self.format_prompt(
-            prompt_template,
+        design_context = self.format_prompt(
+            context_template,
+            design_specification=input_data.design_specification.model_dump_json(
+                indent=2
+            ),
+            coding_standards=input_data.coding_standards
+            or "Follow industry best practices",
+        )
+        file_prompt = self.format_prompt(
+            task_template,
             file_path=file_meta.file_path,
             file_type=file_meta.file_type,
             description=file_meta.description,
@@ -649,9 +721,44 @@ class CodeAgent(BaseAgent):
             dependencies=(
                 ", ".join(file_meta.dependencies) if file_meta.dependencies else "None"
             ),
-            design_specification=design_spec_escaped,
-            coding_standards=input_data.coding_standards
-            or "Follow industry best practices",
+            feedback=feedback or "",
+            previous_content=previous_content or "",
+        )
+        return design_context, file_prompt
+
+    def _generate_file_content(
+        self,
+        file_meta: FileMetadata,
+        input_data: CodeInput,
+        max_retries: int = 3,
+        feedback: str | None = None,
+        previous_content: str | None = None,
+    ) -> str:
+        """
+        Generate content for a single file using LLM (Phase 2 of multi-stage generation).
+
+        This is Phase 2 of the multi-stage code generation process. It generates
+        the actual code content for a single file based on the file metadata and
+        design specification.
+
+        The LLM returns RAW CODE CONTENT (no JSON wrapping), which avoids the
+        JSON escaping issues that occur with large code blocks.
+
+        Args:
+            file_meta: FileMetadata with file path, type, description, etc.
+            input_data: CodeInput with design specification and standards
+            max_retries: Maximum number of retry attempts if generation fails
+            feedback: Optional issues to fix when revising an existing file
+            previous_content: Content of the file being revised
+
+        Returns:
+            str: Raw file content (code, documentation, config, etc.)
+
+        Raises:
+            AgentExecutionError: If LLM call fails after retries or content is invalid
+        """
+        design_context, formatted_prompt = self._build_file_generation_prompts(
+            file_meta, input_data, feedback, previous_content
         )
 
         logger.debug(
@@ -671,6 +778,7 @@ class CodeAgent(BaseAgent):
                     prompt=formatted_prompt,
                     max_tokens=max_tokens,
                     temperature=0.0,  # Deterministic for code generation
+                    cached_prefix=design_context,
                 )
 
                 # Extract content - use raw_content to avoid JSON parsing
@@ -711,6 +819,7 @@ class CodeAgent(BaseAgent):
             except Exception as e:
                 last_error = e
                 if attempt < max_retries - 1:
+                    self.record_retry()
                     logger.warning(
                         f"File generation attempt {attempt + 1}/{max_retries} failed "
                         f"for {file_meta.file_path}: {e}. Retrying..."
@@ -842,6 +951,154 @@ class CodeAgent(BaseAgent):
 
         return generated_code
 
+    @track_agent_cost(
+        agent_role="Code",
+        task_id_param="input_data.task_id",
+        llm_model="claude-sonnet-4-20250514",
+        llm_provider="anthropic",
+        agent_version="1.0.0",
+    )
+    def regenerate_files(
+        self,
+        input_data: CodeInput,
+        generated_code: GeneratedCode,
+        feedback: dict[str, str],
+    ) -> GeneratedCode:
+        """
+        Regenerate only the files named in feedback and splice them into the code.
+
+        Used by correction loops instead of execute(): each listed file is
+        revised through the multi-stage file generation path, with its issues
+        and previous content in the prompt, and every other file is kept as
+        is. The design context is sent as the same cached prefix used for
+        the original generation.
+
+        Args:
+            input_data: CodeInput the code was generated from
+            generated_code: Current GeneratedCode
+            feedback: Issues to fix as prompt text, keyed by file path
+
+        Returns:
+            GeneratedCode with the revised files replaced
+
+        Raises:
+            AgentExecutionError: If a file is unknown or regeneration fails
+        """
+        logger.info(
+            f"Regenerating {len(feedback)}/{generated_code.total_files} files "
+            f"for task_id={input_data.task_id}"
+        )
+
+        try:
+            revised = {}
+            for file in self._files_to_revise(generated_code, feedback):
+                content = self._generate_file_content(
+                    self._file_metadata(file),
+                    input_data,
+                    feedback=feedback[file.file_path],
+                    previous_content=file.content,
+                )
+                revised[file.file_path] = file.model_copy(update={"content": content})
+
+            updated_code = self._splice_files(generated_code, revised)
+            self._write_artifacts(updated_code)
+            return updated_code
+
+        except Exception as e:
+            logger.error(f"CodeAgent regeneration failed: {e}")
+            raise AgentExecutionError(f"Code regeneration failed: {e}") from e
+
+    @staticmethod
+    def format_review_feedback(issues: list[CodeIssue]) -> dict[str, str]:
+        """
+        Group code review issues by file into prompt text for regenerate_files.
+
+        Args:
+            issues: CodeIssue objects from a CodeReviewReport
+
+        Returns:
+            Formatted issue text keyed by file path
+        """
+        grouped: dict[str, list[str]] = {}
+        for issue in issues:
+            location = f" (line {issue.line_number})" if issue.line_number else ""
+            lines = [
+                f"- {issue.issue_id} [{issue.severity}, {issue.category}]{location}: "
+                f"{issue.description}",
+                f"  Evidence: {issue.evidence}",
+                f"  Impact: {issue.impact}",
+            ]
+            grouped.setdefault(issue.file_path, []).extend(lines)
+        return {path: "\n".join(lines) for path, lines in grouped.items()}
+
+    @staticmethod
+    def format_test_feedback(
+        defects_by_file: dict[str, list[TestDefect]],
+    ) -> dict[str, str]:
+        """
+        Format test defects as prompt text for regenerate_files.
+
+        Args:
+            defects_by_file: TestDefect objects keyed by the file to fix
+
+        Returns:
+            Formatted defect text keyed by file path
+        """
+        feedback = {}
+        for path, defects in defects_by_file.items():
+            lines = []
+            for defect in defects:
+                location = f" (line {defect.line_number})" if defect.line_number else ""
+                lines += [
+                    f"- {defect.defect_id} [{defect.severity}, {defect.defect_type}]"
+                    f"{location}: {defect.description}",
+                    f"  Evidence: {defect.evidence}",
+                ]
+            feedback[path] = "\n".join(lines)
+        return feedback
+
+    def _files_to_revise(
+        self, generated_code: GeneratedCode, feedback: dict[str, str]
+    ) -> list[GeneratedFile]:
+        """Return the generated files named in feedback, in generation order."""
+        known_paths = {file.file_path for file in generated_code.files}
+        unknown = sorted(set(feedback) - known_paths)
+        if unknown:
+            raise AgentExecutionError(
+                f"Cannot regenerate files not in the generated code: {unknown}"
+            )
+        return [file for file in generated_code.files if file.file_path in feedback]
+
+    @staticmethod
+    def _file_metadata(file: GeneratedFile) -> FileMetadata:
+        """Rebuild the manifest entry of an already generated file."""
+        return FileMetadata(
+            file_path=file.file_path,
+            file_type=file.file_type,
+            semantic_unit_id=file.semantic_unit_id,
+            component_id=file.component_id,
+            description=file.description,
+            estimated_lines=max(1, len(file.content.splitlines())),
+        )
+
+    @staticmethod
+    def _splice_files(
+        generated_code: GeneratedCode, revised: dict[str, GeneratedFile]
+    ) -> GeneratedCode:
+        """Replace revised files in generated_code and refresh its totals."""
+        files = [revised.get(file.file_path, file) for file in generated_code.files]
+        total_loc = sum(
+            len([line for line in file.content.split("\n") if line.strip()])
+            for file in files
+        )
+        return generated_code.model_copy(
+            update={
+                "files": files,
+                "total_lines_of_code": total_loc,
+                "generation_timestamp": datetime.now().isoformat(),
+            }
+        )
+
     # =========================================================================
     # Async Methods (ADR 008 Phase 2)
     # =========================================================================
@@ -874,11 +1131,8 @@ class CodeAgent(BaseAgent):
                 generated_code = await self._generate_code_multi_stage_async(input_data)
             else:
                 # Single-stage: run sync version in thread pool (legacy)
-                import asyncio
-
-                loop = asyncio.get_running_loop()
-                generated_code = await loop.run_in_executor(
-                    None, self._generate_code_single_stage, input_data
+                generated_code = await asyncio.to_thread(
+                    self._generate_code_single_stage, input_data
                 )
 
             # Log summary
@@ -894,6 +1148,59 @@ class CodeAgent(BaseAgent):
             logger.error(f"CodeAgent async execution failed: {e}")
             raise AgentExecutionError(f"Code generation failed: {e}") from e
 
+    async def regenerate_files_async(
+        self,
+        input_data: CodeInput,
+        generated_code: GeneratedCode,
+        feedback: dict[str, str],
+    ) -> GeneratedCode:
+        """
+        Asynchronous version of regenerate_files.
+
+        Revised files are generated concurrently with the same concurrency
+        limit as async multi-stage generation.
+
+        Args:
+            input_data: CodeInput the code was generated from
+            generated_code: Current GeneratedCode
+            feedback: Issues to fix as prompt text, keyed by file path
+
+        Returns:
+            GeneratedCode with the revised files replaced
+
+        Raises:
+            AgentExecutionError: If a file is unknown or regeneration fails
+        """
+        from asp.orchestrators.parallel import gather_with_concurrency
+
+        logger.info(
+            f"Regenerating (async) {len(feedback)}/{generated_code.total_files} "
+            f"files for task_id={input_data.task_id}"
+        )
+
+        async def revise(file: GeneratedFile) -> GeneratedFile:
+            content = await self._generate_file_content_async(
+                self._file_metadata(file),
+                input_data,
+                feedback=feedback[file.file_path],
+                previous_content=file.content,
+            )
+            return file.model_copy(update={"content": content})
+
+        try:
+            max_concurrent = 3  # Match AsyncConfig.max_concurrent_codegen
+            files = self._files_to_revise(generated_code, feedback)
+            revised_files = await gather_with_concurrency(
+                max_concurrent, *(revise(file) for file in files)
+            )
+            return self._splice_files(
+                generated_code, {file.file_path: file for file in revised_files}
+            )
+
+        except Exception as e:
+            logger.error(f"CodeAgent async regeneration failed: {e}")
+            raise AgentExecutionError(f"Code regeneration failed: {e}") from e
+
     async def _generate_code_multi_stage_async(
         self, input_data: CodeInput
     ) -> GeneratedCode:
@@ -903,6 +1210,9 @@ class CodeAgent(BaseAgent):
         Phase 1: Generate file manifest (async LLM call)
         Phase 2: Generate file contents in parallel (concurrent async LLM calls)
 
+        With use_streaming the two phases overlap: the manifest is streamed
+        and each file starts generating as soon as its entry is complete.
+
         Args:
             input_data: CodeInput with design specification and standards
 
@@ -916,21 +1226,6 @@ class CodeAgent(BaseAgent):
             f"Starting async multi-stage code generation for task_id={input_data.task_id}"
         )
 
-        # Phase 1: Generate file manifest (async)
-        logger.info("Phase 1: Generating file manifest (async)...")
-        manifest = await self._generate_file_manifest_async(input_data)
-
-        logger.info(
-            f"Manifest generated: {manifest.total_files} files, "
-            f"{manifest.total_estimated_lines} estimated LOC"
-        )
-
-        # Phase 2: Generate content for each file IN PARALLEL
-        logger.info(
-            f"Phase 2: Generating content for {manifest.total_files} files in parallel..."
-        )
-
-        # Create async tasks for all files
         from asp.orchestrators.parallel import gather_with_concurrency
 
         async def generate_file_task(file_meta: FileMetadata) -> GeneratedFile:
@@ -947,16 +1242,67 @@ class CodeAgent(BaseAgent):
 
         # Run file generation with limited concurrency (respect API rate limits)
         max_concurrent = 3  # Match AsyncConfig.max_concurrent_codegen
-        tasks = [generate_file_task(fm) for fm in manifest.files]
-        generated_files = await gather_with_concurrency(max_concurrent, *tasks)
+
+        if self.use_streaming:
+            # Phases 1 and 2 overlap: files start as manifest entries stream in
+            logger.info("Streaming file manifest and generating files (async)...")
+            manifest, generated_files = await self._generate_files_streaming_async(
+                input_data, generate_file_task, max_concurrent
+            )
+        else:
+            # Phase 1: Generate file manifest (async)
+            logger.info("Phase 1: Generating file manifest (async)...")
+            manifest = await self._generate_file_manifest_async(input_data)
+
+            logger.info(
+                f"Manifest generated: {manifest.total_files} files, "
+                f"{manifest.total_estimated_lines} estimated LOC"
+            )
+
+            # Phase 2: Generate content for each file IN PARALLEL
+            logger.info(
+                f"Phase 2: Generating content for {manifest.total_files} files in parallel..."
+            )
+            tasks = [generate_file_task(fm) for fm in manifest.files]
+            generated_files = await gather_with_concurrency(
+                max_concurrent, *tasks, return_exceptions=True
+            )
 
         # Check for any errors in results
-        errors = [r for r in generated_files if isinstance(r, Exception)]
+        errors = [r for r in generated_files if isinstance(r, BaseException)]
         if errors:
             raise AgentExecutionError(
                 f"Failed to generate {len(errors)} files: {errors[0]}"
             )
 
+        generated_code = self.assemble_generated_code(
+            input_data, manifest, generated_files
+        )
+
+        logger.info(
+            f"Async multi-stage code generation complete: {generated_code.total_files} files, "
+            f"{generated_code.total_lines_of_code} LOC"
+        )
+
+        return generated_code
+
+    def assemble_generated_code(
+        self,
+        input_data: CodeInput,
+        manifest: FileManifest,
+        generated_files: list[GeneratedFile],
+    ) -> GeneratedCode:
+        """
+        Assemble GeneratedCode from a manifest and its generated files.
+
+        Args:
+            input_data: CodeInput the files were generated from
+            manifest: FileManifest the files were planned in
+            generated_files: Generated files, in manifest order
+
+        Returns:
+            GeneratedCode with file structure and totals
+        """
         # Build file_structure from generated files
         file_structure: dict[str, list[str]] = {}
         for file in generated_files:
@@ -1008,22 +1354,83 @@ class CodeAgent(BaseAgent):
             agent_version=self.agent_version,
             generation_timestamp=datetime.now().isoformat(),
         )
+        return generated_code
 
-        logger.info(
-            f"Async multi-stage code generation complete: {generated_code.total_files} files, "
-            f"{generated_code.total_lines_of_code} LOC"
-        )
+    async def generate_manifest_async(self, input_data: CodeInput) -> FileManifest:
+        """
+        Generate only the file manifest (stage 1 of multi-stage generation).
 
-        return generated_code
+        Used by schedulers that generate the manifest's files in groups
+        (see asp.orchestrators.dag_scheduler) rather than all at once.
+
+        Raises:
+            AgentExecutionError: If the manifest cannot be generated
+        """
+        try:
+            return await self._generate_file_manifest_async(input_data)
+        except AgentExecutionError:
+            raise
+        except Exception as e:
+            logger.error(f"CodeAgent manifest generation failed: {e}")
+            raise AgentExecutionError(f"Manifest generation failed: {e}") from e
+
+    async def generate_files_async(
+        self,
+        input_data: CodeInput,
+        file_metas: list[FileMetadata],
+    ) -> list[GeneratedFile]:
+        """
+        Generate the contents of some manifest entries concurrently.
+
+        Args:
+            input_data: CodeInput with design specification and standards
+            file_metas: Manifest entries to generate
+
+        Returns:
+            GeneratedFile objects in the order of file_metas
+
+        Raises:
+            AgentExecutionError: If any file fails to generate
+        """
+        from asp.orchestrators.parallel import gather_with_concurrency
+
+        async def generate(file_meta: FileMetadata) -> GeneratedFile:
+            content = await self._generate_file_content_async(file_meta, input_data)
+            return GeneratedFile(
+                file_path=file_meta.file_path,
+                content=content,
+                file_type=file_meta.file_type,
+                semantic_unit_id=file_meta.semantic_unit_id,
+                component_id=file_meta.component_id,
+                description=file_meta.description,
+            )
+
+        try:
+            max_concurrent = 3  # Match AsyncConfig.max_concurrent_codegen
+            return list(
+                await gather_with_concurrency(
+                    max_concurrent, *(generate(fm) for fm in file_metas)
+                )
+            )
+        except Exception as e:
+            logger.error(f"CodeAgent file generation failed: {e}")
+            raise AgentExecutionError(f"File generation failed: {e}") from e
 
     async def _generate_file_manifest_async(
-        self, input_data: CodeInput
+        self,
+        input_data: CodeInput,
+        on_file: Callable[[FileMetadata], None] | None = None,
     ) -> FileManifest:
         """
         Async version of _generate_file_manifest using async LLM call.
 
+        When on_file is given the manifest is streamed, and on_file is called
+        with each FileMetadata entry as soon as it is complete in the stream,
+        before the rest of the manifest has been generated.
+
         Args:
             input_data: CodeInput with design specification
+            on_file: Optional callback for each streamed manifest entry
 
         Returns:
             FileManifest with file metadata
@@ -1031,53 +1438,117 @@ class CodeAgent(BaseAgent):
         Raises:
             AgentExecutionError: If LLM call fails or response is invalid
         """
-        # Load prompt template
-        try:
-            prompt_template = self.load_prompt("code_agent_v2_manifest")
-        except FileNotFoundError as e:
-            raise AgentExecutionError(f"Prompt template not found: {e}") from e
+        formatted_prompt = self._build_manifest_prompt(input_data)
+
+        if on_file is None:
+            response = await self.call_llm_async(
+                prompt=formatted_prompt,
+                max_tokens=4000,
+                temperature=0.0,
+                response_model=FileManifest,
+            )
+            return self._parse_manifest_response(response)
 
-        # Format prompt
-        formatted_prompt = self.format_prompt(
-            prompt_template,
-            design_specification=input_data.design_specification.model_dump_json(
-                indent=2
-            ),
-            coding_standards=input_data.coding_standards
-            or "Follow industry best practices",
-        )
+        parser = IncrementalJSONArrayParser("files")
 
-        logger.debug(f"Generated manifest prompt ({len(formatted_prompt)} chars)")
+        def on_text(delta: str) -> None:
+            for item in parser.feed(delta):
+                try:
+                    file_meta = FileMetadata.model_validate(item)
+                except Exception as e:
+                    logger.debug(f"Skipping incomplete streamed manifest entry: {e}")
+                    continue
+                on_file(file_meta)
 
-        # Call LLM to generate manifest (async)
-        response = await self.call_llm_async(
+        response = await self.call_llm_streaming_async(
             prompt=formatted_prompt,
-            max_tokens=4096,
+            on_text=on_text,
+            max_tokens=4000,
             temperature=0.0,
         )
+        return self._parse_manifest_response(response)
 
-        # Parse response
-        content = response.get("content")
-        if not isinstance(content, dict):
-            raise AgentExecutionError(
-                f"LLM returned non-dict response: {type(content)}\n"
-                f"Expected JSON matching FileManifest schema"
+    async def _generate_files_streaming_async(
+        self,
+        input_data: CodeInput,
+        generate_file: Callable[[FileMetadata], Any],
+        max_concurrent: int,
+    ) -> tuple[FileManifest, list[GeneratedFile | BaseException]]:
+        """
+        Stream the manifest and generate files as their entries arrive.
+
+        File generation for each manifest entry starts while the model is
+        still writing the remaining entries. Once the full manifest is
+        validated, entries missed by the stream are started, and files that
+        were started but differ from (or are absent in) the final manifest
+        are cancelled and regenerated from the final entry.
+
+        Args:
+            input_data: CodeInput with design specification and standards
+            generate_file: Coroutine function generating one GeneratedFile
+            max_concurrent: Maximum concurrent file generations
+
+        Returns:
+            Tuple of (validated manifest, generated files in manifest order);
+            a file that failed to generate is returned as its exception
+
+        Raises:
+            AgentExecutionError: If manifest generation fails
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+        started: dict[str, tuple[FileMetadata, asyncio.Task]] = {}
+
+        async def limited(file_meta: FileMetadata) -> GeneratedFile:
+            async with semaphore:
+                return await generate_file(file_meta)
+
+        def start(file_meta: FileMetadata) -> None:
+            if file_meta.file_path in started:
+                return
+            logger.debug(f"Starting streamed file generation: {file_meta.file_path}")
+            started[file_meta.file_path] = (
+                file_meta,
+                asyncio.create_task(limited(file_meta)),
             )
 
-        # Validate against FileManifest schema
         try:
-            manifest = self.validate_output(content, FileManifest)
-            logger.debug(
-                f"Successfully validated FileManifest: {manifest.total_files} files"
+            manifest = await self._generate_file_manifest_async(
+                input_data, on_file=start
+            )
+
+            final_paths = {fm.file_path for fm in manifest.files}
+            for file_meta in manifest.files:
+                entry = started.get(file_meta.file_path)
+                if entry is not None and entry[0] != file_meta:
+                    entry[1].cancel()
+                    del started[file_meta.file_path]
+                start(file_meta)
+            for path in [p for p in started if p not in final_paths]:
+                started.pop(path)[1].cancel()
+
+            logger.info(
+                f"Manifest streamed: {manifest.total_files} files, "
+                f"{manifest.total_estimated_lines} estimated LOC"
             )
-            return manifest
-        except Exception as e:
-            raise AgentExecutionError(
-                f"Failed to validate FileManifest: {e}\nResponse content: {content}"
-            ) from e
+
+            generated_files = await asyncio.gather(
+                *(started[fm.file_path][1] for fm in manifest.files),
+                return_exceptions=True,
+            )
+        except BaseException:
+            for _, task in started.values():
+                task.cancel()
+            raise
+
+        return manifest, list(generated_files)
 
     async def _generate_file_content_async(
-        self, file_meta: FileMetadata, input_data: CodeInput, max_retries: int = 3
+        self,
+        file_meta: FileMetadata,
+        input_data: CodeInput,
+        max_retries: int = 3,
+        feedback: str | None = None,
+        previous_content: str | None = None,
     ) -> str:
         """
         Async version of _generate_file_content using async LLM call.
@@ -1086,6 +1557,8 @@ class CodeAgent(BaseAgent):
             file_meta: FileMetadata with file path, type, description
             input_data: CodeInput with design specification
             max_retries: Maximum retry attempts
+            feedback: Optional issues to fix when revising an existing file
+            previous_content: Content of the file being revised
 
         Returns:
             Generated file content as string
@@ -1093,33 +1566,8 @@ class CodeAgent(BaseAgent):
         Raises:
             AgentExecutionError: If generation fails after all retries
         """
-        # Load prompt template
-        try:
-            prompt_template = self.load_prompt("code_agent_v2_file_content")
-        except FileNotFoundError as e:
-            raise AgentExecutionError(f"Prompt template not found: {e}") from e
-
-        # Escape design specification for inclusion in prompt
-        design_spec_json = input_data.design_specification.model_dump_json(indent=2)
-        design_spec_escaped = (
-            design_spec_json.replace("\\", "\\\\").replace("{", "{{").replace("}", "}}")
-        )
-
-        # Format prompt
-        formatted_prompt = self.format_prompt(
-            prompt_template,
-            file_path=file_meta.file_path,
-            file_type=file_meta.file_type,
-            description=file_meta.description,
-            semantic_unit_id=file_meta.semantic_unit_id or "N/A",
-            component_id=file_meta.component_id or "N/A",
-            estimated_lines=file_meta.estimated_lines,
-            dependencies=(
-                ", ".join(file_meta.dependencies) if file_meta.dependencies else "None"
-            ),
-            design_specification=design_spec_escaped,
-            coding_standards=input_data.coding_standards
-            or "Follow industry best practices",
+        design_context, formatted_prompt = self._build_file_generation_prompts(
+            file_meta, input_data, feedback, previous_content
         )
 
         logger.debug(
@@ -1139,6 +1587,7 @@ class CodeAgent(BaseAgent):
                     prompt=formatted_prompt,
                     max_tokens=max_tokens,
                     temperature=0.0,
+                    cached_prefix=design_context,
                 )
 
                 # Extract content
@@ -1174,6 +1623,7 @@ class CodeAgent(BaseAgent):
             except Exception as e:
                 last_error = e
                 if attempt < max_retries - 1:
+                    self.record_retry()
                     logger.warning(
                         f"File generation attempt {attempt + 1}/{max_retries} failed "
                         f"for {file_meta.file_path}: {e}. Retrying..."
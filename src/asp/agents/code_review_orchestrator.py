@@ -10,10 +10,26 @@ Dispatches generated code to:
 - BestPracticesReviewAgent
 
 Aggregates results, deduplicates issues, resolves conflicts, generates CodeReviewReport.
+
+With an early-exit policy (asp.utils.review_fanout), the review gate is
+evaluated as specialist results arrive: once enough issues make the status
+FAIL regardless of the remaining specialists, they are either cancelled or
+only awaited to enrich the feedback. The report's verdict_duration_seconds
+is the time to that decision; review_duration_seconds remains the time to
+the full report.
+
+Specialist findings are cached per file (asp.utils.review_cache), so in
+correction loops specialists are only sent the files that changed since
+they last reviewed them.
+
+Code larger than max_shard_tokens is split into shards of related files
+(grouped by component); every specialist reviews every shard in parallel
+and the shard findings go through the usual deduplication.
 """
 
 import asyncio
 import logging
+import os
 from datetime import datetime
 from typing import Any
 
@@ -35,9 +51,22 @@ from asp.models.code_review import (
 )
 from asp.telemetry.telemetry import track_agent_cost
 from asp.utils.id_generation import generate_code_improvement_id, generate_code_issue_id
+from asp.utils.review_cache import (
+    CachedSpecialist,
+    ReviewResultsCache,
+    review_cache_enabled,
+)
+from asp.utils.review_fanout import (
+    fan_out,
+    resolve_early_exit,
+    shard_generated_code,
+)
 
 logger = logging.getLogger(__name__)
 
+# Estimated tokens of generated code per specialist prompt before sharding
+DEFAULT_MAX_SHARD_TOKENS = 30000
+
 
 class CodeReviewOrchestrator(BaseAgent):
     """
@@ -47,10 +76,16 @@ class CodeReviewOrchestrator(BaseAgent):
     Documentation, and BestPractices review agents.
     """
 
+    # Specialists still consulted when the run budget is tight
+    CORE_SPECIALISTS = ("code_security", "code_quality")
+
     def __init__(
         self,
         llm_client: Any | None = None,
         db_path: str | None = None,
+        early_exit: str | None = None,
+        review_cache: bool | None = None,
+        max_shard_tokens: int | None = None,
     ):
         """
         Initialize Code Review Orchestrator.
@@ -58,12 +93,31 @@ class CodeReviewOrchestrator(BaseAgent):
         Args:
             llm_client: Optional LLM client instance (for testing/mocking)
             db_path: Optional database path (for testing)
+            early_exit: Early-exit policy "off", "background" or "cancel".
+                If None, checks ASP_REVIEW_EARLY_EXIT environment variable.
+            review_cache: Reuse specialist findings for unchanged files.
+                If None, checks ASP_REVIEW_CACHE environment variable.
+            max_shard_tokens: Estimated code tokens per specialist call;
+                larger code is reviewed in shards (0 disables sharding).
+                If None, checks ASP_REVIEW_SHARD_TOKENS environment variable.
+
+        Raises:
+            ValueError: If early_exit is not a known policy
         """
         super().__init__(
             llm_client=llm_client,
             db_path=db_path,
         )
         self.agent_version = "1.0.0"
+        self.early_exit = resolve_early_exit(early_exit)
+        self.review_cache = (
+            ReviewResultsCache() if review_cache_enabled(review_cache) else None
+        )
+        if max_shard_tokens is None:
+            max_shard_tokens = int(
+                os.getenv("ASP_REVIEW_SHARD_TOKENS", str(DEFAULT_MAX_SHARD_TOKENS))
+            )
+        self.max_shard_tokens = max_shard_tokens
 
         # Initialize specialist agents
         self.specialists = {
@@ -157,12 +211,7 @@ class CodeReviewOrchestrator(BaseAgent):
             # FAIL: Critical issues present OR ≥5 High issues
             # CONDITIONAL_PASS: High issues present but <5, all Critical resolved
             # PASS: No Critical/High issues
-            if critical_count > 0 or high_count >= 5:
-                review_status = "FAIL"
-            elif high_count > 0:
-                review_status = "CONDITIONAL_PASS"
-            else:
-                review_status = "PASS"
+            review_status = self._determine_review_status(critical_count, high_count)
 
             # Step 8: Calculate review duration
             end_time = datetime.now()
@@ -195,18 +244,160 @@ class CodeReviewOrchestrator(BaseAgent):
                 total_lines_reviewed=total_lines_reviewed,
                 agent_version="1.0.0",
                 review_duration_seconds=duration_seconds,
+                verdict_duration_seconds=getattr(
+                    specialist_results, "verdict_seconds", None
+                ),
+                skipped_specialists=getattr(specialist_results, "skipped", []),
             )
 
             logger.info(
                 f"Orchestrated code review completed: {review_status} "
                 f"({critical_count}C/{high_count}H/{medium_count}M/{low_count}L issues)"
             )
+            if report.verdict_duration_seconds is not None:
+                logger.info(
+                    f"Time to verdict {report.verdict_duration_seconds:.1f}s, "
+                    f"time to full report {duration_seconds:.1f}s"
+                )
             return report
 
         except Exception as e:
             logger.error(f"Orchestrated code review failed: {e}", exc_info=True)
             raise AgentExecutionError(f"Code review orchestration failed: {e}") from e
 
+    def review_changed_files(
+        self,
+        generated_code: GeneratedCode,
+        previous_report: CodeReviewReport,
+        changed_paths: set[str],
+        quality_standards: str | None = None,
+    ) -> CodeReviewReport:
+        """
+        Re-review only the changed files and merge with a previous review.
+
+        Used by correction loops after regenerating a subset of files: the
+        specialists only see the changed files, issues previously reported
+        for unchanged files are carried over, and the review status is
+        recomputed from the merged issues.
+
+        Args:
+            generated_code: Complete GeneratedCode after the changes
+            previous_report: Review of the code before the changes
+            changed_paths: File paths that changed since previous_report
+            quality_standards: Optional additional quality standards
+
+        Returns:
+            CodeReviewReport covering every file in generated_code
+
+        Raises:
+            AgentExecutionError: If the review of the changed files fails
+        """
+        changed_files = [
+            file for file in generated_code.files if file.file_path in changed_paths
+        ]
+        logger.info(
+            f"Re-reviewing {len(changed_files)}/{len(generated_code.files)} "
+            f"changed files for task {generated_code.task_id}"
+        )
+        partial_report = self.execute(
+            generated_code.model_copy(
+                update={"files": changed_files, "total_files": len(changed_files)}
+            ),
+            quality_standards,
+        )
+
+        issues = [
+            issue
+            for issue in previous_report.issues_found
+            if issue.file_path not in changed_paths
+        ] + partial_report.issues_found
+        suggestions = [
+            suggestion
+            for suggestion in previous_report.improvement_suggestions
+            if suggestion.file_path not in changed_paths
+        ] + partial_report.improvement_suggestions
+        return self._merged_report(generated_code, partial_report, issues, suggestions)
+
+    def merge_reports(
+        self,
+        generated_code: GeneratedCode,
+        reports: list[CodeReviewReport],
+    ) -> CodeReviewReport:
+        """
+        Combine reviews of disjoint file subsets into one review of all files.
+
+        Used when files are reviewed in groups (see
+        asp.orchestrators.dag_scheduler). Issues and suggestions are
+        concatenated and the review status is recomputed from all issues.
+
+        Args:
+            generated_code: Complete GeneratedCode covered by the reports
+            reports: Reviews of subsets of generated_code's files (at least one)
+
+        Returns:
+            CodeReviewReport covering every file in generated_code
+        """
+        if not reports:
+            raise ValueError("merge_reports needs at least one report")
+        issues = [issue for report in reports for issue in report.issues_found]
+        suggestions = [
+            suggestion
+            for report in reports
+            for suggestion in report.improvement_suggestions
+        ]
+        return self._merged_report(generated_code, reports[-1], issues, suggestions)
+
+    def _merged_report(
+        self,
+        generated_code: GeneratedCode,
+        template: CodeReviewReport,
+        issues: list[CodeIssue],
+        suggestions: list[CodeImprovementSuggestion],
+    ) -> CodeReviewReport:
+        """Build a report over all files from merged issues and suggestions."""
+        critical_count = sum(1 for issue in issues if issue.severity == "Critical")
+        high_count = sum(1 for issue in issues if issue.severity == "High")
+        review_status = self._determine_review_status(critical_count, high_count)
+        checklist_review = self._generate_checklist_review(
+            generated_code, [issue.model_dump() for issue in issues]
+        )
+
+        report = CodeReviewReport.model_validate(
+            {
+                **template.model_dump(),
+                "review_status": review_status,
+                "issues_found": [issue.model_dump() for issue in issues],
+                "improvement_suggestions": [s.model_dump() for s in suggestions],
+                "checklist_review": checklist_review,
+                "files_reviewed": len(generated_code.files),
+                "total_lines_reviewed": sum(
+                    len(f.content.splitlines()) for f in generated_code.files
+                ),
+            }
+        )
+
+        logger.info(
+            f"Merged code review: {review_status} "
+            f"({report.critical_issues}C/{report.high_issues}H/"
+            f"{report.medium_issues}M/{report.low_issues}L issues)"
+        )
+        return report
+
+    @staticmethod
+    def _determine_review_status(critical_count: int, high_count: int) -> str:
+        """
+        Determine review status from issue counts.
+
+        FAIL: Critical issues present OR ≥5 High issues
+        CONDITIONAL_PASS: High issues present but <5, all Critical resolved
+        PASS: No Critical/High issues
+        """
+        if critical_count > 0 or high_count >= 5:
+            return "FAIL"
+        if high_count > 0:
+            return "CONDITIONAL_PASS"
+        return "PASS"
+
     async def _dispatch_specialists(
         self, generated_code: GeneratedCode
     ) -> dict[str, dict[str, Any]]:
@@ -217,31 +408,47 @@ class CodeReviewOrchestrator(BaseAgent):
             generated_code: GeneratedCode to review
 
         Returns:
-            Dictionary mapping specialist name to review results
+            Dictionary mapping specialist name to review results (a
+            SpecialistResults, which also carries the early-exit timing)
         """
+        specialists = self.specialists
+        if self.review_cache is not None:
+            specialists = {
+                name: CachedSpecialist(name, agent, self.review_cache)
+                for name, agent in specialists.items()
+            }
+        shards = shard_generated_code(generated_code, self.max_shard_tokens)
+        if len(shards) > 1:
+            logger.info(
+                f"Reviewing {len(generated_code.files)} files in {len(shards)} "
+                f"shards ({len(specialists) * len(shards)} specialist calls)"
+            )
+        return await fan_out(
+            specialists,
+            shards,
+            self._status_decided,
+            self.early_exit,
+            core=self.CORE_SPECIALISTS,
+        )
 
-        async def run_specialist(
-            name: str, agent: BaseAgent
-        ) -> tuple[str, dict[str, Any]]:
-            """Run a single specialist review (async wrapper)."""
-            try:
-                # Run in thread pool since agents are synchronous
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(None, agent.execute, generated_code)
-                return (name, result)
-            except Exception as e:
-                logger.warning(f"{name} specialist failed: {e}")
-                # Return empty results on failure (don't block other specialists)
-                return (name, {"issues_found": [], "improvement_suggestions": []})
-
-        # Launch all specialists in parallel
-        tasks = [
-            run_specialist(name, agent) for name, agent in self.specialists.items()
-        ]
-
-        results = await asyncio.gather(*tasks)
+    def _status_decided(self, specialist_results: dict[str, dict[str, Any]]) -> bool:
+        """
+        Whether partial specialist results already make the review a FAIL.
 
-        return dict(results)
+        More issues can only keep a FAIL (deduplication keeps the highest
+        severity per location), so FAIL is final; any other status depends
+        on the specialists still running.
+        """
+        issues = self._deduplicate_issues(
+            [
+                self._normalize_issue(issue)
+                for result in specialist_results.values()
+                for issue in result.get("issues_found", [])
+            ]
+        )
+        critical_count = sum(1 for issue in issues if issue["severity"] == "Critical")
+        high_count = sum(1 for issue in issues if issue["severity"] == "High")
+        return self._determine_review_status(critical_count, high_count) == "FAIL"
 
     def _normalize_category(self, category: str) -> str:
         """
@@ -17,8 +17,9 @@ from typing import Any
 
 from asp.agents.base_agent import AgentExecutionError, BaseAgent
 from asp.models.code import GeneratedCode
+from asp.models.code_review import CodeSpecialistReviewOutput
 from asp.telemetry.telemetry import track_agent_cost
-from asp.utils.json_extraction import JSONExtractionError, extract_json_from_response
+from asp.utils.json_extraction import JSONExtractionError
 
 logger = logging.getLogger(__name__)
 
@@ -73,20 +74,29 @@ class CodeSecurityReviewAgent(BaseAgent):
         logger.info(f"Starting security review for task {generated_code.task_id}")
 
         try:
-            # Load and format prompt
-            prompt_template = self.load_prompt("code_security_review_agent_v1")
-            prompt = self.format_prompt(
-                prompt_template,
+            # Load and format prompt. The generated code goes in a shared
+            # prefix (identical for all code review specialists) so it can be
+            # served from the Anthropic prompt cache across the fan-out.
+            code_context = self.format_prompt(
+                self.load_prompt("code_review_v1_code_context"),
                 generated_code=generated_code.model_dump_json(indent=2),
             )
+            prompt = self.format_prompt(
+                self.load_prompt("code_security_review_agent_v1")
+            )
 
             # Call LLM with higher token limit to avoid truncation
             logger.debug("Calling LLM for security review")
-            response = self.call_llm(prompt, max_tokens=8192)
+            response = self.call_llm(
+                prompt,
+                max_tokens=8192,
+                cached_prefix=code_context,
+                response_model=CodeSpecialistReviewOutput,
+            )
 
             # Parse JSON response with robust extraction
             try:
-                content = extract_json_from_response(
+                content = self.parse_json_response(
                     response,
                     required_fields=["issues_found", "improvement_suggestions"],
                 )
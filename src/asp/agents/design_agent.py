@@ -26,7 +26,7 @@ from asp.parsers.design_markdown_parser import DesignMarkdownParser
 from asp.telemetry import track_agent_cost
 from asp.utils.artifact_io import write_artifact_json, write_artifact_markdown
 from asp.utils.git_utils import git_commit_artifact, is_git_repository
-from asp.utils.json_extraction import JSONExtractionError, extract_json_from_response
+from asp.utils.json_extraction import JSONExtractionError
 from asp.utils.markdown_renderer import render_design_markdown
 
 logger = logging.getLogger(__name__)
@@ -259,11 +259,12 @@ class DesignAgent(BaseAgent):
             model=self.model,  # Use configured model or default
             max_tokens=16000,  # Markdown designs can be large (increased from 8000)
             temperature=0.1,  # Low temperature for consistency
+            response_model=DesignSpecification,
         )
 
         # Parse response with robust JSON extraction
         try:
-            content = extract_json_from_response(response)
+            content = self.parse_json_response(response)
         except JSONExtractionError as e:
             raise AgentExecutionError(f"Design generation failed: {e}") from e
 
@@ -745,11 +746,12 @@ class DesignAgent(BaseAgent):
             model=self.model,
             max_tokens=16000,
             temperature=0.1,
+            response_model=DesignSpecification,
         )
 
         # Parse response with robust JSON extraction
         try:
-            content = extract_json_from_response(response)
+            content = self.parse_json_response(response)
         except JSONExtractionError as e:
             raise AgentExecutionError(f"Design generation failed: {e}") from e
 
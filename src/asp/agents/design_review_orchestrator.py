@@ -10,6 +10,13 @@ Dispatches design specifications to:
 - APIDesignReviewAgent
 
 Aggregates results, deduplicates issues, resolves conflicts, generates DesignReviewReport.
+
+With an early-exit policy (asp.utils.review_fanout), the assessment is
+evaluated as specialist results arrive: the first Critical or High issue
+makes it FAIL, after which the remaining specialists are either cancelled
+or only awaited to enrich the feedback. The report's verdict_duration_ms is
+the time to that decision; review_duration_ms remains the time to the full
+report.
 """
 
 import asyncio
@@ -35,6 +42,7 @@ from asp.models.design_review import (
 )
 from asp.telemetry.telemetry import track_agent_cost
 from asp.utils.id_generation import generate_improvement_id, generate_issue_id
+from asp.utils.review_fanout import fan_out, resolve_early_exit
 
 logger = logging.getLogger(__name__)
 
@@ -47,10 +55,14 @@ class DesignReviewOrchestrator(BaseAgent):
     Architecture, and APIDesign review agents.
     """
 
+    # Specialists still consulted when the run budget is tight
+    CORE_SPECIALISTS = ("security", "architecture")
+
     def __init__(
         self,
         llm_client: Any | None = None,
         db_path: str | None = None,
+        early_exit: str | None = None,
     ):
         """
         Initialize Design Review Orchestrator.
@@ -58,12 +70,18 @@ class DesignReviewOrchestrator(BaseAgent):
         Args:
             llm_client: Optional LLM client instance (for testing/mocking)
             db_path: Optional database path (for testing)
+            early_exit: Early-exit policy "off", "background" or "cancel".
+                If None, checks ASP_REVIEW_EARLY_EXIT environment variable.
+
+        Raises:
+            ValueError: If early_exit is not a known policy
         """
         super().__init__(
             llm_client=llm_client,
             db_path=db_path,
         )
         self.agent_version = "1.0.0"
+        self.early_exit = resolve_early_exit(early_exit)
 
         # Initialize specialist agents
         self.specialists = {
@@ -119,6 +137,7 @@ class DesignReviewOrchestrator(BaseAgent):
             # Step 2: Dispatch to all specialists in parallel
             logger.debug("Dispatching to 6 specialist agents in parallel")
             specialist_results = asyncio.run(self._dispatch_specialists(design_spec))
+            verdict_seconds = getattr(specialist_results, "verdict_seconds", None)
 
             # Step 3: Aggregate specialist results
             logger.debug("Aggregating specialist results")
@@ -181,12 +200,21 @@ class DesignReviewOrchestrator(BaseAgent):
                 reviewer_agent="DesignReviewOrchestrator",
                 agent_version="1.0.0",
                 review_duration_ms=duration_ms,
+                verdict_duration_ms=(
+                    verdict_seconds * 1000 if verdict_seconds is not None else None
+                ),
+                skipped_specialists=getattr(specialist_results, "skipped", []),
             )
 
             logger.info(
                 f"Orchestrated design review completed: {overall_assessment} "
                 f"({critical_count}C/{high_count}H/{medium_count}M/{low_count}L issues)"
             )
+            if verdict_seconds is not None:
+                logger.info(
+                    f"Time to verdict {verdict_seconds:.1f}s, "
+                    f"time to full report {duration_ms / 1000:.1f}s"
+                )
             return report
 
         except Exception as e:
@@ -203,31 +231,31 @@ class DesignReviewOrchestrator(BaseAgent):
             design_spec: DesignSpecification to review
 
         Returns:
-            Dictionary mapping specialist name to review results
+            Dictionary mapping specialist name to review results (a
+            SpecialistResults, which also carries the early-exit timing)
         """
+        return await fan_out(
+            self.specialists,
+            [design_spec],
+            self._assessment_decided,
+            self.early_exit,
+            core=self.CORE_SPECIALISTS,
+        )
 
-        async def run_specialist(
-            name: str, agent: BaseAgent
-        ) -> tuple[str, dict[str, Any]]:
-            """Run a single specialist review (async wrapper)."""
-            try:
-                # Run in thread pool since agents are synchronous
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(None, agent.execute, design_spec)
-                return (name, result)
-            except Exception as e:
-                logger.warning(f"{name} specialist failed: {e}")
-                # Return empty results on failure (don't block other specialists)
-                return (name, {"issues_found": [], "improvement_suggestions": []})
-
-        # Launch all specialists in parallel
-        tasks = [
-            run_specialist(name, agent) for name, agent in self.specialists.items()
-        ]
-
-        results = await asyncio.gather(*tasks)
+    def _assessment_decided(
+        self, specialist_results: dict[str, dict[str, Any]]
+    ) -> bool:
+        """
+        Whether partial specialist results already make the assessment FAIL.
 
-        return dict(results)
+        Any Critical or High issue fails the design and deduplication keeps
+        the highest severity, so FAIL is final once reached.
+        """
+        return any(
+            issue.get("severity") in ("Critical", "High")
+            for result in specialist_results.values()
+            for issue in result.get("issues_found", [])
+        )
 
     def _normalize_category(self, category: str) -> str:
         """
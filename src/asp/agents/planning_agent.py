@@ -17,7 +17,12 @@ from pathlib import Path
 from typing import Any
 
 from asp.agents.base_agent import AgentExecutionError, BaseAgent
-from asp.models.planning import ProjectPlan, SemanticUnit, TaskRequirements
+from asp.models.planning import (
+    ProjectPlan,
+    SemanticUnit,
+    SemanticUnitList,
+    TaskRequirements,
+)
 from asp.telemetry import track_agent_cost
 from asp.utils.artifact_io import write_artifact_json, write_artifact_markdown
 from asp.utils.git_utils import git_commit_artifact, is_git_repository
@@ -218,11 +223,13 @@ class PlanningAgent(BaseAgent):
             prompt=formatted_prompt,
             max_tokens=4096,
             temperature=0.0,  # Deterministic for consistency
+            response_model=SemanticUnitList,
         )
 
         # Parse response
         content = response.get("content")
         if not isinstance(content, dict):
+            self.record_parse_failure()
             raise AgentExecutionError(
                 f"LLM returned non-JSON response: {content}\n"
                 f"Expected JSON with 'semantic_units' array"
@@ -333,11 +340,13 @@ class PlanningAgent(BaseAgent):
             prompt=formatted_prompt,
             max_tokens=4096,
             temperature=0.0,  # Deterministic for consistency
+            response_model=SemanticUnitList,
         )
 
         # Step 5: Parse response
         content = response.get("content")
         if not isinstance(content, dict):
+            self.record_parse_failure()
             raise AgentExecutionError(
                 f"LLM returned non-JSON response: {content}\n"
                 f"Expected JSON with 'semantic_units' array"
@@ -525,11 +534,13 @@ class PlanningAgent(BaseAgent):
             prompt=formatted_prompt,
             max_tokens=4096,
             temperature=0.0,  # Deterministic for consistency
+            response_model=SemanticUnitList,
         )
 
         # Parse response
         content = response.get("content")
         if not isinstance(content, dict):
+            self.record_parse_failure()
             raise AgentExecutionError(
                 f"LLM returned non-JSON response: {content}\n"
                 f"Expected JSON with 'semantic_units' array"
@@ -627,11 +638,13 @@ class PlanningAgent(BaseAgent):
             prompt=formatted_prompt,
             max_tokens=4096,
             temperature=0.0,
+            response_model=SemanticUnitList,
         )
 
         # Parse response
         content = response.get("content")
         if not isinstance(content, dict):
+            self.record_parse_failure()
             raise AgentExecutionError(
                 f"LLM returned non-JSON response: {content}\n"
                 f"Expected JSON with 'semantic_units' array"
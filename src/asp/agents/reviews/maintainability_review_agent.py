@@ -11,8 +11,9 @@ from typing import Any
 
 from asp.agents.base_agent import AgentExecutionError, BaseAgent
 from asp.models.design import DesignSpecification
+from asp.models.design_review import SpecialistReviewOutput
 from asp.telemetry.telemetry import track_agent_cost
-from asp.utils.json_extraction import JSONExtractionError, extract_json_from_response
+from asp.utils.json_extraction import JSONExtractionError
 
 logger = logging.getLogger(__name__)
 
@@ -50,11 +51,13 @@ class MaintainabilityReviewAgent(BaseAgent):
             )
 
             # Call LLM with higher token limit to avoid truncation
-            response = self.call_llm(prompt, max_tokens=8192)
+            response = self.call_llm(
+                prompt, max_tokens=8192, response_model=SpecialistReviewOutput
+            )
 
             # Parse JSON response with robust extraction
             try:
-                content = extract_json_from_response(
+                content = self.parse_json_response(
                     response,
                     required_fields=["issues_found", "improvement_suggestions"],
                 )
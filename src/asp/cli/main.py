@@ -3,15 +3,19 @@ ASP CLI - Main entry point for command-line agent execution.
 
 Provides commands for:
 - run: Execute a task through the TSP pipeline
+- run-batch: Execute many tasks concurrently under a shared LLM budget
 - repair: Execute repair workflow on existing code
 - status: Check agent/task status
 - init-db: Initialize the database
+- telemetry compact: Archive old telemetry and shrink the database
 
 Usage:
     python -m asp.cli run --task-id TASK-001 --description "Add feature X"
+    python -m asp.cli run-batch tasks.jsonl --results results.jsonl
     python -m asp.cli repair --task-id REPAIR-001 --workspace /path/to/repo
     python -m asp.cli status
     python -m asp.cli init-db
+    python -m asp.cli telemetry compact --raw-days 30
 
 Author: ASP Development Team
 Date: December 2025
@@ -158,6 +162,17 @@ def cmd_run(args):
     if model_name:
         os.environ["ASP_DEFAULT_MODEL"] = model_name
 
+    # LLM response cache: on by default for CLI runs, --no-llm-cache forces
+    # fresh API calls (responses are still stored to refresh the cache)
+    if getattr(args, "no_llm_cache", False):
+        os.environ["ASP_LLM_CACHE"] = "refresh"
+    else:
+        os.environ.setdefault("ASP_LLM_CACHE", "on")
+    logger.info(f"LLM cache: {os.environ['ASP_LLM_CACHE']}")
+    resume = getattr(args, "resume", False)
+    if resume:
+        logger.info("Resume: skipping phases with valid checkpoints")
+
     db_path = Path(args.db_path) if args.db_path else Path("data/asp_telemetry.db")
     approval_service, hitl_approver = _configure_hitl(args, db_path)
     orchestrator = TSPOrchestrator(db_path=db_path, approval_service=approval_service)
@@ -167,12 +182,16 @@ def cmd_run(args):
         if use_async:
             result = asyncio.run(
                 orchestrator.execute_async(
-                    requirements=task_requirements, hitl_approver=hitl_approver
+                    requirements=task_requirements,
+                    hitl_approver=hitl_approver,
+                    resume=resume,
                 )
             )
         else:
             result = orchestrator.execute(
-                requirements=task_requirements, hitl_approver=hitl_approver
+                requirements=task_requirements,
+                hitl_approver=hitl_approver,
+                resume=resume,
             )
 
         logger.info("=" * 60)
@@ -180,7 +199,8 @@ def cmd_run(args):
         logger.info("=" * 60)
         logger.info(f"Overall Status: {result.overall_status}")
         logger.info(f"Duration: {result.total_duration_seconds:.1f}s")
-        logger.info(f"Files Generated: {result.generated_code.total_files}")
+        if result.generated_code is not None:
+            logger.info(f"Files Generated: {result.generated_code.total_files}")
         logger.info(f"HITL Overrides: {len(result.hitl_overrides)}")
 
         if args.output:
@@ -193,6 +213,76 @@ def cmd_run(args):
         sys.exit(2)
 
 
+def cmd_run_batch(args):
+    """Execute a JSONL file of tasks concurrently through the TSP pipeline."""
+    from asp.orchestrators import TSPBatchRunner
+    from asp.utils.llm_budget import LLMBudget
+
+    logger.info("=" * 60)
+    logger.info("ASP CLI - Batch Execution")
+    logger.info("=" * 60)
+
+    try:
+        tasks = TSPBatchRunner.load_tasks(args.tasks_file)
+    except (OSError, ValueError) as e:
+        logger.error(f"Cannot load tasks: {e}")
+        sys.exit(2)
+    if args.cost_cap is not None:
+        for task in tasks:
+            if task.cost_cap_usd is None:
+                task.cost_cap_usd = args.cost_cap
+    logger.info(f"Tasks: {len(tasks)} from {args.tasks_file}")
+
+    os.environ.setdefault("ASP_LLM_CACHE", "on")
+    db_path = Path(args.db_path) if args.db_path else Path("data/asp_telemetry.db")
+    _, hitl_approver = _configure_hitl(args, db_path)
+    runner = TSPBatchRunner(
+        max_concurrent_tasks=args.max_tasks,
+        budget=LLMBudget(
+            max_concurrent_calls=args.max_llm_calls,
+            max_calls_per_task=args.max_calls_per_task,
+            max_total_tokens=args.max_total_tokens,
+        ),
+        results_path=args.results,
+        hitl_approver=hitl_approver,
+        db_path=db_path,
+    )
+
+    try:
+        summary = runner.run(tasks)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.error(f"Batch execution failed: {e}", exc_info=True)
+        sys.exit(2)
+
+    logger.info("=" * 60)
+    logger.info("BATCH COMPLETE")
+    logger.info("=" * 60)
+    for result in summary.results:
+        logger.info(
+            f"{result.task_id}: {result.status} ({result.overall_status or '-'}) "
+            f"{result.duration_seconds:.1f}s, ${result.cost_usd:.4f}"
+        )
+    logger.info(
+        f"Completed: {summary.count('COMPLETED')}/{len(summary.results)}, "
+        f"budget exceeded: {summary.count('BUDGET_EXCEEDED')}, "
+        f"failed: {summary.count('FAILED')}"
+    )
+    logger.info(f"Duration: {summary.duration_seconds:.1f}s")
+    logger.info(f"Throughput: {summary.tasks_per_hour:.1f} tasks/hour")
+    logger.info(
+        f"Tokens: {summary.total_tokens} ({summary.tokens_per_second:.1f} tokens/s)"
+    )
+    logger.info(f"Cost: ${summary.total_cost_usd:.4f}")
+    if args.results:
+        logger.info(f"Results stream: {args.results}")
+
+    passed = all(
+        result.overall_status in ("PASS", "CONDITIONAL_PASS")
+        for result in summary.results
+    )
+    sys.exit(0 if passed else 1)
+
+
 def cmd_repair(args):
     """Execute repair workflow on existing code."""
     import asyncio
@@ -719,6 +809,16 @@ Examples:
   # Run with async execution (ADR 008 - non-blocking I/O)
   python -m asp.cli run --task-id TASK-001 --description "Add user auth" --async
 
+  # Force fresh LLM calls instead of serving cached responses
+  python -m asp.cli run --task-id TASK-001 --description "Add user auth" --no-llm-cache
+
+  # Resume an interrupted run from its phase checkpoints
+  python -m asp.cli run --task-id TASK-001 --description "Add user auth" --resume
+
+  # Run many tasks concurrently, 20 LLM calls in flight, $2 cap per task
+  python -m asp.cli run-batch tasks.jsonl --max-llm-calls 20 --cost-cap 2.0 \\
+      --results results.jsonl --auto-approve
+
   # Run with auto-approve for testing
   python -m asp.cli run --task-id TEST-001 --description "Test task" --auto-approve
 
@@ -746,6 +846,10 @@ Examples:
   # Initialize database
   python -m asp.cli init-db --with-sample-data
 
+  # Archive raw telemetry older than 30 days into monthly files and VACUUM
+  python -m asp.cli telemetry compact --raw-days 30
+  python -m asp.cli telemetry compact --dry-run    # Preview only
+
   # Beads integration (ADR 009)
   python -m asp.cli beads list                     # List open issues
   python -m asp.cli beads show bd-abc1234          # Show issue details
@@ -817,7 +921,7 @@ Examples:
     )
     run_parser.add_argument(
         "--provider",
-        choices=["anthropic", "openrouter", "groq"],
+        choices=["anthropic", "openrouter", "groq", "local", "router"],
         default=None,
         help="LLM provider to use (default: anthropic, or ASP_LLM_PROVIDER env var)",
     )
@@ -826,8 +930,73 @@ Examples:
         default=None,
         help="Specific model to use (provider-dependent, e.g., claude-sonnet-4-5, openai/gpt-4o)",
     )
+    run_parser.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="Bypass the LLM response cache and force fresh API calls",
+    )
+    run_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume an interrupted run, skipping phases with valid checkpoints",
+    )
     run_parser.set_defaults(func=cmd_run)
 
+    # Run-batch command
+    batch_parser = subparsers.add_parser(
+        "run-batch",
+        help="Execute a JSONL file of tasks concurrently under a shared LLM budget",
+    )
+    batch_parser.add_argument(
+        "tasks_file",
+        help="JSONL file with one task per line (TaskRequirements fields, "
+        "optional priority, cost_cap_usd, design_constraints, coding_standards)",
+    )
+    batch_parser.add_argument(
+        "--max-tasks",
+        type=int,
+        default=4,
+        help="Pipelines running at the same time (default: 4)",
+    )
+    batch_parser.add_argument(
+        "--max-llm-calls",
+        type=int,
+        default=20,
+        help="LLM calls in flight across all tasks (default: 20)",
+    )
+    batch_parser.add_argument(
+        "--max-calls-per-task",
+        type=int,
+        default=None,
+        help="LLM calls one task may have in flight (default: no cap)",
+    )
+    batch_parser.add_argument(
+        "--max-total-tokens",
+        type=int,
+        default=0,
+        help="Token budget for the whole batch (default: 0 = unlimited)",
+    )
+    batch_parser.add_argument(
+        "--cost-cap",
+        type=float,
+        default=None,
+        help="Default LLM cost cap in USD for tasks without cost_cap_usd",
+    )
+    batch_parser.add_argument(
+        "--results",
+        help="JSONL file receiving one result line per finished task",
+    )
+    batch_parser.add_argument(
+        "--db-path",
+        help="Path to SQLite database (default: data/asp_telemetry.db)",
+    )
+    batch_parser.add_argument(
+        "--auto-approve",
+        action="store_true",
+        help="Auto-approve all quality gates (for testing)",
+    )
+    batch_parser.set_defaults(func=cmd_run_batch, hitl_database=False)
+
     # Repair command
     repair_parser = subparsers.add_parser(
         "repair", help="Execute repair workflow on existing code"
@@ -1005,6 +1174,11 @@ Examples:
     )
     init_parser.set_defaults(func=cmd_init_db)
 
+    # Telemetry commands
+    from asp.cli.telemetry_commands import add_telemetry_subparser
+
+    add_telemetry_subparser(subparsers)
+
     return parser
 
 
@@ -0,0 +1,133 @@
+"""
+Telemetry CLI Commands - Retention for the SQLite telemetry database.
+
+Provides commands for:
+- telemetry compact: Archive raw telemetry older than the retention window
+  into per-month files, prune metadata payloads and VACUUM the database
+
+Usage:
+    python -m asp.cli telemetry compact
+    python -m asp.cli telemetry compact --raw-days 90 --metadata-days 14
+    python -m asp.cli telemetry compact --dry-run
+"""
+
+import logging
+import sqlite3
+import sys
+from pathlib import Path
+
+logger = logging.getLogger("asp.cli.telemetry")
+
+
+def _format_size(size: int) -> str:
+    """Human-readable file size."""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def cmd_telemetry_compact(args):
+    """Apply the retention policy to the telemetry database."""
+    from asp.telemetry.retention import RetentionPolicy, compact_telemetry
+
+    db_path = Path(args.db_path) if args.db_path else Path("data/asp_telemetry.db")
+    if not db_path.exists():
+        print(f"Error: Telemetry database not found: {db_path}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        policy = RetentionPolicy(
+            raw_days=args.raw_days,
+            metadata_days=None if args.keep_metadata else args.metadata_days,
+            archive_dir=Path(args.archive_dir) if args.archive_dir else None,
+            vacuum=not args.no_vacuum,
+        )
+        report = compact_telemetry(db_path, policy, dry_run=args.dry_run)
+    except (RuntimeError, ValueError, sqlite3.Error) as e:
+        logger.error(f"Telemetry compaction failed: {e}")
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    prefix = "[Dry Run] Would archive" if report.dry_run else "Archived"
+    print(f"Raw telemetry before {report.cutoff}:")
+    if not report.months:
+        print("  Nothing to archive.")
+    for month in report.months:
+        print(
+            f"  {prefix} {month.month}: {month.agent_execution_rows} executions, "
+            f"{month.agent_cost_vector_rows} metric rows -> {month.path}"
+        )
+
+    pruned = "Would prune" if report.dry_run else "Pruned"
+    print(f"{pruned} metadata of {report.metadata_pruned} rows")
+    if not report.dry_run:
+        print(
+            f"Database size: {_format_size(report.size_before)} -> "
+            f"{_format_size(report.size_after)}"
+        )
+
+
+def add_telemetry_subparser(subparsers):
+    """Add telemetry subcommand and its sub-subcommands to the parser."""
+    telemetry_parser = subparsers.add_parser(
+        "telemetry",
+        help="Telemetry database maintenance",
+        description="Commands for maintaining the SQLite telemetry database.",
+    )
+
+    telemetry_subparsers = telemetry_parser.add_subparsers(
+        dest="telemetry_command",
+        help="Telemetry commands",
+    )
+
+    # telemetry compact
+    compact_parser = telemetry_subparsers.add_parser(
+        "compact",
+        help="Archive old raw telemetry and shrink the database",
+    )
+    compact_parser.add_argument(
+        "--db-path",
+        help="Path to SQLite database (default: data/asp_telemetry.db)",
+    )
+    compact_parser.add_argument(
+        "--raw-days",
+        type=int,
+        default=30,
+        help="Days of raw rows kept in the live database (default: 30)",
+    )
+    compact_parser.add_argument(
+        "--metadata-days",
+        type=int,
+        default=7,
+        help="Days of metadata payloads kept (default: 7)",
+    )
+    compact_parser.add_argument(
+        "--keep-metadata",
+        action="store_true",
+        help="Do not prune metadata payloads",
+    )
+    compact_parser.add_argument(
+        "--archive-dir",
+        help="Directory for monthly archive files (default: <db dir>/archive)",
+    )
+    compact_parser.add_argument(
+        "--no-vacuum",
+        action="store_true",
+        help="Skip VACUUM after archiving",
+    )
+    compact_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show what would be archived and pruned without changing anything",
+    )
+    compact_parser.set_defaults(func=cmd_telemetry_compact)
+
+    # Set default handler for just "telemetry" with no subcommand
+    def telemetry_help(args):
+        telemetry_parser.print_help()
+
+    telemetry_parser.set_defaults(func=telemetry_help)
+
+    return telemetry_parser
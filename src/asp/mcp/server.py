@@ -834,12 +834,18 @@ async def _handle_session_context(args: dict) -> list[TextContent]:
 
 async def _run_server():
     """Run the MCP server (async implementation)."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options(),
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options(),
+            )
+    finally:
+        # Close pooled LLM HTTP connections shared by agents and providers
+        from asp.utils.client_pool import aclose_client_pool
+
+        await aclose_client_pool()
 
 
 def main():
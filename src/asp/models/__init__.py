@@ -6,6 +6,7 @@ from asp.models.code_review import (
     CodeImprovementSuggestion,
     CodeIssue,
     CodeReviewReport,
+    CodeSpecialistReviewOutput,
 )
 from asp.models.design import (
     APIContract,
@@ -20,11 +21,13 @@ from asp.models.design_review import (
     DesignIssue,
     DesignReviewReport,
     ImprovementSuggestion,
+    SpecialistReviewOutput,
 )
 from asp.models.planning import (
     PROBEAIPrediction,
     ProjectPlan,
     SemanticUnit,
+    SemanticUnitList,
     TaskRequirements,
 )
 from asp.models.postmortem import (
@@ -45,6 +48,7 @@ __all__ = [
     # Planning models
     "TaskRequirements",
     "SemanticUnit",
+    "SemanticUnitList",
     "PROBEAIPrediction",
     "ProjectPlan",
     # Design models
@@ -59,6 +63,7 @@ __all__ = [
     "ImprovementSuggestion",
     "ChecklistItemReview",
     "DesignReviewReport",
+    "SpecialistReviewOutput",
     # Code generation models
     "CodeInput",
     "GeneratedFile",
@@ -68,6 +73,7 @@ __all__ = [
     "CodeImprovementSuggestion",
     "CodeChecklistItemReview",
     "CodeReviewReport",
+    "CodeSpecialistReviewOutput",
     # Test models
     "TestInput",
     "TestDefect",
@@ -10,7 +10,7 @@ Date: November 17, 2025
 
 from typing import Literal
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from asp.utils.id_generation import (
     CODE_IMPROVEMENT_ID_PATTERN,
@@ -424,6 +424,18 @@ class CodeReviewReport(BaseModel):
         ge=0,
         description="Duration of review in seconds",
     )
+    verdict_duration_seconds: float | None = Field(
+        default=None,
+        ge=0,
+        description=(
+            "Seconds until the review status was decided (set when the "
+            "orchestrator's early-exit policy is enabled)"
+        ),
+    )
+    skipped_specialists: list[str] = Field(
+        default_factory=list,
+        description="Specialists cancelled once the review status was decided",
+    )
 
     @model_validator(mode="after")
     def group_issues_by_phase(self) -> "CodeReviewReport":
@@ -531,3 +543,63 @@ class CodeReviewReport(BaseModel):
                 "review_duration_seconds": 35.5,
             }
         }
+
+
+class CodeSpecialistIssue(BaseModel):
+    """
+    A code issue as reported by one code review specialist.
+
+    Specialists number their own IDs (e.g., 'QUAL-001'); the orchestrator
+    regenerates IDs and maps categories when building CodeIssue objects.
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    issue_id: str = Field(..., description="Specialist-local ID (e.g., 'QUAL-001')")
+    category: str = Field(..., description="Issue category")
+    severity: Literal["Critical", "High", "Medium", "Low"] = Field(
+        ..., description="Issue severity"
+    )
+    description: str = Field(..., description="What the issue is")
+    evidence: str = Field(..., description="File and line reference")
+    impact: str = Field(..., description="Consequence if left unaddressed")
+    affected_phase: Literal["Planning", "Design", "Code", "Both"] = Field(
+        default="Code", description="Phase where the issue was introduced"
+    )
+    file_path: str = Field(..., description="File containing the issue")
+    line_number: int | None = Field(default=None, description="Line number")
+    code_snippet: str | None = Field(default=None, description="Offending code")
+
+
+class CodeSpecialistSuggestion(BaseModel):
+    """An improvement suggestion as reported by one code review specialist."""
+
+    model_config = ConfigDict(extra="allow")
+
+    suggestion_id: str = Field(
+        ..., description="Specialist-local ID (e.g., 'QUAL-IMP-001')"
+    )
+    related_issue_id: str | None = Field(
+        default=None, description="Specialist-local ID of the addressed issue"
+    )
+    category: str = Field(..., description="Suggestion category")
+    priority: Literal["Critical", "High", "Medium", "Low"] = Field(
+        ..., description="Implementation priority"
+    )
+    description: str = Field(..., description="Actionable recommendation")
+    implementation_notes: str = Field(..., description="How to implement it")
+    file_path: str | None = Field(default=None, description="File to change")
+    suggested_code: str | None = Field(default=None, description="Example fix")
+
+
+class CodeSpecialistReviewOutput(BaseModel):
+    """
+    Findings returned by a code review specialist agent.
+
+    Used as the structured output schema for specialist LLM calls.
+    """
+
+    issues_found: list[CodeSpecialistIssue] = Field(default_factory=list)
+    improvement_suggestions: list[CodeSpecialistSuggestion] = Field(
+        default_factory=list
+    )
@@ -8,7 +8,7 @@ including issues, improvement suggestions, and review reports.
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from asp.utils.id_generation import (
     IMPROVEMENT_ID_PATTERN,
@@ -389,6 +389,18 @@ class DesignReviewReport(BaseModel):
         ge=0,
         description="Review execution time in milliseconds",
     )
+    verdict_duration_ms: float | None = Field(
+        default=None,
+        ge=0,
+        description=(
+            "Milliseconds until the overall assessment was decided (set when "
+            "the orchestrator's early-exit policy is enabled)"
+        ),
+    )
+    skipped_specialists: list[str] = Field(
+        default_factory=list,
+        description="Specialists cancelled once the assessment was decided",
+    )
 
     @model_validator(mode="after")
     def validate_issue_counts(self) -> "DesignReviewReport":
@@ -553,3 +565,56 @@ class DesignReviewReport(BaseModel):
                 "review_duration_ms": 5432.1,
             }
         }
+
+
+class SpecialistIssue(BaseModel):
+    """
+    A design issue as reported by one review specialist.
+
+    Specialists number their own IDs (e.g., 'SEC-001'); the orchestrator
+    regenerates IDs and maps categories when building DesignIssue objects.
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    issue_id: str = Field(..., description="Specialist-local ID (e.g., 'SEC-001')")
+    category: str = Field(..., description="Issue category")
+    severity: Literal["Critical", "High", "Medium", "Low"] = Field(
+        ..., description="Issue severity"
+    )
+    description: str = Field(..., description="What the issue is")
+    evidence: str = Field(..., description="Where in the design it appears")
+    impact: str = Field(..., description="Consequence if left unaddressed")
+    affected_phase: Literal["Planning", "Design", "Both"] = Field(
+        default="Design", description="Phase where the issue was introduced"
+    )
+
+
+class SpecialistSuggestion(BaseModel):
+    """An improvement suggestion as reported by one review specialist."""
+
+    model_config = ConfigDict(extra="allow")
+
+    suggestion_id: str = Field(
+        ..., description="Specialist-local ID (e.g., 'SEC-IMP-001')"
+    )
+    related_issue_id: str | None = Field(
+        default=None, description="Specialist-local ID of the addressed issue"
+    )
+    category: str = Field(..., description="Suggestion category")
+    priority: Literal["Critical", "High", "Medium", "Low"] = Field(
+        ..., description="Implementation priority"
+    )
+    description: str = Field(..., description="Actionable recommendation")
+    implementation_notes: str = Field(..., description="How to implement it")
+
+
+class SpecialistReviewOutput(BaseModel):
+    """
+    Findings returned by a design review specialist agent.
+
+    Used as the structured output schema for specialist LLM calls.
+    """
+
+    issues_found: list[SpecialistIssue] = Field(default_factory=list)
+    improvement_suggestions: list[SpecialistSuggestion] = Field(default_factory=list)
@@ -169,6 +169,18 @@ class SemanticUnit(BaseModel):
     }
 
 
+class SemanticUnitList(BaseModel):
+    """
+    Semantic units returned by the Planning Agent decomposition prompt.
+
+    Used as the structured output schema for decomposition LLM calls.
+    """
+
+    semantic_units: list[SemanticUnit] = Field(
+        ..., description="Decomposed units of work"
+    )
+
+
 class PROBEAIPrediction(BaseModel):
     """
     PROBE-AI estimation results.
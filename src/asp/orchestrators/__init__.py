@@ -5,6 +5,17 @@ Orchestrators coordinate multiple agents with feedback loops,
 implementing phase-aware error correction per PSP/TSP principles.
 """
 
+from asp.orchestrators.batch_runner import (
+    BatchSummary,
+    BatchTask,
+    BatchTaskResult,
+    TSPBatchRunner,
+)
+from asp.orchestrators.checkpoint import (
+    Checkpoint,
+    CheckpointStore,
+    compute_input_hash,
+)
 from asp.orchestrators.confidence import (
     ConfidenceBreakdown,
     calculate_confidence,
@@ -13,6 +24,11 @@ from asp.orchestrators.confidence import (
     calculate_iteration_penalty,
     calculate_test_coverage_confidence,
 )
+from asp.orchestrators.dag_scheduler import (
+    PhaseGraph,
+    PipelinedTSPOrchestrator,
+    semantic_unit_dependencies,
+)
 from asp.orchestrators.hitl_config import (
     AUTONOMOUS_CONFIG,
     CONSERVATIVE_CONFIG,
@@ -33,8 +49,10 @@ from asp.orchestrators.repair_orchestrator import (
 )
 from asp.orchestrators.tsp_orchestrator import TSPOrchestrator
 from asp.orchestrators.types import (
+    NodeTiming,
     PlanningDesignResult,
     RepairExecutionResult,
+    ScheduleReport,
     TSPExecutionResult,
 )
 
@@ -46,6 +64,21 @@ __all__ = [
     "TSPOrchestrator",
     "TSPExecutionResult",
     "RepairExecutionResult",
+    # Pipelined Scheduling
+    "PipelinedTSPOrchestrator",
+    "PhaseGraph",
+    "ScheduleReport",
+    "NodeTiming",
+    "semantic_unit_dependencies",
+    # Batch Execution
+    "TSPBatchRunner",
+    "BatchTask",
+    "BatchTaskResult",
+    "BatchSummary",
+    # Phase Checkpoints
+    "Checkpoint",
+    "CheckpointStore",
+    "compute_input_hash",
     # Repair Orchestration (ADR 006)
     "RepairOrchestrator",
     "RepairRequest",
@@ -0,0 +1,315 @@
+"""
+Batch Runner: Many TSP Pipelines Under One LLM Budget.
+
+Runs a batch of tasks through TSPOrchestrator.execute_async concurrently,
+so a machine that can keep many LLM calls in flight is not limited to the
+handful a single pipeline issues. All tasks share one LLMBudget
+(asp.utils.llm_budget):
+
+- Tasks start in priority order (0 = highest) from a priority queue, at
+  most max_concurrent_tasks at a time
+- LLM calls of all running tasks share a global concurrency limit; freed
+  slots go to the task with the fewest calls in flight, so one task with a
+  wide review fan-out cannot starve the others
+- Each task may carry a cost cap; a task that reaches it stops with status
+  BUDGET_EXCEEDED, as do tasks still running when the optional batch token
+  budget is spent
+
+Each finished task is appended to a JSONL results stream as soon as it
+completes, and the returned BatchSummary reports aggregate throughput
+(tasks/hour, tokens/s).
+
+Task files are JSONL, one task per line: TaskRequirements fields plus the
+optional keys priority, cost_cap_usd, design_constraints and
+coding_standards:
+
+    {"task_id": "TASK-001", "description": "...", "requirements": "...",
+     "priority": 0, "cost_cap_usd": 2.5}
+
+Example:
+    >>> runner = TSPBatchRunner(max_concurrent_tasks=4,
+    ...                         budget=LLMBudget(max_concurrent_calls=20))
+    >>> summary = runner.run(TSPBatchRunner.load_tasks("tasks.jsonl"))
+    >>> print(f"{summary.tasks_per_hour:.1f} tasks/hour")
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+# pylint: disable=logging-fstring-interpolation
+
+import asyncio
+import itertools
+import json
+import logging
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, TextIO
+
+from asp.models.planning import TaskRequirements
+from asp.orchestrators.tsp_orchestrator import TSPOrchestrator
+from asp.utils.llm_budget import (
+    DEFAULT_PRIORITY,
+    LLMBudget,
+    budget_scope,
+    is_budget_exceeded,
+)
+
+logger = logging.getLogger(__name__)
+
+# Keys of a task file line that configure the run rather than the task
+_RUN_OPTIONS = ("priority", "cost_cap_usd", "design_constraints", "coding_standards")
+
+
+@dataclass
+class BatchTask:
+    """A task to run in a batch, with its scheduling options."""
+
+    requirements: TaskRequirements
+    priority: int = DEFAULT_PRIORITY
+    cost_cap_usd: float | None = None
+    design_constraints: str | None = None
+    coding_standards: str | None = None
+
+    @property
+    def task_id(self) -> str:
+        """Task identifier."""
+        return self.requirements.task_id
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BatchTask":
+        """Build a BatchTask from one task file record."""
+        data = dict(data)
+        options = {key: data.pop(key) for key in _RUN_OPTIONS if key in data}
+        return cls(requirements=TaskRequirements(**data), **options)
+
+
+@dataclass
+class BatchTaskResult:
+    """
+    Outcome of one task in a batch.
+
+    status is COMPLETED when the pipeline returned (overall_status then
+    holds its PASS/CONDITIONAL_PASS/FAIL/NEEDS_REVIEW verdict),
+    BUDGET_EXCEEDED when the task's cost cap or the batch token budget
+    stopped it, and FAILED for any other error.
+    """
+
+    task_id: str
+    status: str
+    priority: int
+    overall_status: str | None = None
+    error: str | None = None
+    duration_seconds: float = 0.0
+    llm_calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+    llm_wait_seconds: float = 0.0
+
+    @property
+    def total_tokens(self) -> int:
+        """Input plus output tokens."""
+        return self.input_tokens + self.output_tokens
+
+
+@dataclass
+class BatchSummary:
+    """Aggregate results and throughput of a batch run."""
+
+    results: list[BatchTaskResult] = field(default_factory=list)
+    duration_seconds: float = 0.0
+
+    def count(self, status: str) -> int:
+        """Number of tasks that finished with a status."""
+        return sum(1 for result in self.results if result.status == status)
+
+    @property
+    def total_tokens(self) -> int:
+        """Tokens used by all tasks."""
+        return sum(result.total_tokens for result in self.results)
+
+    @property
+    def total_cost_usd(self) -> float:
+        """LLM cost of all tasks."""
+        return sum(result.cost_usd for result in self.results)
+
+    @property
+    def tasks_per_hour(self) -> float:
+        """Completed tasks per hour of wall time."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return self.count("COMPLETED") * 3600 / self.duration_seconds
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Tokens per second of wall time."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return self.total_tokens / self.duration_seconds
+
+
+class TSPBatchRunner:
+    """
+    Execute many TSP pipelines concurrently under a shared LLM budget.
+
+    Each task runs on its own TSPOrchestrator (orchestrators keep per-run
+    state), built by orchestrator_factory.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_tasks: int = 4,
+        budget: LLMBudget | None = None,
+        results_path: str | Path | None = None,
+        hitl_approver: Callable | None = None,
+        orchestrator_factory: Callable[[], TSPOrchestrator] | None = None,
+        db_path: Path | None = None,
+    ):
+        """
+        Initialize the batch runner.
+
+        Args:
+            max_concurrent_tasks: Pipelines running at the same time
+            budget: Shared LLM budget (default: LLMBudget())
+            results_path: Optional JSONL file receiving one line per task
+            hitl_approver: Optional HITL approver passed to every pipeline
+            orchestrator_factory: Optional factory for per-task orchestrators
+            db_path: Telemetry database for the default orchestrators
+        """
+        if max_concurrent_tasks < 1:
+            raise ValueError("max_concurrent_tasks must be at least 1")
+        self.max_concurrent_tasks = max_concurrent_tasks
+        self.budget = budget or LLMBudget()
+        self.results_path = Path(results_path) if results_path else None
+        self.hitl_approver = hitl_approver
+        self.orchestrator_factory = orchestrator_factory or (
+            lambda: TSPOrchestrator(db_path=db_path)
+        )
+
+    @staticmethod
+    def load_tasks(path: str | Path) -> list[BatchTask]:
+        """
+        Read a JSONL task file (blank lines and # comments are skipped).
+
+        Raises:
+            ValueError: If a line is not valid JSON or not a valid task
+        """
+        tasks = []
+        lines = Path(path).read_text(encoding="utf-8").splitlines()
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            try:
+                tasks.append(BatchTask.from_dict(json.loads(line)))
+            except Exception as e:
+                raise ValueError(f"{path}:{line_number}: invalid task: {e}") from e
+        return tasks
+
+    def run(self, tasks: Iterable[BatchTask]) -> BatchSummary:
+        """Synchronous entry point around run_async."""
+        return asyncio.run(self.run_async(tasks))
+
+    async def run_async(self, tasks: Iterable[BatchTask]) -> BatchSummary:
+        """
+        Run all tasks and return their results in completion order.
+
+        Args:
+            tasks: Tasks to run (task IDs must be unique)
+
+        Returns:
+            BatchSummary with per-task results and throughput
+
+        Raises:
+            ValueError: If two tasks share a task ID
+        """
+        tasks = list(tasks)
+        task_ids = [task.task_id for task in tasks]
+        duplicates = sorted({tid for tid in task_ids if task_ids.count(tid) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate task IDs in batch: {duplicates}")
+
+        queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        order = itertools.count()
+        for task in tasks:
+            self.budget.register_task(task.task_id, task.priority, task.cost_cap_usd)
+            queue.put_nowait((task.priority, next(order), task))
+
+        logger.info(
+            f"Running batch of {len(tasks)} tasks: "
+            f"{self.max_concurrent_tasks} concurrent tasks, "
+            f"{self.budget.max_concurrent_calls} concurrent LLM calls"
+        )
+        summary = BatchSummary()
+        start = time.monotonic()
+        stream = self._open_results()
+        try:
+
+            async def worker() -> None:
+                while not queue.empty():
+                    _, _, task = queue.get_nowait()
+                    result = await self._run_task(task)
+                    summary.results.append(result)
+                    if stream:
+                        stream.write(json.dumps(asdict(result)) + "\n")
+                        stream.flush()
+
+            workers = min(self.max_concurrent_tasks, len(tasks))
+            await asyncio.gather(*(worker() for _ in range(workers)))
+        finally:
+            if stream:
+                stream.close()
+
+        summary.duration_seconds = time.monotonic() - start
+        logger.info(
+            f"Batch complete: {summary.count('COMPLETED')}/{len(tasks)} completed "
+            f"in {summary.duration_seconds:.1f}s "
+            f"({summary.tasks_per_hour:.1f} tasks/hour, "
+            f"{summary.tokens_per_second:.1f} tokens/s, "
+            f"${summary.total_cost_usd:.4f})"
+        )
+        return summary
+
+    async def _run_task(self, task: BatchTask) -> BatchTaskResult:
+        """Run one pipeline inside its budget scope; never raises."""
+        logger.info(f"[{task.task_id}] Starting (priority {task.priority})")
+        start = time.monotonic()
+        result = BatchTaskResult(
+            task_id=task.task_id, status="COMPLETED", priority=task.priority
+        )
+        try:
+            with budget_scope(self.budget, task.task_id):
+                execution = await self.orchestrator_factory().execute_async(
+                    requirements=task.requirements,
+                    design_constraints=task.design_constraints,
+                    coding_standards=task.coding_standards,
+                    hitl_approver=self.hitl_approver,
+                )
+            result.overall_status = execution.overall_status
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            result.status = "BUDGET_EXCEEDED" if is_budget_exceeded(e) else "FAILED"
+            result.error = str(e)
+            logger.warning(f"[{task.task_id}] {result.status}: {e}")
+
+        usage = self.budget.usage(task.task_id)
+        result.duration_seconds = time.monotonic() - start
+        result.llm_calls = usage.calls
+        result.input_tokens = usage.input_tokens
+        result.output_tokens = usage.output_tokens
+        result.cost_usd = usage.cost_usd
+        result.llm_wait_seconds = usage.waited_seconds
+        logger.info(
+            f"[{task.task_id}] {result.status} "
+            f"({result.overall_status or '-'}) in {result.duration_seconds:.1f}s, "
+            f"{result.llm_calls} LLM calls, ${result.cost_usd:.4f}"
+        )
+        return result
+
+    def _open_results(self) -> TextIO | None:
+        """Open (truncate) the JSONL results stream, if configured."""
+        if self.results_path is None:
+            return None
+        self.results_path.parent.mkdir(parents=True, exist_ok=True)
+        return self.results_path.open("w", encoding="utf-8")
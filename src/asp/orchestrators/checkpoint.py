@@ -0,0 +1,222 @@
+"""
+Phase Checkpoints for TSP Pipelines.
+
+Persists the validated output of each TSP phase so that an interrupted run
+(timeout, provider outage, process restart) can resume without repeating
+the LLM calls of phases that already completed.
+
+Checkpoints are written to artifacts/{task_id}/checkpoints/{phase}.json and
+are keyed by a hash of the inputs that produced them. Because each phase's
+inputs include the artifacts of the phases before it, recomputing an early
+phase automatically invalidates every checkpoint downstream of it.
+
+Configuration:
+    ASP_CHECKPOINTS: "on" (default) or "off" to stop writing checkpoints
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+# pylint: disable=logging-fstring-interpolation
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+
+def checkpoints_enabled() -> bool:
+    """Return whether phase checkpoints should be written (ASP_CHECKPOINTS)."""
+    return os.getenv("ASP_CHECKPOINTS", "on").lower() not in ("off", "false", "0")
+
+
+def compute_input_hash(*inputs: Any) -> str:
+    """
+    Compute a stable hash of the inputs to a pipeline phase.
+
+    Pydantic models are hashed by their JSON dump, so two equal models hash
+    identically regardless of object identity. None values are included,
+    which keeps ("a", None) and (None, "a") distinct.
+
+    Args:
+        *inputs: Pydantic models, strings, or other JSON-serializable values
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    payload = [
+        item.model_dump(mode="json") if isinstance(item, BaseModel) else item
+        for item in inputs
+    ]
+    encoded = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class Checkpoint:
+    """A restored phase checkpoint."""
+
+    phase: str
+    artifacts: dict[str, BaseModel]
+    hitl_overrides: list[dict[str, Any]] = field(default_factory=list)
+    created_at: str | None = None
+
+
+class CheckpointStore:
+    """
+    File-backed store of TSP phase checkpoints for a single task.
+
+    Example:
+        >>> store = CheckpointStore("TASK-001")
+        >>> input_hash = compute_input_hash(requirements)
+        >>> store.save("planning", input_hash, {"project_plan": plan})
+        >>> checkpoint = store.load(
+        ...     "planning", input_hash, {"project_plan": ProjectPlan}
+        ... )
+        >>> checkpoint.artifacts["project_plan"] == plan
+        True
+    """
+
+    def __init__(self, task_id: str, base_path: str | Path | None = None):
+        """
+        Initialize the checkpoint store.
+
+        Args:
+            task_id: Task identifier the checkpoints belong to
+            base_path: Optional base path (defaults to current directory)
+        """
+        base = Path(base_path) if base_path else Path.cwd()
+        self.task_id = task_id
+        self.directory = base / "artifacts" / task_id / "checkpoints"
+
+    def path_for(self, phase: str) -> Path:
+        """Return the checkpoint file path for a phase."""
+        return self.directory / f"{phase}.json"
+
+    def save(
+        self,
+        phase: str,
+        input_hash: str,
+        artifacts: dict[str, BaseModel],
+        hitl_overrides: list[dict[str, Any]] | None = None,
+    ) -> Path | None:
+        """
+        Write a phase checkpoint, replacing any previous one atomically.
+
+        Failures are logged and swallowed: a checkpoint is an optimization
+        and must never fail the pipeline that produced it.
+
+        Args:
+            phase: Phase name (e.g., "planning", "design")
+            input_hash: Hash of the inputs that produced the artifacts
+            artifacts: Validated phase outputs keyed by name
+            hitl_overrides: HITL overrides granted while running the phase
+
+        Returns:
+            Path to the checkpoint file, or None if it could not be written
+        """
+        path = self.path_for(phase)
+        try:
+            record = {
+                "version": CHECKPOINT_VERSION,
+                "phase": phase,
+                "task_id": self.task_id,
+                "input_hash": input_hash,
+                "created_at": datetime.now().isoformat(),
+                "hitl_overrides": hitl_overrides or [],
+                "artifacts": {
+                    name: artifact.model_dump(mode="json")
+                    for name, artifact in artifacts.items()
+                },
+            }
+            encoded = json.dumps(record, indent=2, ensure_ascii=False)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".json.tmp")
+            tmp_path.write_text(encoded, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning(f"Failed to write {phase} checkpoint: {e}")
+            return None
+
+        logger.debug(f"Wrote {phase} checkpoint: {path}")
+        return path
+
+    def load(
+        self,
+        phase: str,
+        input_hash: str,
+        schema: dict[str, type[BaseModel]],
+    ) -> Checkpoint | None:
+        """
+        Load a phase checkpoint if it is still valid for the given inputs.
+
+        A checkpoint is rejected (and the phase must be recomputed) if it is
+        missing, unreadable, from another checkpoint version, produced from
+        different inputs, or no longer validates against the phase models.
+
+        Args:
+            phase: Phase name (e.g., "planning", "design")
+            input_hash: Hash of the current inputs to the phase
+            schema: Expected artifact names mapped to their model classes
+
+        Returns:
+            Restored Checkpoint, or None if no valid checkpoint exists
+        """
+        path = self.path_for(phase)
+        if not path.exists():
+            return None
+
+        try:
+            record = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable {phase} checkpoint: {e}")
+            return None
+
+        if record.get("version") != CHECKPOINT_VERSION:
+            logger.info(f"Ignoring {phase} checkpoint from another version")
+            return None
+        if record.get("input_hash") != input_hash:
+            logger.info(f"Ignoring stale {phase} checkpoint: inputs changed")
+            return None
+
+        try:
+            stored = record["artifacts"]
+            artifacts = {
+                name: model.model_validate(stored[name])
+                for name, model in schema.items()
+            }
+        except (KeyError, TypeError, ValidationError) as e:
+            logger.warning(f"Ignoring invalid {phase} checkpoint: {e}")
+            return None
+
+        return Checkpoint(
+            phase=phase,
+            artifacts=artifacts,
+            hitl_overrides=record.get("hitl_overrides") or [],
+            created_at=record.get("created_at"),
+        )
+
+    def clear(self) -> int:
+        """
+        Delete all checkpoints for the task.
+
+        Returns:
+            Number of checkpoint files removed
+        """
+        if not self.directory.exists():
+            return 0
+        removed = 0
+        for path in self.directory.glob("*.json"):
+            path.unlink()
+            removed += 1
+        return removed
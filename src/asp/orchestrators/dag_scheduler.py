@@ -0,0 +1,660 @@
+"""
+DAG Scheduler: Pipelined Phases per Semantic Unit.
+
+TSPOrchestrator runs each phase over the whole task before the next phase
+starts, so the slowest file of code generation holds back every review.
+PipelinedTSPOrchestrator instead models the run as a dependency graph of
+phase nodes (PhaseGraph) at semantic-unit granularity:
+
+    planning -> design (+ design review gate) -> manifest
+    manifest + review of dependency units -> code:<SU> -> review:<SU>
+    all review:<SU> -> code_review -> test -> postmortem
+
+Components are grouped by their SemanticUnit id (ComponentLogic.
+semantic_unit_id) and unit dependencies come from ComponentLogic.
+dependencies. As soon as a unit's dependencies have passed their review
+gates its files are generated and reviewed, while other units are still
+being generated or reviewed. Files the manifest does not attribute to a
+design unit (configuration, shared helpers) form a "shared" unit without
+dependencies.
+
+Design and design review remain single nodes: the Design Agent produces
+the whole specification in one LLM call and the design review covers it
+as a whole, so pipelining starts at code generation.
+
+Quality-gate semantics are kept per unit: a unit's review gate (with the
+same targeted correction loop and HITL override as TSPOrchestrator) must
+pass before any unit depending on it is generated, and a gate failure
+halts the run. The merged code review is gated once more, since issue
+counts (e.g. five High issues) can fail the whole review even when every
+unit passed on its own.
+
+The result carries a ScheduleReport comparing critical-path time with
+total work time. Phase checkpoints are not written in this mode.
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+# pylint: disable=logging-fstring-interpolation
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from asp.models.code import CodeInput, FileManifest, FileMetadata, GeneratedCode
+from asp.models.code_review import CodeReviewReport
+from asp.models.design import DesignSpecification
+from asp.models.planning import TaskRequirements
+from asp.orchestrators.tsp_orchestrator import (
+    QualityGateFailure,
+    TSPOrchestrator,
+    enforce_run_budget,
+)
+from asp.orchestrators.types import NodeTiming, ScheduleReport, TSPExecutionResult
+from asp.utils.llm_budget import RunBudgetExceededError, is_budget_exceeded
+from asp.utils.llm_cache import cache_refresh
+
+logger = logging.getLogger(__name__)
+
+# Unit for manifest files not attributed to a semantic unit of the design
+SHARED_UNIT = "shared"
+
+
+@dataclass
+class _Node:
+    name: str
+    run: Callable[[dict[str, Any]], Awaitable[Any]]
+    depends_on: tuple[str, ...]
+
+
+class PhaseGraph:
+    """
+    Run async phase nodes as soon as the nodes they depend on are done.
+
+    Nodes must be added after their dependencies, so the graph is acyclic by
+    construction. A node's run callable receives the results of all nodes
+    finished so far, keyed by node name. run_async() may be called again
+    after adding nodes that depend on finished ones; timings accumulate
+    across runs.
+
+    Example:
+        >>> graph = PhaseGraph()
+        >>> graph.add("a", lambda results: fetch())
+        >>> graph.add("b", lambda results: use(results["a"]), depends_on=["a"])
+        >>> results = await graph.run_async()
+        >>> print(graph.report().critical_path)
+    """
+
+    def __init__(self, max_concurrent: int = 0):
+        """
+        Initialize the graph.
+
+        Args:
+            max_concurrent: Nodes allowed to run at the same time (0 = unlimited)
+        """
+        self.max_concurrent = max_concurrent
+        self._nodes: dict[str, _Node] = {}
+        self._results: dict[str, Any] = {}
+        self._timings: dict[str, NodeTiming] = {}
+        self._origin: float | None = None
+        self._wall_seconds = 0.0
+
+    def add(
+        self,
+        name: str,
+        run: Callable[[dict[str, Any]], Awaitable[Any]],
+        depends_on: Iterable[str] = (),
+    ) -> None:
+        """
+        Add a node.
+
+        Raises:
+            ValueError: If the name is taken or a dependency is unknown
+        """
+        if name in self._nodes:
+            raise ValueError(f"Duplicate phase node: {name}")
+        depends_on = tuple(depends_on)
+        unknown = [dep for dep in depends_on if dep not in self._nodes]
+        if unknown:
+            raise ValueError(f"Phase node {name} depends on unknown nodes: {unknown}")
+        self._nodes[name] = _Node(name=name, run=run, depends_on=depends_on)
+
+    @property
+    def results(self) -> dict[str, Any]:
+        """Results of the nodes finished so far."""
+        return dict(self._results)
+
+    async def run_async(self) -> dict[str, Any]:
+        """
+        Run every node that has not run yet.
+
+        If a node raises, the nodes still running are cancelled and the
+        error is re-raised.
+
+        Returns:
+            Results of all finished nodes, keyed by node name
+        """
+        if self._origin is None:
+            self._origin = time.monotonic()
+        semaphore = asyncio.Semaphore(self.max_concurrent or len(self._nodes) or 1)
+        tasks: dict[str, asyncio.Task] = {}
+
+        async def run_node(node: _Node) -> None:
+            for dep in node.depends_on:
+                if dep in tasks:
+                    await tasks[dep]
+            async with semaphore:
+                started = time.monotonic() - self._origin
+                logger.debug(f"Phase node {node.name} started at {started:.2f}s")
+                result = await node.run(self._results)
+                finished = time.monotonic() - self._origin
+            self._results[node.name] = result
+            self._timings[node.name] = NodeTiming(
+                name=node.name,
+                depends_on=node.depends_on,
+                started_at=started,
+                finished_at=finished,
+            )
+
+        for node in self._nodes.values():
+            if node.name not in self._results:
+                tasks[node.name] = asyncio.create_task(run_node(node))
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        finally:
+            self._wall_seconds = time.monotonic() - self._origin
+        return self.results
+
+    def report(self) -> ScheduleReport:
+        """Critical path and total work of the nodes run so far."""
+        # Longest chain of dependent nodes ending at each node (nodes finish
+        # after their dependencies, so completion order is topological)
+        chain: dict[str, tuple[float, list[str]]] = {}
+        for name, timing in self._timings.items():
+            before = max(
+                (chain[dep] for dep in timing.depends_on if dep in chain),
+                key=lambda entry: entry[0],
+                default=(0.0, []),
+            )
+            chain[name] = (before[0] + timing.duration_seconds, before[1] + [name])
+        critical_seconds, critical_path = max(
+            chain.values(), key=lambda entry: entry[0], default=(0.0, [])
+        )
+
+        timings = sorted(self._timings.values(), key=lambda t: t.started_at)
+        return ScheduleReport(
+            timings=timings,
+            wall_seconds=self._wall_seconds,
+            total_work_seconds=sum(t.duration_seconds for t in timings),
+            critical_path=critical_path,
+            critical_path_seconds=critical_seconds,
+        )
+
+
+def semantic_unit_dependencies(
+    design_spec: DesignSpecification,
+) -> dict[str, list[str]]:
+    """
+    Map each semantic unit of a design to the units its components depend on.
+
+    Components sharing a semantic_unit_id form one unit. Dependencies on
+    names that are not components of the design (e.g. libraries) are
+    ignored, and dependency cycles are broken by dropping the edge that
+    closes the cycle.
+
+    Returns:
+        Dependencies keyed by semantic unit id, in a topological order
+        (dependencies first, otherwise design order)
+    """
+    unit_of = {
+        component.component_name: component.semantic_unit_id
+        for component in design_spec.component_logic
+    }
+    wanted: dict[str, list[str]] = {}
+    for component in design_spec.component_logic:
+        deps = wanted.setdefault(component.semantic_unit_id, [])
+        for name in component.dependencies:
+            dep = unit_of.get(name)
+            if dep and dep != component.semantic_unit_id and dep not in deps:
+                deps.append(dep)
+
+    ordered: dict[str, list[str]] = {}
+    visiting: set[str] = set()
+
+    def visit(unit: str) -> None:
+        if unit in ordered:
+            return
+        visiting.add(unit)
+        deps = []
+        for dep in wanted[unit]:
+            if dep in visiting:
+                logger.warning(
+                    f"Dependency cycle between {unit} and {dep}: "
+                    f"scheduling {unit} without waiting for {dep}"
+                )
+                continue
+            visit(dep)
+            deps.append(dep)
+        visiting.discard(unit)
+        ordered[unit] = deps
+
+    for unit in wanted:
+        visit(unit)
+    return ordered
+
+
+class PipelinedTSPOrchestrator(TSPOrchestrator):
+    """
+    TSP pipeline with code generation and review pipelined per semantic unit.
+
+    Runs the same agents and quality gates as TSPOrchestrator, scheduled
+    with a PhaseGraph (see module docstring). result.schedule reports the
+    critical path against total work time.
+
+    Example:
+        >>> orchestrator = PipelinedTSPOrchestrator(max_concurrent_units=4)
+        >>> result = orchestrator.execute(requirements)
+        >>> schedule = result.schedule
+        >>> print(f"{schedule.critical_path_seconds:.0f}s critical path, "
+        ...       f"{schedule.total_work_seconds:.0f}s total work")
+    """
+
+    def __init__(self, *args, max_concurrent_units: int = 4, **kwargs):
+        """
+        Initialize the orchestrator.
+
+        Args:
+            *args: Passed to TSPOrchestrator
+            max_concurrent_units: Code/review nodes running at the same time
+            **kwargs: Passed to TSPOrchestrator
+        """
+        super().__init__(*args, **kwargs)
+        # Unit nodes generate from the manifest, not via CodeAgent.execute_async
+        self.speculative_codegen = False
+        if max_concurrent_units < 1:
+            raise ValueError("max_concurrent_units must be at least 1")
+        self.max_concurrent_units = max_concurrent_units
+
+    def execute(
+        self,
+        requirements: TaskRequirements,
+        design_constraints: str | None = None,
+        coding_standards: str | None = None,
+        hitl_approver: Callable | None = None,
+        resume: bool = False,
+    ) -> TSPExecutionResult:
+        """Synchronous entry point around execute_async."""
+        return asyncio.run(
+            self.execute_async(
+                requirements,
+                design_constraints=design_constraints,
+                coding_standards=coding_standards,
+                hitl_approver=hitl_approver,
+                resume=resume,
+            )
+        )
+
+    @enforce_run_budget
+    async def execute_async(
+        self,
+        requirements: TaskRequirements,
+        design_constraints: str | None = None,
+        coding_standards: str | None = None,
+        hitl_approver: Callable | None = None,
+        resume: bool = False,
+    ) -> TSPExecutionResult:
+        """
+        Execute the TSP pipeline as a phase graph.
+
+        Args:
+            requirements: TaskRequirements with task description
+            design_constraints: Optional design constraints/standards
+            coding_standards: Optional coding standards
+            hitl_approver: Optional callable for HITL approval
+            resume: Not supported (no checkpoints are written in this mode)
+
+        Returns:
+            TSPExecutionResult with its schedule report
+
+        Raises:
+            ValueError: If resume is requested
+            QualityGateFailure: If a quality gate fails and no HITL override
+            AgentExecutionError: If agent execution fails
+        """
+        if resume:
+            raise ValueError("PipelinedTSPOrchestrator does not support resume")
+
+        logger.info(
+            f"PIPELINED TSP ORCHESTRATOR: Starting "
+            f"{requirements.task_id} - {requirements.description}"
+        )
+        start_time = datetime.now()
+        self.execution_log = []
+        self.hitl_overrides = []
+        self._checkpoints = None
+        graph = PhaseGraph()
+
+        try:
+            # Planning and design are one chain of whole-task LLM calls
+            async def planning(_results):
+                project_plan = await self._execute_planning_async(requirements)
+                self._log_phase("Planning", "SUCCESS", project_plan)
+                return project_plan
+
+            async def design(results):
+                (
+                    design_spec,
+                    design_review,
+                ) = await self._execute_design_with_review_async(
+                    requirements=requirements,
+                    project_plan=results["planning"],
+                    design_constraints=design_constraints,
+                    hitl_approver=hitl_approver,
+                )
+                self._log_phase("Design", "SUCCESS", design_spec)
+                self._log_phase(
+                    "DesignReview", design_review.overall_assessment, design_review
+                )
+                return design_spec, design_review
+
+            graph.add("planning", planning)
+            graph.add("design", design, depends_on=["planning"])
+            await graph.run_async()
+
+            design_spec, design_review = graph.results["design"]
+            code_input = CodeInput(
+                task_id=requirements.task_id,
+                design_specification=design_spec,
+                coding_standards=coding_standards
+                or "Follow PEP 8. Use type hints. Include docstrings.",
+            )
+
+            async def manifest_node(_results):
+                return await self._generate_manifest(code_input)
+
+            graph.add("manifest", manifest_node, depends_on=["design"])
+            manifest = (await graph.run_async())["manifest"]
+
+            # From here on, each semantic unit moves through code generation
+            # and review on its own
+            graph.max_concurrent = self.max_concurrent_units
+            review_nodes = self._add_unit_nodes(
+                graph, requirements, code_input, manifest, design_spec, hitl_approver
+            )
+
+            async def code_review(results):
+                return self._merge_unit_reviews(
+                    requirements,
+                    code_input,
+                    manifest,
+                    [results[node] for node in review_nodes],
+                    hitl_approver,
+                )
+
+            async def test(results):
+                generated_code, _ = results["code_review"]
+                return await self._execute_testing_with_retry_async(
+                    requirements=requirements,
+                    design_spec=design_spec,
+                    generated_code=generated_code,
+                    coding_standards=coding_standards,
+                )
+
+            async def postmortem(results):
+                _, code_review_report = results["code_review"]
+                _, test_report = results["test"]
+                return await self._execute_postmortem_async(
+                    requirements=requirements,
+                    project_plan=results["planning"],
+                    design_review=design_review,
+                    code_review=code_review_report,
+                    test_report=test_report,
+                )
+
+            graph.add("code_review", code_review, depends_on=review_nodes)
+            graph.add("test", test, depends_on=["code_review"])
+            graph.add("postmortem", postmortem, depends_on=["test"])
+            results = await graph.run_async()
+
+            _, code_review_report = results["code_review"]
+            generated_code, test_report = results["test"]
+            self._log_phase("Test", test_report.test_status, test_report)
+            self._log_phase("Postmortem", "SUCCESS", results["postmortem"])
+
+            schedule = graph.report()
+            duration_seconds = (datetime.now() - start_time).total_seconds()
+            overall_status = self._determine_overall_status(
+                design_review, code_review_report, test_report
+            )
+            logger.info(
+                f"PIPELINED TSP ORCHESTRATOR: Pipeline COMPLETE "
+                f"({overall_status}) in {duration_seconds:.1f}s - "
+                f"critical path {schedule.critical_path_seconds:.1f}s, "
+                f"total work {schedule.total_work_seconds:.1f}s "
+                f"(parallelism {schedule.parallelism:.2f}): "
+                f"{' -> '.join(schedule.critical_path)}"
+            )
+
+            return TSPExecutionResult(
+                task_id=requirements.task_id,
+                overall_status=overall_status,
+                project_plan=results["planning"],
+                design_specification=design_spec,
+                design_review=design_review,
+                generated_code=generated_code,
+                code_review=code_review_report,
+                test_report=test_report,
+                postmortem_report=results["postmortem"],
+                execution_log=self.execution_log,
+                hitl_overrides=self.hitl_overrides,
+                total_duration_seconds=duration_seconds,
+                timestamp=start_time,
+                schedule=schedule,
+            )
+
+        except Exception as e:
+            if is_budget_exceeded(e, RunBudgetExceededError):
+                raise
+            logger.error(f"Pipelined TSP Orchestrator failed: {e}", exc_info=True)
+            self._log_phase("Pipeline", "FAILED", {"error": str(e)})
+            raise
+
+    async def _generate_manifest(self, code_input: CodeInput) -> FileManifest:
+        """Generate the file manifest all unit nodes draw their files from."""
+        manifest = await self.code_agent.generate_manifest_async(code_input)
+        logger.info(
+            f"✓ Manifest generated: {manifest.total_files} files, "
+            f"{manifest.total_estimated_lines} estimated LOC"
+        )
+        return manifest
+
+    def _add_unit_nodes(
+        self,
+        graph: PhaseGraph,
+        requirements: TaskRequirements,
+        code_input: CodeInput,
+        manifest: FileManifest,
+        design_spec: DesignSpecification,
+        hitl_approver: Callable | None,
+    ) -> list[str]:
+        """Add code:<unit> and review:<unit> nodes; return the review nodes."""
+        unit_deps = semantic_unit_dependencies(design_spec)
+        files_by_unit: dict[str, list[FileMetadata]] = {}
+        for file_meta in manifest.files:
+            unit = file_meta.semantic_unit_id
+            if unit not in unit_deps:
+                unit = SHARED_UNIT
+            files_by_unit.setdefault(unit, []).append(file_meta)
+
+        review_nodes = []
+        units = [unit for unit in unit_deps if unit in files_by_unit]
+        if SHARED_UNIT in files_by_unit:
+            units.append(SHARED_UNIT)
+        for unit in units:
+            file_metas = files_by_unit[unit]
+            deps = [f"review:{dep}" for dep in unit_deps.get(unit, []) if dep in units]
+            logger.info(
+                f"Unit {unit}: {len(file_metas)} files, "
+                f"waits for {deps or 'manifest only'}"
+            )
+
+            def make_code(unit=unit, file_metas=file_metas):
+                async def code(_results):
+                    files = await self.code_agent.generate_files_async(
+                        code_input, file_metas
+                    )
+                    unit_code = self.code_agent.assemble_generated_code(
+                        code_input, manifest, files
+                    )
+                    self._log_phase(f"Code[{unit}]", "SUCCESS", unit_code)
+                    return unit_code
+
+                return code
+
+            def make_review(unit=unit, file_metas=file_metas):
+                async def review(results):
+                    return await self._review_unit(
+                        requirements,
+                        unit,
+                        code_input,
+                        manifest,
+                        file_metas,
+                        results[f"code:{unit}"],
+                        hitl_approver,
+                    )
+
+                return review
+
+            graph.add(f"code:{unit}", make_code(), depends_on=["manifest", *deps])
+            graph.add(f"review:{unit}", make_review(), depends_on=[f"code:{unit}"])
+            review_nodes.append(f"review:{unit}")
+        return review_nodes
+
+    async def _review_unit(
+        self,
+        requirements: TaskRequirements,
+        unit: str,
+        code_input: CodeInput,
+        manifest: FileManifest,
+        file_metas: list[FileMetadata],
+        unit_code: GeneratedCode,
+        hitl_approver: Callable | None,
+    ) -> tuple[GeneratedCode, CodeReviewReport]:
+        """
+        Review one unit's files with the code review gate and correction loop.
+
+        Mirrors TSPOrchestrator._execute_code_with_review_async for a subset
+        of the files: after a FAIL only the failing files are regenerated and
+        re-reviewed, unless an issue cannot be attributed to one of them.
+        """
+        gate_name = f"CodeReview[{unit}]"
+        code_review = await self.code_review_orchestrator.execute_async(unit_code)
+        code_iterations = 1
+
+        while True:
+            logger.info(
+                f"{gate_name}: {code_review.review_status} "
+                f"({code_review.critical_issues}C/{code_review.high_issues}H/"
+                f"{code_review.medium_issues}M/{code_review.low_issues}L)"
+            )
+            self._log_phase(gate_name, code_review.review_status, code_review)
+            if code_review.review_status in ("PASS", "CONDITIONAL_PASS"):
+                return unit_code, code_review
+
+            approved = self._request_approval(
+                task_id=requirements.task_id,
+                gate_type="code_review",
+                gate_name=gate_name,
+                report=code_review,
+                hitl_approver=hitl_approver,
+            )
+            if approved:
+                logger.info(f"✓ HITL override approved for {gate_name}")
+                return unit_code, code_review
+
+            if code_iterations >= self.MAX_CODE_ITERATIONS:
+                raise QualityGateFailure(
+                    f"Code Review of {unit} FAILED after {code_iterations} "
+                    f"iterations. Critical: {code_review.critical_issues}, "
+                    f"High: {code_review.high_issues}. "
+                    f"Requires HITL approval to proceed."
+                )
+            if not self._can_afford_retry(f"{unit} code"):
+                raise RunBudgetExceededError(
+                    f"Run budget too tight to revise the failed code of {unit}"
+                )
+
+            feedback = self._review_feedback(unit_code, code_review)
+            if feedback:
+                unit_code = await self.code_agent.regenerate_files_async(
+                    code_input, unit_code, feedback
+                )
+                code_review = await asyncio.to_thread(
+                    self.code_review_orchestrator.review_changed_files,
+                    unit_code,
+                    code_review,
+                    set(feedback),
+                )
+            else:
+                # Same prompts as the rejected code: skip the response cache
+                with cache_refresh():
+                    files = await self.code_agent.generate_files_async(
+                        code_input, file_metas
+                    )
+                unit_code = self.code_agent.assemble_generated_code(
+                    code_input, manifest, files
+                )
+                code_review = await self.code_review_orchestrator.execute_async(
+                    unit_code
+                )
+            code_iterations += 1
+
+    def _merge_unit_reviews(
+        self,
+        requirements: TaskRequirements,
+        code_input: CodeInput,
+        manifest: FileManifest,
+        unit_results: list[tuple[GeneratedCode, CodeReviewReport]],
+        hitl_approver: Callable | None,
+    ) -> tuple[GeneratedCode, CodeReviewReport]:
+        """Assemble all units' code in manifest order and gate the merged review."""
+        files = {
+            file.file_path: file
+            for unit_code, _ in unit_results
+            for file in unit_code.files
+        }
+        generated_code = self.code_agent.assemble_generated_code(
+            code_input,
+            manifest,
+            [files[file_meta.file_path] for file_meta in manifest.files],
+        )
+        code_review = self.code_review_orchestrator.merge_reports(
+            generated_code, [review for _, review in unit_results]
+        )
+        self._log_phase("Code", "SUCCESS", generated_code)
+        self._log_phase("CodeReview", code_review.review_status, code_review)
+
+        if code_review.review_status == "FAIL" and not self._request_approval(
+            task_id=requirements.task_id,
+            gate_type="code_review",
+            gate_name="CodeReview",
+            report=code_review,
+            hitl_approver=hitl_approver,
+        ):
+            raise QualityGateFailure(
+                f"Merged Code Review FAILED. "
+                f"Critical: {code_review.critical_issues}, "
+                f"High: {code_review.high_issues}. "
+                f"Requires HITL approval to proceed."
+            )
+        return generated_code, code_review
@@ -18,6 +18,8 @@ from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from asp.utils.rate_limiter import TokenBucket
+
 if TYPE_CHECKING:
     from pydantic import BaseModel
 
@@ -343,6 +345,10 @@ class RateLimiter:
     Token bucket rate limiter for API calls.
 
     Limits the rate of operations to prevent API rate limit violations.
+    Backed by a timer-based TokenBucket: each acquire() reserves a token
+    and sleeps until refill covers it, so no background task is created
+    per token. For process-wide, header-driven limiting of LLM calls see
+    asp.utils.rate_limiter.AdaptiveRateLimiter.
 
     Example:
         >>> limiter = RateLimiter(requests_per_minute=60)
@@ -364,22 +370,14 @@ class RateLimiter:
         """
         self.requests_per_minute = requests_per_minute
         self.burst_size = burst_size or requests_per_minute
-        self._semaphore = asyncio.Semaphore(self.burst_size)
         self._refill_rate = 60.0 / requests_per_minute  # seconds per token
-        self._tasks: set[asyncio.Task[Any]] = set()  # Track background tasks
+        self._bucket = TokenBucket(requests_per_minute, burst=self.burst_size)
 
     async def acquire(self) -> None:
-        """Acquire a rate limit token."""
-        await self._semaphore.acquire()
-        # Schedule token release and track the task
-        task = asyncio.create_task(self._release_after_delay())
-        self._tasks.add(task)
-        task.add_done_callback(self._tasks.discard)
-
-    async def _release_after_delay(self) -> None:
-        """Release token after delay."""
-        await asyncio.sleep(self._refill_rate)
-        self._semaphore.release()
+        """Acquire a rate limit token, waiting for refill if necessary."""
+        delay = self._bucket.reserve(1)
+        if delay > 0:
+            await asyncio.sleep(delay)
 
     async def __aenter__(self) -> RateLimiter:
         """Context manager entry."""
@@ -387,28 +385,18 @@ class RateLimiter:
         return self
 
     async def __aexit__(self, *args) -> None:
-        """Context manager exit (token already scheduled for release)."""
+        """Context manager exit (tokens refill on their own)."""
         pass
 
     async def close(self) -> None:
         """
-        Cancel pending tasks and clean up resources.
+        Release resources.
 
-        Call this method during graceful shutdown to ensure all background
-        tasks are properly cancelled and awaited.
+        Kept for API compatibility: the timer-based bucket has no
+        background tasks to cancel, so this is a no-op.
 
         Example:
             >>> limiter = RateLimiter(requests_per_minute=60)
             >>> # ... use limiter ...
             >>> await limiter.close()  # Clean shutdown
         """
-        if not self._tasks:
-            return
-
-        # Cancel all pending tasks
-        for task in self._tasks:
-            task.cancel()
-
-        # Wait for all tasks to complete (with cancellation)
-        await asyncio.gather(*self._tasks, return_exceptions=True)
-        self._tasks.clear()
@@ -20,9 +20,14 @@ Date: November 22, 2025
 
 # pylint: disable=logging-fstring-interpolation
 
+import asyncio
+import functools
+import inspect
 import logging
+import os
 from collections.abc import Callable
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -46,8 +51,24 @@ from asp.models.postmortem import (
     PostmortemInput,
     PostmortemReport,
 )
-from asp.models.test import TestInput, TestReport
+from asp.models.test import TestDefect, TestInput, TestReport
+from asp.orchestrators.checkpoint import (
+    CheckpointStore,
+    checkpoints_enabled,
+    compute_input_hash,
+)
 from asp.orchestrators.types import TSPExecutionResult
+from asp.telemetry import log_agent_metric
+from asp.utils.llm_budget import (
+    RunBudget,
+    RunBudgetExceededError,
+    UsageMeter,
+    is_budget_exceeded,
+    run_budget_scope,
+    run_budget_tight,
+    usage_meter,
+)
+from asp.utils.llm_cache import cache_refresh
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +81,84 @@ class MaxIterationsExceeded(Exception):
     """Raised when orchestrator exceeds maximum correction iterations."""
 
 
+@dataclass
+class _Speculation:
+    """Code generation started on a candidate design during its review."""
+
+    task_id: str
+    project_id: str | None
+    design_spec: DesignSpecification
+    task: asyncio.Task
+    meter: UsageMeter
+
+
+# Result field holding each phase's artifact (see _log_phase)
+_PHASE_ARTIFACTS = {
+    "Planning": "project_plan",
+    "Design": "design_specification",
+    "DesignReview": "design_review",
+    "Code": "generated_code",
+    "CodeReview": "code_review",
+    "Test": "test_report",
+    "Postmortem": "postmortem_report",
+}
+
+
+def enforce_run_budget(method: Callable) -> Callable:
+    """
+    Run a pipeline entry point (execute/execute_async) within the run budget.
+
+    Starts the orchestrator's RunBudget, scopes every LLM call of the run to
+    it, and turns its exhaustion into a BUDGET_EXCEEDED result holding the
+    phases completed so far. Async runs are also cancelled at the deadline;
+    sync runs stop at their next LLM call after it.
+    """
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def run_async(self, requirements, *args, **kwargs):
+            self._phase_artifacts = {}
+            budget = self.run_budget
+            if budget is None:
+                return await method(self, requirements, *args, **kwargs)
+            budget.start()
+            with run_budget_scope(budget):
+                deadline = asyncio.timeout(budget.remaining_seconds)
+                try:
+                    async with deadline:
+                        result = await method(self, requirements, *args, **kwargs)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    if not (
+                        deadline.expired()
+                        or is_budget_exceeded(e, RunBudgetExceededError)
+                    ):
+                        raise
+                    return self._budget_exceeded_result(requirements, budget, e)
+            result.budget_summary = budget.summary()
+            return result
+
+        return run_async
+
+    @functools.wraps(method)
+    def run(self, requirements, *args, **kwargs):
+        self._phase_artifacts = {}
+        budget = self.run_budget
+        if budget is None:
+            return method(self, requirements, *args, **kwargs)
+        budget.start()
+        with run_budget_scope(budget):
+            try:
+                result = method(self, requirements, *args, **kwargs)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                if not is_budget_exceeded(e, RunBudgetExceededError):
+                    raise
+                return self._budget_exceeded_result(requirements, budget, e)
+        result.budget_summary = budget.summary()
+        return result
+
+    return run
+
+
 class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
     """
     TSP Orchestrator: Complete autonomous development pipeline with quality gates.
@@ -86,6 +185,18 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
     - Human can approve override with justification
     - All overrides are logged for audit trail
 
+    Speculative code generation (opt-in, execute_async only):
+    - Code generation starts on each candidate design during design review
+    - Kept if the design passes unchanged, cancelled if it is revised
+    - Hits, misses and wasted tokens/cost are logged as telemetry metrics
+
+    Run budget (optional wall clock, token and USD limits per run):
+    - Every LLM call is checked against and charged to the budget
+    - Once tight: fallback model, core review specialists only, no
+      speculative code generation, no further correction iterations
+    - Once exhausted: overall_status BUDGET_EXCEEDED with the phases
+      completed so far (later artifacts are None)
+
     Example:
         >>> orchestrator = TSPOrchestrator()
         >>> requirements = TaskRequirements(...)
@@ -103,11 +214,24 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
     MAX_TEST_ITERATIONS = 2
     MAX_TOTAL_ITERATIONS = 15
 
+    # Artifacts persisted by each checkpointed phase
+    CHECKPOINT_SCHEMAS: dict[str, dict[str, type]] = {
+        "planning": {"project_plan": ProjectPlan},
+        "design": {
+            "design_specification": DesignSpecification,
+            "design_review": DesignReviewReport,
+        },
+        "code": {"generated_code": GeneratedCode, "code_review": CodeReviewReport},
+        "test": {"generated_code": GeneratedCode, "test_report": TestReport},
+    }
+
     def __init__(
         self,
         db_path: Path | None = None,
         llm_client: Any | None = None,
         approval_service: ApprovalService | None = None,
+        speculative_codegen: bool | None = None,
+        run_budget: RunBudget | None = None,
     ):
         """
         Initialize TSP Orchestrator.
@@ -116,10 +240,24 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
             db_path: Optional path to SQLite database for telemetry
             llm_client: Optional LLM client (for dependency injection in tests)
             approval_service: Optional ApprovalService for HITL workflow
+            speculative_codegen: Optional flag to start code generation on each
+                candidate design while it is being reviewed (execute_async
+                only). If None, checks ASP_SPECULATIVE_CODEGEN environment
+                variable.
+            run_budget: Optional wall-clock/token/USD limits for each run.
+                If None, built from the ASP_RUN_* environment variables
+                (no limits when none is set).
         """
         self.db_path = db_path
         self.llm_client = llm_client
         self.approval_service = approval_service
+        if speculative_codegen is not None:
+            self.speculative_codegen = speculative_codegen
+        else:
+            self.speculative_codegen = (
+                os.getenv("ASP_SPECULATIVE_CODEGEN", "false").lower() == "true"
+            )
+        self.run_budget = run_budget if run_budget is not None else RunBudget.from_env()
 
         # Initialize agents (lazy-loaded)
         self._planning_agent: PlanningAgent | None = None
@@ -133,6 +271,10 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
         # Execution state
         self.execution_log: list[dict[str, Any]] = []
         self.hitl_overrides: list[dict[str, Any]] = []
+        self._checkpoints: CheckpointStore | None = None
+        self._resume = False
+        self._speculation: _Speculation | None = None
+        self._phase_artifacts: dict[str, Any] = {}
 
         logger.info("TSPOrchestrator initialized")
 
@@ -215,12 +357,14 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
     # Main execution method
     # =========================================================================
 
+    @enforce_run_budget
     def execute(
         self,
         requirements: TaskRequirements,
         design_constraints: str | None = None,
         coding_standards: str | None = None,
         hitl_approver: Callable | None = None,
+        resume: bool = False,
     ) -> TSPExecutionResult:
         """
         Execute complete TSP autonomous development pipeline.
@@ -233,6 +377,9 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
         - Code Review failure halts pipeline (requires HITL override)
         - Test failure triggers code regeneration loop (max 2 iterations)
 
+        The validated output of each phase is checkpointed (ASP_CHECKPOINTS)
+        keyed by a hash of its inputs, so a failed run can be resumed.
+
         Args:
             requirements: TaskRequirements with task description
             design_constraints: Optional design constraints/standards
@@ -242,9 +389,13 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
                           If None and no approval_service configured, quality gate
                           failures raise QualityGateFailure.
                           NOTE: approval_service takes precedence over hitl_approver
+            resume: If True, skip phases whose checkpoint in
+                    artifacts/{task_id}/checkpoints/ is still valid for the
+                    current inputs (Postmortem always reruns)
 
         Returns:
             TSPExecutionResult containing all artifacts and execution metadata
+            (only the completed phases' if the run budget was exhausted)
 
         Raises:
             QualityGateFailure: If quality gate fails and no HITL override
@@ -262,50 +413,110 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
         start_time = datetime.now()
         self.execution_log = []
         self.hitl_overrides = []
+        self._checkpoints = CheckpointStore(requirements.task_id)
+        self._resume = resume
 
         try:
             # Phase 1: Planning
             logger.info("\n[PHASE 1/7] PLANNING AGENT")
             logger.info("-" * 80)
-            project_plan = self._execute_planning(requirements)
-            self._log_phase("Planning", "SUCCESS", project_plan)
+            planning_hash = compute_input_hash(requirements)
+            restored = self._restore_checkpoint("planning", planning_hash)
+            if restored:
+                project_plan = restored["project_plan"]
+                self._log_phase("Planning", "RESUMED", project_plan)
+            else:
+                project_plan = self._execute_planning(requirements)
+                self._log_phase("Planning", "SUCCESS", project_plan)
+                self._save_checkpoint(
+                    "planning", planning_hash, {"project_plan": project_plan}
+                )
 
             # Phase 2: Design (with correction loop)
             logger.info("\n[PHASE 2/7] DESIGN AGENT")
             logger.info("-" * 80)
-            design_spec, design_review = self._execute_design_with_review(
-                requirements=requirements,
-                project_plan=project_plan,
-                design_constraints=design_constraints,
-                hitl_approver=hitl_approver,
-            )
-            self._log_phase("Design", "SUCCESS", design_spec)
-            self._log_phase(
-                "DesignReview", design_review.overall_assessment, design_review
+            design_hash = compute_input_hash(
+                requirements, project_plan, design_constraints
             )
+            restored = self._restore_checkpoint("design", design_hash)
+            if restored:
+                design_spec = restored["design_specification"]
+                design_review = restored["design_review"]
+                self._log_phase("Design", "RESUMED", design_spec)
+                self._log_phase("DesignReview", "RESUMED", design_review)
+            else:
+                overrides_from = len(self.hitl_overrides)
+                design_spec, design_review = self._execute_design_with_review(
+                    requirements=requirements,
+                    project_plan=project_plan,
+                    design_constraints=design_constraints,
+                    hitl_approver=hitl_approver,
+                )
+                self._log_phase("Design", "SUCCESS", design_spec)
+                self._log_phase(
+                    "DesignReview", design_review.overall_assessment, design_review
+                )
+                self._save_checkpoint(
+                    "design",
+                    design_hash,
+                    {
+                        "design_specification": design_spec,
+                        "design_review": design_review,
+                    },
+                    overrides_from,
+                )
 
             # Phase 3: Code Generation (with correction loop)
             logger.info("\n[PHASE 3/7] CODE AGENT")
             logger.info("-" * 80)
-            generated_code, code_review = self._execute_code_with_review(
-                requirements=requirements,
-                design_spec=design_spec,
-                coding_standards=coding_standards,
-                hitl_approver=hitl_approver,
-            )
-            self._log_phase("Code", "SUCCESS", generated_code)
-            self._log_phase("CodeReview", code_review.review_status, code_review)
+            code_hash = compute_input_hash(requirements, design_spec, coding_standards)
+            restored = self._restore_checkpoint("code", code_hash)
+            if restored:
+                generated_code = restored["generated_code"]
+                code_review = restored["code_review"]
+                self._log_phase("Code", "RESUMED", generated_code)
+                self._log_phase("CodeReview", "RESUMED", code_review)
+            else:
+                overrides_from = len(self.hitl_overrides)
+                generated_code, code_review = self._execute_code_with_review(
+                    requirements=requirements,
+                    design_spec=design_spec,
+                    coding_standards=coding_standards,
+                    hitl_approver=hitl_approver,
+                )
+                self._log_phase("Code", "SUCCESS", generated_code)
+                self._log_phase("CodeReview", code_review.review_status, code_review)
+                self._save_checkpoint(
+                    "code",
+                    code_hash,
+                    {"generated_code": generated_code, "code_review": code_review},
+                    overrides_from,
+                )
 
             # Phase 4: Testing (with correction loop for failures)
             logger.info("\n[PHASE 4/7] TEST AGENT")
             logger.info("-" * 80)
-            test_report = self._execute_testing_with_retry(
-                requirements=requirements,
-                design_spec=design_spec,
-                generated_code=generated_code,
-                coding_standards=coding_standards,
+            test_hash = compute_input_hash(
+                requirements, design_spec, generated_code, coding_standards
             )
-            self._log_phase("Test", test_report.test_status, test_report)
+            restored = self._restore_checkpoint("test", test_hash)
+            if restored:
+                generated_code = restored["generated_code"]
+                test_report = restored["test_report"]
+                self._log_phase("Test", "RESUMED", test_report)
+            else:
+                generated_code, test_report = self._execute_testing_with_retry(
+                    requirements=requirements,
+                    design_spec=design_spec,
+                    generated_code=generated_code,
+                    coding_standards=coding_standards,
+                )
+                self._log_phase("Test", test_report.test_status, test_report)
+                self._save_checkpoint(
+                    "test",
+                    test_hash,
+                    {"generated_code": generated_code, "test_report": test_report},
+                )
 
             # Phase 5: Postmortem Analysis
             logger.info("\n[PHASE 5/7] POSTMORTEM AGENT")
@@ -361,6 +572,8 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
             )
 
         except Exception as e:
+            if is_budget_exceeded(e, RunBudgetExceededError):
+                raise
             logger.error(f"TSP Orchestrator failed: {e}", exc_info=True)
             self._log_phase("Pipeline", "FAILED", {"error": str(e)})
             raise
@@ -466,6 +679,10 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
 
                 # No HITL or rejected - attempt correction if iterations remain
                 if design_iterations < self.MAX_DESIGN_ITERATIONS:
+                    if not self._can_afford_retry("design"):
+                        raise RunBudgetExceededError(
+                            "Run budget too tight to revise the failed design"
+                        )
                     logger.info("Retrying design with feedback from review...")
                     # In a full implementation, would pass feedback to design agent
                     # For now, just retry
@@ -494,21 +711,31 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
 
         Implements correction loop: Code → Review → Feedback → Recode
         Enforces quality gate: Halts on FAIL (requires HITL override)
+
+        After a FAIL, only files with Critical/High issues are regenerated
+        (with their issues as feedback) and only those files are re-reviewed.
         """
         code_iterations = 0
+        code_input = self._build_code_input(requirements, design_spec, coding_standards)
+        generated_code: GeneratedCode | None = None
+        code_review: CodeReviewReport | None = None
 
         while code_iterations < self.MAX_CODE_ITERATIONS:
-            # Generate code
+            # Generate code (only the failing files after a review FAIL)
             logger.info(
                 f"Code iteration {code_iterations + 1}/{self.MAX_CODE_ITERATIONS}"
             )
-            code_input = CodeInput(
-                task_id=requirements.task_id,
-                design_specification=design_spec,
-                coding_standards=coding_standards
-                or "Follow PEP 8. Use type hints. Include docstrings.",
-            )
-            generated_code = self.code_agent.execute(code_input)
+            feedback = self._review_feedback(generated_code, code_review)
+            if generated_code and code_review and feedback:
+                generated_code = self.code_agent.regenerate_files(
+                    code_input, generated_code, feedback
+                )
+            elif generated_code is None:
+                generated_code = self.code_agent.execute(code_input)
+            else:
+                # Same prompts as the rejected code: skip the response cache
+                with cache_refresh():
+                    generated_code = self.code_agent.execute(code_input)
             code_iterations += 1
 
             logger.info(
@@ -518,7 +745,12 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
 
             # Code Review (Quality Gate)
             logger.info("Executing Code Review Orchestrator (Quality Gate)...")
-            code_review = self.code_review_orchestrator.execute(generated_code)
+            if code_review and feedback:
+                code_review = self.code_review_orchestrator.review_changed_files(
+                    generated_code, code_review, set(feedback)
+                )
+            else:
+                code_review = self.code_review_orchestrator.execute(generated_code)
 
             logger.info(
                 f"Code Review: {code_review.review_status} "
@@ -560,6 +792,10 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
 
                 # No HITL or rejected - attempt correction if iterations remain
                 if code_iterations < self.MAX_CODE_ITERATIONS:
+                    if not self._can_afford_retry("code"):
+                        raise RunBudgetExceededError(
+                            "Run budget too tight to revise the failed code"
+                        )
                     logger.info("Retrying code generation with feedback from review...")
                     continue
                 raise QualityGateFailure(
@@ -579,31 +815,47 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
         design_spec: DesignSpecification,
         generated_code: GeneratedCode,
         coding_standards: str | None,
-    ) -> TestReport:
+    ) -> tuple[GeneratedCode, TestReport]:
         """
         Execute Test Agent with retry loop for test failures.
 
         Unlike review quality gates, test failures trigger automatic code regeneration
         (up to MAX_TEST_ITERATIONS) rather than requiring HITL approval.
+
+        After a failure, only the files the defects resolve to are regenerated
+        (with their defects as feedback) and only those files and the tests
+        that exercise them are re-tested. Returns the (possibly regenerated)
+        code together with its test report.
         """
         if self.MAX_TEST_ITERATIONS < 1:
             raise ValueError("MAX_TEST_ITERATIONS must be at least 1")
 
         test_iterations = 0
-        test_report: TestReport  # Will be assigned in first iteration
+        code_input = CodeInput(
+            task_id=requirements.task_id,
+            design_specification=design_spec,
+            coding_standards=coding_standards or "Follow PEP 8. Use type hints.",
+        )
+        test_report: TestReport | None = None
+        feedback: dict[str, str] | None = None
 
         while test_iterations < self.MAX_TEST_ITERATIONS:
             logger.info(
                 f"Test iteration {test_iterations + 1}/{self.MAX_TEST_ITERATIONS}"
             )
 
-            # Execute tests
+            # Execute tests (only the affected files after a targeted fix)
             test_input = TestInput(
                 task_id=requirements.task_id,
                 generated_code=generated_code,
                 design_specification=design_spec,
             )
-            test_report = self.test_agent.execute(test_input)
+            if test_report and feedback:
+                test_report = self.test_agent.retest_files(
+                    test_input, test_report, set(feedback)
+                )
+            else:
+                test_report = self.test_agent.execute(test_input)
             test_iterations += 1
 
             # Get test summary values
@@ -618,27 +870,29 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
             # Check test status
             if test_report.test_status == "PASS":
                 logger.info("✓ All tests PASSED")
-                return test_report
+                return generated_code, test_report
 
             # Tests failed - attempt correction if iterations remain
-            if test_iterations < self.MAX_TEST_ITERATIONS:
+            if test_iterations < self.MAX_TEST_ITERATIONS and self._can_afford_retry(
+                "test"
+            ):
                 logger.warning(
                     f"⚠ Tests FAILED: {len(test_report.defects_found)} defects found"
                 )
                 logger.info("Regenerating code with test feedback...")
 
-                # Regenerate code with feedback from test failures
-                # (In full implementation, would pass defects as feedback to code agent)
-                code_input = CodeInput(
-                    task_id=requirements.task_id,
-                    design_specification=design_spec,
-                    coding_standards=coding_standards
-                    or "Follow PEP 8. Use type hints.",
-                )
-                generated_code = self.code_agent.execute(code_input)
+                # Regenerate only the files the defects point at, if possible
+                feedback = self._defect_feedback(generated_code, test_report)
+                if feedback:
+                    generated_code = self.code_agent.regenerate_files(
+                        code_input, generated_code, feedback
+                    )
+                else:
+                    with cache_refresh():
+                        generated_code = self.code_agent.execute(code_input)
                 continue
             logger.error(f"✗ Tests still failing after {test_iterations} iterations")
-            return test_report
+            return generated_code, test_report
 
         # This is unreachable: loop always runs at least once and all paths return
         raise RuntimeError("Unreachable: test loop should always return")
@@ -768,8 +1022,253 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
             "timestamp": datetime.now().isoformat(),
         }
         self.execution_log.append(log_entry)
+        if phase_name in _PHASE_ARTIFACTS:
+            self._phase_artifacts[_PHASE_ARTIFACTS[phase_name]] = artifact
         logger.debug(f"Logged phase: {phase_name} - {status}")
 
+    def _can_afford_retry(self, phase: str) -> bool:
+        """Whether the run budget leaves room for another correction iteration."""
+        if run_budget_tight():
+            logger.warning(f"Run budget tight: no further {phase} iterations")
+            return False
+        return True
+
+    def _budget_exceeded_result(
+        self,
+        requirements: TaskRequirements,
+        budget: RunBudget,
+        error: Exception,
+    ) -> TSPExecutionResult:
+        """Result of a run stopped by its budget, with the completed phases."""
+        reason = budget.exhausted_reason() or str(error)
+        artifacts = self._phase_artifacts
+        logger.warning(
+            f"TSP ORCHESTRATOR: Run budget exhausted for {requirements.task_id} "
+            f"({reason}); returning {len(artifacts)} completed phase artifacts"
+        )
+        self._log_phase("Pipeline", "BUDGET_EXCEEDED", {"error": reason})
+        return TSPExecutionResult(
+            task_id=requirements.task_id,
+            overall_status="BUDGET_EXCEEDED",
+            project_plan=artifacts.get("project_plan"),
+            design_specification=artifacts.get("design_specification"),
+            design_review=artifacts.get("design_review"),
+            generated_code=artifacts.get("generated_code"),
+            code_review=artifacts.get("code_review"),
+            test_report=artifacts.get("test_report"),
+            postmortem_report=artifacts.get("postmortem_report"),
+            execution_log=self.execution_log,
+            hitl_overrides=self.hitl_overrides,
+            total_duration_seconds=budget.elapsed_seconds,
+            timestamp=datetime.now() - timedelta(seconds=budget.elapsed_seconds),
+            budget_summary=budget.summary(),
+        )
+
+    def _restore_checkpoint(self, phase: str, input_hash: str) -> dict | None:
+        """
+        Restore a phase's artifacts from its checkpoint when resuming.
+
+        HITL overrides granted when the checkpoint was written are replayed
+        into the audit trail so the result reflects how the gate was passed.
+        """
+        if not self._resume or self._checkpoints is None:
+            return None
+        checkpoint = self._checkpoints.load(
+            phase, input_hash, self.CHECKPOINT_SCHEMAS[phase]
+        )
+        if checkpoint is None:
+            return None
+
+        self.hitl_overrides.extend(checkpoint.hitl_overrides)
+        logger.info(f"↻ Resumed {phase} from checkpoint ({checkpoint.created_at})")
+        return checkpoint.artifacts
+
+    def _save_checkpoint(
+        self,
+        phase: str,
+        input_hash: str,
+        artifacts: dict[str, Any],
+        overrides_from: int = 0,
+    ):
+        """Checkpoint a completed phase with the HITL overrides it recorded."""
+        if self._checkpoints is None or not checkpoints_enabled():
+            return
+        self._checkpoints.save(
+            phase, input_hash, artifacts, self.hitl_overrides[overrides_from:]
+        )
+
+    @staticmethod
+    def _build_code_input(
+        requirements: TaskRequirements,
+        design_spec: DesignSpecification,
+        coding_standards: str | None,
+    ) -> CodeInput:
+        """CodeInput for the code phase (also used for speculative generation)."""
+        return CodeInput(
+            task_id=requirements.task_id,
+            design_specification=design_spec,
+            coding_standards=coding_standards
+            or "Follow PEP 8. Use type hints. Include docstrings.",
+        )
+
+    def _start_speculation(
+        self,
+        requirements: TaskRequirements,
+        design_spec: DesignSpecification,
+        coding_standards: str | None,
+    ) -> None:
+        """Start generating code for a candidate design while it is reviewed."""
+        code_input = self._build_code_input(requirements, design_spec, coding_standards)
+        # The task runs in a copy of the current context, so the meter keeps
+        # measuring its LLM calls after the with block
+        with usage_meter() as meter:
+            task = asyncio.create_task(self.code_agent.execute_async(code_input))
+        self._speculation = _Speculation(
+            task_id=requirements.task_id,
+            project_id=requirements.project_id,
+            design_spec=design_spec,
+            task=task,
+            meter=meter,
+        )
+        logger.info("Speculative code generation started during design review")
+
+    async def _take_speculation(
+        self, design_spec: DesignSpecification
+    ) -> GeneratedCode | None:
+        """
+        Return speculatively generated code for the approved design, if any.
+
+        Code generated for a different design object (e.g. a design restored
+        from a checkpoint) or a speculation that failed is discarded, and the
+        code phase generates from scratch.
+        """
+        speculation = self._speculation
+        if speculation is None:
+            return None
+        if speculation.design_spec is not design_spec:
+            await self._discard_speculation("design changed")
+            return None
+
+        self._speculation = None
+        try:
+            generated_code = await speculation.task
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning(f"Speculative code generation failed: {e}")
+            self._record_speculation(speculation, hit=False)
+            return None
+        logger.info("✓ Speculative code generation hit: design passed unchanged")
+        self._record_speculation(speculation, hit=True)
+        return generated_code
+
+    async def _discard_speculation(self, reason: str) -> None:
+        """Cancel a pending speculation and record its wasted usage."""
+        speculation = self._speculation
+        if speculation is None:
+            return
+        self._speculation = None
+        speculation.task.cancel()
+        await asyncio.gather(speculation.task, return_exceptions=True)
+        logger.info(f"Speculative code generation discarded: {reason}")
+        self._record_speculation(speculation, hit=False)
+
+    def _record_speculation(self, speculation: _Speculation, hit: bool) -> None:
+        """Log a speculation outcome; a miss also logs its wasted tokens/cost."""
+        metrics = [("Speculation_Hits" if hit else "Speculation_Misses", 1, "count")]
+        if not hit:
+            metrics += [
+                ("Speculation_Wasted_Tokens", speculation.meter.total_tokens, "tokens"),
+                ("Speculation_Wasted_Cost", speculation.meter.cost_usd, "USD"),
+            ]
+        for metric_type, value, unit in metrics:
+            if value:
+                log_agent_metric(
+                    task_id=speculation.task_id,
+                    project_id=speculation.project_id,
+                    agent_role="Code",
+                    metric_type=metric_type,
+                    metric_value=value,
+                    metric_unit=unit,
+                    db_path=self.db_path,
+                )
+
+    def _review_feedback(
+        self,
+        generated_code: GeneratedCode | None,
+        code_review: CodeReviewReport | None,
+    ) -> dict[str, str] | None:
+        """
+        Map a failed code review to per-file feedback for targeted regeneration.
+
+        Files with Critical or High issues are regenerated with all of their
+        issues as feedback. Returns None (regenerate everything) before the
+        first review, or when a blocking issue names a file that is not in
+        the generated code (e.g. a missing module or a cross-file problem).
+        """
+        if generated_code is None or code_review is None:
+            return None
+
+        blocking = [
+            issue
+            for issue in code_review.issues_found
+            if issue.severity in ("Critical", "High")
+        ]
+        generated_paths = {file.file_path for file in generated_code.files}
+        unmapped = {issue.file_path for issue in blocking} - generated_paths
+        if not blocking or unmapped:
+            logger.info(
+                f"Review issues not attributable to generated files {sorted(unmapped)}"
+                " - regenerating all files"
+            )
+            return None
+
+        failing_paths = {issue.file_path for issue in blocking}
+        logger.info(
+            f"Regenerating {len(failing_paths)}/{len(generated_paths)} files "
+            f"with review feedback: {sorted(failing_paths)}"
+        )
+        return self.code_agent.format_review_feedback(
+            [
+                issue
+                for issue in code_review.issues_found
+                if issue.file_path in failing_paths
+            ]
+        )
+
+    def _defect_feedback(
+        self,
+        generated_code: GeneratedCode,
+        test_report: TestReport,
+    ) -> dict[str, str] | None:
+        """
+        Map failed tests to per-file feedback for targeted regeneration.
+
+        Each defect is resolved to the generated files it occurs in (see
+        TestAgent.resolve_defect_files). Returns None (regenerate everything)
+        when there are no defects to go by (e.g. a build failure without
+        defects) or when any defect cannot be attributed to a file.
+        """
+        defects_by_file: dict[str, list[TestDefect]] = {}
+        unresolved = []
+        for defect in test_report.defects_found:
+            paths = self.test_agent.resolve_defect_files(defect, generated_code)
+            if not paths:
+                unresolved.append(defect.defect_id)
+            for path in sorted(paths):
+                defects_by_file.setdefault(path, []).append(defect)
+
+        if not defects_by_file or unresolved:
+            logger.info(
+                f"Test defects not attributable to generated files {unresolved}"
+                " - regenerating all files"
+            )
+            return None
+
+        logger.info(
+            f"Regenerating {len(defects_by_file)}/{generated_code.total_files} "
+            f"files with test feedback: {sorted(defects_by_file)}"
+        )
+        return self.code_agent.format_test_feedback(defects_by_file)
+
     def _record_hitl_override(self, gate_name: str, report: Any, decision: str):
         """Record HITL override decision to audit trail."""
         override_record = {
@@ -890,12 +1389,14 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
     # Async execution methods (ADR 008 Phase 4)
     # =========================================================================
 
+    @enforce_run_budget
     async def execute_async(
         self,
         requirements: TaskRequirements,
         design_constraints: str | None = None,
         coding_standards: str | None = None,
         hitl_approver: Callable | None = None,
+        resume: bool = False,
     ) -> TSPExecutionResult:
         """
         Execute complete TSP autonomous development pipeline asynchronously.
@@ -916,9 +1417,11 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
             design_constraints: Optional design constraints/standards
             coding_standards: Optional coding standards
             hitl_approver: Optional callable for HITL approval (legacy interface).
+            resume: If True, skip phases with a valid checkpoint (see execute())
 
         Returns:
             TSPExecutionResult containing all artifacts and execution metadata
+            (only the completed phases' if the run budget was exhausted)
 
         Raises:
             QualityGateFailure: If quality gate fails and no HITL override
@@ -936,50 +1439,121 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
         start_time = datetime.now()
         self.execution_log = []
         self.hitl_overrides = []
+        self._checkpoints = CheckpointStore(requirements.task_id)
+        self._resume = resume
 
         try:
             # Phase 1: Planning
             logger.info("\n[PHASE 1/7] PLANNING AGENT (async)")
             logger.info("-" * 80)
-            project_plan = await self._execute_planning_async(requirements)
-            self._log_phase("Planning", "SUCCESS", project_plan)
+            planning_hash = compute_input_hash(requirements)
+            restored = self._restore_checkpoint("planning", planning_hash)
+            if restored:
+                project_plan = restored["project_plan"]
+                self._log_phase("Planning", "RESUMED", project_plan)
+            else:
+                project_plan = await self._execute_planning_async(requirements)
+                self._log_phase("Planning", "SUCCESS", project_plan)
+                self._save_checkpoint(
+                    "planning", planning_hash, {"project_plan": project_plan}
+                )
 
             # Phase 2: Design (with correction loop)
             logger.info("\n[PHASE 2/7] DESIGN AGENT (async)")
             logger.info("-" * 80)
-            design_spec, design_review = await self._execute_design_with_review_async(
-                requirements=requirements,
-                project_plan=project_plan,
-                design_constraints=design_constraints,
-                hitl_approver=hitl_approver,
-            )
-            self._log_phase("Design", "SUCCESS", design_spec)
-            self._log_phase(
-                "DesignReview", design_review.overall_assessment, design_review
+            design_hash = compute_input_hash(
+                requirements, project_plan, design_constraints
             )
+            restored = self._restore_checkpoint("design", design_hash)
+            if restored:
+                design_spec = restored["design_specification"]
+                design_review = restored["design_review"]
+                self._log_phase("Design", "RESUMED", design_spec)
+                self._log_phase("DesignReview", "RESUMED", design_review)
+            else:
+                overrides_from = len(self.hitl_overrides)
+                (
+                    design_spec,
+                    design_review,
+                ) = await self._execute_design_with_review_async(
+                    requirements=requirements,
+                    project_plan=project_plan,
+                    design_constraints=design_constraints,
+                    hitl_approver=hitl_approver,
+                    coding_standards=coding_standards,
+                )
+                self._log_phase("Design", "SUCCESS", design_spec)
+                self._log_phase(
+                    "DesignReview", design_review.overall_assessment, design_review
+                )
+                self._save_checkpoint(
+                    "design",
+                    design_hash,
+                    {
+                        "design_specification": design_spec,
+                        "design_review": design_review,
+                    },
+                    overrides_from,
+                )
 
             # Phase 3: Code Generation (with correction loop)
             logger.info("\n[PHASE 3/7] CODE AGENT (async)")
             logger.info("-" * 80)
-            generated_code, code_review = await self._execute_code_with_review_async(
-                requirements=requirements,
-                design_spec=design_spec,
-                coding_standards=coding_standards,
-                hitl_approver=hitl_approver,
-            )
-            self._log_phase("Code", "SUCCESS", generated_code)
-            self._log_phase("CodeReview", code_review.review_status, code_review)
+            code_hash = compute_input_hash(requirements, design_spec, coding_standards)
+            restored = self._restore_checkpoint("code", code_hash)
+            if restored:
+                generated_code = restored["generated_code"]
+                code_review = restored["code_review"]
+                self._log_phase("Code", "RESUMED", generated_code)
+                self._log_phase("CodeReview", "RESUMED", code_review)
+            else:
+                overrides_from = len(self.hitl_overrides)
+                (
+                    generated_code,
+                    code_review,
+                ) = await self._execute_code_with_review_async(
+                    requirements=requirements,
+                    design_spec=design_spec,
+                    coding_standards=coding_standards,
+                    hitl_approver=hitl_approver,
+                )
+                self._log_phase("Code", "SUCCESS", generated_code)
+                self._log_phase("CodeReview", code_review.review_status, code_review)
+                self._save_checkpoint(
+                    "code",
+                    code_hash,
+                    {"generated_code": generated_code, "code_review": code_review},
+                    overrides_from,
+                )
+            await self._discard_speculation("code phase resumed from checkpoint")
 
             # Phase 4: Testing (with correction loop for failures)
             logger.info("\n[PHASE 4/7] TEST AGENT (async)")
             logger.info("-" * 80)
-            test_report = await self._execute_testing_with_retry_async(
-                requirements=requirements,
-                design_spec=design_spec,
-                generated_code=generated_code,
-                coding_standards=coding_standards,
+            test_hash = compute_input_hash(
+                requirements, design_spec, generated_code, coding_standards
             )
-            self._log_phase("Test", test_report.test_status, test_report)
+            restored = self._restore_checkpoint("test", test_hash)
+            if restored:
+                generated_code = restored["generated_code"]
+                test_report = restored["test_report"]
+                self._log_phase("Test", "RESUMED", test_report)
+            else:
+                (
+                    generated_code,
+                    test_report,
+                ) = await self._execute_testing_with_retry_async(
+                    requirements=requirements,
+                    design_spec=design_spec,
+                    generated_code=generated_code,
+                    coding_standards=coding_standards,
+                )
+                self._log_phase("Test", test_report.test_status, test_report)
+                self._save_checkpoint(
+                    "test",
+                    test_hash,
+                    {"generated_code": generated_code, "test_report": test_report},
+                )
 
             # Phase 5: Postmortem Analysis
             logger.info("\n[PHASE 5/7] POSTMORTEM AGENT (async)")
@@ -1035,9 +1609,13 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
             )
 
         except Exception as e:
+            if is_budget_exceeded(e, RunBudgetExceededError):
+                raise
             logger.error(f"TSP Orchestrator (async) failed: {e}", exc_info=True)
             self._log_phase("Pipeline", "FAILED", {"error": str(e)})
             raise
+        finally:
+            await self._discard_speculation("pipeline ended")
 
     async def _execute_planning_async(
         self,
@@ -1064,12 +1642,18 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
         project_plan: ProjectPlan,
         design_constraints: str | None,
         hitl_approver: Callable | None,
+        coding_standards: str | None = None,
     ) -> tuple[DesignSpecification, DesignReviewReport]:
         """
         Execute Design Agent asynchronously with Design Review quality gate.
 
         Implements correction loop: Design → Review → Feedback → Redesign
         Enforces quality gate: Halts on FAIL (requires HITL override)
+
+        With speculative_codegen, code generation starts on each candidate
+        design while it is reviewed. The speculation is kept for the code
+        phase if the design passes unchanged (including by HITL override)
+        and cancelled if the design is revised or the gate fails.
         """
         design_iterations = 0
 
@@ -1091,6 +1675,8 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
                 f"✓ Design complete: {len(design_spec.api_contracts)} APIs, "
                 f"{len(design_spec.component_logic)} components"
             )
+            if self.speculative_codegen and not run_budget_tight():
+                self._start_speculation(requirements, design_spec, coding_standards)
 
             # Design Review (Quality Gate)
             logger.info("Executing Design Review Orchestrator (async, Quality Gate)...")
@@ -1137,7 +1723,12 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
                     return design_spec, design_review
 
                 # No HITL or rejected - attempt correction if iterations remain
+                await self._discard_speculation("design failed review")
                 if design_iterations < self.MAX_DESIGN_ITERATIONS:
+                    if not self._can_afford_retry("design"):
+                        raise RunBudgetExceededError(
+                            "Run budget too tight to revise the failed design"
+                        )
                     logger.info("Retrying design with feedback from review...")
                     continue
                 # Exceeded iterations
@@ -1164,21 +1755,35 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
 
         Implements correction loop: Code → Review → Feedback → Recode
         Enforces quality gate: Halts on FAIL (requires HITL override)
+
+        After a FAIL, only files with Critical/High issues are regenerated
+        (with their issues as feedback) and only those files are re-reviewed.
+        The first iteration uses code generated speculatively during design
+        review, if there is any for this design.
         """
         code_iterations = 0
+        code_input = self._build_code_input(requirements, design_spec, coding_standards)
+        generated_code = await self._take_speculation(design_spec)
+        code_review: CodeReviewReport | None = None
 
         while code_iterations < self.MAX_CODE_ITERATIONS:
-            # Generate code
+            # Generate code (only the failing files after a review FAIL)
             logger.info(
                 f"Code iteration {code_iterations + 1}/{self.MAX_CODE_ITERATIONS}"
             )
-            code_input = CodeInput(
-                task_id=requirements.task_id,
-                design_specification=design_spec,
-                coding_standards=coding_standards
-                or "Follow PEP 8. Use type hints. Include docstrings.",
-            )
-            generated_code = await self.code_agent.execute_async(code_input)
+            feedback = self._review_feedback(generated_code, code_review)
+            if generated_code and code_review and feedback:
+                generated_code = await self.code_agent.regenerate_files_async(
+                    code_input, generated_code, feedback
+                )
+            elif generated_code and code_review is None:
+                logger.info("Using code generated speculatively during design review")
+            elif generated_code is None:
+                generated_code = await self.code_agent.execute_async(code_input)
+            else:
+                # Same prompts as the rejected code: skip the response cache
+                with cache_refresh():
+                    generated_code = await self.code_agent.execute_async(code_input)
             code_iterations += 1
 
             logger.info(
@@ -1188,9 +1793,17 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
 
             # Code Review (Quality Gate)
             logger.info("Executing Code Review Orchestrator (async, Quality Gate)...")
-            code_review = await self.code_review_orchestrator.execute_async(
-                generated_code
-            )
+            if code_review and feedback:
+                code_review = await asyncio.to_thread(
+                    self.code_review_orchestrator.review_changed_files,
+                    generated_code,
+                    code_review,
+                    set(feedback),
+                )
+            else:
+                code_review = await self.code_review_orchestrator.execute_async(
+                    generated_code
+                )
 
             logger.info(
                 f"Code Review: {code_review.review_status} "
@@ -1232,6 +1845,10 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
 
                 # No HITL or rejected - attempt correction if iterations remain
                 if code_iterations < self.MAX_CODE_ITERATIONS:
+                    if not self._can_afford_retry("code"):
+                        raise RunBudgetExceededError(
+                            "Run budget too tight to revise the failed code"
+                        )
                     logger.info("Retrying code generation with feedback from review...")
                     continue
                 raise QualityGateFailure(
@@ -1251,31 +1868,47 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
         design_spec: DesignSpecification,
         generated_code: GeneratedCode,
         coding_standards: str | None,
-    ) -> TestReport:
+    ) -> tuple[GeneratedCode, TestReport]:
         """
         Execute Test Agent asynchronously with retry loop for test failures.
 
         Unlike review quality gates, test failures trigger automatic code regeneration
         (up to MAX_TEST_ITERATIONS) rather than requiring HITL approval.
+
+        After a failure, only the files the defects resolve to are regenerated
+        (with their defects as feedback) and only those files and the tests
+        that exercise them are re-tested. Returns the (possibly regenerated)
+        code together with its test report.
         """
         if self.MAX_TEST_ITERATIONS < 1:
             raise ValueError("MAX_TEST_ITERATIONS must be at least 1")
 
         test_iterations = 0
-        test_report: TestReport  # Will be assigned in first iteration
+        code_input = CodeInput(
+            task_id=requirements.task_id,
+            design_specification=design_spec,
+            coding_standards=coding_standards or "Follow PEP 8. Use type hints.",
+        )
+        test_report: TestReport | None = None
+        feedback: dict[str, str] | None = None
 
         while test_iterations < self.MAX_TEST_ITERATIONS:
             logger.info(
                 f"Test iteration {test_iterations + 1}/{self.MAX_TEST_ITERATIONS}"
             )
 
-            # Execute tests
+            # Execute tests (only the affected files after a targeted fix)
             test_input = TestInput(
                 task_id=requirements.task_id,
                 generated_code=generated_code,
                 design_specification=design_spec,
             )
-            test_report = await self.test_agent.execute_async(test_input)
+            if test_report and feedback:
+                test_report = await self.test_agent.retest_files_async(
+                    test_input, test_report, set(feedback)
+                )
+            else:
+                test_report = await self.test_agent.execute_async(test_input)
             test_iterations += 1
 
             # Get test summary values
@@ -1290,26 +1923,29 @@ class TSPOrchestrator:  # pylint: disable=too-many-instance-attributes
             # Check test status
             if test_report.test_status == "PASS":
                 logger.info("✓ All tests PASSED")
-                return test_report
+                return generated_code, test_report
 
             # Tests failed - attempt correction if iterations remain
-            if test_iterations < self.MAX_TEST_ITERATIONS:
+            if test_iterations < self.MAX_TEST_ITERATIONS and self._can_afford_retry(
+                "test"
+            ):
                 logger.warning(
                     f"⚠ Tests FAILED: {len(test_report.defects_found)} defects found"
                 )
                 logger.info("Regenerating code with test feedback (async)...")
 
-                # Regenerate code with feedback from test failures
-                code_input = CodeInput(
-                    task_id=requirements.task_id,
-                    design_specification=design_spec,
-                    coding_standards=coding_standards
-                    or "Follow PEP 8. Use type hints.",
-                )
-                generated_code = await self.code_agent.execute_async(code_input)
+                # Regenerate only the files the defects point at, if possible
+                feedback = self._defect_feedback(generated_code, test_report)
+                if feedback:
+                    generated_code = await self.code_agent.regenerate_files_async(
+                        code_input, generated_code, feedback
+                    )
+                else:
+                    with cache_refresh():
+                        generated_code = await self.code_agent.execute_async(code_input)
                 continue
             logger.error(f"✗ Tests still failing after {test_iterations} iterations")
-            return test_report
+            return generated_code, test_report
 
         # This is unreachable: loop always runs at least once and all paths return
         raise RuntimeError("Unreachable: test loop should always return")
@@ -10,7 +10,7 @@ Date: November 20, 2025
 
 # pylint: disable=too-many-instance-attributes
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Literal
 
@@ -50,6 +50,50 @@ class PlanningDesignResult:
     design_review: DesignReviewReport
 
 
+@dataclass
+class NodeTiming:
+    """
+    When one node of a phase graph ran.
+
+    started_at and finished_at are seconds since the graph started running.
+    """
+
+    name: str
+    depends_on: tuple[str, ...]
+    started_at: float
+    finished_at: float
+
+    @property
+    def duration_seconds(self) -> float:
+        """Time the node spent running."""
+        return self.finished_at - self.started_at
+
+
+@dataclass
+class ScheduleReport:
+    """
+    Critical-path analysis of a phase graph run.
+
+    total_work_seconds is the sum of all node durations (the time a strictly
+    sequential run would take); critical_path_seconds is the longest chain
+    of dependent nodes, the lower bound on wall time however much runs in
+    parallel.
+    """
+
+    timings: list[NodeTiming] = field(default_factory=list)
+    wall_seconds: float = 0.0
+    total_work_seconds: float = 0.0
+    critical_path: list[str] = field(default_factory=list)
+    critical_path_seconds: float = 0.0
+
+    @property
+    def parallelism(self) -> float:
+        """Total work divided by critical-path time (1.0 = fully sequential)."""
+        if self.critical_path_seconds <= 0:
+            return 1.0
+        return self.total_work_seconds / self.critical_path_seconds
+
+
 @dataclass
 class TSPExecutionResult:
     """
@@ -68,7 +112,7 @@ class TSPExecutionResult:
     - execution_log: List of phase execution events
     - hitl_overrides: List of HITL approval decisions
     - total_duration_seconds: Total pipeline execution time
-    - overall_status: PASS/CONDITIONAL_PASS/FAIL/NEEDS_REVIEW
+    - overall_status: PASS/CONDITIONAL_PASS/FAIL/NEEDS_REVIEW/BUDGET_EXCEEDED
 
     Example:
         >>> orchestrator = TSPOrchestrator()
@@ -84,16 +128,17 @@ class TSPExecutionResult:
     timestamp: datetime
 
     # Execution status
-    overall_status: str  # PASS, CONDITIONAL_PASS, FAIL, NEEDS_REVIEW
-
-    # Phase artifacts (in pipeline order)
-    project_plan: ProjectPlan
-    design_specification: DesignSpecification
-    design_review: DesignReviewReport
-    generated_code: GeneratedCode
-    code_review: CodeReviewReport
-    test_report: TestReport
-    postmortem_report: PostmortemReport
+    overall_status: str  # PASS, CONDITIONAL_PASS, FAIL, NEEDS_REVIEW, BUDGET_EXCEEDED
+
+    # Phase artifacts (in pipeline order; None for phases a BUDGET_EXCEEDED
+    # run did not complete)
+    project_plan: ProjectPlan | None
+    design_specification: DesignSpecification | None
+    design_review: DesignReviewReport | None
+    generated_code: GeneratedCode | None
+    code_review: CodeReviewReport | None
+    test_report: TestReport | None
+    postmortem_report: PostmortemReport | None
 
     # Execution metadata
     execution_log: list[dict[str, Any]]
@@ -106,6 +151,12 @@ class TSPExecutionResult:
     # Repair result (only set when mode="repair")
     repair_result: RepairResult | None = None
 
+    # Phase schedule (only set by PipelinedTSPOrchestrator)
+    schedule: ScheduleReport | None = None
+
+    # Run budget limits and usage (only set when a RunBudget applied)
+    budget_summary: dict[str, Any] | None = None
+
 
 @dataclass
 class RepairExecutionResult:
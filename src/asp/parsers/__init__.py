@@ -6,11 +6,21 @@ This module contains parsers for converting various output formats
 
 Parsers:
     - DesignMarkdownParser: Parse Design Agent markdown output
+    - IncrementalJSONArrayParser: Surface completed JSON array items while streaming
+    - IncrementalMarkdownSectionParser: Surface completed markdown sections while streaming
 
 Author: ASP Development Team
 Date: November 21, 2025
 """
 
 from asp.parsers.design_markdown_parser import DesignMarkdownParser
+from asp.parsers.incremental import (
+    IncrementalJSONArrayParser,
+    IncrementalMarkdownSectionParser,
+)
 
-__all__ = ["DesignMarkdownParser"]
+__all__ = [
+    "DesignMarkdownParser",
+    "IncrementalJSONArrayParser",
+    "IncrementalMarkdownSectionParser",
+]
@@ -28,12 +28,17 @@ class DesignMarkdownParser:
         design_spec = DesignSpecification.model_validate(design_dict)
     """
 
-    def parse(self, markdown: str) -> dict[str, Any]:
+    def parse(
+        self, markdown: str, sections: dict[str, str] | None = None
+    ) -> dict[str, Any]:
         """
         Parse markdown content into DesignSpecification dict.
 
         Args:
             markdown: Markdown-formatted design specification
+            sections: Optional pre-extracted sections (e.g., collected by
+                IncrementalMarkdownSectionParser while streaming). Extracted
+                from markdown when not provided.
 
         Returns:
             Dictionary with DesignSpecification fields
@@ -42,7 +47,8 @@ class DesignMarkdownParser:
             ValueError: If required sections missing or malformed
         """
         # Extract major sections
-        sections = self._extract_sections(markdown)
+        if sections is None:
+            sections = self._extract_sections(markdown)
 
         # Parse metadata
         task_id = self._extract_task_id(markdown)
@@ -0,0 +1,235 @@
+"""
+Incremental parsers for streamed LLM output.
+
+These parsers accept text deltas as they arrive from a streaming LLM call
+and surface completed structures before the full response is available,
+so downstream work can start while the model is still generating:
+
+    - IncrementalJSONArrayParser: yields each completed object of a
+      top-level JSON array (e.g., the "files" array of a code manifest)
+    - IncrementalMarkdownSectionParser: yields each completed "## Section"
+      of a markdown document (same sectioning as DesignMarkdownParser)
+
+Example:
+    parser = IncrementalJSONArrayParser("files")
+    async for delta in provider.stream_async(prompt):
+        for file_entry in parser.feed(delta):
+            start_file_generation(file_entry)
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import json
+import logging
+import re
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalJSONArrayParser:
+    """
+    Surface completed objects of a top-level JSON array while streaming.
+
+    Tracks string/escape state and container nesting over the text seen so
+    far, so braces inside string values never confuse it. Text before the
+    first "{" (such as a markdown fence) is ignored.
+
+    Attributes:
+        array_key: Key of the array in the top-level object (e.g., "files")
+        items: All completed array items parsed so far
+    """
+
+    def __init__(self, array_key: str):
+        """
+        Initialize parser.
+
+        Args:
+            array_key: Key of the top-level array whose items to surface
+        """
+        self.array_key = array_key
+        self.items: list[dict[str, Any]] = []
+        self._text = ""
+        self._pos = 0
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_string: str | None = None
+        self._current_key: str | None = None
+        self._array_depth: int | None = None
+        self._item_start: int | None = None
+        self._done = False
+
+    def feed(self, chunk: str) -> list[dict[str, Any]]:
+        """
+        Consume a text delta.
+
+        Args:
+            chunk: Next piece of streamed text
+
+        Returns:
+            Array items completed by this chunk (possibly empty)
+        """
+        completed: list[dict[str, Any]] = []
+        if self._done or not chunk:
+            return completed
+
+        self._text += chunk
+        text = self._text
+
+        for i in range(self._pos, len(text)):
+            char = text[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if len(self._stack) == 1:
+                        self._last_string = text[self._string_start + 1 : i]
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = i
+            elif char == ":":
+                if len(self._stack) == 1:
+                    self._current_key = self._last_string
+            elif char == ",":
+                if len(self._stack) == 1:
+                    self._current_key = None
+            elif char in "{[":
+                if (
+                    char == "["
+                    and self._array_depth is None
+                    and self._stack == ["{"]
+                    and self._current_key == self.array_key
+                ):
+                    self._array_depth = 2
+                elif (
+                    char == "{"
+                    and self._array_depth is not None
+                    and len(self._stack) == self._array_depth
+                ):
+                    self._item_start = i
+                self._stack.append(char)
+            elif char in "}]":
+                if not self._stack:
+                    continue
+                self._stack.pop()
+                if (
+                    char == "}"
+                    and self._item_start is not None
+                    and len(self._stack) == self._array_depth
+                ):
+                    item = self._parse_item(text[self._item_start : i + 1])
+                    self._item_start = None
+                    if item is not None:
+                        self.items.append(item)
+                        completed.append(item)
+                elif (
+                    char == "]"
+                    and self._array_depth is not None
+                    and len(self._stack) == self._array_depth - 1
+                ):
+                    self._done = True
+                    break
+
+        self._pos = len(text)
+        return completed
+
+    @staticmethod
+    def _parse_item(item_text: str) -> dict[str, Any] | None:
+        try:
+            item = json.loads(item_text)
+        except json.JSONDecodeError as e:
+            logger.debug(f"Skipping unparseable streamed array item: {e}")
+            return None
+        return item if isinstance(item, dict) else None
+
+
+class IncrementalMarkdownSectionParser:
+    """
+    Surface completed "## " sections of a markdown document while streaming.
+
+    A section is complete once the next section header arrives; the final
+    section is returned by finish(). Section names and content match
+    DesignMarkdownParser._extract_sections() for the same document.
+
+    Attributes:
+        sections: All completed sections so far, keyed by section name
+    """
+
+    _HEADER = re.compile(r"^## (.+?)$")
+
+    def __init__(self):
+        """Initialize parser."""
+        self.sections: dict[str, str] = {}
+        self._partial_line = ""
+        self._current_name: str | None = None
+        self._current_lines: list[str] = []
+
+    def feed(self, chunk: str) -> list[tuple[str, str]]:
+        """
+        Consume a text delta.
+
+        Args:
+            chunk: Next piece of streamed markdown
+
+        Returns:
+            (name, content) tuples for sections completed by this chunk
+        """
+        text = self._partial_line + chunk
+        lines = text.split("\n")
+        self._partial_line = lines.pop()
+
+        completed = []
+        for line in lines:
+            section = self._process_line(line)
+            if section:
+                completed.append(section)
+        return completed
+
+    def finish(self) -> list[tuple[str, str]]:
+        """
+        Flush the trailing line and close the last open section.
+
+        Returns:
+            (name, content) tuples for sections completed by the flush
+        """
+        completed = []
+        if self._partial_line:
+            section = self._process_line(self._partial_line)
+            self._partial_line = ""
+            if section:
+                completed.append(section)
+        section = self._close_section()
+        if section:
+            completed.append(section)
+        return completed
+
+    def _process_line(self, line: str) -> tuple[str, str] | None:
+        match = self._HEADER.match(line)
+        if not match:
+            if self._current_name is not None:
+                self._current_lines.append(line)
+            return None
+
+        closed = self._close_section()
+        self._current_name = match.group(1).strip()
+        self._current_lines = []
+        return closed
+
+    def _close_section(self) -> tuple[str, str] | None:
+        if self._current_name is None:
+            return None
+        name = self._current_name
+        content = "\n".join(self._current_lines).strip()
+        self.sections[name] = content
+        self._current_name = None
+        self._current_lines = []
+        return name, content
@@ -6,7 +6,8 @@ enabling flexibility, cost optimization, and vendor independence.
 
 Supported Providers:
 - Cloud: Anthropic (default), OpenRouter, Groq, Gemini, Together, Fireworks, DeepInfra
-- Local: Ollama, vLLM, Claude CLI
+- Local: Ollama, vLLM, Claude CLI (any OpenAI-compatible server via "local")
+- Router: latency-aware routing and hedging across the above ("router")
 
 Usage:
     from asp.providers import ProviderRegistry, LLMResponse
@@ -40,6 +41,7 @@ from asp.providers.errors import (
 # Import OpenAI-compatible base for subclassing
 from asp.providers.openai_compat import OpenAICompatibleProvider
 from asp.providers.registry import ProviderRegistry, get_default_provider, get_provider
+from asp.providers.routing_provider import RouteTarget, RoutingProvider
 
 __all__ = [
     # Base types
@@ -47,6 +49,9 @@ __all__ = [
     "LLMResponse",
     "ProviderConfig",
     "OpenAICompatibleProvider",
+    # Routing
+    "RoutingProvider",
+    "RouteTarget",
     # Registry
     "ProviderRegistry",
     "get_provider",
@@ -12,6 +12,7 @@ Date: December 2025
 import json
 import logging
 import os
+from collections.abc import AsyncIterator
 from typing import Any
 
 from tenacity import (
@@ -29,6 +30,8 @@ from asp.providers.errors import (
     ProviderError,
     RateLimitError,
 )
+from asp.utils.client_pool import get_anthropic_client, get_async_anthropic_client
+from asp.utils.structured_output import tool_use_input
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +59,38 @@ def _should_retry_anthropic_error(exception: Exception) -> bool:
     return False
 
 
+def _build_user_content(
+    prompt: str, cached_prefix: str | None
+) -> str | list[dict[str, Any]]:
+    """
+    Build user message content, marking a shared prefix as cacheable.
+
+    Args:
+        prompt: Per-call prompt text
+        cached_prefix: Optional prefix shared across calls
+
+    Returns:
+        Plain prompt string, or two text blocks with a cache_control
+        breakpoint on the prefix
+    """
+    if not cached_prefix:
+        return prompt
+    return [
+        {
+            "type": "text",
+            "text": cached_prefix,
+            "cache_control": {"type": "ephemeral"},
+        },
+        {"type": "text", "text": prompt},
+    ]
+
+
+def _usage_count(usage: Any, field: str) -> int:
+    """Read an optional integer usage field (absent on older SDK responses)."""
+    value = getattr(usage, field, 0)
+    return value if isinstance(value, int) else 0
+
+
 class AnthropicProvider(LLMProvider):
     """
     Anthropic (Claude) LLM provider.
@@ -97,6 +132,10 @@ class AnthropicProvider(LLMProvider):
         "claude-haiku-4-5": {"input": 0.25, "output": 1.25},
     }
 
+    # Prompt caching multipliers relative to the input token price
+    CACHE_WRITE_COST_MULTIPLIER = 1.25
+    CACHE_READ_COST_MULTIPLIER = 0.1
+
     def __init__(self, config: ProviderConfig | None = None):
         """
         Initialize Anthropic provider.
@@ -131,21 +170,19 @@ class AnthropicProvider(LLMProvider):
 
     @property
     def _sync_client(self):
-        """Lazy-load synchronous Anthropic client."""
+        """Lazy-load the shared synchronous Anthropic client."""
         if self._sync_client_impl is None:
-            from anthropic import Anthropic
-
-            self._sync_client_impl = Anthropic(api_key=self._api_key)
+            self._sync_client_impl = get_anthropic_client(
+                self._api_key, base_url=self.config.base_url
+            )
         return self._sync_client_impl
 
     @property
     def _async_client(self):
-        """Lazy-load asynchronous Anthropic client."""
-        if self._async_client_impl is None:
-            from anthropic import AsyncAnthropic
-
-            self._async_client_impl = AsyncAnthropic(api_key=self._api_key)
-        return self._async_client_impl
+        """Shared asynchronous Anthropic client for the running event loop."""
+        if self._async_client_impl is not None:
+            return self._async_client_impl
+        return get_async_anthropic_client(self._api_key, base_url=self.config.base_url)
 
     @property
     def available_models(self) -> list[str]:
@@ -195,6 +232,7 @@ class AnthropicProvider(LLMProvider):
         max_tokens: int = 4096,
         temperature: float = 0.0,
         system: str | None = None,
+        cached_prefix: str | None = None,
         **kwargs: Any,
     ) -> LLMResponse:
         """
@@ -206,6 +244,8 @@ class AnthropicProvider(LLMProvider):
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature (0.0 = deterministic)
             system: Optional system prompt
+            cached_prefix: Optional prompt prefix shared across calls, sent as
+                a separate content block with a cache_control breakpoint
             **kwargs: Additional arguments for Anthropic API
 
         Returns:
@@ -235,7 +275,12 @@ class AnthropicProvider(LLMProvider):
                 "model": model,
                 "max_tokens": max_tokens,
                 "temperature": temperature,
-                "messages": [{"role": "user", "content": prompt}],
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": _build_user_content(prompt, cached_prefix),
+                    }
+                ],
                 **kwargs,
             }
             if system:
@@ -275,6 +320,7 @@ class AnthropicProvider(LLMProvider):
         max_tokens: int = 4096,
         temperature: float = 0.0,
         system: str | None = None,
+        cached_prefix: str | None = None,
         **kwargs: Any,
     ) -> LLMResponse:
         """
@@ -311,7 +357,12 @@ class AnthropicProvider(LLMProvider):
                         "model": model,
                         "max_tokens": max_tokens,
                         "temperature": temperature,
-                        "messages": [{"role": "user", "content": prompt}],
+                        "messages": [
+                            {
+                                "role": "user",
+                                "content": _build_user_content(prompt, cached_prefix),
+                            }
+                        ],
                         **kwargs,
                     }
                     if system:
@@ -347,6 +398,79 @@ class AnthropicProvider(LLMProvider):
         # Should never reach here due to reraise=True
         raise RuntimeError("Async retry loop completed without return or exception")
 
+    async def stream_async(
+        self,
+        prompt: str,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        system: str | None = None,
+        cached_prefix: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response from Anthropic as text deltas.
+
+        Streams are not retried: once text has been yielded a retry would
+        duplicate it, so errors are mapped and raised immediately.
+        See call() for parameter documentation.
+
+        Yields:
+            Text deltas in generation order
+        """
+        from anthropic import APIConnectionError, APIStatusError
+        from anthropic import RateLimitError as AnthropicRateLimitError
+
+        model = model or self._default_model
+
+        api_params = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": _build_user_content(prompt, cached_prefix),
+                }
+            ],
+            **kwargs,
+        }
+        if system:
+            api_params["system"] = system
+
+        try:
+            logger.debug(
+                "Streaming Anthropic API: model=%s, max_tokens=%d, temp=%s",
+                model,
+                max_tokens,
+                temperature,
+            )
+            async with self._async_client.messages.stream(**api_params) as stream:
+                async for text in stream.text_stream:
+                    yield text
+
+        except AnthropicRateLimitError as e:
+            logger.warning("Rate limit hit: %s", e)
+            raise RateLimitError(
+                str(e),
+                provider=self.name,
+                retry_after=getattr(e, "retry_after", None),
+            ) from e
+
+        except APIConnectionError as e:
+            logger.warning("Connection error: %s", e)
+            raise ConnectionError(str(e), provider=self.name) from e
+
+        except APIStatusError as e:
+            logger.error("API error (HTTP %d): %s", e.status_code, e.message)
+            if e.status_code == 401:
+                raise AuthenticationError(e.message, provider=self.name) from e
+            raise ProviderError(
+                f"HTTP {e.status_code}: {e.message}",
+                provider=self.name,
+                details={"status_code": e.status_code},
+            ) from e
+
     def _process_response(self, response: Any, model: str) -> LLMResponse:
         """
         Process Anthropic API response into LLMResponse.
@@ -358,23 +482,43 @@ class AnthropicProvider(LLMProvider):
         Returns:
             Normalized LLMResponse
         """
-        # Extract content
-        content_text = response.content[0].text
-
-        # Try to parse as JSON
-        parsed_content = self._try_parse_json(content_text)
-
-        # Calculate cost
-        cost = self.estimate_cost(
-            model,
-            response.usage.input_tokens,
-            response.usage.output_tokens,
-        )
+        # Extract content; a forced tool call (structured output) returns
+        # the tool input as the parsed content and its JSON as raw content
+        tool_input = tool_use_input(response.content)
+        if tool_input is not None:
+            content_text = json.dumps(tool_input)
+            parsed_content = tool_input
+        else:
+            content_text = response.content[0].text
+
+            # Try to parse as JSON
+            parsed_content = self._try_parse_json(content_text)
+
+        input_tokens = response.usage.input_tokens
+        output_tokens = response.usage.output_tokens
+        cache_write_tokens = _usage_count(response.usage, "cache_creation_input_tokens")
+        cache_read_tokens = _usage_count(response.usage, "cache_read_input_tokens")
+
+        # Calculate cost (cache reads/writes are billed relative to input price)
+        cost = self.estimate_cost(model, input_tokens, output_tokens)
+        if cache_write_tokens or cache_read_tokens:
+            pricing = self.PRICING.get(model, self.PRICING["claude-haiku-4-5"])
+            cost += (
+                (
+                    cache_write_tokens * self.CACHE_WRITE_COST_MULTIPLIER
+                    + cache_read_tokens * self.CACHE_READ_COST_MULTIPLIER
+                )
+                / 1_000_000
+                * pricing["input"]
+            )
 
         logger.info(
-            "LLM call successful: input_tokens=%d, output_tokens=%d, cost=$%.4f",
-            response.usage.input_tokens,
-            response.usage.output_tokens,
+            "LLM call successful: input_tokens=%d, output_tokens=%d, "
+            "cache_read=%d, cache_write=%d, cost=$%.4f",
+            input_tokens,
+            output_tokens,
+            cache_read_tokens,
+            cache_write_tokens,
             cost,
         )
 
@@ -382,8 +526,10 @@ class AnthropicProvider(LLMProvider):
             content=parsed_content,
             raw_content=content_text,
             usage={
-                "input_tokens": response.usage.input_tokens,
-                "output_tokens": response.usage.output_tokens,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cache_creation_input_tokens": cache_write_tokens,
+                "cache_read_input_tokens": cache_read_tokens,
             },
             cost=cost,
             model=response.model,
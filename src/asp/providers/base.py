@@ -9,6 +9,7 @@ Date: December 2025
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -164,6 +165,45 @@ class LLMProvider(ABC):
         """
         ...
 
+    async def stream_async(
+        self,
+        prompt: str,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        system: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Stream an LLM response as text deltas.
+
+        Lets callers start incremental parsing (see asp.parsers.incremental)
+        before the full response has been generated. The default
+        implementation makes a regular call_async() and yields the whole
+        response as a single delta; providers with native streaming
+        support override it.
+
+        Args:
+            prompt: User prompt text
+            model: Model identifier (uses default if not specified)
+            max_tokens: Maximum tokens in response
+            temperature: Sampling temperature (0.0 = deterministic)
+            system: Optional system prompt
+            **kwargs: Provider-specific additional arguments
+
+        Yields:
+            Text deltas in generation order
+        """
+        response = await self.call_async(
+            prompt,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
+            **kwargs,
+        )
+        yield response.raw_content
+
     @abstractmethod
     def estimate_cost(
         self,
@@ -195,6 +235,26 @@ class LLMProvider(ABC):
         """
         ...
 
+    @staticmethod
+    def join_cached_prefix(prompt: str, cached_prefix: str | None) -> str:
+        """
+        Prepend a shared prompt prefix to the prompt.
+
+        Providers without explicit cache breakpoints (OpenAI-compatible APIs
+        cache identical prompt prefixes automatically) use this to honour the
+        cached_prefix argument accepted by AnthropicProvider.
+
+        Args:
+            prompt: Per-call prompt text
+            cached_prefix: Optional prefix shared across calls
+
+        Returns:
+            Combined prompt with the prefix first
+        """
+        if not cached_prefix:
+            return prompt
+        return f"{cached_prefix}\n\n{prompt}"
+
     @property
     def default_model(self) -> str | None:
         """Get the default model for this provider."""
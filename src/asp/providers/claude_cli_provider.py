@@ -202,6 +202,7 @@ class ClaudeCLIProvider(LLMProvider):
             LLMResponse with normalized response data
         """
         model = model or self._default_model
+        prompt = self.join_cached_prefix(prompt, kwargs.pop("cached_prefix", None))
 
         # Build command arguments
         cmd = [
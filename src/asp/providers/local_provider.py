@@ -0,0 +1,63 @@
+"""
+Local OpenAI-Compatible Provider implementation.
+
+Targets self-hosted inference servers that expose an OpenAI-compatible API
+(Ollama, vLLM, llama.cpp server, LM Studio). No API key is required and any
+model name served by the endpoint is accepted.
+
+Environment Variables:
+    ASP_LOCAL_LLM_BASE_URL: Endpoint URL (default: http://localhost:11434/v1)
+    ASP_LOCAL_LLM_MODEL: Default model (default: llama3.2)
+    ASP_LOCAL_LLM_API_KEY: Optional key for servers that require one
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import os
+from dataclasses import replace
+
+from asp.providers.base import ProviderConfig
+from asp.providers.openai_compat import OpenAICompatibleProvider
+
+
+class LocalProvider(OpenAICompatibleProvider):
+    """
+    Provider for local OpenAI-compatible inference servers.
+
+    Example:
+        provider = LocalProvider(
+            ProviderConfig(base_url="http://localhost:8000/v1", default_model="qwen2.5")
+        )
+        response = await provider.call_async("Summarize this diff")
+    """
+
+    name = "local"
+    BASE_URL = "http://localhost:11434/v1"
+    API_KEY_ENV_VAR = "ASP_LOCAL_LLM_API_KEY"
+    MODELS: list[str] = []
+    DEFAULT_MODEL = "llama3.2"
+    REQUIRES_API_KEY = False
+
+    def __init__(self, config: ProviderConfig | None = None):
+        """
+        Initialize local provider.
+
+        Args:
+            config: Provider configuration. Base URL and default model fall
+                   back to ASP_LOCAL_LLM_BASE_URL and ASP_LOCAL_LLM_MODEL.
+        """
+        config = config or ProviderConfig()
+        config = replace(
+            config,
+            base_url=config.base_url
+            or os.getenv("ASP_LOCAL_LLM_BASE_URL", self.BASE_URL),
+            default_model=config.default_model
+            or os.getenv("ASP_LOCAL_LLM_MODEL", self.DEFAULT_MODEL),
+        )
+        super().__init__(config)
+
+    @property
+    def available_models(self) -> list[str]:
+        """The served models are unknown; report the configured default."""
+        return [self._default_model]
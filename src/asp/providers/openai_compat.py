@@ -12,6 +12,7 @@ Date: December 2025
 import json
 import logging
 import os
+from collections.abc import AsyncIterator
 from typing import Any
 
 from tenacity import (
@@ -29,6 +30,7 @@ from asp.providers.errors import (
     ProviderError,
     RateLimitError,
 )
+from asp.utils.client_pool import get_async_openai_client, get_openai_client
 
 logger = logging.getLogger(__name__)
 
@@ -107,12 +109,10 @@ class OpenAICompatibleProvider(LLMProvider):
 
     @property
     def _sync_client(self):
-        """Lazy-load synchronous OpenAI client."""
+        """Lazy-load the shared synchronous OpenAI client for this endpoint."""
         if self._sync_client_impl is None:
-            from openai import OpenAI
-
-            self._sync_client_impl = OpenAI(
-                api_key=self._api_key,
+            self._sync_client_impl = get_openai_client(
+                self._api_key,
                 base_url=self._base_url,
                 default_headers=self._get_headers(),
             )
@@ -120,16 +120,14 @@ class OpenAICompatibleProvider(LLMProvider):
 
     @property
     def _async_client(self):
-        """Lazy-load asynchronous OpenAI client."""
-        if self._async_client_impl is None:
-            from openai import AsyncOpenAI
-
-            self._async_client_impl = AsyncOpenAI(
-                api_key=self._api_key,
-                base_url=self._base_url,
-                default_headers=self._get_headers(),
-            )
-        return self._async_client_impl
+        """Shared asynchronous OpenAI client for the running event loop."""
+        if self._async_client_impl is not None:
+            return self._async_client_impl
+        return get_async_openai_client(
+            self._api_key,
+            base_url=self._base_url,
+            default_headers=self._get_headers(),
+        )
 
     def _get_headers(self) -> dict[str, str]:
         """Get headers for API requests. Override for custom headers."""
@@ -215,6 +213,7 @@ class OpenAICompatibleProvider(LLMProvider):
         from openai import RateLimitError as OpenAIRateLimitError
 
         model = model or self._default_model
+        prompt = self.join_cached_prefix(prompt, kwargs.pop("cached_prefix", None))
 
         try:
             logger.debug(
@@ -282,6 +281,7 @@ class OpenAICompatibleProvider(LLMProvider):
         from openai import RateLimitError as OpenAIRateLimitError
 
         model = model or self._default_model
+        prompt = self.join_cached_prefix(prompt, kwargs.pop("cached_prefix", None))
 
         async for attempt in AsyncRetrying(
             retry=retry_if_exception_type((ConnectionError,)),
@@ -340,6 +340,69 @@ class OpenAICompatibleProvider(LLMProvider):
         # Should never reach here due to reraise=True
         raise RuntimeError("Async retry loop completed without return or exception")
 
+    async def stream_async(
+        self,
+        prompt: str,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        system: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion as text deltas.
+
+        Streams are not retried: once text has been yielded a retry would
+        duplicate it. See call() for parameter documentation.
+
+        Yields:
+            Text deltas in generation order
+        """
+        from openai import APIConnectionError, APIStatusError
+        from openai import RateLimitError as OpenAIRateLimitError
+
+        model = model or self._default_model
+        prompt = self.join_cached_prefix(prompt, kwargs.pop("cached_prefix", None))
+
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
+
+        try:
+            stream = await self._async_client.chat.completions.create(
+                model=model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True,
+                **kwargs,
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except OpenAIRateLimitError as e:
+            logger.warning("Rate limit hit: %s", e)
+            raise RateLimitError(
+                str(e),
+                provider=self.name,
+            ) from e
+
+        except APIConnectionError as e:
+            logger.warning("Connection error: %s", e)
+            raise ConnectionError(str(e), provider=self.name) from e
+
+        except APIStatusError as e:
+            logger.error("API error (HTTP %d): %s", e.status_code, e.message)
+            if e.status_code == 401:
+                raise AuthenticationError(e.message, provider=self.name) from e
+            raise ProviderError(
+                f"HTTP {e.status_code}: {e.message}",
+                provider=self.name,
+                details={"status_code": e.status_code},
+            ) from e
+
     def _process_response(self, response: Any, model: str) -> LLMResponse:
         """
         Process OpenAI API response into LLMResponse.
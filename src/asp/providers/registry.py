@@ -209,14 +209,25 @@ class ProviderRegistry:
         except ImportError:
             logger.debug("ClaudeCLIProvider not available")
 
+        # Register local OpenAI-compatible provider (Ollama, vLLM, LM Studio)
+        try:
+            from asp.providers.local_provider import LocalProvider
+
+            cls.register("local", LocalProvider)
+        except ImportError:
+            logger.debug("LocalProvider not available (missing openai SDK)")
+
+        # Register latency-aware router across the providers above
+        from asp.providers.routing_provider import RoutingProvider
+
+        cls.register("router", RoutingProvider)
+
         # Future providers will be registered here as they are implemented:
         # - gemini (uses google-generativeai SDK)
         # - together (OpenAI-compatible)
         # - fireworks (OpenAI-compatible)
         # - deepinfra (OpenAI-compatible)
         # - cloudflare (REST API)
-        # - ollama (OpenAI-compatible, local)
-        # - vllm (OpenAI-compatible, local)
 
 
 # Alias for convenience
@@ -0,0 +1,751 @@
+"""
+Latency-Aware Routing Provider.
+
+ProviderRegistry.get_default() binds a process to a single provider, so a
+provider with a slow tail stalls the whole TSP pipeline. RoutingProvider
+wraps several registered providers (each optionally pinned to a model),
+tracks rolling latency percentiles and error rates per target, and sends
+each call to the best-scoring target, failing over to the next one on
+provider errors.
+
+With hedging enabled, an async call that has not finished within the
+chosen target's latency percentile (p95 by default) fires a duplicate
+request at the runner-up; whichever finishes first wins and the other is
+cancelled.
+
+Routing statistics are written to telemetry (metric types from migration
+011) by the track_agent_cost decorator after each agent execution, or
+explicitly with log_routing_stats().
+
+Environment Variables:
+    ASP_ROUTER_PROVIDERS: Comma-separated targets as "provider" or
+        "provider:model" (default: "anthropic"), e.g.
+        "anthropic,groq:llama-3.3-70b-versatile,local"
+    ASP_ROUTER_HEDGE: Fire hedged duplicate requests ("true"/"false",
+        default: "false")
+    ASP_ROUTER_HEDGE_PERCENTILE: Latency percentile of the chosen target
+        after which the hedge fires (default: 95)
+    ASP_ROUTER_HEDGE_MIN_DELAY: Minimum hedge delay in seconds (default: 0.5)
+    ASP_ROUTER_HEDGE_INITIAL_DELAY: Hedge delay before a target has enough
+        latency samples (default: 10)
+    ASP_ROUTER_WINDOW: Number of recent calls kept per target (default: 50)
+
+Example:
+    export ASP_LLM_PROVIDER=router
+    export ASP_ROUTER_PROVIDERS="anthropic,groq:llama-3.3-70b-versatile"
+    export ASP_ROUTER_HEDGE=true
+
+    router = ProviderRegistry.get_default()
+    response = await router.call_async("Hello")
+    print(response.metadata["routing"])   # {"route": "groq:...", ...}
+    router.log_routing_stats(task_id="TASK-001", agent_role="Code")
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import asyncio
+import logging
+import math
+import os
+import time
+import weakref
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+from asp.providers.base import LLMProvider, LLMResponse, ProviderConfig
+from asp.providers.errors import ProviderError, RateLimitError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TARGETS = "anthropic"
+DEFAULT_WINDOW = 50
+DEFAULT_HEDGE_PERCENTILE = 95.0
+DEFAULT_HEDGE_MIN_DELAY = 0.5
+DEFAULT_HEDGE_INITIAL_DELAY = 10.0
+
+# Minimum successful samples before a target's percentiles drive hedging
+MIN_HEDGE_SAMPLES = 5
+
+# Latency assumed for targets whose recent calls all failed (seconds)
+FAILED_TARGET_LATENCY = 60.0
+
+# RouteStats counters written to telemetry as increments since the last log
+LOGGED_COUNTERS = ("calls", "errors", "hedges_fired", "hedges_won")
+
+
+@dataclass
+class RouteTarget:
+    """
+    A provider, optionally pinned to one model, that calls can be routed to.
+
+    Attributes:
+        provider: Underlying LLM provider
+        model: Model to always use with this provider (None = honour the
+            caller's model when the provider serves it, else its default)
+    """
+
+    provider: LLMProvider
+    model: str | None = None
+
+    @property
+    def name(self) -> str:
+        """Route identifier, "provider:model"."""
+        model = self.model or self.provider.default_model or "default"
+        return f"{self.provider.name}:{model}"
+
+    def resolve_model(self, model: str | None) -> str | None:
+        """
+        Pick the model to send to this target.
+
+        Args:
+            model: Model requested by the caller
+
+        Returns:
+            Pinned model, the requested model if this provider serves it,
+            or None to use the provider default
+        """
+        if self.model:
+            return self.model
+        if model and model in self.provider.available_models:
+            return model
+        return None
+
+
+class RouteStats:
+    """
+    Rolling latency and error statistics for one route target.
+
+    Keeps the outcome of the last `window` calls. Percentiles are computed
+    over successful calls only; the error rate over finished calls.
+    Cancelled hedge losers are censored samples: their elapsed time is only
+    a lower bound on the latency, so it ranks a target that has no
+    successful samples but never enters the percentiles.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        """
+        Initialize statistics.
+
+        Args:
+            window: Number of recent calls to keep
+        """
+        # (latency, ok, censored) per call
+        self._outcomes: deque[tuple[float, bool, bool]] = deque(maxlen=window)
+        self.calls = 0
+        self.errors = 0
+        self.cancelled = 0
+        self.hedges_fired = 0
+        self.hedges_won = 0
+        self.blocked_until = 0.0
+        # Counters already written by RoutingProvider.log_routing_stats()
+        self.logged: dict[str, int] = dict.fromkeys(LOGGED_COUNTERS, 0)
+
+    def record(self, latency: float, ok: bool) -> None:
+        """Record a finished call (latency in seconds)."""
+        self._outcomes.append((latency, ok, False))
+        self.calls += 1
+        if not ok:
+            self.errors += 1
+
+    def record_cancelled(self, elapsed: float) -> None:
+        """Record a call cancelled after `elapsed` seconds (censored sample)."""
+        self._outcomes.append((elapsed, False, True))
+        self.cancelled += 1
+
+    def unlogged(self) -> dict[str, int]:
+        """Counter increments since the last log_routing_stats()."""
+        return {key: getattr(self, key) - self.logged[key] for key in LOGGED_COUNTERS}
+
+    @property
+    def samples(self) -> int:
+        """Successful calls in the window."""
+        return sum(1 for _, ok, _ in self._outcomes if ok)
+
+    def percentile(self, pct: float) -> float | None:
+        """
+        Nearest-rank latency percentile over successful calls in the window.
+
+        Args:
+            pct: Percentile in (0, 100]
+
+        Returns:
+            Latency in seconds, or None without successful samples
+        """
+        latencies = sorted(latency for latency, ok, _ in self._outcomes if ok)
+        if not latencies:
+            return None
+        rank = max(1, math.ceil(pct / 100 * len(latencies)))
+        return latencies[min(rank, len(latencies)) - 1]
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of failed calls in the window."""
+        finished = [ok for _, ok, censored in self._outcomes if not censored]
+        if not finished:
+            return 0.0
+        return finished.count(False) / len(finished)
+
+    def score(self) -> float:
+        """
+        Routing score; lower is better.
+
+        Median latency inflated by the error rate. Targets without any
+        recorded calls score 0 so each is tried once before being ranked;
+        without successful calls, the longest censored wait stands in for
+        the median.
+        """
+        if not self._outcomes:
+            return 0.0
+        latency = self.percentile(50)
+        if latency is None:
+            censored = [elapsed for elapsed, _, cut in self._outcomes if cut]
+            latency = max(censored) if censored else FAILED_TARGET_LATENCY
+        return latency / max(0.05, 1.0 - self.error_rate)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Snapshot for routing_stats()."""
+        p50 = self.percentile(50)
+        p95 = self.percentile(95)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "cancelled": self.cancelled,
+            "error_rate": round(self.error_rate, 4),
+            "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "hedges_fired": self.hedges_fired,
+            "hedges_won": self.hedges_won,
+        }
+
+
+# Live routers, whose statistics the telemetry decorators log
+_routers: "weakref.WeakSet[RoutingProvider]" = weakref.WeakSet()
+
+
+def log_active_routing_stats(
+    task_id: str, agent_role: str, db_path: Any = None
+) -> None:
+    """
+    Log the routing statistics of every live RoutingProvider.
+
+    Called by the telemetry decorators after each tracked agent execution,
+    so routed calls are attributed to the task and agent that made them.
+
+    Args:
+        task_id: Task the statistics are attributed to
+        agent_role: Agent role of the tracked execution
+        db_path: Optional database path override
+    """
+    for router in list(_routers):
+        router.log_routing_stats(task_id, agent_role, db_path=db_path)
+
+
+def parse_target_specs(spec: str) -> list[tuple[str, str | None]]:
+    """
+    Parse an ASP_ROUTER_PROVIDERS value.
+
+    Args:
+        spec: Comma-separated "provider" or "provider:model" entries
+
+    Returns:
+        List of (provider name, model or None)
+    """
+    targets = []
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, _, model = entry.partition(":")
+        targets.append((name.strip(), model.strip() or None))
+    return targets
+
+
+class RoutingProvider(LLMProvider):
+    """
+    Route LLM calls across providers by observed latency and error rate.
+
+    Targets are ranked by rolling median latency divided by success rate.
+    Calls go to the best target and fail over down the ranking when a
+    target raises ProviderError; rate-limited targets are tried last until
+    their retry-after expires. Async calls can additionally be hedged
+    (see module docstring).
+
+    Example:
+        router = RoutingProvider(
+            targets=[
+                RouteTarget(ProviderRegistry.get("anthropic")),
+                RouteTarget(ProviderRegistry.get("groq"), "llama-3.1-8b-instant"),
+            ],
+            hedge=True,
+        )
+        response = await router.call_async("Hello")
+    """
+
+    name = "router"
+
+    def __init__(
+        self,
+        config: ProviderConfig | None = None,
+        targets: list[RouteTarget | LLMProvider] | None = None,
+        hedge: bool | None = None,
+        hedge_percentile: float | None = None,
+        hedge_min_delay: float | None = None,
+        hedge_initial_delay: float | None = None,
+        window: int | None = None,
+    ):
+        """
+        Initialize router.
+
+        Args:
+            config: Provider configuration. config.extra may carry
+                "targets" (spec string), "hedge", "hedge_percentile",
+                "hedge_min_delay", "hedge_initial_delay" and "window",
+                overriding the ASP_ROUTER_* environment variables.
+            targets: Explicit route targets (bare providers are wrapped in
+                an unpinned RouteTarget); built from the registry if omitted
+            hedge: Fire hedged duplicate requests on async calls
+            hedge_percentile: Latency percentile after which to hedge
+            hedge_min_delay: Minimum hedge delay in seconds
+            hedge_initial_delay: Hedge delay before enough samples exist
+            window: Number of recent calls kept per target
+
+        Raises:
+            ProviderError: If no targets are configured or a target
+                provider cannot be created
+        """
+        self.config = config or ProviderConfig()
+        extra = self.config.extra
+
+        def setting(value: Any, key: str, env_var: str, default: Any) -> Any:
+            if value is not None:
+                return value
+            if key in extra:
+                return extra[key]
+            return os.getenv(env_var, default)
+
+        hedge_setting = setting(hedge, "hedge", "ASP_ROUTER_HEDGE", "false")
+        self.hedge = str(hedge_setting).lower() in ("true", "1")
+        self.hedge_percentile = float(
+            setting(
+                hedge_percentile,
+                "hedge_percentile",
+                "ASP_ROUTER_HEDGE_PERCENTILE",
+                DEFAULT_HEDGE_PERCENTILE,
+            )
+        )
+        self.hedge_min_delay = float(
+            setting(
+                hedge_min_delay,
+                "hedge_min_delay",
+                "ASP_ROUTER_HEDGE_MIN_DELAY",
+                DEFAULT_HEDGE_MIN_DELAY,
+            )
+        )
+        self.hedge_initial_delay = float(
+            setting(
+                hedge_initial_delay,
+                "hedge_initial_delay",
+                "ASP_ROUTER_HEDGE_INITIAL_DELAY",
+                DEFAULT_HEDGE_INITIAL_DELAY,
+            )
+        )
+        window = int(setting(window, "window", "ASP_ROUTER_WINDOW", DEFAULT_WINDOW))
+
+        if targets is None:
+            spec = setting(None, "targets", "ASP_ROUTER_PROVIDERS", DEFAULT_TARGETS)
+            targets = self._build_targets(spec)
+
+        self.targets = [
+            t if isinstance(t, RouteTarget) else RouteTarget(t) for t in targets
+        ]
+        if not self.targets:
+            raise ProviderError("Router has no targets configured", provider=self.name)
+
+        self._stats = {target.name: RouteStats(window) for target in self.targets}
+        _routers.add(self)
+        first = self.targets[0]
+        self._default_model = first.model or first.provider.default_model
+
+        logger.info(
+            "RoutingProvider initialized (targets=%s, hedge=%s)",
+            ", ".join(target.name for target in self.targets),
+            self.hedge,
+        )
+
+    @staticmethod
+    def _build_targets(spec: str) -> list[RouteTarget]:
+        """Create route targets from a spec string via the registry."""
+        from asp.providers.registry import ProviderRegistry
+
+        targets = []
+        for provider_name, model in parse_target_specs(spec):
+            if provider_name == RoutingProvider.name:
+                raise ProviderError(
+                    "Router cannot route to itself", provider=RoutingProvider.name
+                )
+            targets.append(RouteTarget(ProviderRegistry.get(provider_name), model))
+        return targets
+
+    # ------------------------------------------------------------------
+    # Ranking and statistics
+    # ------------------------------------------------------------------
+
+    def ranked_targets(self) -> list[RouteTarget]:
+        """
+        Targets ordered best first.
+
+        Rate-limited targets sort last; ties keep configuration order.
+        """
+        now = time.monotonic()
+
+        def key(indexed: tuple[int, RouteTarget]) -> tuple[bool, float, int]:
+            index, target = indexed
+            stats = self._stats[target.name]
+            return (stats.blocked_until > now, stats.score(), index)
+
+        return [target for _, target in sorted(enumerate(self.targets), key=key)]
+
+    def _hedge_delay(self, target: RouteTarget) -> float:
+        """Seconds to wait on a target before hedging to the runner-up."""
+        stats = self._stats[target.name]
+        if stats.samples < MIN_HEDGE_SAMPLES:
+            return max(self.hedge_min_delay, self.hedge_initial_delay)
+        latency = stats.percentile(self.hedge_percentile) or 0.0
+        return max(self.hedge_min_delay, latency)
+
+    def _record_error(
+        self, target: RouteTarget, latency: float, error: Exception
+    ) -> None:
+        stats = self._stats[target.name]
+        stats.record(latency, ok=False)
+        if isinstance(error, RateLimitError) and error.retry_after:
+            stats.blocked_until = time.monotonic() + error.retry_after
+        logger.warning("Route %s failed after %.2fs: %s", target.name, latency, error)
+
+    def routing_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Per-target routing statistics.
+
+        Returns:
+            Dict keyed by route name with calls, errors, error_rate,
+            p50_ms, p95_ms, hedges_fired and hedges_won
+        """
+        return {name: stats.to_dict() for name, stats in self._stats.items()}
+
+    def log_routing_stats(
+        self,
+        task_id: str,
+        agent_role: str,
+        db_path: Any = None,
+    ) -> None:
+        """
+        Persist routing statistics to the telemetry database.
+
+        Writes Route_Latency_P50 and Route_Latency_P95 over the rolling
+        window, and Route_Errors, Hedges_Fired and Hedges_Won as increments
+        since the previous call, per target that has seen calls since then.
+        Records go through the background telemetry writer.
+
+        Args:
+            task_id: Task the statistics are attributed to
+            agent_role: Agent role the router served
+            db_path: Optional database path override
+        """
+        from asp.telemetry.telemetry import record_agent_cost
+
+        for target in self.targets:
+            stats = self._stats[target.name]
+            increments = stats.unlogged()
+            if not (increments["calls"] or increments["hedges_fired"]):
+                continue
+            snapshot = stats.to_dict()
+            metrics = (
+                ("Route_Latency_P50", snapshot["p50_ms"], "ms"),
+                ("Route_Latency_P95", snapshot["p95_ms"], "ms"),
+                ("Route_Errors", increments["errors"], "count"),
+                ("Hedges_Fired", increments["hedges_fired"], "count"),
+                ("Hedges_Won", increments["hedges_won"], "count"),
+            )
+            for metric_type, value, unit in metrics:
+                if value is None:
+                    continue
+                try:
+                    record_agent_cost(
+                        task_id=task_id,
+                        agent_role=agent_role,
+                        metric_type=metric_type,
+                        metric_value=value,
+                        metric_unit=unit,
+                        llm_model=target.model or target.provider.default_model,
+                        llm_provider=target.provider.name,
+                        metadata={"route": target.name, **snapshot},
+                        db_path=db_path,
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to log routing stats: {e}")
+                    return
+            stats.logged = {key: getattr(stats, key) for key in LOGGED_COUNTERS}
+
+    # ------------------------------------------------------------------
+    # Calls
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _annotate(
+        response: LLMResponse, target: RouteTarget, hedged: bool, attempts: int
+    ) -> LLMResponse:
+        response.metadata["routing"] = {
+            "route": target.name,
+            "hedged": hedged,
+            "attempts": attempts,
+        }
+        return response
+
+    def _all_failed(self, errors: list[str]) -> ProviderError:
+        return ProviderError(
+            f"All {len(self.targets)} routes failed",
+            provider=self.name,
+            details={"errors": errors},
+        )
+
+    def call(
+        self,
+        prompt: str,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        system: str | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """
+        Make a synchronous LLM call on the best target, failing over on errors.
+
+        Synchronous calls are never hedged. See LLMProvider.call() for
+        parameter documentation.
+        """
+        errors: list[str] = []
+        for attempt, target in enumerate(self.ranked_targets(), start=1):
+            start = time.perf_counter()
+            try:
+                response = target.provider.call(
+                    prompt,
+                    model=target.resolve_model(model),
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    system=system,
+                    **kwargs,
+                )
+            except ProviderError as e:
+                self._record_error(target, time.perf_counter() - start, e)
+                errors.append(f"{target.name}: {e}")
+                continue
+            self._stats[target.name].record(time.perf_counter() - start, ok=True)
+            return self._annotate(response, target, hedged=False, attempts=attempt)
+        raise self._all_failed(errors)
+
+    async def _timed_call(
+        self, target: RouteTarget, prompt: str, model: str | None, **kwargs: Any
+    ) -> LLMResponse:
+        """
+        Call a target and record its latency and outcome.
+
+        A cancelled hedge loser is recorded as a censored sample: its
+        elapsed time is kept out of the percentiles.
+        """
+        start = time.perf_counter()
+        try:
+            response = await target.provider.call_async(
+                prompt, model=target.resolve_model(model), **kwargs
+            )
+        except ProviderError as e:
+            self._record_error(target, time.perf_counter() - start, e)
+            raise
+        except asyncio.CancelledError:
+            self._stats[target.name].record_cancelled(time.perf_counter() - start)
+            raise
+        self._stats[target.name].record(time.perf_counter() - start, ok=True)
+        return response
+
+    async def _call_hedged(
+        self,
+        primary: RouteTarget,
+        backup: RouteTarget,
+        prompt: str,
+        model: str | None,
+        started: list[RouteTarget],
+        **kwargs: Any,
+    ) -> tuple[LLMResponse, RouteTarget, bool]:
+        """
+        Call primary; after its hedge delay also call backup, first wins.
+
+        Targets are appended to `started` as their requests are sent.
+
+        Returns:
+            (response, winning target, whether the hedge fired)
+
+        Raises:
+            ProviderError: If every started request failed
+        """
+        primary_task = asyncio.create_task(
+            self._timed_call(primary, prompt, model, **kwargs)
+        )
+        tasks = {primary_task: primary}
+        started.append(primary)
+        hedged = False
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self._hedge_delay(primary))
+            if not done:
+                hedged = True
+                self._stats[primary.name].hedges_fired += 1
+                logger.debug("Hedging %s with %s", primary.name, backup.name)
+                started.append(backup)
+                backup_task = asyncio.create_task(
+                    self._timed_call(backup, prompt, model, **kwargs)
+                )
+                tasks[backup_task] = backup
+
+            pending = set(tasks)
+            first_error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        winner = tasks[task]
+                        if winner is backup:
+                            self._stats[primary.name].hedges_won += 1
+                        return task.result(), winner, hedged
+                    first_error = first_error or error
+            raise first_error
+        finally:
+            losers = [task for task in tasks if not task.done()]
+            for task in losers:
+                task.cancel()
+            if losers:
+                await asyncio.gather(*losers, return_exceptions=True)
+
+    async def call_async(
+        self,
+        prompt: str,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        system: str | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """
+        Make an asynchronous LLM call on the best target.
+
+        Fails over down the ranking on provider errors. When hedging is
+        enabled, a call outliving the target's hedge delay is duplicated to
+        the next-ranked target and the slower request is cancelled. See
+        LLMProvider.call() for parameter documentation.
+        """
+        call_kwargs = {
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "system": system,
+            **kwargs,
+        }
+        remaining = self.ranked_targets()
+        errors: list[str] = []
+        attempts = 0
+        while remaining:
+            primary = remaining[0]
+            backup = remaining[1] if self.hedge and len(remaining) > 1 else None
+            started: list[RouteTarget] = [primary]
+            attempts += 1
+            try:
+                if backup is None:
+                    response = await self._timed_call(
+                        primary, prompt, model, **call_kwargs
+                    )
+                    return self._annotate(
+                        response, primary, hedged=False, attempts=attempts
+                    )
+                started.clear()
+                response, winner, hedged = await self._call_hedged(
+                    primary, backup, prompt, model, started, **call_kwargs
+                )
+                return self._annotate(
+                    response, winner, hedged=hedged, attempts=attempts
+                )
+            except ProviderError as e:
+                errors.append(f"{', '.join(t.name for t in started)}: {e}")
+                remaining = [t for t in remaining if t not in started]
+        raise self._all_failed(errors)
+
+    async def stream_async(
+        self,
+        prompt: str,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        system: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Stream from the best target.
+
+        Fails over only while no text has been yielded; streams are not
+        hedged. Latency is recorded at the end of the stream.
+        """
+        errors: list[str] = []
+        for target in self.ranked_targets():
+            start = time.perf_counter()
+            emitted = False
+            try:
+                async for delta in target.provider.stream_async(
+                    prompt,
+                    model=target.resolve_model(model),
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    system=system,
+                    **kwargs,
+                ):
+                    emitted = True
+                    yield delta
+            except ProviderError as e:
+                self._record_error(target, time.perf_counter() - start, e)
+                if emitted:
+                    raise
+                errors.append(f"{target.name}: {e}")
+                continue
+            self._stats[target.name].record(time.perf_counter() - start, ok=True)
+            return
+        raise self._all_failed(errors)
+
+    # ------------------------------------------------------------------
+    # Models and cost
+    # ------------------------------------------------------------------
+
+    def _target_for_model(self, model: str) -> RouteTarget:
+        for target in self.targets:
+            if model == target.model or model in target.provider.available_models:
+                return target
+        return self.targets[0]
+
+    def estimate_cost(
+        self,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+    ) -> float:
+        """Estimate cost using the pricing of the target serving `model`."""
+        target = self._target_for_model(model)
+        return target.provider.estimate_cost(model, input_tokens, output_tokens)
+
+    @property
+    def available_models(self) -> list[str]:
+        """Models served by any target (pinned models first)."""
+        models: list[str] = []
+        for target in self.targets:
+            for name in [target.model, *target.provider.available_models]:
+                if name and name not in models:
+                    models.append(name)
+        return models
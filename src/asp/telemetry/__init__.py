@@ -9,10 +9,17 @@ Configure via ASP_TELEMETRY_PROVIDER environment variable:
 - "logfire" (recommended)
 - "langfuse" (default for backward compatibility)
 - "none" (disable cloud telemetry, SQLite still works)
+
+SQLite writes from the decorators are batched by a background writer
+(ASP_TELEMETRY_WRITER); call flush_telemetry() before reading them back
+in the same process. compact_telemetry() (`asp-cli telemetry compact`)
+moves raw rows older than a RetentionPolicy into per-month archive files.
 """
 
 import asp.telemetry.config as config
+import asp.telemetry.retention as retention_module
 import asp.telemetry.telemetry as telemetry_module
+import asp.telemetry.writer as writer_module
 
 configure_anthropic_instrumentation = config.configure_anthropic_instrumentation
 configure_httpx_instrumentation = config.configure_httpx_instrumentation
@@ -29,12 +36,23 @@ is_logfire_available = config.is_logfire_available
 get_db_connection = telemetry_module.get_db_connection
 get_langfuse_client = telemetry_module.get_langfuse_client
 insert_agent_cost = telemetry_module.insert_agent_cost
+insert_agent_execution = telemetry_module.insert_agent_execution
 insert_defect = telemetry_module.insert_defect
 log_agent_metric = telemetry_module.log_agent_metric
 log_defect = telemetry_module.log_defect
 log_defect_manual = telemetry_module.log_defect_manual
+record_agent_cost = telemetry_module.record_agent_cost
+record_agent_execution = telemetry_module.record_agent_execution
+record_defect = telemetry_module.record_defect
 track_agent_cost = telemetry_module.track_agent_cost
 
+flush_telemetry = writer_module.flush_telemetry
+get_telemetry_writer = writer_module.get_telemetry_writer
+
+CompactionReport = retention_module.CompactionReport
+RetentionPolicy = retention_module.RetentionPolicy
+compact_telemetry = retention_module.compact_telemetry
+
 __all__ = [
     # Core decorators
     "track_agent_cost",
@@ -58,7 +76,18 @@ __all__ = [
     # Database helpers
     "get_db_connection",
     "insert_agent_cost",
+    "insert_agent_execution",
     "insert_defect",
     "log_agent_metric",
     "log_defect_manual",
+    "record_agent_cost",
+    "record_agent_execution",
+    "record_defect",
+    # Background SQLite writer
+    "flush_telemetry",
+    "get_telemetry_writer",
+    # Retention and compaction
+    "CompactionReport",
+    "RetentionPolicy",
+    "compact_telemetry",
 ]
@@ -0,0 +1,342 @@
+"""
+Telemetry Retention and Compaction for the SQLite Backend
+
+The telemetry database keeps every agent_execution and agent_cost_vector
+row, with its JSON metadata, forever; dashboards slow down as the file
+grows. compact_telemetry() applies a RetentionPolicy to it:
+
+- Raw rows older than raw_days (cut at a UTC day boundary) are moved into
+  one archive file per month, <archive_dir>/<db stem>-YYYY-MM.db, and the
+  month is recorded in the telemetry_archive table (migration 018). Their
+  aggregates are already in the agent_execution rollups (migration 017),
+  which stay in the live database, so dashboards keep the full history.
+- The metadata payloads of rows older than metadata_days are set to NULL,
+  before they are archived.
+- The live database is then ANALYZEd and VACUUMed, so its file and
+  indexes shrink with it.
+
+Each month is moved in one transaction, copied with INSERT OR IGNORE on
+the primary key before it is deleted, so re-running after an interruption
+does not duplicate rows. asp.web.archives attaches the archives when a
+dashboard query reaches back past the live data.
+
+Example:
+    report = compact_telemetry(Path("data/asp_telemetry.db"), RetentionPolicy())
+    print(report.rows_archived, report.size_before - report.size_after)
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+# pylint: disable=logging-fstring-interpolation
+
+import logging
+import os
+import re
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from asp.telemetry.telemetry import DEFAULT_DB_PATH
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RAW_DAYS = 30
+DEFAULT_METADATA_DAYS = 7
+
+# Raw tables moved into the archives, and the tables that must exist first
+ARCHIVED_TABLES = ("agent_execution", "agent_cost_vector")
+REQUIRED_TABLES = {
+    "agent_execution_hourly": "017_add_agent_execution_rollups.sql",
+    "agent_execution_daily": "017_add_agent_execution_rollups.sql",
+    "agent_execution_daily_tasks": "017_add_agent_execution_rollups.sql",
+    "telemetry_archive": "018_add_telemetry_archive_catalogue.sql",
+}
+
+# Seconds to wait for the telemetry writer's locks
+_BUSY_TIMEOUT = 30.0
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """How long raw telemetry stays in the live database."""
+
+    raw_days: int = DEFAULT_RAW_DAYS
+    metadata_days: int | None = DEFAULT_METADATA_DAYS
+    archive_dir: Path | None = None
+    vacuum: bool = True
+
+    def __post_init__(self):
+        if self.raw_days < 1:
+            raise ValueError(f"raw_days must be at least 1, got {self.raw_days}")
+        if self.metadata_days is not None and self.metadata_days < 0:
+            raise ValueError(
+                f"metadata_days must not be negative, got {self.metadata_days}"
+            )
+
+
+@dataclass
+class ArchivedMonth:
+    """Raw rows of one month moved (or, in a dry run, to be moved)."""
+
+    month: str
+    path: Path
+    agent_execution_rows: int = 0
+    agent_cost_vector_rows: int = 0
+
+    @property
+    def rows(self) -> int:
+        """Rows of both raw tables."""
+        return self.agent_execution_rows + self.agent_cost_vector_rows
+
+
+@dataclass
+class CompactionReport:
+    """What compact_telemetry() did to the live database."""
+
+    cutoff: str
+    dry_run: bool = False
+    months: list[ArchivedMonth] = field(default_factory=list)
+    metadata_pruned: int = 0
+    size_before: int = 0
+    size_after: int = 0
+
+    @property
+    def rows_archived(self) -> int:
+        """Raw rows moved into the archives."""
+        return sum(month.rows for month in self.months)
+
+
+def retention_cutoff(now: datetime, days: int) -> str:
+    """UTC day ('YYYY-MM-DD') `days` before now; rows before it are compacted."""
+    return (now.astimezone(UTC) - timedelta(days=days)).date().isoformat()
+
+
+def archive_path(db_path: Path, month: str, archive_dir: Path | None = None) -> Path:
+    """Archive file for one month of the database at db_path."""
+    return (archive_dir or db_path.parent / "archive") / f"{db_path.stem}-{month}.db"
+
+
+def _next_month(month: str) -> str:
+    year, mon = (int(part) for part in month.split("-"))
+    return f"{year + mon // 12:04d}-{mon % 12 + 1:02d}"
+
+
+def _require_tables(conn: sqlite3.Connection) -> None:
+    existing = {
+        row[0]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+    missing = sorted(
+        {
+            migration
+            for table, migration in REQUIRED_TABLES.items()
+            if table not in existing
+        }
+    )
+    missing += [table for table in ARCHIVED_TABLES if table not in existing]
+    if missing:
+        raise RuntimeError(
+            "Telemetry database is not ready for compaction; apply "
+            f"{', '.join(missing)} from database/ first"
+        )
+
+
+def _prune_metadata(conn: sqlite3.Connection, before: str, dry_run: bool) -> int:
+    pruned = 0
+    condition = "timestamp < ? AND metadata IS NOT NULL"
+    for table in ARCHIVED_TABLES:
+        if dry_run:
+            count = conn.execute(
+                f"SELECT COUNT(*) FROM {table} WHERE {condition}", (before,)
+            )
+            pruned += count.fetchone()[0]
+        else:
+            update = f"UPDATE {table} SET metadata = NULL WHERE {condition}"
+            pruned += conn.execute(update, (before,)).rowcount
+    return pruned
+
+
+def _months_before(conn: sqlite3.Connection, cutoff: str) -> list[str]:
+    selects = " UNION ".join(
+        f"SELECT DISTINCT substr(timestamp, 1, 7) FROM {table} WHERE timestamp < ?"
+        for table in ARCHIVED_TABLES
+    )
+    rows = conn.execute(f"{selects} ORDER BY 1", (cutoff,) * len(ARCHIVED_TABLES))
+    return [row[0] for row in rows]
+
+
+def _create_archive_tables(conn: sqlite3.Connection) -> None:
+    """Create the raw tables in the attached archive with the live DDL."""
+    for table in ARCHIVED_TABLES:
+        sql = conn.execute(
+            "SELECT sql FROM main.sqlite_master WHERE type = 'table' AND name = ?",
+            (table,),
+        ).fetchone()[0]
+        conn.execute(
+            re.sub(
+                rf'^CREATE TABLE\s+"?{table}"?',
+                f"CREATE TABLE IF NOT EXISTS archive.{table}",
+                sql,
+                count=1,
+            )
+        )
+        for column in ("timestamp", "task_id"):
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS archive.idx_{table}_{column} "
+                f"ON {table}({column})"
+            )
+
+
+def _shared_columns(conn: sqlite3.Connection, table: str) -> str:
+    """Columns in both copies, in case the live table gained some since."""
+    archived = {row[1] for row in conn.execute(f"PRAGMA archive.table_info({table})")}
+    return ", ".join(
+        f'"{row[1]}"'
+        for row in conn.execute(f"PRAGMA main.table_info({table})")
+        if row[1] in archived
+    )
+
+
+def _archive_month(
+    conn: sqlite3.Connection,
+    db_path: Path,
+    month: str,
+    cutoff: str,
+    policy: RetentionPolicy,
+    dry_run: bool,
+) -> ArchivedMonth:
+    """Move one month's raw rows before cutoff into its archive file."""
+    until = min(f"{_next_month(month)}-01", cutoff)
+    where = "WHERE timestamp >= ? AND timestamp < ?"
+    params = (month, until)
+    entry = ArchivedMonth(month, archive_path(db_path, month, policy.archive_dir))
+
+    if dry_run:
+        for table in ARCHIVED_TABLES:
+            count = conn.execute(f"SELECT COUNT(*) FROM {table} {where}", params)
+            setattr(entry, f"{table}_rows", count.fetchone()[0])
+        return entry
+
+    entry.path.parent.mkdir(parents=True, exist_ok=True)
+    conn.execute("ATTACH DATABASE ? AS archive", (str(entry.path),))
+    try:
+        _create_archive_tables(conn)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            first = min(
+                (
+                    row[0]
+                    for table in ARCHIVED_TABLES
+                    for row in conn.execute(
+                        f"SELECT MIN(timestamp) FROM main.{table} {where}", params
+                    )
+                    if row[0] is not None
+                ),
+                default=None,
+            )
+            for table in ARCHIVED_TABLES:
+                columns = _shared_columns(conn, table)
+                conn.execute(
+                    f"INSERT OR IGNORE INTO archive.{table} ({columns}) "
+                    f"SELECT {columns} FROM main.{table} {where}",
+                    params,
+                )
+                moved = conn.execute(f"DELETE FROM main.{table} {where}", params)
+                setattr(entry, f"{table}_rows", moved.rowcount)
+            conn.execute(
+                """
+                INSERT INTO telemetry_archive (
+                    month, path, first_timestamp, archived_until,
+                    agent_execution_rows, agent_cost_vector_rows, compacted_at
+                ) VALUES (?, ?, ?, ?, ?, ?, datetime('now'))
+                ON CONFLICT (month) DO UPDATE SET
+                    path = excluded.path,
+                    first_timestamp = MIN(
+                        COALESCE(first_timestamp, excluded.first_timestamp),
+                        COALESCE(excluded.first_timestamp, first_timestamp)
+                    ),
+                    archived_until = MAX(archived_until, excluded.archived_until),
+                    agent_execution_rows =
+                        agent_execution_rows + excluded.agent_execution_rows,
+                    agent_cost_vector_rows =
+                        agent_cost_vector_rows + excluded.agent_cost_vector_rows,
+                    compacted_at = excluded.compacted_at
+                """,
+                (
+                    month,
+                    os.path.relpath(entry.path, db_path.parent),
+                    first,
+                    until,
+                    entry.agent_execution_rows,
+                    entry.agent_cost_vector_rows,
+                ),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+    finally:
+        conn.execute("DETACH DATABASE archive")
+
+    logger.info(f"Archived {entry.rows} telemetry rows of {month} to {entry.path}")
+    return entry
+
+
+def compact_telemetry(
+    db_path: Path | None = None,
+    policy: RetentionPolicy | None = None,
+    now: datetime | None = None,
+    dry_run: bool = False,
+) -> CompactionReport:
+    """
+    Apply a retention policy to the telemetry database.
+
+    Args:
+        db_path: Live telemetry database. Defaults to DEFAULT_DB_PATH.
+        policy: Retention policy (default: RetentionPolicy())
+        now: Reference time for the retention windows (default: now)
+        dry_run: Only count what would be pruned and archived
+
+    Returns:
+        CompactionReport with the archived months and file sizes
+
+    Raises:
+        FileNotFoundError: If the database does not exist
+        RuntimeError: If migrations 017/018 have not been applied; without
+            the rollups, archiving would drop the rows from the dashboards
+    """
+    db_path = Path(db_path or DEFAULT_DB_PATH)
+    if not db_path.exists():
+        raise FileNotFoundError(f"Telemetry database not found: {db_path}")
+    policy = policy or RetentionPolicy()
+    now = now or datetime.now(UTC)
+
+    report = CompactionReport(
+        cutoff=retention_cutoff(now, policy.raw_days),
+        dry_run=dry_run,
+        size_before=db_path.stat().st_size,
+    )
+    conn = sqlite3.connect(db_path, timeout=_BUSY_TIMEOUT, isolation_level=None)
+    try:
+        _require_tables(conn)
+        if policy.metadata_days is not None:
+            report.metadata_pruned = _prune_metadata(
+                conn, retention_cutoff(now, policy.metadata_days), dry_run
+            )
+        for month in _months_before(conn, report.cutoff):
+            report.months.append(
+                _archive_month(conn, db_path, month, report.cutoff, policy, dry_run)
+            )
+
+        if not dry_run:
+            conn.execute("ANALYZE")
+            if policy.vacuum and (report.rows_archived or report.metadata_pruned):
+                conn.execute("VACUUM")
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        conn.close()
+
+    report.size_after = db_path.stat().st_size
+    return report
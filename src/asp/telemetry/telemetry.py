@@ -13,9 +13,18 @@ Features:
 - Database helpers for SQLite operations
 - Dual-backend support via ASP_TELEMETRY_PROVIDER env var
 
+Decorator and log_* writes are queued to a background writer
+(asp.telemetry.writer) that batches them over one connection per
+database; insert_agent_cost/insert_defect still write synchronously.
+
+@track_agent_cost writes one row per metric to agent_cost_vector and one
+wide row per execution to agent_execution (used by the dashboards).
+
 Environment Variables:
 - ASP_TELEMETRY_PROVIDER: "logfire" (recommended), "langfuse", or "none"
-- ASP_USER_ID: Override user identification
+- ASP_TELEMETRY_WRITER: "background" (default) or "sync"
+- ASP_USER_ID: Override user identification (read on every call; the
+  git/system fallback is resolved once per process)
 
 Author: ASP Development Team
 Date: November 13, 2025 (updated December 2025)
@@ -23,9 +32,13 @@ Date: November 13, 2025 (updated December 2025)
 
 import asyncio
 import functools
+import inspect
+import json
 import os
 import sqlite3
+import sys
 import time
+import uuid
 from collections.abc import Callable
 from contextlib import contextmanager
 from datetime import UTC, datetime
@@ -36,6 +49,7 @@ from typing import Any
 from langfuse import Langfuse
 
 import asp.telemetry.config as telemetry_config
+from asp.telemetry.writer import get_telemetry_writer
 
 # ============================================================================
 # Configuration
@@ -117,12 +131,20 @@ def get_user_id() -> str:
     2. Git user.email configuration
     3. System user (os.getlogin())
     4. "unknown-user" fallback
+
+    Steps 2-4 run once per process (the git lookup is a subprocess); call
+    invalidate_user_id_cache() to resolve them again.
     """
     # 1. Environment variable
     env_user = os.getenv("ASP_USER_ID")
     if env_user:
         return env_user
+    return _resolve_system_user_id()
 
+
+@functools.lru_cache(maxsize=1)
+def _resolve_system_user_id() -> str:
+    """Resolve the user ID from git or the OS (cached, see get_user_id)."""
     # 2. Git config
     try:
         import subprocess
@@ -148,6 +170,11 @@ def get_user_id() -> str:
     return "unknown-user"
 
 
+def invalidate_user_id_cache() -> None:
+    """Forget the cached git/system user ID (e.g. after changing git config)."""
+    _resolve_system_user_id.cache_clear()
+
+
 # ============================================================================
 # Database Helpers
 # ============================================================================
@@ -177,6 +204,161 @@ def get_db_connection(db_path: Path | None = None):
         conn.close()
 
 
+_AGENT_COST_INSERT = """
+    INSERT INTO agent_cost_vector (
+        timestamp, task_id, subtask_id, project_id, user_id,
+        agent_role, agent_version, agent_iteration,
+        metric_type, metric_value, metric_unit,
+        llm_model, llm_provider, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_AGENT_EXECUTION_INSERT = """
+    INSERT INTO agent_execution (
+        timestamp, task_id, subtask_id, project_id, user_id,
+        agent_role, agent_version, agent_iteration, function_name,
+        status, error_type, latency_ms, tokens_in, tokens_out, api_cost_usd,
+        cache_read_tokens, cache_write_tokens,
+        llm_model, llm_provider, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_DEFECT_INSERT = """
+    INSERT INTO defect_log (
+        defect_id, created_at, task_id, project_id, user_id,
+        defect_type, severity, description,
+        phase_injected, phase_removed,
+        component_path, function_name, line_number,
+        root_cause, resolution_notes,
+        flagged_by_agent, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _agent_cost_row(
+    task_id: str,
+    agent_role: str,
+    metric_type: str,
+    metric_value: float,
+    metric_unit: str,
+    subtask_id: str | None = None,
+    project_id: str | None = None,
+    user_id: str | None = None,
+    agent_version: str | None = None,
+    agent_iteration: int = 1,
+    llm_model: str | None = None,
+    llm_provider: str | None = None,
+    metadata: dict[str, Any] | None = None,
+) -> tuple:
+    """Parameters of _AGENT_COST_INSERT (see insert_agent_cost)."""
+    return (
+        datetime.now(UTC).isoformat(),
+        task_id,
+        subtask_id,
+        project_id,
+        user_id if user_id is not None else get_user_id(),
+        agent_role,
+        agent_version,
+        agent_iteration,
+        metric_type,
+        metric_value,
+        metric_unit,
+        llm_model,
+        llm_provider,
+        json.dumps(metadata) if metadata else None,
+    )
+
+
+def _agent_execution_row(
+    task_id: str,
+    agent_role: str,
+    latency_ms: float,
+    status: str = "success",
+    tokens_in: int = 0,
+    tokens_out: int = 0,
+    api_cost_usd: float = 0.0,
+    cache_read_tokens: int = 0,
+    cache_write_tokens: int = 0,
+    subtask_id: str | None = None,
+    project_id: str | None = None,
+    user_id: str | None = None,
+    agent_version: str | None = None,
+    agent_iteration: int = 1,
+    function_name: str | None = None,
+    error_type: str | None = None,
+    llm_model: str | None = None,
+    llm_provider: str | None = None,
+    metadata: dict[str, Any] | None = None,
+) -> tuple:
+    """Parameters of _AGENT_EXECUTION_INSERT (see insert_agent_execution)."""
+    return (
+        datetime.now(UTC).isoformat(),
+        task_id,
+        subtask_id,
+        project_id,
+        user_id if user_id is not None else get_user_id(),
+        agent_role,
+        agent_version,
+        agent_iteration,
+        function_name,
+        status,
+        error_type,
+        latency_ms,
+        tokens_in,
+        tokens_out,
+        api_cost_usd,
+        cache_read_tokens,
+        cache_write_tokens,
+        llm_model,
+        llm_provider,
+        json.dumps(metadata) if metadata else None,
+    )
+
+
+def _defect_row(
+    defect_id: str,
+    task_id: str,
+    defect_type: str,
+    severity: str,
+    phase_injected: str,
+    phase_removed: str,
+    description: str,
+    project_id: str | None = None,
+    user_id: str | None = None,
+    component_path: str | None = None,
+    function_name: str | None = None,
+    line_number: int | None = None,
+    root_cause: str | None = None,
+    resolution_notes: str | None = None,
+    flagged_by_agent: bool = False,
+    metadata: dict[str, Any] | None = None,
+) -> tuple:
+    """Parameters of _DEFECT_INSERT (see insert_defect)."""
+    return (
+        defect_id,
+        datetime.now(UTC).isoformat(),
+        task_id,
+        project_id,
+        user_id if user_id is not None else get_user_id(),
+        defect_type,
+        severity,
+        description,
+        phase_injected,
+        phase_removed,
+        component_path,
+        function_name,
+        line_number,
+        root_cause,
+        resolution_notes,
+        1 if flagged_by_agent else 0,
+        json.dumps(metadata) if metadata else None,
+    )
+
+
+def _new_defect_id() -> str:
+    return f"DEFECT-{uuid.uuid4().hex[:12].upper()}"
+
+
 def insert_agent_cost(
     task_id: str,
     agent_role: str,
@@ -215,40 +397,104 @@ def insert_agent_cost(
     Returns:
         int: ID of inserted record
     """
-    import json
+    row = _agent_cost_row(
+        task_id=task_id,
+        agent_role=agent_role,
+        metric_type=metric_type,
+        metric_value=metric_value,
+        metric_unit=metric_unit,
+        subtask_id=subtask_id,
+        project_id=project_id,
+        user_id=user_id,
+        agent_version=agent_version,
+        agent_iteration=agent_iteration,
+        llm_model=llm_model,
+        llm_provider=llm_provider,
+        metadata=metadata,
+    )
+    with get_db_connection(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.execute(_AGENT_COST_INSERT, row)
+        return cursor.lastrowid
+
+
+def insert_agent_execution(
+    task_id: str,
+    agent_role: str,
+    latency_ms: float,
+    status: str = "success",
+    tokens_in: int = 0,
+    tokens_out: int = 0,
+    api_cost_usd: float = 0.0,
+    cache_read_tokens: int = 0,
+    cache_write_tokens: int = 0,
+    subtask_id: str | None = None,
+    project_id: str | None = None,
+    user_id: str | None = None,
+    agent_version: str | None = None,
+    agent_iteration: int = 1,
+    function_name: str | None = None,
+    error_type: str | None = None,
+    llm_model: str | None = None,
+    llm_provider: str | None = None,
+    metadata: dict[str, Any] | None = None,
+    db_path: Path | None = None,
+) -> int:
+    """
+    Insert one agent invocation into the agent_execution table.
 
-    # Auto-resolve user_id if not provided
-    if user_id is None:
-        user_id = get_user_id()
+    Unlike agent_cost_vector, which stores one row per metric, this is one
+    wide row per execution, so dashboards can aggregate without pivoting.
+
+    Args:
+        task_id: Task identifier
+        agent_role: Agent role (Planning, Design, Code, etc.)
+        latency_ms: Execution latency in milliseconds
+        status: "success" or "error"
+        tokens_in: Input tokens consumed
+        tokens_out: Output tokens produced
+        api_cost_usd: API cost in USD
+        cache_read_tokens: Prompt cache read tokens
+        cache_write_tokens: Prompt cache write tokens
+        subtask_id: Optional subtask identifier
+        project_id: Optional project identifier
+        user_id: Optional user identifier (auto-resolved if None)
+        agent_version: Optional agent version
+        agent_iteration: Iteration number (default: 1)
+        function_name: Name of the decorated function
+        error_type: Exception class name when status is "error"
+        llm_model: Optional LLM model name
+        llm_provider: Optional LLM provider name
+        metadata: Optional metadata dict (stored as JSON)
+        db_path: Optional database path
 
+    Returns:
+        int: ID of inserted record
+    """
+    row = _agent_execution_row(
+        task_id=task_id,
+        agent_role=agent_role,
+        latency_ms=latency_ms,
+        status=status,
+        tokens_in=tokens_in,
+        tokens_out=tokens_out,
+        api_cost_usd=api_cost_usd,
+        cache_read_tokens=cache_read_tokens,
+        cache_write_tokens=cache_write_tokens,
+        subtask_id=subtask_id,
+        project_id=project_id,
+        user_id=user_id,
+        agent_version=agent_version,
+        agent_iteration=agent_iteration,
+        function_name=function_name,
+        error_type=error_type,
+        llm_model=llm_model,
+        llm_provider=llm_provider,
+        metadata=metadata,
+    )
     with get_db_connection(db_path) as conn:
         cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO agent_cost_vector (
-                timestamp, task_id, subtask_id, project_id, user_id,
-                agent_role, agent_version, agent_iteration,
-                metric_type, metric_value, metric_unit,
-                llm_model, llm_provider, metadata
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                datetime.now(UTC).isoformat(),
-                task_id,
-                subtask_id,
-                project_id,
-                user_id,
-                agent_role,
-                agent_version,
-                agent_iteration,
-                metric_type,
-                metric_value,
-                metric_unit,
-                llm_model,
-                llm_provider,
-                json.dumps(metadata) if metadata else None,
-            ),
-        )
+        cursor.execute(_AGENT_EXECUTION_INSERT, row)
         return cursor.lastrowid
 
 
@@ -293,49 +539,84 @@ def insert_defect(
     Returns:
         str: defect_id of inserted record
     """
-    import json
-    import uuid
+    defect_id = _new_defect_id()
+    row = _defect_row(
+        defect_id,
+        task_id=task_id,
+        defect_type=defect_type,
+        severity=severity,
+        phase_injected=phase_injected,
+        phase_removed=phase_removed,
+        description=description,
+        project_id=project_id,
+        user_id=user_id,
+        component_path=component_path,
+        function_name=function_name,
+        line_number=line_number,
+        root_cause=root_cause,
+        resolution_notes=resolution_notes,
+        flagged_by_agent=flagged_by_agent,
+        metadata=metadata,
+    )
+    with get_db_connection(db_path) as conn:
+        conn.execute(_DEFECT_INSERT, row)
+        return defect_id
+
+
+def record_agent_cost(db_path: Path | None = None, **fields: Any) -> None:
+    """
+    Queue an agent cost record for the background telemetry writer.
 
-    defect_id = f"DEFECT-{uuid.uuid4().hex[:12].upper()}"
+    Takes the same fields as insert_agent_cost. In "sync" writer mode
+    (ASP_TELEMETRY_WRITER) the record is inserted immediately instead.
+    """
+    writer = get_telemetry_writer()
+    if writer is None:
+        insert_agent_cost(db_path=db_path, **fields)
+        return
+    writer.submit(
+        _AGENT_COST_INSERT, _agent_cost_row(**fields), db_path or DEFAULT_DB_PATH
+    )
 
-    # Auto-resolve user_id if not provided
-    if user_id is None:
-        user_id = get_user_id()
 
-    with get_db_connection(db_path) as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO defect_log (
-                defect_id, created_at, task_id, project_id, user_id,
-                defect_type, severity, description,
-                phase_injected, phase_removed,
-                component_path, function_name, line_number,
-                root_cause, resolution_notes,
-                flagged_by_agent, metadata
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                defect_id,
-                datetime.now(UTC).isoformat(),
-                task_id,
-                project_id,
-                user_id,
-                defect_type,
-                severity,
-                description,
-                phase_injected,
-                phase_removed,
-                component_path,
-                function_name,
-                line_number,
-                root_cause,
-                resolution_notes,
-                1 if flagged_by_agent else 0,
-                json.dumps(metadata) if metadata else None,
-            ),
-        )
-        return defect_id
+def record_agent_execution(db_path: Path | None = None, **fields: Any) -> None:
+    """
+    Queue an agent execution record for the background telemetry writer.
+
+    Takes the same fields as insert_agent_execution. In "sync" writer mode
+    (ASP_TELEMETRY_WRITER) the record is inserted immediately instead.
+    """
+    writer = get_telemetry_writer()
+    if writer is None:
+        insert_agent_execution(db_path=db_path, **fields)
+        return
+    writer.submit(
+        _AGENT_EXECUTION_INSERT,
+        _agent_execution_row(**fields),
+        db_path or DEFAULT_DB_PATH,
+    )
+
+
+def record_defect(db_path: Path | None = None, **fields: Any) -> str:
+    """
+    Queue a defect record for the background telemetry writer.
+
+    Takes the same fields as insert_defect. In "sync" writer mode
+    (ASP_TELEMETRY_WRITER) the record is inserted immediately instead.
+
+    Returns:
+        str: defect_id of the record
+    """
+    writer = get_telemetry_writer()
+    if writer is None:
+        return insert_defect(db_path=db_path, **fields)
+    defect_id = _new_defect_id()
+    writer.submit(
+        _DEFECT_INSERT,
+        _defect_row(defect_id, **fields),
+        db_path or DEFAULT_DB_PATH,
+    )
+    return defect_id
 
 
 # ============================================================================
@@ -343,9 +624,22 @@ def insert_defect(
 # ============================================================================
 
 
-def _extract_task_id(func: Callable, args: tuple, kwargs: dict, task_id_param: str):
+def _positional_index(func: Callable, param_name: str) -> int | None:
+    """Position of param_name in func's signature, or None if absent."""
+    try:
+        param_names = list(inspect.signature(func).parameters)
+    except (TypeError, ValueError):
+        return None
+    if param_name in param_names:
+        return param_names.index(param_name)
+    return None
+
+
+def _compile_task_id_extractor(
+    func: Callable, task_id_param: str
+) -> Callable[[tuple, dict], Any]:
     """
-    Extract task_id from function arguments.
+    Build a task_id extractor for func, resolving its signature once.
 
     Supports:
     - Simple parameter name: "task_id"
@@ -353,50 +647,41 @@ def _extract_task_id(func: Callable, args: tuple, kwargs: dict, task_id_param: s
     - Object with task_id attribute
 
     Returns:
-        str | None: The extracted task_id or None
+        Callable taking (args, kwargs) and returning the task_id or None
     """
-    import inspect
-
-    task_id = None
-
-    if "." in task_id_param:
-        # Handle dot notation (e.g., "input_data.task_id")
-        parts = task_id_param.split(".", 1)
-        param_name = parts[0]
-        attr_name = parts[1]
-
-        # Try to get the parameter
-        param_value = kwargs.get(param_name)
-        if param_value is None:
-            # Try positional args
-            sig = inspect.signature(func)
-            param_names = list(sig.parameters.keys())
-            if param_name in param_names:
-                idx = param_names.index(param_name)
-                if idx < len(args):
-                    param_value = args[idx]
-
-        # Extract attribute from the parameter object
-        if param_value is not None and hasattr(param_value, attr_name):
-            task_id = getattr(param_value, attr_name)
-    else:
-        # Simple parameter name (backwards compatible)
-        task_id = kwargs.get(task_id_param)
-        if task_id is None:
-            # Try to find it in positional args based on function signature
-            sig = inspect.signature(func)
-            param_names = list(sig.parameters.keys())
-            if task_id_param in param_names:
-                idx = param_names.index(task_id_param)
-                if idx < len(args):
-                    param_value = args[idx]
-                    # If it's an object with task_id attribute, extract it
-                    if hasattr(param_value, "task_id"):
-                        task_id = param_value.task_id
-                    else:
-                        task_id = param_value
-
-    return task_id
+    param_name, _, attr_name = task_id_param.partition(".")
+    idx = _positional_index(func, param_name)
+
+    if attr_name:
+        # Dot notation (e.g., "input_data.task_id")
+        def extract_attribute(args: tuple, kwargs: dict) -> Any:
+            param_value = kwargs.get(param_name)
+            if param_value is None and idx is not None and idx < len(args):
+                param_value = args[idx]
+            if param_value is not None and hasattr(param_value, attr_name):
+                return getattr(param_value, attr_name)
+            return None
+
+        return extract_attribute
+
+    # Simple parameter name (backwards compatible)
+    def extract_parameter(args: tuple, kwargs: dict) -> Any:
+        task_id = kwargs.get(param_name)
+        if task_id is None and idx is not None and idx < len(args):
+            param_value = args[idx]
+            # If it's an object with task_id attribute, extract it
+            if hasattr(param_value, "task_id"):
+                return param_value.task_id
+            return param_value
+        return task_id
+
+    return extract_parameter
+
+
+def _reset_llm_call_stats(args: tuple) -> None:
+    """Reset per-execution LLM cache counters on the agent instance, if any."""
+    if args and isinstance(getattr(args[0], "_llm_call_stats", None), dict):
+        args[0].reset_llm_call_stats()
 
 
 def _log_metrics_to_sqlite(
@@ -413,7 +698,7 @@ def _log_metrics_to_sqlite(
     """Log agent metrics to SQLite database."""
     try:
         # Always log latency
-        insert_agent_cost(
+        record_agent_cost(
             task_id=task_id,
             agent_role=agent_role,
             metric_type="Latency",
@@ -428,7 +713,7 @@ def _log_metrics_to_sqlite(
 
         # Log token usage if available
         if llm_usage.get("input_tokens"):
-            insert_agent_cost(
+            record_agent_cost(
                 task_id=task_id,
                 agent_role=agent_role,
                 metric_type="Tokens_In",
@@ -442,7 +727,7 @@ def _log_metrics_to_sqlite(
             )
 
         if llm_usage.get("output_tokens"):
-            insert_agent_cost(
+            record_agent_cost(
                 task_id=task_id,
                 agent_role=agent_role,
                 metric_type="Tokens_Out",
@@ -456,7 +741,7 @@ def _log_metrics_to_sqlite(
             )
 
         if llm_usage.get("cost"):
-            insert_agent_cost(
+            record_agent_cost(
                 task_id=task_id,
                 agent_role=agent_role,
                 metric_type="API_Cost",
@@ -469,10 +754,71 @@ def _log_metrics_to_sqlite(
                 metadata=metadata,
             )
 
+        # Log LLM response cache and Anthropic prompt cache effectiveness,
+        # continuation calls made for responses truncated at max_tokens,
+        # response parse failures, agent-level retries and calls coalesced
+        # into an identical in-flight request
+        for usage_key, metric_type, metric_unit in (
+            ("cache_hits", "Cache_Hits", "count"),
+            ("cache_misses", "Cache_Misses", "count"),
+            ("tokens_saved", "Tokens_Saved", "tokens"),
+            ("prompt_cache_read_tokens", "Prompt_Cache_Read_Tokens", "tokens"),
+            ("prompt_cache_write_tokens", "Prompt_Cache_Write_Tokens", "tokens"),
+            ("continuations", "Continuations", "count"),
+            ("parse_failures", "Parse_Failures", "count"),
+            ("retries", "Retries", "count"),
+            ("coalesced_calls", "Coalesced_Calls", "count"),
+        ):
+            if llm_usage.get(usage_key):
+                record_agent_cost(
+                    task_id=task_id,
+                    agent_role=agent_role,
+                    metric_type=metric_type,
+                    metric_value=llm_usage[usage_key],
+                    metric_unit=metric_unit,
+                    llm_model=llm_usage.get("model", llm_model),
+                    llm_provider=llm_provider,
+                    user_id=user_id,
+                    agent_version=agent_version,
+                    metadata=metadata,
+                )
+
     except Exception as db_error:
         # Don't fail the function if telemetry fails
         print(f"Warning: Failed to log telemetry to database: {db_error}")
 
+    # One wide row per execution for dashboards (agent_execution)
+    try:
+        record_agent_execution(
+            task_id=task_id,
+            agent_role=agent_role,
+            latency_ms=latency_ms,
+            status="success" if metadata.get("success", True) else "error",
+            tokens_in=llm_usage.get("input_tokens") or 0,
+            tokens_out=llm_usage.get("output_tokens") or 0,
+            api_cost_usd=llm_usage.get("cost") or 0.0,
+            cache_read_tokens=llm_usage.get("prompt_cache_read_tokens") or 0,
+            cache_write_tokens=llm_usage.get("prompt_cache_write_tokens") or 0,
+            function_name=metadata.get("function"),
+            error_type=metadata.get("error_type"),
+            llm_model=llm_usage.get("model", llm_model),
+            llm_provider=llm_provider,
+            user_id=user_id,
+            agent_version=agent_version,
+        )
+    except Exception as db_error:
+        print(f"Warning: Failed to log agent execution to database: {db_error}")
+
+    # Routing statistics of RoutingProviders that served calls since the
+    # previous tracked execution; none can exist before the module is loaded
+    routing = sys.modules.get("asp.providers.routing_provider")
+    if routing is None:
+        return
+    try:
+        routing.log_active_routing_stats(task_id=task_id, agent_role=agent_role)
+    except Exception as db_error:
+        print(f"Warning: Failed to log routing statistics to database: {db_error}")
+
 
 def _track_with_langfuse(
     func_name: str,
@@ -611,11 +957,13 @@ def track_agent_cost(
     """
 
     def decorator(func: Callable) -> Callable:
+        extract_task_id = _compile_task_id_extractor(func, task_id_param)
+
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
             _ensure_telemetry_initialized()
 
-            task_id = _extract_task_id(func, args, kwargs, task_id_param)
+            task_id = extract_task_id(args, kwargs)
             if task_id is None:
                 raise ValueError(
                     f"task_id not found in function arguments (looking for '{task_id_param}')"
@@ -623,6 +971,7 @@ def track_agent_cost(
 
             user_id = get_user_id()
             provider = telemetry_config.get_telemetry_provider()
+            _reset_llm_call_stats(args)
             start_time = time.time()
             error = None
 
@@ -645,6 +994,8 @@ def track_agent_cost(
                     "success": error is None,
                     "error_type": type(error).__name__ if error else None,
                 }
+                if "structured_output" in llm_usage:
+                    metadata["structured_output"] = llm_usage["structured_output"]
 
                 # Always log to SQLite
                 _log_metrics_to_sqlite(
@@ -691,7 +1042,7 @@ def track_agent_cost(
         def sync_wrapper(*args, **kwargs):
             _ensure_telemetry_initialized()
 
-            task_id = _extract_task_id(func, args, kwargs, task_id_param)
+            task_id = extract_task_id(args, kwargs)
             if task_id is None:
                 raise ValueError(
                     f"task_id not found in function arguments (looking for '{task_id_param}')"
@@ -699,6 +1050,7 @@ def track_agent_cost(
 
             user_id = get_user_id()
             provider = telemetry_config.get_telemetry_provider()
+            _reset_llm_call_stats(args)
             start_time = time.time()
             error = None
 
@@ -721,6 +1073,8 @@ def track_agent_cost(
                     "success": error is None,
                     "error_type": type(error).__name__ if error else None,
                 }
+                if "structured_output" in llm_usage:
+                    metadata["structured_output"] = llm_usage["structured_output"]
 
                 # Always log to SQLite
                 _log_metrics_to_sqlite(
@@ -803,19 +1157,15 @@ def log_defect(
     """
 
     def decorator(func: Callable) -> Callable:
+        task_id_idx = _positional_index(func, task_id_param)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             # Extract task_id from function arguments
             task_id = kwargs.get(task_id_param)
-            if task_id is None:
-                import inspect
-
-                sig = inspect.signature(func)
-                param_names = list(sig.parameters.keys())
-                if task_id_param in param_names:
-                    idx = param_names.index(task_id_param)
-                    if idx < len(args):
-                        task_id = args[idx]
+            if task_id is None and task_id_idx is not None:
+                if task_id_idx < len(args):
+                    task_id = args[task_id_idx]
 
             if task_id is None:
                 raise ValueError(
@@ -844,7 +1194,7 @@ def log_defect(
 
                 # Insert defect record to database
                 try:
-                    insert_defect(
+                    record_defect(
                         task_id=task_id,
                         defect_type=defect_type,
                         severity=severity,
@@ -915,7 +1265,7 @@ def log_agent_metric(
         **kwargs: Additional fields (subtask_id, project_id, llm_model, etc.)
     """
     try:
-        insert_agent_cost(
+        record_agent_cost(
             task_id=task_id,
             agent_role=agent_role,
             metric_type=metric_type,
@@ -951,7 +1301,7 @@ def log_defect_manual(
         **kwargs: Additional fields (component_path, root_cause, etc.)
     """
     try:
-        insert_defect(
+        record_defect(
             task_id=task_id,
             defect_type=defect_type,
             severity=severity,
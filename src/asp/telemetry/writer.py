@@ -0,0 +1,334 @@
+"""
+Background Telemetry Writer for the SQLite Backend
+
+Writing a telemetry row used to open a new sqlite3 connection, insert the
+row, commit (an fsync) and close the connection, synchronously on the
+agent's hot path and, in async agents, on the event loop. A
+@track_agent_cost execution writes up to a dozen rows that way.
+
+TelemetryWriter moves those writes off the hot path:
+
+- Callers enqueue (statement, parameters) records and return immediately
+- One daemon thread owns a long-lived connection per database file, in
+  WAL mode with synchronous=NORMAL
+- Records are written with executemany() in one transaction per batch,
+  once batch_size records are queued or the oldest queued record is
+  flush_interval seconds old
+- flush() waits until everything queued so far is written; the queue is
+  drained when the process exits (atexit)
+
+A failed record (e.g. a missing table or a violated constraint) is logged
+and dropped, like the warnings the synchronous path prints; it never
+reaches the agent, and the other records in the same batch are still
+written.
+
+Environment Variables:
+    ASP_TELEMETRY_WRITER: "background" (default) or "sync" (write each
+        row on the calling thread, one connection per row)
+    ASP_TELEMETRY_BATCH_SIZE: Records per transaction (default: 200)
+    ASP_TELEMETRY_FLUSH_INTERVAL: Seconds a record may wait in the queue
+        (default: 0.5)
+
+Example:
+    writer = get_telemetry_writer()
+    writer.submit("INSERT INTO t (a) VALUES (?)", (1,), Path("data/t.db"))
+    writer.flush()
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+# pylint: disable=logging-fstring-interpolation
+
+import atexit
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL = 0.5
+WRITER_MODES = ("background", "sync")
+
+# Seconds to wait for queued records at process exit
+_EXIT_TIMEOUT = 5.0
+
+_STOP = object()
+
+
+class TelemetryWriter:
+    """
+    Batches telemetry inserts on a background thread.
+
+    Thread-safe; submit() never blocks on the database.
+
+    Attributes:
+        batch_size: Records written per transaction at most
+        flush_interval: Seconds a queued record may wait before a write
+        written: Records written so far
+        dropped: Records lost to failed batches
+    """
+
+    def __init__(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.dropped = 0
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._connections: dict[Path, sqlite3.Connection] = {}
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, sql: str, params: tuple, db_path: Path) -> None:
+        """
+        Queue one insert.
+
+        Args:
+            sql: Parameterized INSERT statement
+            params: Statement parameters
+            db_path: SQLite database file
+        """
+        if self._closed:
+            raise RuntimeError("TelemetryWriter is closed")
+        self._ensure_thread()
+        self._queue.put((Path(db_path), sql, params))
+
+    def flush(self, timeout: float | None = 10.0) -> bool:
+        """
+        Wait until every record queued before the call is written.
+
+        Returns:
+            False if the timeout expired first
+        """
+        if self._thread is None or self._closed:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: float | None = 10.0) -> None:
+        """Write the queued records, stop the thread and close connections."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning("Telemetry writer did not drain before the timeout")
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="asp-telemetry-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        pending: list[tuple[Path, str, tuple]] = []
+        oldest = 0.0
+        while True:
+            timeout = None
+            if pending:
+                timeout = max(0.0, oldest + self.flush_interval - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._write(pending)
+                pending = []
+                continue
+
+            if item is _STOP:
+                self._write(pending)
+                self._close_connections()
+                return
+            if isinstance(item, threading.Event):
+                self._write(pending)
+                pending = []
+                item.set()
+                continue
+
+            if not pending:
+                oldest = time.monotonic()
+            pending.append(item)
+            if len(pending) >= self.batch_size:
+                self._write(pending)
+                pending = []
+
+    def _write(self, records: list[tuple[Path, str, tuple]]) -> None:
+        """
+        Write records, one transaction per database file.
+
+        Each statement runs under its own savepoint, so records that fail
+        (e.g. a table missing from an older database) are dropped on their
+        own and the rest of the batch still commits.
+        """
+        batches: dict[Path, dict[str, list[tuple]]] = {}
+        for db_path, sql, params in records:
+            batches.setdefault(db_path, {}).setdefault(sql, []).append(params)
+
+        for db_path, statements in batches.items():
+            count = sum(len(rows) for rows in statements.values())
+            try:
+                conn = self._connection(db_path)
+                with conn:
+                    for sql, rows in statements.items():
+                        self._write_statement(conn, db_path, sql, rows)
+            except sqlite3.Error as e:
+                self.dropped += count
+                logger.warning(
+                    f"Failed to write {count} telemetry records to {db_path}: {e}"
+                )
+                self._drop_connection(db_path)
+
+    def _write_statement(
+        self, conn: sqlite3.Connection, db_path: Path, sql: str, rows: list[tuple]
+    ) -> None:
+        """
+        Write all rows of one statement, dropping only rows that fail.
+
+        The rows go in a single executemany(); if that fails, they are
+        retried one at a time so one bad row (e.g. a metric type rejected
+        by the CHECK constraint of an older database) does not drop the
+        valid rows queued with it.
+        """
+        error = self._execute_under_savepoint(conn, sql, rows)
+        if error is None:
+            self.written += len(rows)
+            return
+
+        failed = len(rows)
+        if len(rows) > 1:
+            failed = 0
+            for row in rows:
+                row_error = self._execute_under_savepoint(conn, sql, [row])
+                if row_error is not None:
+                    failed += 1
+                    error = row_error
+        self.written += len(rows) - failed
+        self.dropped += failed
+        if failed:
+            logger.warning(
+                f"Failed to write {failed} telemetry records to {db_path}: {error}"
+            )
+
+    @staticmethod
+    def _execute_under_savepoint(
+        conn: sqlite3.Connection, sql: str, rows: list[tuple]
+    ) -> sqlite3.Error | None:
+        """Run executemany() under a savepoint; roll back and return any error."""
+        conn.execute("SAVEPOINT telemetry_batch")
+        try:
+            conn.executemany(sql, rows)
+        except sqlite3.Error as e:
+            conn.execute("ROLLBACK TO telemetry_batch")
+            conn.execute("RELEASE telemetry_batch")
+            return e
+        conn.execute("RELEASE telemetry_batch")
+        return None
+
+    def _connection(self, db_path: Path) -> sqlite3.Connection:
+        conn = self._connections.get(db_path)
+        if conn is None:
+            conn = sqlite3.connect(str(db_path))
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._connections[db_path] = conn
+        return conn
+
+    def _drop_connection(self, db_path: Path) -> None:
+        conn = self._connections.pop(db_path, None)
+        if conn is not None:
+            conn.close()
+
+    def _close_connections(self) -> None:
+        for db_path in list(self._connections):
+            self._drop_connection(db_path)
+
+
+_writer: TelemetryWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def telemetry_writer_mode(mode: str | None = None) -> str:
+    """
+    Resolve the writer mode: explicit value > ASP_TELEMETRY_WRITER > background.
+
+    Raises:
+        ValueError: If the mode is not one of WRITER_MODES
+    """
+    if mode is None:
+        mode = os.getenv("ASP_TELEMETRY_WRITER", "background")
+    mode = mode.strip().lower()
+    if mode not in WRITER_MODES:
+        raise ValueError(
+            f"Invalid telemetry writer mode {mode!r}; "
+            f"expected one of {', '.join(WRITER_MODES)}"
+        )
+    return mode
+
+
+def get_telemetry_writer() -> TelemetryWriter | None:
+    """
+    The process-wide background writer, or None in "sync" mode.
+
+    The writer is created on first use and drained at process exit.
+    """
+    global _writer  # pylint: disable=global-statement
+    if telemetry_writer_mode() == "sync":
+        return None
+    if _writer is not None:
+        return _writer
+    # Imported here: asp.utils imports the telemetry package
+    from asp.utils.env import env_float, env_int
+
+    with _writer_lock:
+        if _writer is None:
+            batch_size = env_int("ASP_TELEMETRY_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+            if batch_size < 1:
+                logger.warning(
+                    f"Ignoring ASP_TELEMETRY_BATCH_SIZE={batch_size}, "
+                    f"using {DEFAULT_BATCH_SIZE}"
+                )
+                batch_size = DEFAULT_BATCH_SIZE
+            _writer = TelemetryWriter(
+                batch_size=batch_size,
+                flush_interval=env_float(
+                    "ASP_TELEMETRY_FLUSH_INTERVAL", DEFAULT_FLUSH_INTERVAL
+                ),
+            )
+            atexit.register(_writer.close, _EXIT_TIMEOUT)
+        return _writer
+
+
+def flush_telemetry(timeout: float | None = 10.0) -> bool:
+    """
+    Wait until queued telemetry records are written (no-op in "sync" mode).
+
+    Call before reading telemetry written by this process.
+
+    Returns:
+        False if the timeout expired first
+    """
+    writer = _writer
+    if writer is None:
+        return True
+    return writer.flush(timeout)
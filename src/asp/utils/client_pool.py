@@ -0,0 +1,354 @@
+"""
+Process-Wide Pooled LLM SDK Clients for ASP Platform
+
+Every agent used to construct its own Anthropic/AsyncAnthropic client, each
+with a private HTTP connection pool, so a full TSP run (7 agents plus 12
+review specialists) opened many pools and repeated TCP/TLS handshakes. This
+module hands out shared SDK clients keyed by (SDK, API key, base URL,
+headers), so all agents and orchestrators in a process reuse one pool per
+endpoint. Every pooled client reports its responses to the shared adaptive
+rate limiter for its endpoint (see asp.utils.rate_limiter).
+
+Async clients are additionally keyed by the running event loop, because
+httpx async connections cannot be reused across loops (e.g., successive
+asyncio.run() calls).
+
+Environment Variables:
+    ASP_HTTP_MAX_CONNECTIONS: Maximum concurrent connections per pool
+        (default: 20)
+    ASP_HTTP_MAX_KEEPALIVE: Maximum idle keep-alive connections per pool
+        (default: 10)
+    ASP_HTTP_KEEPALIVE_EXPIRY: Seconds an idle connection is kept open
+        (default: 30)
+    ASP_HTTP2: Enable HTTP/2 when the "h2" package is installed
+        ("true"/"false", default: "false")
+
+Example:
+    client = get_anthropic_client(api_key)
+    async_client = get_async_anthropic_client(api_key)
+    ...
+    await aclose_client_pool()  # on server shutdown
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from asp.utils.env import env_float, env_int
+from asp.utils.rate_limiter import get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE = 10
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """
+    HTTP connection pool settings shared by all pooled clients.
+
+    Attributes:
+        max_connections: Maximum concurrent connections per pool
+        max_keepalive_connections: Maximum idle connections kept alive
+        keepalive_expiry: Seconds before an idle connection is closed
+        http2: Whether to negotiate HTTP/2
+    """
+
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY
+    http2: bool = False
+
+    @classmethod
+    def from_env(cls) -> "PoolConfig":
+        """Build pool settings from ASP_HTTP_* environment variables."""
+        http2 = os.getenv("ASP_HTTP2", "false").lower() == "true"
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning(
+                    "ASP_HTTP2=true but the 'h2' package is not installed; "
+                    "using HTTP/1.1 (pip install httpx[http2])"
+                )
+                http2 = False
+
+        return cls(
+            max_connections=env_int(
+                "ASP_HTTP_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS
+            ),
+            max_keepalive_connections=env_int(
+                "ASP_HTTP_MAX_KEEPALIVE", DEFAULT_MAX_KEEPALIVE
+            ),
+            keepalive_expiry=env_float(
+                "ASP_HTTP_KEEPALIVE_EXPIRY", DEFAULT_KEEPALIVE_EXPIRY
+            ),
+            http2=http2,
+        )
+
+    @property
+    def limits(self) -> httpx.Limits:
+        """httpx connection limits for this configuration."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+_lock = threading.Lock()
+_sync_clients: dict[tuple, Any] = {}
+_async_clients: "weakref.WeakKeyDictionary[Any, dict[tuple, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+_no_loop_async_clients: dict[tuple, Any] = {}
+_stats = {"created": 0, "reused": 0}
+
+
+def _client_key(
+    sdk: str,
+    api_key: str | None,
+    base_url: str | None,
+    default_headers: dict[str, str] | None,
+) -> tuple:
+    headers = tuple(sorted((default_headers or {}).items()))
+    return (sdk, api_key, base_url, headers)
+
+
+def rate_limiter_name(sdk: str, base_url: str | None) -> str:
+    """
+    Name of the shared rate limiter for an SDK/endpoint.
+
+    Args:
+        sdk: "anthropic" or "openai"
+        base_url: Custom endpoint, if any
+
+    Returns:
+        Limiter name passed to asp.utils.rate_limiter.get_rate_limiter()
+    """
+    return base_url or sdk
+
+
+def _rate_limit_hooks(limiter_name: str, is_async: bool) -> dict[str, list]:
+    """httpx event hooks feeding every response into the shared rate limiter."""
+
+    def observe(response: httpx.Response) -> None:
+        limiter = get_rate_limiter(limiter_name)
+        if limiter is not None:
+            limiter.on_response(response.status_code, response.headers)
+
+    if not is_async:
+        return {"response": [observe]}
+
+    async def observe_async(response: httpx.Response) -> None:
+        observe(response)
+
+    return {"response": [observe_async]}
+
+
+def _build_client(sdk: str, is_async: bool, key: tuple) -> Any:
+    """Construct an SDK client backed by a tuned httpx pool."""
+    _, api_key, base_url, headers = key
+    config = PoolConfig.from_env()
+    http_options = {
+        "limits": config.limits,
+        "http2": config.http2,
+        "event_hooks": _rate_limit_hooks(rate_limiter_name(sdk, base_url), is_async),
+    }
+    kwargs: dict[str, Any] = {"api_key": api_key}
+    if base_url:
+        kwargs["base_url"] = base_url
+    if headers:
+        kwargs["default_headers"] = dict(headers)
+
+    if sdk == "anthropic":
+        import anthropic
+
+        if is_async:
+            http_client = anthropic.DefaultAsyncHttpxClient(**http_options)
+            return anthropic.AsyncAnthropic(http_client=http_client, **kwargs)
+        http_client = anthropic.DefaultHttpxClient(**http_options)
+        return anthropic.Anthropic(http_client=http_client, **kwargs)
+
+    if sdk == "openai":
+        import openai
+
+        if is_async:
+            http_client = openai.DefaultAsyncHttpxClient(**http_options)
+            return openai.AsyncOpenAI(http_client=http_client, **kwargs)
+        http_client = openai.DefaultHttpxClient(**http_options)
+        return openai.OpenAI(http_client=http_client, **kwargs)
+
+    raise ValueError(f"Unknown SDK for client pool: {sdk!r}")
+
+
+def _get_sync(sdk: str, key: tuple) -> Any:
+    with _lock:
+        client = _sync_clients.get(key)
+        if client is not None:
+            _stats["reused"] += 1
+            return client
+        client = _build_client(sdk, is_async=False, key=key)
+        _sync_clients[key] = client
+        _stats["created"] += 1
+        logger.debug(f"Created pooled {sdk} client (base_url={key[2]})")
+        return client
+
+
+def _get_async(sdk: str, key: tuple) -> Any:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    with _lock:
+        if loop is None:
+            clients = _no_loop_async_clients
+        else:
+            clients = _async_clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is not None:
+            _stats["reused"] += 1
+            return client
+        client = _build_client(sdk, is_async=True, key=key)
+        clients[key] = client
+        _stats["created"] += 1
+        logger.debug(f"Created pooled async {sdk} client (base_url={key[2]})")
+        return client
+
+
+def get_anthropic_client(api_key: str, base_url: str | None = None) -> Any:
+    """
+    Get the shared synchronous Anthropic client for an API key/endpoint.
+
+    Args:
+        api_key: Anthropic API key
+        base_url: Optional custom API endpoint
+
+    Returns:
+        anthropic.Anthropic instance shared across the process
+    """
+    return _get_sync("anthropic", _client_key("anthropic", api_key, base_url, None))
+
+
+def get_async_anthropic_client(api_key: str, base_url: str | None = None) -> Any:
+    """
+    Get the shared AsyncAnthropic client for the current event loop.
+
+    Args:
+        api_key: Anthropic API key
+        base_url: Optional custom API endpoint
+
+    Returns:
+        anthropic.AsyncAnthropic instance shared within the running loop
+    """
+    return _get_async("anthropic", _client_key("anthropic", api_key, base_url, None))
+
+
+def get_openai_client(
+    api_key: str,
+    base_url: str | None = None,
+    default_headers: dict[str, str] | None = None,
+) -> Any:
+    """
+    Get the shared synchronous OpenAI-compatible client for an endpoint.
+
+    Args:
+        api_key: API key for the endpoint
+        base_url: API endpoint (OpenRouter, Groq, Ollama, ...)
+        default_headers: Extra headers sent with every request
+
+    Returns:
+        openai.OpenAI instance shared across the process
+    """
+    key = _client_key("openai", api_key, base_url, default_headers)
+    return _get_sync("openai", key)
+
+
+def get_async_openai_client(
+    api_key: str,
+    base_url: str | None = None,
+    default_headers: dict[str, str] | None = None,
+) -> Any:
+    """
+    Get the shared AsyncOpenAI client for the current event loop.
+
+    Args:
+        api_key: API key for the endpoint
+        base_url: API endpoint (OpenRouter, Groq, Ollama, ...)
+        default_headers: Extra headers sent with every request
+
+    Returns:
+        openai.AsyncOpenAI instance shared within the running loop
+    """
+    key = _client_key("openai", api_key, base_url, default_headers)
+    return _get_async("openai", key)
+
+
+def client_pool_stats() -> dict[str, int]:
+    """
+    Summarize pool usage since the last reset.
+
+    Returns:
+        Dict with clients created, lookups served by an existing client,
+        and sync/async clients currently pooled
+    """
+    with _lock:
+        async_count = len(_no_loop_async_clients) + sum(
+            len(clients) for clients in _async_clients.values()
+        )
+        return {
+            "created": _stats["created"],
+            "reused": _stats["reused"],
+            "sync_clients": len(_sync_clients),
+            "async_clients": async_count,
+        }
+
+
+def close_client_pool() -> None:
+    """
+    Close all pooled synchronous clients and forget async ones.
+
+    Async clients cannot be closed without their event loop; use
+    aclose_client_pool() from async shutdown hooks to close them cleanly.
+    """
+    with _lock:
+        clients = list(_sync_clients.values())
+        _sync_clients.clear()
+        _async_clients.clear()
+        _no_loop_async_clients.clear()
+        _stats.update(created=0, reused=0)
+
+    for client in clients:
+        try:
+            client.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled client: {e}")
+    logger.debug(f"Closed {len(clients)} pooled sync clients")
+
+
+async def aclose_client_pool() -> None:
+    """Close pooled clients, including async clients on the running loop."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        async_clients = list(_async_clients.pop(loop, {}).values())
+        async_clients.extend(_no_loop_async_clients.values())
+        _no_loop_async_clients.clear()
+
+    for client in async_clients:
+        try:
+            await client.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled async client: {e}")
+    close_client_pool()
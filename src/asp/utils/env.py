@@ -0,0 +1,62 @@
+"""
+Tolerant Parsing of Numeric Environment Settings
+
+Numeric tuning variables (cache sizes, pool limits, rate limits, telemetry
+batching) are optional. A malformed value falls back to the setting's
+default with a warning instead of raising, so a typo in one of them cannot
+stop every agent from running.
+
+Example:
+    max_entries = env_int("ASP_LLM_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)
+    expiry = env_float("ASP_HTTP_KEEPALIVE_EXPIRY", DEFAULT_KEEPALIVE_EXPIRY)
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import logging
+import os
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+def env_int(name: str, default: int) -> int:
+    """
+    Read an integer setting from the environment.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset or malformed
+
+    Returns:
+        Parsed value, or default
+    """
+    return _env_number(name, default, int)
+
+
+def env_float(name: str, default: float) -> float:
+    """
+    Read a float setting from the environment.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset or malformed
+
+    Returns:
+        Parsed value, or default
+    """
+    return _env_number(name, default, float)
+
+
+def _env_number[NumberT: (int, float)](
+    name: str, default: NumberT, parse: Callable[[str], NumberT]
+) -> NumberT:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return parse(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={value!r}, using {default}")
+        return default
@@ -0,0 +1,689 @@
+"""
+Shared LLM Call Budget for Concurrent Tasks
+
+When many TSP pipelines run in one process (see
+asp.orchestrators.batch_runner), their LLM calls draw from one LLMBudget:
+
+    - A global cap on concurrent LLM calls across all tasks
+    - Fair slot hand-off: a freed slot goes to the waiting task with the
+      fewest calls in flight (then the higher priority, then the longest
+      waiting call), so one task with a wide fan-out cannot starve the
+      others; an optional per-task cap bounds any single task
+    - Per-task cost caps and an optional batch-wide token budget: once
+      spent, further calls of that task (or of the batch) raise
+      BudgetExceededError instead of reaching the provider
+
+The budget applies to the calls made inside budget_scope(budget, task_id).
+The scope is a context variable, so it follows asyncio tasks and
+asyncio.to_thread() workers. BaseAgent routes its LLM client calls through
+budgeted_call()/budgeted_call_async(); outside a scope they run unchanged.
+Cache hits never reach the budget.
+
+usage_meter() measures the billed calls made inside it the same way,
+without limiting them (e.g. to price work that is later discarded); meters
+nest and apply with or without a budget scope.
+
+The provider rate limiter (asp.utils.rate_limiter) still applies beneath
+the budget: the budget decides which task's call goes next, the rate
+limiter how fast calls reach the provider.
+
+A RunBudget bounds a single pipeline run instead: wall clock, tokens and
+USD, charged live from every LLM response made inside run_budget_scope().
+Once a third of any limit is all that is left the budget is "tight" and
+callers degrade (a cheaper fallback model, fewer review specialists, no
+speculative work, no further correction iterations); once a limit is
+reached further calls raise RunBudgetExceededError. TSPOrchestrator turns
+that into a BUDGET_EXCEEDED result with the phases completed so far.
+
+Environment Variables:
+    ASP_RUN_DEADLINE_SECONDS: Wall-clock limit per pipeline run (unset = none)
+    ASP_RUN_MAX_TOKENS: Token limit per pipeline run (unset = none)
+    ASP_RUN_MAX_COST_USD: LLM spend limit per pipeline run (unset = none)
+    ASP_RUN_FALLBACK_MODEL: Model used once the run budget is tight
+        (unset = keep the requested model)
+
+Example:
+    budget = LLMBudget(max_concurrent_calls=20)
+    budget.register_task("TASK-001", priority=0, cost_cap_usd=2.0)
+    with budget_scope(budget, "TASK-001"):
+        result = await orchestrator.execute_async(requirements)
+    print(budget.usage("TASK-001").cost_usd)
+
+    run_budget = RunBudget(deadline_seconds=600, max_cost_usd=2.0)
+    result = TSPOrchestrator(run_budget=run_budget).execute(requirements)
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+# pylint: disable=logging-fstring-interpolation
+
+import asyncio
+import itertools
+import logging
+import os
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PRIORITY = 2  # 0=Highest, 4=Lowest (same scale as Beads issues)
+
+# Share of a run budget left at which callers start to degrade
+DEFAULT_TIGHT_FRACTION = 1 / 3
+
+_scope: ContextVar[tuple["LLMBudget", str] | None] = ContextVar(
+    "asp_llm_budget_scope", default=None
+)
+_meters: ContextVar[tuple["UsageMeter", ...]] = ContextVar(
+    "asp_llm_usage_meters", default=()
+)
+_run_scope: ContextVar["RunBudget | None"] = ContextVar(
+    "asp_run_budget_scope", default=None
+)
+
+
+class BudgetExceededError(Exception):
+    """Raised when a task's cost cap or the batch token budget is spent."""
+
+
+class RunBudgetExceededError(BudgetExceededError):
+    """Raised when a pipeline run's deadline, token or cost limit is reached."""
+
+
+def is_budget_exceeded(
+    error: BaseException, kind: type[BudgetExceededError] = BudgetExceededError
+) -> bool:
+    """
+    Whether an error was caused by a budget error of the given kind.
+
+    Agents wrap budget errors, so the __cause__/__context__ chain is followed.
+    """
+    seen = set()
+    current: BaseException | None = error
+    while current is not None and id(current) not in seen:
+        if isinstance(current, kind):
+            return True
+        seen.add(id(current))
+        current = current.__cause__ or current.__context__
+    return False
+
+
+@dataclass
+class TaskUsage:
+    """LLM usage charged to one task."""
+
+    priority: int = DEFAULT_PRIORITY
+    cost_cap_usd: float | None = None
+    calls: int = 0
+    in_flight: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+    waited_seconds: float = 0.0
+
+    @property
+    def total_tokens(self) -> int:
+        """Input plus output tokens."""
+        return self.input_tokens + self.output_tokens
+
+
+@dataclass
+class UsageMeter:
+    """LLM usage of the billed calls made inside a usage_meter() context."""
+
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+
+    @property
+    def total_tokens(self) -> int:
+        """Input plus output tokens."""
+        return self.input_tokens + self.output_tokens
+
+
+@dataclass
+class _Waiter:
+    task_id: str
+    seq: int
+    wake: Callable[[], None]
+    granted: bool = False
+
+
+class LLMBudget:
+    """
+    Global LLM concurrency and spend budget shared by concurrent tasks.
+
+    Thread-safe; usable from any event loop (acquire_async) and from worker
+    threads (acquire_sync), like AdaptiveRateLimiter.
+
+    Attributes:
+        max_concurrent_calls: LLM calls allowed in flight across all tasks
+        max_calls_per_task: Calls one task may have in flight (None = no cap)
+        max_total_tokens: Tokens the whole batch may use (0 = unlimited)
+    """
+
+    def __init__(
+        self,
+        max_concurrent_calls: int = 20,
+        max_calls_per_task: int | None = None,
+        max_total_tokens: int = 0,
+    ):
+        """
+        Initialize budget.
+
+        Args:
+            max_concurrent_calls: Global concurrent call limit
+            max_calls_per_task: Optional per-task concurrent call limit
+            max_total_tokens: Optional batch-wide token budget (0 = unlimited)
+        """
+        if max_concurrent_calls < 1:
+            raise ValueError("max_concurrent_calls must be at least 1")
+        if max_calls_per_task is not None and max_calls_per_task < 1:
+            raise ValueError("max_calls_per_task must be at least 1")
+        self.max_concurrent_calls = max_concurrent_calls
+        self.max_calls_per_task = max_calls_per_task
+        self.max_total_tokens = max_total_tokens
+        self._tasks: dict[str, TaskUsage] = {}
+        self._waiters: list[_Waiter] = []
+        self._in_flight = 0
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # Tasks and usage
+    # -------------------------------------------------------------------------
+
+    def register_task(
+        self,
+        task_id: str,
+        priority: int = DEFAULT_PRIORITY,
+        cost_cap_usd: float | None = None,
+    ) -> TaskUsage:
+        """
+        Register a task's priority and cost cap (unregistered tasks get defaults).
+
+        Args:
+            task_id: Task identifier
+            priority: 0 (highest) to 4 (lowest)
+            cost_cap_usd: Maximum LLM spend for the task (None = no cap)
+
+        Returns:
+            The task's TaskUsage record
+        """
+        with self._lock:
+            usage = self._tasks.setdefault(task_id, TaskUsage())
+            usage.priority = priority
+            usage.cost_cap_usd = cost_cap_usd
+            return usage
+
+    def usage(self, task_id: str) -> TaskUsage:
+        """Usage charged to a task so far."""
+        with self._lock:
+            return self._tasks.setdefault(task_id, TaskUsage())
+
+    @property
+    def in_flight(self) -> int:
+        """Calls currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def total_tokens(self) -> int:
+        """Tokens charged across all tasks."""
+        with self._lock:
+            return sum(usage.total_tokens for usage in self._tasks.values())
+
+    def _check_spend(self, task_id: str, usage: TaskUsage) -> None:
+        """Raise BudgetExceededError if the task may not start a call. Needs lock."""
+        if usage.cost_cap_usd is not None and usage.cost_usd >= usage.cost_cap_usd:
+            raise BudgetExceededError(
+                f"Task {task_id} reached its cost cap "
+                f"(${usage.cost_usd:.4f} of ${usage.cost_cap_usd:.4f})"
+            )
+        if self.max_total_tokens:
+            spent = sum(u.total_tokens for u in self._tasks.values())
+            if spent >= self.max_total_tokens:
+                raise BudgetExceededError(
+                    f"Batch token budget spent ({spent} of {self.max_total_tokens})"
+                )
+
+    # -------------------------------------------------------------------------
+    # Slots
+    # -------------------------------------------------------------------------
+
+    def _has_room(self, usage: TaskUsage) -> bool:
+        """Whether a call of this task may take a slot now. Needs lock."""
+        if self.max_calls_per_task and usage.in_flight >= self.max_calls_per_task:
+            return False
+        return self._in_flight < self.max_concurrent_calls
+
+    def _enter(self, usage: TaskUsage) -> None:
+        """Take a slot for a task. Needs lock."""
+        self._in_flight += 1
+        usage.in_flight += 1
+        usage.calls += 1
+
+    def _try_enter(
+        self, task_id: str, wake: Callable[[], None], force: bool = False
+    ) -> _Waiter | None:
+        """Take a slot or enqueue a waiter; returns the waiter if queued."""
+        with self._lock:
+            usage = self._tasks.setdefault(task_id, TaskUsage())
+            self._check_spend(task_id, usage)
+            # Waiters are only ever queued behind a full budget or their own
+            # per-task cap (release() hands free slots to them first), so a
+            # free slot may be taken directly
+            if force or self._has_room(usage):
+                self._enter(usage)
+                return None
+            waiter = _Waiter(task_id=task_id, seq=next(self._seq), wake=wake)
+            self._waiters.append(waiter)
+            return waiter
+
+    def _dispatch(self) -> list[Callable[[], None]]:
+        """Hand free slots to the fairest eligible waiters. Needs lock."""
+        woken = []
+        while self._in_flight < self.max_concurrent_calls:
+            eligible = [
+                waiter
+                for waiter in self._waiters
+                if self._has_room(self._tasks[waiter.task_id])
+            ]
+            if not eligible:
+                break
+            waiter = min(
+                eligible,
+                key=lambda w: (
+                    self._tasks[w.task_id].in_flight,
+                    self._tasks[w.task_id].priority,
+                    w.seq,
+                ),
+            )
+            self._waiters.remove(waiter)
+            self._enter(self._tasks[waiter.task_id])
+            waiter.granted = True
+            woken.append(waiter.wake)
+        return woken
+
+    def _cancel(self, waiter: _Waiter) -> None:
+        """Withdraw a waiter whose caller gave up, returning any granted slot."""
+        with self._lock:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                return
+        if waiter.granted:
+            self.release(waiter.task_id)
+
+    async def acquire_async(self, task_id: str) -> None:
+        """
+        Wait for a call slot for a task.
+
+        Args:
+            task_id: Task the call is charged to
+
+        Raises:
+            BudgetExceededError: If the task's cost cap or the token budget
+                is spent
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiter = self._try_enter(
+            task_id, lambda: loop.call_soon_threadsafe(_resolve, future)
+        )
+        if waiter is None:
+            return
+        start = loop.time()
+        try:
+            await future
+        except BaseException:
+            self._cancel(waiter)
+            raise
+        self._record_wait(task_id, loop.time() - start)
+
+    def acquire_sync(self, task_id: str) -> None:
+        """
+        Blocking version of acquire_async for worker threads.
+
+        On a thread running an event loop the slot is taken without waiting,
+        since blocking the loop could deadlock against async slot holders.
+
+        Args:
+            task_id: Task the call is charged to
+
+        Raises:
+            BudgetExceededError: If the task's cost cap or the token budget
+                is spent
+        """
+        try:
+            asyncio.get_running_loop()
+            on_loop_thread = True
+        except RuntimeError:
+            on_loop_thread = False
+
+        event = threading.Event()
+        waiter = self._try_enter(task_id, event.set, force=on_loop_thread)
+        if waiter is None:
+            return
+        start = time.monotonic()
+        event.wait()
+        self._record_wait(task_id, time.monotonic() - start)
+
+    def _record_wait(self, task_id: str, waited: float) -> None:
+        with self._lock:
+            self._tasks[task_id].waited_seconds += waited
+
+    def release(self, task_id: str) -> None:
+        """Free a slot taken by acquire_async/acquire_sync."""
+        with self._lock:
+            usage = self._tasks[task_id]
+            usage.in_flight = max(0, usage.in_flight - 1)
+            self._in_flight = max(0, self._in_flight - 1)
+            woken = self._dispatch()
+        for wake in woken:
+            wake()
+
+    def charge(self, task_id: str, response: dict[str, Any]) -> None:
+        """
+        Charge a completed LLM call's tokens and cost to a task.
+
+        Args:
+            task_id: Task the call belongs to
+            response: LLM client response (usage and cost keys)
+        """
+        usage_data = response.get("usage") or {}
+        with self._lock:
+            usage = self._tasks.setdefault(task_id, TaskUsage())
+            usage.input_tokens += usage_data.get("input_tokens", 0) or 0
+            usage.output_tokens += usage_data.get("output_tokens", 0) or 0
+            usage.cost_usd += response.get("cost", 0.0) or 0.0
+
+
+@dataclass
+class RunBudget:  # pylint: disable=too-many-instance-attributes
+    """
+    Wall-clock, token and USD limits for one pipeline run.
+
+    Limits left as None are not enforced. The clock starts at start()
+    (TSPOrchestrator calls it when a run begins) or on first use. Charging
+    is thread-safe, so one budget can be shared by the specialists a review
+    fans out to.
+
+    Attributes:
+        deadline_seconds: Wall-clock limit for the run
+        max_tokens: Input plus output tokens the run may use
+        max_cost_usd: LLM spend the run may incur
+        fallback_model: Model calls switch to once the budget is tight
+        tight_fraction: Share of a limit left at which the budget is tight
+    """
+
+    deadline_seconds: float | None = None
+    max_tokens: int | None = None
+    max_cost_usd: float | None = None
+    fallback_model: str | None = None
+    tight_fraction: float = DEFAULT_TIGHT_FRACTION
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+    _started: float | None = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_env(cls) -> "RunBudget | None":
+        """Build a budget from the ASP_RUN_* variables (None if none is set)."""
+        deadline = os.getenv("ASP_RUN_DEADLINE_SECONDS")
+        max_tokens = os.getenv("ASP_RUN_MAX_TOKENS")
+        max_cost = os.getenv("ASP_RUN_MAX_COST_USD")
+        if not (deadline or max_tokens or max_cost):
+            return None
+        return cls(
+            deadline_seconds=float(deadline) if deadline else None,
+            max_tokens=int(max_tokens) if max_tokens else None,
+            max_cost_usd=float(max_cost) if max_cost else None,
+            fallback_model=os.getenv("ASP_RUN_FALLBACK_MODEL") or None,
+        )
+
+    def start(self) -> None:
+        """Start (or restart) the run: reset the clock and the usage."""
+        with self._lock:
+            self._started = time.monotonic()
+            self.calls = 0
+            self.input_tokens = 0
+            self.output_tokens = 0
+            self.cost_usd = 0.0
+
+    @property
+    def total_tokens(self) -> int:
+        """Input plus output tokens."""
+        return self.input_tokens + self.output_tokens
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Wall-clock time since the run started."""
+        if self._started is None:
+            self._started = time.monotonic()
+        return time.monotonic() - self._started
+
+    @property
+    def remaining_seconds(self) -> float | None:
+        """Time left until the deadline (None without a deadline)."""
+        if self.deadline_seconds is None:
+            return None
+        return max(0.0, self.deadline_seconds - self.elapsed_seconds)
+
+    def remaining_fraction(self) -> float:
+        """Smallest share left of any limit (1.0 without limits)."""
+        fractions = [1.0]
+        for used, limit in (
+            (self.elapsed_seconds, self.deadline_seconds),
+            (self.total_tokens, self.max_tokens),
+            (self.cost_usd, self.max_cost_usd),
+        ):
+            if limit is not None:
+                fractions.append(max(0.0, 1 - used / limit) if limit > 0 else 0.0)
+        return min(fractions)
+
+    @property
+    def tight(self) -> bool:
+        """Whether callers should degrade to stay within the budget."""
+        return self.remaining_fraction() <= self.tight_fraction
+
+    def exhausted_reason(self) -> str | None:
+        """Which limit has been reached, or None."""
+        if self.deadline_seconds is not None and (
+            self.elapsed_seconds >= self.deadline_seconds
+        ):
+            return (
+                f"deadline reached ({self.elapsed_seconds:.1f}s of "
+                f"{self.deadline_seconds:.1f}s)"
+            )
+        if self.max_tokens is not None and self.total_tokens >= self.max_tokens:
+            return f"token limit reached ({self.total_tokens} of {self.max_tokens})"
+        if self.max_cost_usd is not None and self.cost_usd >= self.max_cost_usd:
+            return (
+                f"cost limit reached (${self.cost_usd:.4f} of ${self.max_cost_usd:.4f})"
+            )
+        return None
+
+    def check(self) -> None:
+        """
+        Raise if the run may not start another LLM call.
+
+        Raises:
+            RunBudgetExceededError: If a limit has been reached
+        """
+        reason = self.exhausted_reason()
+        if reason:
+            raise RunBudgetExceededError(f"Run budget exhausted: {reason}")
+
+    def charge(self, response: dict[str, Any]) -> None:
+        """Charge a completed LLM call's tokens and cost to the run."""
+        usage = response.get("usage") or {}
+        with self._lock:
+            self.calls += 1
+            self.input_tokens += usage.get("input_tokens", 0) or 0
+            self.output_tokens += usage.get("output_tokens", 0) or 0
+            self.cost_usd += response.get("cost", 0.0) or 0.0
+
+    def summary(self) -> dict[str, Any]:
+        """Limits and usage so far, for results and logs."""
+        return {
+            "deadline_seconds": self.deadline_seconds,
+            "max_tokens": self.max_tokens,
+            "max_cost_usd": self.max_cost_usd,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "calls": self.calls,
+            "total_tokens": self.total_tokens,
+            "cost_usd": round(self.cost_usd, 6),
+            "exhausted": self.exhausted_reason(),
+        }
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+# =============================================================================
+# Scopes
+# =============================================================================
+
+
+@contextmanager
+def budget_scope(budget: LLMBudget, task_id: str) -> Iterator[LLMBudget]:
+    """Charge LLM calls made in this context (and its tasks/threads) to task_id."""
+    token = _scope.set((budget, task_id))
+    try:
+        yield budget
+    finally:
+        _scope.reset(token)
+
+
+@contextmanager
+def run_budget_scope(run_budget: RunBudget | None) -> Iterator[RunBudget | None]:
+    """Check and charge LLM calls made in this context against a run budget."""
+    token = _run_scope.set(run_budget)
+    try:
+        yield run_budget
+    finally:
+        _run_scope.reset(token)
+
+
+@contextmanager
+def usage_meter() -> Iterator[UsageMeter]:
+    """Measure the LLM calls made in this context (and its tasks/threads)."""
+    meter = UsageMeter()
+    token = _meters.set(_meters.get() + (meter,))
+    try:
+        yield meter
+    finally:
+        _meters.reset(token)
+
+
+_meter_lock = threading.Lock()
+
+
+def _charge_meters(response: dict[str, Any]) -> None:
+    """Add a completed call's usage to the run budget and usage meters."""
+    run_budget = _run_scope.get()
+    if run_budget is not None:
+        run_budget.charge(response)
+    meters = _meters.get()
+    if not meters:
+        return
+    usage = response.get("usage") or {}
+    with _meter_lock:
+        for meter in meters:
+            meter.calls += 1
+            meter.input_tokens += usage.get("input_tokens", 0) or 0
+            meter.output_tokens += usage.get("output_tokens", 0) or 0
+            meter.cost_usd += response.get("cost", 0.0) or 0.0
+
+
+def current_budget() -> tuple[LLMBudget, str] | None:
+    """The (budget, task_id) of the enclosing budget_scope, if any."""
+    return _scope.get()
+
+
+def current_run_budget() -> RunBudget | None:
+    """The RunBudget of the enclosing run_budget_scope, if any."""
+    return _run_scope.get()
+
+
+def run_budget_tight() -> bool:
+    """Whether the enclosing run budget (if any) is tight."""
+    run_budget = _run_scope.get()
+    return run_budget is not None and run_budget.tight
+
+
+def budget_model(model: str | None) -> str | None:
+    """The model to call: the run budget's fallback model once it is tight."""
+    run_budget = _run_scope.get()
+    if run_budget is None or not run_budget.fallback_model or not run_budget.tight:
+        return model
+    if model != run_budget.fallback_model:
+        logger.info(
+            f"Run budget tight ({run_budget.remaining_fraction():.0%} left): "
+            f"using {run_budget.fallback_model} instead of {model or 'default'}"
+        )
+    return run_budget.fallback_model
+
+
+def check_run_budget() -> None:
+    """
+    Raise if the enclosing run budget (if any) is exhausted.
+
+    Raises:
+        RunBudgetExceededError: If a limit of the run budget has been reached
+    """
+    run_budget = _run_scope.get()
+    if run_budget is not None:
+        run_budget.check()
+
+
+def budgeted_call(fn: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+    """Run a sync LLM client call under the enclosing budgets and meters, if any."""
+    check_run_budget()
+    scope = _scope.get()
+    if scope is None:
+        response = fn()
+        _charge_meters(response)
+        return response
+    budget, task_id = scope
+    budget.acquire_sync(task_id)
+    try:
+        response = fn()
+    finally:
+        budget.release(task_id)
+    budget.charge(task_id, response)
+    _charge_meters(response)
+    return response
+
+
+async def budgeted_call_async(
+    fn: Callable[[], Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    """Run an async LLM client call under the enclosing budgets and meters, if any."""
+    check_run_budget()
+    scope = _scope.get()
+    if scope is None:
+        response = await fn()
+        _charge_meters(response)
+        return response
+    budget, task_id = scope
+    await budget.acquire_async(task_id)
+    try:
+        response = await fn()
+    finally:
+        budget.release(task_id)
+    budget.charge(task_id, response)
+    _charge_meters(response)
+    return response
@@ -0,0 +1,401 @@
+"""
+Content-Addressed LLM Response Cache for ASP Platform
+
+This module provides a persistent, SQLite-backed cache for LLM responses.
+Entries are keyed by a SHA-256 hash of everything that determines the
+response (provider, model, system prompt, prompt, temperature, max_tokens
+and any extra request parameters), so identical requests issued by
+bootstrap scripts, E2E reruns or correction loops are served from disk
+instead of the API.
+
+Only deterministic requests are cached: calls with temperature > 0 bypass
+the cache entirely. Calls made inside cache_refresh() skip lookups, so a
+correction loop that regenerates from an unchanged prompt reaches the API
+instead of replaying the response it just rejected.
+
+Environment Variables:
+    ASP_LLM_CACHE: Cache mode ("off", "on", "refresh"). Defaults to "off".
+        "refresh" skips lookups but still stores fresh responses.
+    ASP_LLM_CACHE_PATH: SQLite file for the cache (default: data/llm_cache.db)
+    ASP_LLM_CACHE_MAX_ENTRIES: Maximum cached responses before LRU eviction
+        (default: 5000)
+    ASP_LLM_CACHE_TTL_SECONDS: Entry lifetime in seconds, 0 disables expiry
+        (default: 604800, i.e. 7 days)
+
+Example:
+    cache = LLMResponseCache(Path("data/llm_cache.db"))
+    key = make_cache_key("anthropic", "claude-haiku-4-5", None, prompt, 0.0, 4096)
+    response = cache.get(key)
+    if response is None:
+        response = client.call_with_retry(prompt=prompt)
+        cache.set(key, response, model="claude-haiku-4-5")
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Literal
+
+from asp.utils.env import env_int
+
+logger = logging.getLogger(__name__)
+
+CacheMode = Literal["off", "on", "refresh"]
+
+DEFAULT_CACHE_PATH = (
+    Path(__file__).parent.parent.parent.parent / "data" / "llm_cache.db"
+)
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Bump when the key derivation or stored payload format changes
+CACHE_KEY_VERSION = 1
+
+_refresh: ContextVar[bool] = ContextVar("asp_llm_cache_refresh", default=False)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_response_cache (
+    cache_key TEXT PRIMARY KEY,
+    model TEXT,
+    response_json TEXT NOT NULL,
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    last_accessed REAL NOT NULL,
+    hit_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_last_accessed
+    ON llm_response_cache(last_accessed);
+"""
+
+
+def make_cache_key(
+    provider: str,
+    model: str,
+    system: str | None,
+    prompt: str,
+    temperature: float,
+    max_tokens: int,
+    extra: dict[str, Any] | None = None,
+) -> str:
+    """
+    Build a content-addressed cache key for an LLM request.
+
+    Args:
+        provider: Provider name (e.g., "anthropic")
+        model: Resolved model name
+        system: Optional system prompt
+        prompt: User prompt text
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens in response
+        extra: Any additional request parameters that affect the response
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    payload = {
+        "v": CACHE_KEY_VERSION,
+        "provider": provider,
+        "model": model,
+        "system": system,
+        "prompt": prompt,
+        "temperature": float(temperature),
+        "max_tokens": int(max_tokens),
+        "extra": extra or {},
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def is_cacheable(temperature: float) -> bool:
+    """Only deterministic (temperature == 0) requests are cached."""
+    return temperature <= 0.0
+
+
+@contextmanager
+def cache_refresh() -> Iterator[None]:
+    """
+    Skip cache lookups for the calls made inside this context.
+
+    Fresh responses are still stored, replacing the previous entries.
+    """
+    token = _refresh.set(True)
+    try:
+        yield
+    finally:
+        _refresh.reset(token)
+
+
+def cache_refresh_active() -> bool:
+    """Whether the caller is inside cache_refresh()."""
+    return _refresh.get()
+
+
+class LLMResponseCache:
+    """
+    Persistent SQLite-backed LLM response cache with LRU and TTL eviction.
+
+    The cache is safe to share between threads; each operation opens a
+    short-lived connection under a lock, matching how the telemetry module
+    talks to SQLite.
+
+    Attributes:
+        db_path: Path to the SQLite cache file
+        max_entries: Maximum number of entries kept (least recently used
+            entries are evicted first)
+        ttl_seconds: Entry lifetime in seconds (0 disables expiry)
+        mode: "on" (read and write) or "refresh" (write only)
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        mode: CacheMode = "on",
+    ):
+        """
+        Initialize the cache and create its table if needed.
+
+        Args:
+            db_path: SQLite file path (defaults to data/llm_cache.db)
+            max_entries: Maximum number of cached responses
+            ttl_seconds: Entry lifetime in seconds (0 = never expire)
+            mode: "on" to read and write, "refresh" to only write
+        """
+        if mode not in ("on", "refresh"):
+            raise ValueError(
+                f"Invalid cache mode: {mode!r} (expected 'on' or 'refresh')"
+            )
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+
+        self.db_path = Path(db_path) if db_path else DEFAULT_CACHE_PATH
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.mode = mode
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Look up a cached response.
+
+        Returns None on a miss, when the entry has expired, or when the
+        cache is in refresh mode.
+
+        Args:
+            key: Cache key from make_cache_key()
+
+        Returns:
+            Stored response dict, or None
+        """
+        if self.mode == "refresh":
+            return None
+
+        now = time.time()
+        try:
+            with self._lock, self._connect() as conn:
+                row = conn.execute(
+                    "SELECT response_json, created_at FROM llm_response_cache "
+                    "WHERE cache_key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+
+                response_json, created_at = row
+                if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                    conn.execute(
+                        "DELETE FROM llm_response_cache WHERE cache_key = ?", (key,)
+                    )
+                    return None
+
+                conn.execute(
+                    "UPDATE llm_response_cache "
+                    "SET last_accessed = ?, hit_count = hit_count + 1 "
+                    "WHERE cache_key = ?",
+                    (now, key),
+                )
+            return json.loads(response_json)
+        except (sqlite3.Error, json.JSONDecodeError) as e:
+            logger.warning(f"LLM cache lookup failed, treating as miss: {e}")
+            return None
+
+    def set(self, key: str, response: dict[str, Any], model: str | None = None) -> bool:
+        """
+        Store a response, evicting least recently used entries if needed.
+
+        Args:
+            key: Cache key from make_cache_key()
+            response: Response dict as returned by the LLM client
+            model: Optional model name (informational)
+
+        Returns:
+            True if the response was stored
+        """
+        try:
+            response_json = json.dumps(response)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"LLM response not JSON-serializable, not caching: {e}")
+            return False
+
+        usage = response.get("usage") or {}
+        now = time.time()
+        try:
+            with self._lock, self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_response_cache "
+                    "(cache_key, model, response_json, input_tokens, output_tokens, "
+                    "created_at, last_accessed, hit_count) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+                    (
+                        key,
+                        model or response.get("model"),
+                        response_json,
+                        int(usage.get("input_tokens", 0) or 0),
+                        int(usage.get("output_tokens", 0) or 0),
+                        now,
+                        now,
+                    ),
+                )
+                self._evict(conn, now)
+            return True
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache write failed: {e}")
+            return False
+
+    def delete(self, key: str) -> bool:
+        """
+        Remove a cached response, e.g. one its caller rejected.
+
+        Args:
+            key: Cache key from make_cache_key()
+
+        Returns:
+            True if an entry was removed
+        """
+        try:
+            with self._lock, self._connect() as conn:
+                cursor = conn.execute(
+                    "DELETE FROM llm_response_cache WHERE cache_key = ?", (key,)
+                )
+            return cursor.rowcount > 0
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache delete failed: {e}")
+            return False
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then trim to max_entries by last access."""
+        if self.ttl_seconds:
+            conn.execute(
+                "DELETE FROM llm_response_cache WHERE created_at < ?",
+                (now - self.ttl_seconds,),
+            )
+        conn.execute(
+            "DELETE FROM llm_response_cache WHERE cache_key IN ("
+            "SELECT cache_key FROM llm_response_cache "
+            "ORDER BY last_accessed DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM llm_response_cache")
+
+    def stats(self) -> dict[str, int]:
+        """
+        Summarize cache contents.
+
+        Returns:
+            Dict with entries, total_hits, and tokens stored
+        """
+        with self._lock, self._connect() as conn:
+            entries, hits, tokens = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(hit_count), 0), "
+                "COALESCE(SUM(input_tokens + output_tokens), 0) "
+                "FROM llm_response_cache"
+            ).fetchone()
+        return {"entries": entries, "total_hits": hits, "tokens": tokens}
+
+
+_default_cache: LLMResponseCache | None = None
+_default_cache_config: tuple | None = None
+_default_cache_lock = threading.Lock()
+
+
+def get_cache_mode() -> CacheMode:
+    """
+    Get the configured cache mode from ASP_LLM_CACHE.
+
+    Returns:
+        "off", "on", or "refresh" (invalid values fall back to "off")
+    """
+    mode = os.getenv("ASP_LLM_CACHE", "off").lower()
+    if mode in ("on", "true", "1"):
+        return "on"
+    if mode == "refresh":
+        return "refresh"
+    return "off"
+
+
+def get_llm_cache() -> LLMResponseCache | None:
+    """
+    Get the process-wide LLM response cache configured from the environment.
+
+    The instance is rebuilt whenever the relevant environment variables
+    change, so the CLI can toggle caching by setting ASP_LLM_CACHE.
+
+    Returns:
+        LLMResponseCache instance, or None when caching is off
+    """
+    global _default_cache, _default_cache_config
+
+    mode = get_cache_mode()
+    if mode == "off":
+        return None
+
+    config = (
+        mode,
+        os.getenv("ASP_LLM_CACHE_PATH") or str(DEFAULT_CACHE_PATH),
+        os.getenv("ASP_LLM_CACHE_MAX_ENTRIES"),
+        os.getenv("ASP_LLM_CACHE_TTL_SECONDS"),
+    )
+    with _default_cache_lock:
+        if _default_cache is None or _default_cache_config != config:
+            try:
+                _default_cache = LLMResponseCache(
+                    db_path=config[1],
+                    max_entries=env_int(
+                        "ASP_LLM_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES
+                    ),
+                    ttl_seconds=env_int(
+                        "ASP_LLM_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS
+                    ),
+                    mode=mode,
+                )
+            except (sqlite3.Error, OSError, ValueError) as e:
+                logger.warning(f"LLM cache unavailable, continuing without it: {e}")
+                _default_cache = None
+            _default_cache_config = config
+        return _default_cache
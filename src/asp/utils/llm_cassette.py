@@ -0,0 +1,509 @@
+"""
+LLM Cassettes: Record and Replay LLM Calls
+
+A cassette is a JSON file of LLM request/response pairs. In "record" mode a
+CassetteLLMClient wraps a real client, forwards every call and appends the
+request, the response and the observed latency to the cassette. In "replay"
+mode it answers every call from the cassette without touching the network,
+so full pipeline runs (TSPOrchestrator.execute, RepairOrchestrator.repair,
+review fan-out) can be benchmarked and profiled offline and reproducibly.
+
+Requests are matched by the same key as the LLM response cache (model,
+system prompt, prompt, temperature, max_tokens and extra parameters).
+Identical requests recorded several times are replayed in recorded order;
+once exhausted, the last recording is repeated.
+
+Replay can simulate provider latency so that concurrency effects (parallel
+review specialists, hedging) remain visible:
+
+- "none": answer immediately (default)
+- "recorded": sleep for the latency observed while recording
+- "fixed:MS": sleep MS milliseconds per call
+- "lognormal:MEDIAN_MS,SIGMA": sample from a log-normal distribution
+
+Sampling is seeded, so a replay run sees the same latency sequence every
+time. Prompts that embed volatile text (timestamps, temporary paths, test
+durations) can be matched by passing scrub patterns, which are replaced in
+the prompt and other text parameters before the request key is computed.
+
+Environment Variables:
+    ASP_LLM_CASSETTE: Cassette file; when set, agents use a cassette client
+    ASP_LLM_CASSETTE_MODE: "replay" (default) or "record"
+    ASP_LLM_CASSETTE_LATENCY: Simulated replay latency (default: "none")
+    ASP_LLM_CASSETTE_SEED: Seed for sampled latency (default: 0)
+
+Example:
+    cassette = Cassette(Path("benchmarks/cassettes/pipeline.json"))
+    client = CassetteLLMClient(cassette, mode="record", inner=LLMClient())
+    ...
+    client = CassetteLLMClient(cassette, mode="replay", latency="recorded")
+    response = client.call_with_retry(prompt="Plan the task")
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import asyncio
+import copy
+import json
+import logging
+import math
+import os
+import random
+import re
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Literal
+
+from asp.utils.llm_cache import make_cache_key
+
+logger = logging.getLogger(__name__)
+
+CassetteMode = Literal["record", "replay"]
+
+# Bump when the file layout or request key derivation changes
+CASSETTE_VERSION = 1
+
+
+class CassetteError(Exception):
+    """Raised when a cassette cannot be read, written or used."""
+
+
+class CassetteMissError(CassetteError):
+    """Raised in replay mode when a request was never recorded."""
+
+
+def request_key(
+    prompt: str,
+    model: str | None,
+    max_tokens: int,
+    temperature: float,
+    kwargs: dict[str, Any],
+) -> str:
+    """
+    Key identifying an LLM request in a cassette.
+
+    Args:
+        prompt: User prompt
+        model: Requested model (None for the client default)
+        max_tokens: Maximum output tokens
+        temperature: Sampling temperature
+        kwargs: Remaining call parameters (system, cached_prefix, tools, ...)
+
+    Returns:
+        Hex digest shared by identical requests
+    """
+    extra = {k: v for k, v in kwargs.items() if k != "system"}
+    return make_cache_key(
+        provider="cassette",
+        model=model or "default",
+        system=kwargs.get("system"),
+        prompt=prompt,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        extra=extra,
+    )
+
+
+class Cassette:
+    """
+    Recorded LLM interactions backed by a JSON file.
+
+    Attributes:
+        path: Cassette file
+        interactions: Recorded interactions in recording order
+    """
+
+    def __init__(self, path: Path | str):
+        """
+        Load a cassette, or start an empty one if the file does not exist.
+
+        Args:
+            path: Cassette file
+
+        Raises:
+            CassetteError: If the file exists but is not a valid cassette
+        """
+        self.path = Path(path)
+        self.interactions: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._positions: dict[str, int] = {}
+        self._by_key: dict[str, list[dict[str, Any]]] = {}
+
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError) as e:
+                raise CassetteError(f"Cannot read cassette {self.path}: {e}") from e
+            if data.get("version") != CASSETTE_VERSION:
+                raise CassetteError(
+                    f"Cassette {self.path} has version {data.get('version')}, "
+                    f"expected {CASSETTE_VERSION}"
+                )
+            for interaction in data.get("interactions", []):
+                self._index(interaction)
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    def _index(self, interaction: dict[str, Any]) -> None:
+        self.interactions.append(interaction)
+        self._by_key.setdefault(interaction["key"], []).append(interaction)
+
+    def record(
+        self,
+        key: str,
+        request: dict[str, Any],
+        response: dict[str, Any],
+        latency_ms: float,
+    ) -> None:
+        """
+        Append an interaction and save the cassette.
+
+        The file is rewritten atomically after every interaction, so a run
+        that fails halfway still leaves a usable cassette.
+
+        Args:
+            key: Request key (see request_key)
+            request: Request summary stored for inspection
+            response: LLM response dict
+            latency_ms: Observed call latency
+        """
+        interaction = {
+            "key": key,
+            "request": request,
+            "response": response,
+            "latency_ms": round(latency_ms, 3),
+        }
+        with self._lock:
+            self._index(interaction)
+            self._save()
+
+    def next_response(self, key: str) -> tuple[dict[str, Any], float]:
+        """
+        Next recorded response for a request key.
+
+        Args:
+            key: Request key (see request_key)
+
+        Returns:
+            Tuple of (response copy, recorded latency in ms)
+
+        Raises:
+            CassetteMissError: If the request was never recorded
+        """
+        with self._lock:
+            recorded = self._by_key.get(key)
+            if not recorded:
+                raise CassetteMissError(
+                    f"No recorded response for request {key[:12]} in "
+                    f"{self.path} ({len(self.interactions)} interactions); "
+                    f"re-record the cassette"
+                )
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+            interaction = recorded[min(position, len(recorded) - 1)]
+        return copy.deepcopy(interaction["response"]), interaction["latency_ms"]
+
+    def rewind(self) -> None:
+        """Restart replay from the first recording of every request."""
+        with self._lock:
+            self._positions.clear()
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        payload = {"version": CASSETTE_VERSION, "interactions": self.interactions}
+        try:
+            tmp_path.write_text(
+                json.dumps(payload, indent=1, default=str), encoding="utf-8"
+            )
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            raise CassetteError(f"Cannot write cassette {self.path}: {e}") from e
+
+
+class LatencyModel:
+    """
+    Simulated replay latency.
+
+    Args:
+        spec: "none", "recorded", "fixed:MS" or "lognormal:MEDIAN_MS,SIGMA"
+        seed: Seed for sampled latencies
+    """
+
+    def __init__(self, spec: str = "none", seed: int = 0):
+        self.spec = spec
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        kind, _, args = spec.partition(":")
+        self.kind = kind.strip().lower()
+        try:
+            values = [float(v) for v in args.split(",")] if args else []
+        except ValueError as e:
+            raise ValueError(f"Invalid cassette latency spec: {spec!r}") from e
+
+        if self.kind in ("none", "recorded") and not values:
+            self._params: list[float] = []
+        elif (self.kind == "fixed" and len(values) == 1) or (
+            self.kind == "lognormal" and len(values) == 2 and values[0] > 0
+        ):
+            self._params = values
+        else:
+            raise ValueError(f"Invalid cassette latency spec: {spec!r}")
+
+    def delay_ms(self, recorded_ms: float) -> float:
+        """
+        Latency to simulate for one replayed call.
+
+        Args:
+            recorded_ms: Latency observed while recording
+
+        Returns:
+            Delay in milliseconds
+        """
+        if self.kind == "recorded":
+            return recorded_ms
+        if self.kind == "fixed":
+            return self._params[0]
+        if self.kind == "lognormal":
+            median_ms, sigma = self._params
+            with self._lock:
+                return self._rng.lognormvariate(math.log(median_ms), sigma)
+        return 0.0
+
+
+class CassetteLLMClient:
+    """
+    LLMClient-compatible client that records to or replays from a cassette.
+
+    Implements call_with_retry, call_with_retry_async and
+    call_streaming_async, so it can be injected wherever agents and
+    orchestrators accept an llm_client.
+    """
+
+    provider_name = "cassette"
+    DEFAULT_MODEL = "default"
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        mode: CassetteMode = "replay",
+        inner: Any | None = None,
+        latency: LatencyModel | str | None = None,
+        scrub: list[tuple[str, str]] | None = None,
+    ):
+        """
+        Initialize the cassette client.
+
+        Args:
+            cassette: Cassette to record to or replay from
+            mode: "record" or "replay"
+            inner: Client that serves calls in record mode
+            latency: Simulated replay latency (LatencyModel or spec string)
+            scrub: (regex, replacement) pairs applied to prompts before
+                matching, for text that differs between runs
+
+        Raises:
+            ValueError: If mode is unknown or record mode has no inner client
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode!r}")
+        if mode == "record" and inner is None:
+            raise ValueError("Cassette record mode requires an inner client")
+        if isinstance(latency, str) or latency is None:
+            latency = LatencyModel(latency or "none")
+
+        self.cassette = cassette
+        self.mode = mode
+        self.inner = inner
+        self.latency = latency
+        self.scrub = [(re.compile(pattern), repl) for pattern, repl in scrub or []]
+
+    def call_with_retry(
+        self,
+        prompt: str,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Record or replay a synchronous call (see LLMClient.call_with_retry)."""
+        key = self._key(prompt, model, max_tokens, temperature, kwargs)
+        if self.mode == "replay":
+            response, delay_ms = self._replay(key)
+            if delay_ms:
+                time.sleep(delay_ms / 1000)
+            return response
+
+        start = time.perf_counter()
+        response = self.inner.call_with_retry(
+            prompt=prompt,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs,
+        )
+        self._record(key, prompt, model, max_tokens, temperature, response, start)
+        return response
+
+    async def call_with_retry_async(
+        self,
+        prompt: str,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Record or replay an asynchronous call."""
+        key = self._key(prompt, model, max_tokens, temperature, kwargs)
+        if self.mode == "replay":
+            response, delay_ms = self._replay(key)
+            if delay_ms:
+                await asyncio.sleep(delay_ms / 1000)
+            return response
+
+        start = time.perf_counter()
+        response = await self.inner.call_with_retry_async(
+            prompt=prompt,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs,
+        )
+        self._record(key, prompt, model, max_tokens, temperature, response, start)
+        return response
+
+    async def call_streaming_async(
+        self,
+        prompt: str,
+        on_text: Callable[[str], None],
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """
+        Record or replay a streaming call.
+
+        Streaming and non-streaming calls share request keys. A replayed
+        response is delivered to on_text as a single chunk.
+        """
+        if self.mode == "replay" or not asyncio.iscoroutinefunction(
+            getattr(self.inner, "call_streaming_async", None)
+        ):
+            response = await self.call_with_retry_async(
+                prompt=prompt,
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                **kwargs,
+            )
+            on_text(response.get("raw_content") or "")
+            return response
+
+        key = self._key(prompt, model, max_tokens, temperature, kwargs)
+        start = time.perf_counter()
+        response = await self.inner.call_streaming_async(
+            prompt=prompt,
+            on_text=on_text,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs,
+        )
+        self._record(key, prompt, model, max_tokens, temperature, response, start)
+        return response
+
+    def _key(
+        self,
+        prompt: str,
+        model: str | None,
+        max_tokens: int,
+        temperature: float,
+        kwargs: dict[str, Any],
+    ) -> str:
+        if self.scrub:
+            prompt = self._scrub(prompt)
+            kwargs = {
+                k: self._scrub(v) if isinstance(v, str) else v
+                for k, v in kwargs.items()
+            }
+        return request_key(prompt, model, max_tokens, temperature, kwargs)
+
+    def _scrub(self, text: str) -> str:
+        for pattern, repl in self.scrub:
+            text = pattern.sub(repl, text)
+        return text
+
+    def _replay(self, key: str) -> tuple[dict[str, Any], float]:
+        response, recorded_ms = self.cassette.next_response(key)
+        return response, self.latency.delay_ms(recorded_ms)
+
+    def _record(
+        self,
+        key: str,
+        prompt: str,
+        model: str | None,
+        max_tokens: int,
+        temperature: float,
+        response: dict[str, Any],
+        start: float,
+    ) -> None:
+        latency_ms = (time.perf_counter() - start) * 1000
+        request = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "prompt_chars": len(prompt),
+            "prompt_head": prompt[:200],
+        }
+        self.cassette.record(key, request, copy.deepcopy(response), latency_ms)
+        logger.debug(f"Recorded LLM call {key[:12]} ({latency_ms:.0f}ms)")
+
+
+_clients: dict[tuple[str, str], CassetteLLMClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_cassette_client() -> CassetteLLMClient | None:
+    """
+    Get the process-wide cassette client configured by ASP_LLM_CASSETTE.
+
+    All agents share one client per cassette, so a recording captures every
+    call of a run in order.
+
+    Returns:
+        CassetteLLMClient, or None when ASP_LLM_CASSETTE is not set
+
+    Raises:
+        ValueError: If ASP_LLM_CASSETTE_MODE or ASP_LLM_CASSETTE_LATENCY is
+            invalid
+        CassetteError: If the cassette file cannot be loaded
+    """
+    path = os.getenv("ASP_LLM_CASSETTE")
+    if not path:
+        return None
+    mode = os.getenv("ASP_LLM_CASSETTE_MODE", "replay").lower()
+
+    with _clients_lock:
+        client = _clients.get((path, mode))
+        if client is None:
+            inner = None
+            if mode == "record":
+                # Import here to avoid circular dependencies
+                from asp.utils.llm_client import LLMClient
+
+                inner = LLMClient()
+            latency = LatencyModel(
+                os.getenv("ASP_LLM_CASSETTE_LATENCY", "none"),
+                seed=int(os.getenv("ASP_LLM_CASSETTE_SEED", "0")),
+            )
+            client = CassetteLLMClient(
+                Cassette(path), mode=mode, inner=inner, latency=latency
+            )
+            _clients[(path, mode)] = client
+            logger.info(f"Using LLM cassette {path} in {mode} mode")
+        return client
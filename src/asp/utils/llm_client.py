@@ -5,6 +5,7 @@ This module provides a wrapper around the Anthropic SDK with:
 - Exponential backoff retry logic
 - Rate limiting handling
 - Structured output parsing
+- Continuation of responses truncated at max_tokens
 - Token counting
 - Error handling and logging
 - Automatic telemetry instrumentation (Logfire/Langfuse)
@@ -16,6 +17,8 @@ Date: November 13, 2025 (updated December 2025)
 import json
 import logging
 import os
+from collections.abc import Callable
+from contextlib import nullcontext
 from typing import Any
 
 # Initialize LLM instrumentation BEFORE importing Anthropic
@@ -39,6 +42,15 @@ from tenacity import (  # noqa: E402
     wait_exponential,
 )
 
+from asp.utils.client_pool import (  # noqa: E402
+    get_anthropic_client,
+    get_async_anthropic_client,
+    rate_limiter_name,
+)
+from asp.utils.env import env_int  # noqa: E402
+from asp.utils.rate_limiter import get_rate_limiter  # noqa: E402
+from asp.utils.structured_output import tool_use_input  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,6 +74,33 @@ def should_retry_api_error(exception):
     return False
 
 
+_exponential_backoff = wait_exponential(multiplier=1, min=2, max=10)
+
+
+def wait_for_retry(retry_state) -> float:
+    """
+    Tenacity wait strategy for LLM API retries.
+
+    Rate-limit errors are retried without extra backoff when the adaptive
+    rate limiter is active: it has already paused new calls until the
+    provider's retry-after time, so sleeping here as well would only waste
+    quota. Everything else uses exponential backoff (2-10 seconds).
+    """
+    outcome = retry_state.outcome
+    exception = outcome.exception() if outcome is not None else None
+    if isinstance(exception, RateLimitError) and get_rate_limiter(
+        LLMClient.provider_name
+    ):
+        return 0.0
+    return _exponential_backoff(retry_state)
+
+
+def _usage_count(usage: Any, field: str) -> int:
+    """Read an optional integer usage field (absent on older SDK responses)."""
+    value = getattr(usage, field, 0)
+    return value if isinstance(value, int) else 0
+
+
 class LLMClient:
     """
     Wrapper around Anthropic SDK with retry logic and error handling.
@@ -82,6 +121,9 @@ class LLMClient:
         )
     """
 
+    # Provider name (used in LLM response cache keys)
+    provider_name = "anthropic"
+
     # Default model (pinned version for reproducibility)
     # Using Haiku 4.5 for cost-effective testing
     DEFAULT_MODEL = "claude-haiku-4-5"
@@ -91,12 +133,24 @@ class LLMClient:
     COST_PER_MILLION_INPUT_TOKENS = 0.25  # USD
     COST_PER_MILLION_OUTPUT_TOKENS = 1.25  # USD
 
-    def __init__(self, api_key: str | None = None):
+    # Prompt caching multipliers relative to the input token price
+    CACHE_WRITE_COST_MULTIPLIER = 1.25
+    CACHE_READ_COST_MULTIPLIER = 0.1
+
+    # Continuation calls allowed for a response truncated at max_tokens
+    DEFAULT_MAX_CONTINUATIONS = 3
+
+    def __init__(
+        self, api_key: str | None = None, max_continuations: int | None = None
+    ):
         """
         Initialize LLM client.
 
         Args:
             api_key: Optional Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
+            max_continuations: Maximum continuation calls for a response cut
+                off at max_tokens (defaults to ASP_LLM_MAX_CONTINUATIONS or
+                DEFAULT_MAX_CONTINUATIONS; 0 disables continuation)
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not self.api_key:
@@ -105,32 +159,35 @@ class LLMClient:
                 "Set ANTHROPIC_API_KEY environment variable or pass api_key parameter."
             )
 
-        # Sync client for backward compatibility
-        self.client = Anthropic(api_key=self.api_key)
+        # Sync client for backward compatibility (shared connection pool)
+        self.client: Anthropic = get_anthropic_client(self.api_key)
 
-        # Async client for concurrent operations
+        # Async client override; the pooled per-loop client is used when unset
         self._async_client: AsyncAnthropic | None = None
 
+        if max_continuations is None:
+            max_continuations = env_int(
+                "ASP_LLM_MAX_CONTINUATIONS", self.DEFAULT_MAX_CONTINUATIONS
+            )
+        self.max_continuations = max_continuations
+
         logger.info("LLMClient initialized with Anthropic SDK")
 
     @property
     def async_client(self) -> AsyncAnthropic:
         """
-        Lazy-load async client.
+        Async client for the current event loop.
+
+        Returns the process-wide pooled client for the running loop unless
+        an explicit client has been assigned to _async_client.
 
         Returns:
             AsyncAnthropic client instance
         """
-        if self._async_client is None:
-            self._async_client = AsyncAnthropic(api_key=self.api_key)
-        return self._async_client
+        if self._async_client is not None:
+            return self._async_client
+        return get_async_anthropic_client(self.api_key)
 
-    @retry(
-        retry=retry_if_exception(should_retry_api_error),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
     def call_with_retry(
         self,
         prompt: str,
@@ -138,6 +195,7 @@ class LLMClient:
         max_tokens: int = 4096,
         temperature: float = 0.0,
         system: str | None = None,
+        cached_prefix: str | None = None,
         **kwargs,
     ) -> dict[str, Any]:
         """
@@ -151,21 +209,34 @@ class LLMClient:
         Does NOT retry on:
         - APIStatusError 4xx (client errors - bad request)
 
+        Responses cut off at max_tokens are completed with continuation
+        calls (see max_continuations) and returned stitched together.
+
         Args:
             prompt: User prompt text
             model: Model name (defaults to DEFAULT_MODEL)
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature (0.0 = deterministic, 1.0 = creative)
             system: Optional system prompt
+            cached_prefix: Optional prompt prefix shared across calls (e.g., a
+                design spec or generated code). Sent as a separate content
+                block marked with a cache_control breakpoint so Anthropic
+                processes and bills it once while it stays in the prompt cache.
             **kwargs: Additional arguments for Anthropic API
 
         Returns:
             Dict with parsed response:
                 {
                     "content": str or dict (parsed JSON if applicable),
-                    "usage": {"input_tokens": int, "output_tokens": int},
+                    "usage": {
+                        "input_tokens": int,
+                        "output_tokens": int,
+                        "cache_creation_input_tokens": int,
+                        "cache_read_input_tokens": int,
+                    },
                     "model": str,
-                    "stop_reason": str
+                    "stop_reason": str,
+                    "continuations": int
                 }
 
         Raises:
@@ -175,67 +246,45 @@ class LLMClient:
             ValueError: Invalid parameters
         """
         model = model or self.DEFAULT_MODEL
+        logger.debug(
+            "Calling Anthropic API: model=%s, max_tokens=%d, temp=%s",
+            model,
+            max_tokens,
+            temperature,
+        )
 
-        try:
-            logger.debug(
-                "Calling Anthropic API: model=%s, max_tokens=%d, temp=%s",
-                model,
-                max_tokens,
-                temperature,
+        api_params = self._build_api_params(
+            prompt, model, max_tokens, temperature, system, cached_prefix, kwargs
+        )
+        estimate = self._estimate_input_tokens(prompt, system, cached_prefix)
+
+        responses = [self._create_message(api_params, estimate)]
+        while self._needs_continuation(responses):
+            partial = self._stitch_text(responses)
+            responses.append(
+                self._create_message(
+                    self._continuation_params(api_params, partial),
+                    estimate + self.count_tokens_approximate(partial),
+                )
             )
+        return self._process_response(responses[-1], previous=responses[:-1])
 
-            # Build messages
-            messages = [{"role": "user", "content": prompt}]
-
-            # Build API call parameters
-            api_params = {
-                "model": model,
-                "max_tokens": max_tokens,
-                "temperature": temperature,
-                "messages": messages,
-                **kwargs,
-            }
-
-            # Only include system parameter if it's provided
-            if system:
-                api_params["system"] = system
-
-            # Make API call
-            response = self.client.messages.create(**api_params)
-
-            # Extract content
-            content_text = response.content[0].text
-
-            # Try to parse as JSON if it looks like JSON
-            parsed_content = self._try_parse_json(content_text)
-
-            # Calculate cost
-            input_cost = (
-                response.usage.input_tokens / 1_000_000
-            ) * self.COST_PER_MILLION_INPUT_TOKENS
-            output_cost = (
-                response.usage.output_tokens / 1_000_000
-            ) * self.COST_PER_MILLION_OUTPUT_TOKENS
-            total_cost = input_cost + output_cost
-
-            logger.info(
-                "LLM call successful: input_tokens=%d, output_tokens=%d, cost=$%.4f",
-                response.usage.input_tokens,
-                response.usage.output_tokens,
-                total_cost,
-            )
+    @retry(
+        retry=retry_if_exception(should_retry_api_error),
+        stop=stop_after_attempt(3),
+        wait=wait_for_retry,
+        reraise=True,
+    )
+    def _create_message(self, api_params: dict[str, Any], estimate: int) -> Any:
+        """Make one messages.create() call with retries and rate limiting."""
+        try:
+            # Make API call within the shared rate limit budget
+            limiter = self._rate_limiter()
+            with limiter.slot(estimate) if limiter else nullcontext():
+                response = self.client.messages.create(**api_params)
 
-            return {
-                "content": parsed_content,
-                "raw_content": content_text,
-                "usage": {
-                    "input_tokens": response.usage.input_tokens,
-                    "output_tokens": response.usage.output_tokens,
-                },
-                "cost": total_cost,
-                "model": response.model,
-                "stop_reason": response.stop_reason,
-            }
+            self._charge_output_tokens(limiter, response)
+            return response
 
         except RateLimitError as e:
             logger.warning("Rate limit hit: %s. Will retry...", e)
@@ -273,6 +322,7 @@ class LLMClient:
         max_tokens: int = 4096,
         temperature: float = 0.0,
         system: str | None = None,
+        cached_prefix: str | None = None,
         **kwargs,
     ) -> dict[str, Any]:
         """
@@ -289,21 +339,34 @@ class LLMClient:
         Does NOT retry on:
         - APIStatusError 4xx (client errors - bad request)
 
+        Responses cut off at max_tokens are completed with continuation
+        calls (see max_continuations) and returned stitched together.
+
         Args:
             prompt: User prompt text
             model: Model name (defaults to DEFAULT_MODEL)
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature (0.0 = deterministic, 1.0 = creative)
             system: Optional system prompt
+            cached_prefix: Optional prompt prefix shared across calls (e.g., a
+                design spec or generated code). Sent as a separate content
+                block marked with a cache_control breakpoint so Anthropic
+                processes and bills it once while it stays in the prompt cache.
             **kwargs: Additional arguments for Anthropic API
 
         Returns:
             Dict with parsed response:
                 {
                     "content": str or dict (parsed JSON if applicable),
-                    "usage": {"input_tokens": int, "output_tokens": int},
+                    "usage": {
+                        "input_tokens": int,
+                        "output_tokens": int,
+                        "cache_creation_input_tokens": int,
+                        "cache_read_input_tokens": int,
+                    },
                     "model": str,
-                    "stop_reason": str
+                    "stop_reason": str,
+                    "continuations": int
                 }
 
         Raises:
@@ -313,74 +376,50 @@ class LLMClient:
             ValueError: Invalid parameters
         """
         model = model or self.DEFAULT_MODEL
+        logger.debug(
+            "Async calling Anthropic API: model=%s, max_tokens=%d, temp=%s",
+            model,
+            max_tokens,
+            temperature,
+        )
+
+        api_params = self._build_api_params(
+            prompt, model, max_tokens, temperature, system, cached_prefix, kwargs
+        )
+        estimate = self._estimate_input_tokens(prompt, system, cached_prefix)
+
+        responses = [await self._create_message_async(api_params, estimate)]
+        while self._needs_continuation(responses):
+            partial = self._stitch_text(responses)
+            responses.append(
+                await self._create_message_async(
+                    self._continuation_params(api_params, partial),
+                    estimate + self.count_tokens_approximate(partial),
+                )
+            )
+        return self._process_response(responses[-1], previous=responses[:-1])
 
+    async def _create_message_async(
+        self, api_params: dict[str, Any], estimate: int
+    ) -> Any:
+        """Make one async messages.create() call with retries and rate limiting."""
         async for attempt in AsyncRetrying(
             retry=retry_if_exception(should_retry_api_error),
             stop=stop_after_attempt(3),
-            wait=wait_exponential(multiplier=1, min=2, max=10),
+            wait=wait_for_retry,
             reraise=True,
         ):
             with attempt:
                 try:
-                    logger.debug(
-                        "Async calling Anthropic API: model=%s, max_tokens=%d, temp=%s",
-                        model,
-                        max_tokens,
-                        temperature,
-                    )
-
-                    # Build messages
-                    messages = [{"role": "user", "content": prompt}]
-
-                    # Build API call parameters
-                    api_params = {
-                        "model": model,
-                        "max_tokens": max_tokens,
-                        "temperature": temperature,
-                        "messages": messages,
-                        **kwargs,
-                    }
-
-                    # Only include system parameter if it's provided
-                    if system:
-                        api_params["system"] = system
-
-                    # Make async API call
-                    response = await self.async_client.messages.create(**api_params)
-
-                    # Extract content
-                    content_text = response.content[0].text
-
-                    # Try to parse as JSON if it looks like JSON
-                    parsed_content = self._try_parse_json(content_text)
-
-                    # Calculate cost
-                    input_cost = (
-                        response.usage.input_tokens / 1_000_000
-                    ) * self.COST_PER_MILLION_INPUT_TOKENS
-                    output_cost = (
-                        response.usage.output_tokens / 1_000_000
-                    ) * self.COST_PER_MILLION_OUTPUT_TOKENS
-                    total_cost = input_cost + output_cost
-
-                    logger.info(
-                        "Async LLM call successful: input_tokens=%d, output_tokens=%d, cost=$%.4f",
-                        response.usage.input_tokens,
-                        response.usage.output_tokens,
-                        total_cost,
-                    )
+                    # Make async API call within the shared rate limit budget
+                    limiter = self._rate_limiter()
+                    async with (
+                        limiter.slot_async(estimate) if limiter else nullcontext()
+                    ):
+                        response = await self.async_client.messages.create(**api_params)
 
-                    return {
-                        "content": parsed_content,
-                        "raw_content": content_text,
-                        "usage": {
-                            "input_tokens": response.usage.input_tokens,
-                            "output_tokens": response.usage.output_tokens,
-                        },
-                        "cost": total_cost,
-                        "model": response.model,
-                        "stop_reason": response.stop_reason,
-                    }
+                    self._charge_output_tokens(limiter, response)
+                    return response
 
                 except RateLimitError as e:
                     logger.warning("Rate limit hit: %s. Will retry...", e)
@@ -414,6 +453,322 @@ class LLMClient:
         # Should never reach here due to reraise=True, but for type safety
         raise RuntimeError("Async retry loop completed without return or exception")
 
+    async def call_streaming_async(
+        self,
+        prompt: str,
+        on_text: Callable[[str], None],
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        system: str | None = None,
+        cached_prefix: str | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """
+        Stream a response from Anthropic, forwarding text deltas as they arrive.
+
+        Lets callers parse partial output (e.g., a file manifest) and start
+        downstream work before generation finishes. Retries follow
+        call_with_retry_async, but only while no text has been forwarded;
+        once on_text has been called a retry would replay text, so the
+        error is raised instead. Truncated responses are continued as in
+        call_with_retry_async, with the continuation text streamed to
+        on_text as well.
+
+        Args:
+            prompt: User prompt text
+            on_text: Callback invoked with each text delta
+            model: Model name (defaults to DEFAULT_MODEL)
+            max_tokens: Maximum tokens in response
+            temperature: Sampling temperature
+            system: Optional system prompt
+            cached_prefix: Optional prompt prefix to mark for prompt caching
+            **kwargs: Additional arguments for Anthropic API
+
+        Returns:
+            Dict with parsed response, same format as call_with_retry_async
+
+        Raises:
+            APIConnectionError, RateLimitError, APIStatusError: As for
+                call_with_retry_async
+        """
+        model = model or self.DEFAULT_MODEL
+        logger.debug(
+            "Streaming Anthropic API: model=%s, max_tokens=%d, temp=%s",
+            model,
+            max_tokens,
+            temperature,
+        )
+        api_params = self._build_api_params(
+            prompt, model, max_tokens, temperature, system, cached_prefix, kwargs
+        )
+        estimate = self._estimate_input_tokens(prompt, system, cached_prefix)
+
+        # Trailing whitespace dropped from a continuation prefill has already
+        # been streamed; swallow it when the continuation regenerates it.
+        state = {"emitted": False, "skip": ""}
+
+        def forward(text: str) -> None:
+            state["emitted"] = True
+            skip = state["skip"]
+            while skip and text and text[0] == skip[0]:
+                skip, text = skip[1:], text[1:]
+            state["skip"] = skip
+            if text:
+                on_text(text)
+
+        responses = [
+            await self._stream_message_async(api_params, estimate, forward, state)
+        ]
+        while self._needs_continuation(responses):
+            partial = self._stitch_text(responses)
+            state["skip"] = partial[len(partial.rstrip()) :]
+            responses.append(
+                await self._stream_message_async(
+                    self._continuation_params(api_params, partial),
+                    estimate + self.count_tokens_approximate(partial),
+                    forward,
+                    state,
+                )
+            )
+        return self._process_response(responses[-1], previous=responses[:-1])
+
+    async def _stream_message_async(
+        self,
+        api_params: dict[str, Any],
+        estimate: int,
+        on_text: Callable[[str], None],
+        state: dict[str, Any],
+    ) -> Any:
+        """Stream one message, retrying only while nothing has been emitted."""
+
+        def _should_retry(exception: BaseException) -> bool:
+            return not state["emitted"] and should_retry_api_error(exception)
+
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception(_should_retry),
+            stop=stop_after_attempt(3),
+            wait=wait_for_retry,
+            reraise=True,
+        ):
+            with attempt:
+                limiter = self._rate_limiter()
+                async with (
+                    limiter.slot_async(estimate) if limiter else nullcontext(),
+                    self.async_client.messages.stream(**api_params) as stream,
+                ):
+                    async for text in stream.text_stream:
+                        on_text(text)
+                    final_message = await stream.get_final_message()
+
+                self._charge_output_tokens(limiter, final_message)
+                return final_message
+
+        # Should never reach here due to reraise=True, but for type safety
+        raise RuntimeError("Streaming retry loop completed without return or exception")
+
+    def _needs_continuation(self, responses: list[Any]) -> bool:
+        """
+        Check whether the last response was truncated and may be continued.
+
+        Only plain-text responses stopped by max_tokens are continued, and
+        at most max_continuations times per call.
+        """
+        last = responses[-1]
+        if last.stop_reason != "max_tokens":
+            return False
+        if len(responses) > self.max_continuations:
+            logger.warning(
+                "Response still truncated after %d continuations; "
+                "consider raising max_tokens",
+                self.max_continuations,
+            )
+            return False
+        if not last.content or not isinstance(
+            getattr(last.content[-1], "text", None), str
+        ):
+            return False
+        logger.info(
+            "Response truncated at max_tokens; requesting continuation %d/%d",
+            len(responses),
+            self.max_continuations,
+        )
+        return True
+
+    @staticmethod
+    def _stitch_text(responses: list[Any]) -> str:
+        """
+        Join the text of a response and its continuations.
+
+        Each continuation resumes from the previous text with trailing
+        whitespace removed (the API rejects prefills ending in whitespace).
+        """
+        text = ""
+        for index, response in enumerate(responses):
+            chunk = response.content[0].text if response.content else ""
+            text = (text.rstrip() if index else text) + chunk
+        return text
+
+    @staticmethod
+    def _continuation_params(
+        api_params: dict[str, Any], partial_text: str
+    ) -> dict[str, Any]:
+        """
+        Parameters for a continuation call.
+
+        Appends the partial output as an assistant prefill, so the model
+        resumes exactly where the truncated response stopped.
+        """
+        messages = [
+            *api_params["messages"],
+            {"role": "assistant", "content": partial_text.rstrip()},
+        ]
+        return {**api_params, "messages": messages}
+
+    def _rate_limiter(self):
+        """Shared adaptive rate limiter for Anthropic (None when disabled)."""
+        return get_rate_limiter(rate_limiter_name(self.provider_name, None))
+
+    def _estimate_input_tokens(
+        self, prompt: str, system: str | None, cached_prefix: str | None
+    ) -> int:
+        """Approximate input tokens reserved against the tokens-per-minute budget."""
+        text = "".join(part for part in (system, cached_prefix, prompt) if part)
+        return self.count_tokens_approximate(text)
+
+    @staticmethod
+    def _charge_output_tokens(limiter: Any, response: Any) -> None:
+        """Charge the response's output tokens to the rate limit budget."""
+        if limiter is not None:
+            limiter.charge_tokens(
+                _usage_count(getattr(response, "usage", None), "output_tokens")
+            )
+
+    def _build_api_params(
+        self,
+        prompt: str,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        system: str | None,
+        cached_prefix: str | None,
+        kwargs: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Build Anthropic messages.create() parameters.
+
+        When cached_prefix is given, the user message is split into two text
+        blocks: the shared prefix (marked with an ephemeral cache_control
+        breakpoint) followed by the per-call prompt.
+
+        Returns:
+            Dict of API parameters
+        """
+        if cached_prefix:
+            content: str | list[dict[str, Any]] = [
+                {
+                    "type": "text",
+                    "text": cached_prefix,
+                    "cache_control": {"type": "ephemeral"},
+                },
+                {"type": "text", "text": prompt},
+            ]
+        else:
+            content = prompt
+
+        api_params = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": content}],
+            **kwargs,
+        }
+
+        # Only include system parameter if it's provided
+        if system:
+            api_params["system"] = system
+
+        return api_params
+
+    def _process_response(
+        self, response: Any, previous: list[Any] | None = None
+    ) -> dict[str, Any]:
+        """
+        Convert an Anthropic API response into the client's response dict.
+
+        Cache write tokens are billed at CACHE_WRITE_COST_MULTIPLIER and cache
+        read tokens at CACHE_READ_COST_MULTIPLIER times the input token price.
+
+        Args:
+            response: Raw Anthropic API response
+            previous: Truncated responses that `response` continues; their
+                text is prepended and their usage added
+
+        Returns:
+            Dict with content, raw_content, usage, cost, model, stop_reason
+            and continuations
+        """
+        responses = [*(previous or []), response]
+
+        # Extract content; a forced tool call (structured output) returns
+        # the tool input as the parsed content and its JSON as raw content
+        tool_input = tool_use_input(response.content)
+        if tool_input is not None:
+            content_text = json.dumps(tool_input)
+            parsed_content = tool_input
+        else:
+            if previous:
+                content_text = self._stitch_text(responses)
+            else:
+                content_text = response.content[0].text
+
+            # Try to parse as JSON if it looks like JSON
+            parsed_content = self._try_parse_json(content_text)
+
+        input_tokens = sum(r.usage.input_tokens for r in responses)
+        output_tokens = sum(r.usage.output_tokens for r in responses)
+        cache_write_tokens = sum(
+            _usage_count(r.usage, "cache_creation_input_tokens") for r in responses
+        )
+        cache_read_tokens = sum(
+            _usage_count(r.usage, "cache_read_input_tokens") for r in responses
+        )
+
+        # Calculate cost
+        input_price = self.COST_PER_MILLION_INPUT_TOKENS / 1_000_000
+        input_cost = input_tokens * input_price
+        cache_cost = (
+            cache_write_tokens * self.CACHE_WRITE_COST_MULTIPLIER
+            + cache_read_tokens * self.CACHE_READ_COST_MULTIPLIER
+        ) * input_price
+        output_cost = (output_tokens / 1_000_000) * self.COST_PER_MILLION_OUTPUT_TOKENS
+        total_cost = input_cost + cache_cost + output_cost
+
+        logger.info(
+            "LLM call successful: input_tokens=%d, output_tokens=%d, "
+            "cache_read=%d, cache_write=%d, cost=$%.4f",
+            input_tokens,
+            output_tokens,
+            cache_read_tokens,
+            cache_write_tokens,
+            total_cost,
+        )
+
+        return {
+            "content": parsed_content,
+            "raw_content": content_text,
+            "usage": {
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cache_creation_input_tokens": cache_write_tokens,
+                "cache_read_input_tokens": cache_read_tokens,
+            },
+            "cost": total_cost,
+            "model": response.model,
+            "stop_reason": response.stop_reason,
+            "continuations": len(responses) - 1,
+        }
+
     def _try_parse_json(self, text: str) -> Any:
         """
         Attempt to parse text as JSON.
@@ -0,0 +1,590 @@
+"""
+Adaptive, Header-Driven Rate Limiting for LLM Calls
+
+This module provides a process-wide rate limiter shared by every agent that
+talks to the same LLM provider:
+
+    - TokenBucket: timer-based token bucket. Reservations are computed
+      arithmetically (callers sleep for the returned delay), so no
+      background task is needed per token.
+    - AdaptiveRateLimiter: budgets requests per minute and tokens per
+      minute with two TokenBuckets, and adjusts allowed concurrency AIMD
+      style: +1 slot per "window" of successful responses, halved on
+      429/529 responses.
+    - parse_rate_limit_headers(): reads Anthropic
+      (anthropic-ratelimit-*) and OpenAI-compatible (x-ratelimit-*) rate
+      limit headers, which resize the buckets to the provider's actual
+      limits and drain them to the provider's remaining quota.
+
+Response headers reach the limiter through httpx response hooks installed
+on the pooled SDK clients (see asp.utils.client_pool), so all traffic in the
+process is observed, including the SDK's own internal retries.
+
+The limiter is thread-safe and usable from both sync code (acquire_sync)
+and any event loop (acquire_async); waiters are woken with
+loop.call_soon_threadsafe, so it is not bound to a single loop.
+
+Environment Variables:
+    ASP_RATE_LIMIT: "adaptive" (default) or "off"
+    ASP_RATE_LIMIT_RPM: Initial requests per minute, 0 = unlimited until
+        learned from headers (default: 0)
+    ASP_RATE_LIMIT_TPM: Initial tokens per minute, 0 = unlimited until
+        learned from headers (default: 0)
+    ASP_RATE_LIMIT_CONCURRENCY: Initial concurrent calls (default: 5)
+    ASP_RATE_LIMIT_MAX_CONCURRENCY: Upper bound for AIMD growth
+        (default: 32)
+
+Example:
+    limiter = get_rate_limiter("anthropic")
+    async with limiter.slot_async(estimated_tokens=2000):
+        response = await client.messages.create(...)
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import asyncio
+import logging
+import os
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import asynccontextmanager, contextmanager, suppress
+from datetime import datetime
+from typing import Any
+
+from asp.utils.env import env_float, env_int
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INITIAL_CONCURRENCY = 5
+DEFAULT_MAX_CONCURRENCY = 32
+
+# Pause applied to a 429/529 response that carries no retry-after header
+DEFAULT_RATE_LIMIT_PAUSE_SECONDS = 1.0
+
+# Status codes treated as congestion signals (rate limited / overloaded)
+CONGESTION_STATUS_CODES = (429, 529)
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+class TokenBucket:
+    """
+    Timer-based token bucket.
+
+    reserve() takes tokens immediately (the balance may go negative) and
+    returns how long the caller must wait before its reservation is
+    covered by refill. Concurrent callers therefore queue in reservation
+    order without any background refill task.
+
+    Not thread-safe on its own; AdaptiveRateLimiter guards it with a lock.
+
+    Attributes:
+        per_minute: Refill rate in tokens per minute (0 = unlimited)
+        capacity: Maximum balance (burst size)
+    """
+
+    def __init__(self, per_minute: float = 0, burst: float | None = None):
+        """
+        Initialize bucket, starting full.
+
+        Args:
+            per_minute: Tokens per minute (0 = unlimited)
+            burst: Maximum balance (defaults to per_minute)
+        """
+        self.per_minute = float(per_minute)
+        self.capacity = float(burst if burst is not None else per_minute)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+    @property
+    def unlimited(self) -> bool:
+        """True when the bucket imposes no rate."""
+        return self.per_minute <= 0
+
+    @property
+    def available(self) -> float:
+        """Current balance after refill (negative while reservations queue)."""
+        self._refill(time.monotonic())
+        return self._tokens
+
+    def _refill(self, now: float) -> None:
+        if not self.unlimited:
+            elapsed = max(0.0, now - self._updated)
+            self._tokens = min(
+                self.capacity, self._tokens + elapsed * self.per_minute / 60.0
+            )
+        self._updated = now
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """
+        Reserve tokens and return the delay before they are available.
+
+        Args:
+            amount: Tokens to take
+
+        Returns:
+            Seconds to wait (0.0 if available now)
+        """
+        now = time.monotonic()
+        blocked = max(0.0, self._blocked_until - now)
+        if self.unlimited or amount <= 0:
+            return blocked
+
+        self._refill(now)
+        self._tokens -= amount
+        deficit = -self._tokens
+        delay = deficit * 60.0 / self.per_minute if deficit > 0 else 0.0
+        return max(delay, blocked)
+
+    def refund(self, amount: float = 1.0) -> None:
+        """Return tokens from a reservation that was never used."""
+        if self.unlimited or amount <= 0:
+            return
+        self._refill(time.monotonic())
+        self._tokens = min(self.capacity, self._tokens + amount)
+
+    def configure(self, per_minute: float) -> None:
+        """
+        Resize the bucket to a new per-minute limit.
+
+        The current balance is scaled to keep the same fill fraction.
+
+        Args:
+            per_minute: New tokens per minute (must be > 0)
+        """
+        if per_minute <= 0 or per_minute == self.per_minute:
+            return
+        now = time.monotonic()
+        self._refill(now)
+        fraction = self._tokens / self.capacity if self.capacity > 0 else 1.0
+        self.per_minute = float(per_minute)
+        self.capacity = float(per_minute)
+        self._tokens = fraction * self.capacity
+
+    def observe(self, remaining: float | None, reset_in: float | None) -> None:
+        """
+        Reconcile the balance with provider-reported quota.
+
+        Args:
+            remaining: Provider-reported remaining quota
+            reset_in: Seconds until the provider's quota resets
+        """
+        if remaining is None:
+            return
+        self._refill(time.monotonic())
+        if remaining < self._tokens:
+            self._tokens = float(remaining)
+        if remaining <= 0 and reset_in:
+            self.block(reset_in)
+
+    def block(self, seconds: float) -> None:
+        """Refuse reservations for the next `seconds` seconds."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+def _parse_duration(value: str) -> float | None:
+    """Parse OpenAI-style durations ("20ms", "1s", "6m0s") to seconds."""
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    scale = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+    return sum(float(number) * scale[unit] for number, unit in parts)
+
+
+def _parse_reset(value: str | None) -> float | None:
+    """Parse a reset header (RFC 3339 timestamp, duration or seconds)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        reset_at = datetime.fromisoformat(value)
+        return max(0.0, reset_at.timestamp() - time.time())
+    except ValueError:
+        return _parse_duration(value)
+
+
+def _parse_number(value: str | None) -> float | None:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def parse_rate_limit_headers(headers: Mapping[str, str]) -> dict[str, Any]:
+    """
+    Extract rate-limit state from Anthropic or OpenAI-compatible headers.
+
+    Args:
+        headers: Response headers (case-insensitive mapping, e.g. httpx)
+
+    Returns:
+        Dict with "requests" and "tokens" entries (each a dict of limit,
+        remaining and reset_in seconds, or None when absent) and
+        "retry_after" seconds (or None)
+    """
+    lowered = {k.lower(): v for k, v in headers.items()}
+
+    def read(limit_key: str, remaining_key: str, reset_key: str) -> dict | None:
+        if limit_key not in lowered and remaining_key not in lowered:
+            return None
+        return {
+            "limit": _parse_number(lowered.get(limit_key)),
+            "remaining": _parse_number(lowered.get(remaining_key)),
+            "reset_in": _parse_reset(lowered.get(reset_key)),
+        }
+
+    requests = read(
+        "anthropic-ratelimit-requests-limit",
+        "anthropic-ratelimit-requests-remaining",
+        "anthropic-ratelimit-requests-reset",
+    ) or read(
+        "x-ratelimit-limit-requests",
+        "x-ratelimit-remaining-requests",
+        "x-ratelimit-reset-requests",
+    )
+    tokens = (
+        read(
+            "anthropic-ratelimit-tokens-limit",
+            "anthropic-ratelimit-tokens-remaining",
+            "anthropic-ratelimit-tokens-reset",
+        )
+        or read(
+            "anthropic-ratelimit-input-tokens-limit",
+            "anthropic-ratelimit-input-tokens-remaining",
+            "anthropic-ratelimit-input-tokens-reset",
+        )
+        or read(
+            "x-ratelimit-limit-tokens",
+            "x-ratelimit-remaining-tokens",
+            "x-ratelimit-reset-tokens",
+        )
+    )
+
+    return {
+        "requests": requests,
+        "tokens": tokens,
+        "retry_after": _parse_reset(lowered.get("retry-after")),
+    }
+
+
+class AdaptiveRateLimiter:
+    """
+    Shared request/token budget with AIMD concurrency control.
+
+    Attributes:
+        name: Limiter name (provider or endpoint)
+        requests: Requests-per-minute bucket
+        tokens: Tokens-per-minute bucket
+        min_concurrency: Floor for multiplicative decrease
+        max_concurrency: Ceiling for additive increase
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: float = 0,
+        tokens_per_minute: float = 0,
+        initial_concurrency: int = DEFAULT_INITIAL_CONCURRENCY,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        min_concurrency: int = 1,
+    ):
+        """
+        Initialize limiter.
+
+        Args:
+            name: Limiter name (provider or endpoint)
+            requests_per_minute: Initial RPM budget (0 = unlimited)
+            tokens_per_minute: Initial TPM budget (0 = unlimited)
+            initial_concurrency: Starting number of concurrent calls
+            max_concurrency: Upper bound for concurrency growth
+            min_concurrency: Lower bound for concurrency decrease
+        """
+        if min_concurrency < 1 or max_concurrency < min_concurrency:
+            raise ValueError(
+                f"Invalid concurrency bounds: min={min_concurrency}, max={max_concurrency}"
+            )
+        self.name = name
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self._limit = float(
+            min(max(initial_concurrency, min_concurrency), max_concurrency)
+        )
+        self._in_flight = 0
+        self._waiters: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+        self.stats = {
+            "acquired": 0,
+            "rate_limited": 0,
+            "waited_seconds": 0.0,
+        }
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Current number of calls allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Calls currently holding a slot."""
+        return self._in_flight
+
+    def _try_enter(self, estimated_tokens: float, force: bool = False) -> float | None:
+        """Take a slot and reserve budget; None if no slot is free. Needs lock."""
+        if self._in_flight >= int(self._limit) and not force:
+            return None
+        self._in_flight += 1
+        self.stats["acquired"] += 1
+        return max(self.requests.reserve(1), self.tokens.reserve(estimated_tokens))
+
+    def _record_wait(self, start: float) -> None:
+        waited = time.monotonic() - start
+        if waited > 0.001:
+            with self._lock:
+                self.stats["waited_seconds"] += waited
+
+    def _wake_waiters(self) -> list[Callable[[], None]]:
+        """Detach all waiters so they can re-check for a slot. Needs lock."""
+        waiters, self._waiters = self._waiters, []
+        return waiters
+
+    def _withdraw(self, wake: Callable[[], None]) -> None:
+        """Drop the wake-up callback of a waiter whose caller gave up."""
+        with self._lock:
+            if wake in self._waiters:
+                self._waiters.remove(wake)
+
+    def _cancel_entry(self, estimated_tokens: float) -> None:
+        """Undo _try_enter for a caller cancelled while waiting for budget."""
+        with self._lock:
+            self.requests.refund(1)
+            self.tokens.refund(estimated_tokens)
+            self.stats["acquired"] -= 1
+        self.release()
+
+    async def acquire_async(self, estimated_tokens: float = 0) -> None:
+        """
+        Wait for a concurrency slot and request/token budget.
+
+        Args:
+            estimated_tokens: Tokens to reserve against the TPM budget
+        """
+        start = time.monotonic()
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                delay = self._try_enter(estimated_tokens)
+                if delay is None:
+                    future = loop.create_future()
+                    wake = _waker(loop, future)
+                    self._waiters.append(wake)
+            if delay is not None:
+                break
+            try:
+                await future
+            except BaseException:
+                self._withdraw(wake)
+                raise
+
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except BaseException:
+                self._cancel_entry(estimated_tokens)
+                raise
+        self._record_wait(start)
+
+    def acquire_sync(self, estimated_tokens: float = 0) -> None:
+        """
+        Blocking version of acquire_async for synchronous callers.
+
+        When called from a thread that is running an event loop, the
+        concurrency slot is taken without waiting, since blocking the loop
+        could deadlock against async holders on the same loop. For the same
+        reason the request/token budget delay is not slept there.
+
+        Args:
+            estimated_tokens: Tokens to reserve against the TPM budget
+        """
+        start = time.monotonic()
+        try:
+            asyncio.get_running_loop()
+            on_loop_thread = True
+        except RuntimeError:
+            on_loop_thread = False
+
+        while True:
+            event = threading.Event()
+            with self._lock:
+                delay = self._try_enter(estimated_tokens, force=on_loop_thread)
+                if delay is None:
+                    self._waiters.append(event.set)
+            if delay is not None:
+                break
+            event.wait()
+
+        if delay > 0 and on_loop_thread:
+            logger.warning(
+                f"Sync call on an event loop thread exceeds the {self.name} "
+                f"rate budget by {delay:.1f}s; not waiting"
+            )
+        elif delay > 0:
+            time.sleep(delay)
+        self._record_wait(start)
+
+    def release(self) -> None:
+        """Free a concurrency slot taken by acquire_async/acquire_sync."""
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            waiters = self._wake_waiters()
+        for wake in waiters:
+            wake()
+
+    @asynccontextmanager
+    async def slot_async(self, estimated_tokens: float = 0):
+        """Async context manager around acquire_async/release."""
+        await self.acquire_async(estimated_tokens)
+        try:
+            yield self
+        finally:
+            self.release()
+
+    @contextmanager
+    def slot(self, estimated_tokens: float = 0) -> Iterator["AdaptiveRateLimiter"]:
+        """Context manager around acquire_sync/release."""
+        self.acquire_sync(estimated_tokens)
+        try:
+            yield self
+        finally:
+            self.release()
+
+    def charge_tokens(self, amount: float) -> None:
+        """
+        Charge tokens used beyond the up-front estimate (e.g., output tokens).
+
+        The balance may go negative, which delays subsequent callers.
+
+        Args:
+            amount: Additional tokens consumed
+        """
+        if amount > 0:
+            with self._lock:
+                self.tokens.reserve(amount)
+
+    def on_response(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """
+        Feed a provider response into the limiter.
+
+        Resizes and reconciles the request/token buckets from rate-limit
+        headers, then applies AIMD: successful responses grow concurrency
+        by about one slot per window of calls, congestion responses
+        (429/529) halve it and pause new calls until retry-after.
+
+        Args:
+            status_code: HTTP status code
+            headers: Response headers
+        """
+        state = parse_rate_limit_headers(headers)
+        with self._lock:
+            for bucket, info in (
+                (self.requests, state["requests"]),
+                (self.tokens, state["tokens"]),
+            ):
+                if info is None:
+                    continue
+                if info["limit"]:
+                    bucket.configure(info["limit"])
+                bucket.observe(info["remaining"], info["reset_in"])
+
+            previous = int(self._limit)
+            if status_code in CONGESTION_STATUS_CODES:
+                self.stats["rate_limited"] += 1
+                self._limit = max(float(self.min_concurrency), self._limit / 2)
+                pause = state["retry_after"] or DEFAULT_RATE_LIMIT_PAUSE_SECONDS
+                self.requests.block(pause)
+                logger.warning(
+                    f"Rate limited by {self.name} (HTTP {status_code}): "
+                    f"concurrency -> {int(self._limit)}, pausing {pause:.1f}s"
+                )
+            elif 200 <= status_code < 300:
+                self._limit = min(
+                    float(self.max_concurrency), self._limit + 1.0 / self._limit
+                )
+
+            waiters = self._wake_waiters() if int(self._limit) > previous else []
+        for wake in waiters:
+            wake()
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def _waker(
+    loop: asyncio.AbstractEventLoop, future: asyncio.Future
+) -> Callable[[], None]:
+    """Wake-up callback for an async waiter; a no-op once its loop is closed."""
+
+    def wake() -> None:
+        if loop.is_closed():
+            return
+        # The loop may still close between the check and the call
+        with suppress(RuntimeError):
+            loop.call_soon_threadsafe(_resolve, future)
+
+    return wake
+
+
+_limiters: dict[str, AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def is_rate_limiting_enabled() -> bool:
+    """Check ASP_RATE_LIMIT (enabled unless set to "off")."""
+    return os.getenv("ASP_RATE_LIMIT", "adaptive").lower() not in ("off", "false", "0")
+
+
+def get_rate_limiter(name: str) -> AdaptiveRateLimiter | None:
+    """
+    Get the process-wide limiter for a provider or endpoint.
+
+    Args:
+        name: Provider name or endpoint URL (see client_pool)
+
+    Returns:
+        Shared AdaptiveRateLimiter, or None when rate limiting is off
+    """
+    if not is_rate_limiting_enabled():
+        return None
+
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(
+                name,
+                requests_per_minute=env_float("ASP_RATE_LIMIT_RPM", 0.0),
+                tokens_per_minute=env_float("ASP_RATE_LIMIT_TPM", 0.0),
+                initial_concurrency=env_int(
+                    "ASP_RATE_LIMIT_CONCURRENCY", DEFAULT_INITIAL_CONCURRENCY
+                ),
+                max_concurrency=env_int(
+                    "ASP_RATE_LIMIT_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY
+                ),
+            )
+            _limiters[name] = limiter
+        return limiter
+
+
+def reset_rate_limiters() -> None:
+    """Forget all process-wide limiters (used by tests and reconfiguration)."""
+    with _limiters_lock:
+        _limiters.clear()
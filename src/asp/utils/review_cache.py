@@ -0,0 +1,242 @@
+"""
+Per-File Review Results Cache for Code Review Specialists
+
+In correction loops most files are byte-identical to the previous
+iteration, yet every code review specialist is sent the entire
+GeneratedCode again. This cache stores each specialist's findings per file,
+keyed by:
+
+- specialist name and agent version (the prompt version)
+- SHA-256 of the file (path, content, type, semantic unit, description)
+- SHA-256 of the task-level context the specialists also read
+  (implementation notes, dependencies, setup instructions)
+
+CachedSpecialist wraps a specialist agent: files with cached findings are
+not sent to the agent, the findings are returned alongside the fresh
+results, and the orchestrator aggregates both as usual. When every file is
+cached the specialist is not called at all. Specialist review cost thus
+drops roughly in proportion to the share of unchanged files.
+
+Findings are attributed to files by their file_path. Findings that name no
+reviewed file (cross-file or "unknown") are cached under a whole-submission
+key (every file hash plus the context). That entry is only written when
+the specialist reviewed every file, so it is served only for the exact set
+of files it saw; when every file is cached but that submission has not been
+reviewed as a whole, the specialist reviews all files again. A failed
+specialist call caches nothing. The cache lives in memory, one per
+CodeReviewOrchestrator, so it spans the correction iterations of one run.
+
+Environment Variables:
+    ASP_REVIEW_CACHE: Reuse per-file specialist findings ("true"/"false",
+        default: "true")
+
+Example:
+    cache = ReviewResultsCache()
+    specialist = CachedSpecialist("code_security", agent, cache)
+    result = specialist.execute(generated_code)
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+# pylint: disable=logging-fstring-interpolation
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from asp.models.code import GeneratedCode, GeneratedFile
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 2048
+
+# GeneratedCode fields besides the files that specialists take into account
+_CONTEXT_FIELDS = {
+    "implementation_notes",
+    "dependencies",
+    "setup_instructions",
+    "test_coverage_target",
+}
+
+
+def review_cache_enabled(enabled: bool | None = None) -> bool:
+    """Resolve whether to cache reviews: explicit value > ASP_REVIEW_CACHE."""
+    if enabled is not None:
+        return enabled
+    return os.getenv("ASP_REVIEW_CACHE", "true").lower() in ("true", "1", "on")
+
+
+def _digest(data: Any) -> str:
+    encoded = json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def file_hash(file: GeneratedFile) -> str:
+    """Content hash of a generated file."""
+    return _digest(file.model_dump())
+
+
+def context_hash(generated_code: GeneratedCode) -> str:
+    """Hash of the task-level context specialists read besides the files."""
+    return _digest(generated_code.model_dump(include=_CONTEXT_FIELDS))
+
+
+class ReviewResultsCache:
+    """
+    Thread-safe in-memory LRU cache of specialist findings per file.
+
+    Values are {"issues_found": [...], "improvement_suggestions": [...]}
+    with the specialist's raw finding dicts; copies are handed out.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, dict[str, list]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> dict[str, list] | None:
+        """Return a copy of the cached findings for a key, or None."""
+        with self._lock:
+            findings = self._entries.get(key)
+            if findings is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(findings)
+
+    def set(self, key: tuple, findings: dict[str, list]) -> None:
+        """Store findings, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = copy.deepcopy(findings)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CachedSpecialist:
+    """
+    Specialist agent wrapper that only reviews files without cached findings.
+
+    Exposes execute(generated_code) like the wrapped agent.
+    """
+
+    def __init__(self, name: str, agent: Any, cache: ReviewResultsCache):
+        self.name = name
+        self.agent = agent
+        self.cache = cache
+
+    def execute(self, generated_code: GeneratedCode) -> dict[str, Any]:
+        """
+        Review the files without cached findings and add the cached ones.
+
+        Raises:
+            Whatever the wrapped agent raises (nothing is cached then)
+        """
+        version = getattr(self.agent, "agent_version", None)
+        context = context_hash(generated_code)
+        keys = {
+            file.file_path: (self.name, version, file_hash(file), context)
+            for file in generated_code.files
+        }
+        submission_key = (
+            self.name,
+            version,
+            _digest(sorted(key[2] for key in keys.values())),
+            context,
+        )
+        cached = {}
+        for path, key in keys.items():
+            findings = self.cache.get(key)
+            if findings is not None:
+                cached[path] = findings
+        missing = [
+            file for file in generated_code.files if file.file_path not in cached
+        ]
+
+        result: dict[str, Any] = {"issues_found": [], "improvement_suggestions": []}
+        if not missing:
+            # Findings not tied to a file are only known for a whole submission
+            unattributed = self.cache.get(submission_key)
+            if unattributed is not None:
+                result = unattributed
+            else:
+                logger.info(
+                    f"{self.name}: submission not reviewed as a whole before, "
+                    "reviewing all files"
+                )
+                cached = {}
+                missing = list(generated_code.files)
+        if missing:
+            if cached:
+                logger.info(
+                    f"{self.name}: reviewing {len(missing)}/"
+                    f"{len(generated_code.files)} files, "
+                    f"{len(cached)} served from the review cache"
+                )
+                review_input = generated_code.model_copy(
+                    update={"files": missing, "total_files": len(missing)}
+                )
+            else:
+                review_input = generated_code
+            result = self.agent.execute(review_input)
+            # A partial review's unattributed findings are not the submission's
+            whole = len(missing) == len(generated_code.files)
+            self._store(
+                result,
+                {f.file_path: keys[f.file_path] for f in missing},
+                submission_key if whole else None,
+            )
+        else:
+            logger.info(f"{self.name}: all files served from the review cache")
+
+        result = dict(result)
+        for field in ("issues_found", "improvement_suggestions"):
+            result[field] = list(result.get(field, [])) + [
+                finding for findings in cached.values() for finding in findings[field]
+            ]
+        return result
+
+    def _store(
+        self,
+        result: dict[str, Any],
+        keys: dict[str, tuple],
+        submission_key: tuple | None,
+    ) -> None:
+        """
+        Cache the findings of each reviewed file.
+
+        The unattributed findings are cached under submission_key, which is
+        None unless every file of the submission was reviewed.
+        """
+        per_file: dict[str, dict[str, list]] = {
+            path: {"issues_found": [], "improvement_suggestions": []} for path in keys
+        }
+        unattributed: dict[str, list] = {
+            "issues_found": [],
+            "improvement_suggestions": [],
+        }
+        for field in ("issues_found", "improvement_suggestions"):
+            for finding in result.get(field, []):
+                path = finding.get("file_path") if isinstance(finding, dict) else None
+                if path in per_file:
+                    per_file[path][field].append(finding)
+                else:
+                    unattributed[field].append(finding)
+        for path, findings in per_file.items():
+            self.cache.set(keys[path], findings)
+        if submission_key is not None:
+            self.cache.set(submission_key, unattributed)
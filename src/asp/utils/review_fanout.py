@@ -0,0 +1,304 @@
+"""
+Specialist Fan-Out for the Review Orchestrators
+
+CodeReviewOrchestrator and DesignReviewOrchestrator send their input to six
+specialist agents at once. By default all six are awaited before the
+results are aggregated. An early-exit policy evaluates the review gate as
+each specialist result arrives instead:
+
+- "off": wait for every specialist (default)
+- "background": record when the gate outcome was decided, but keep waiting
+  for the remaining specialists so their issues enrich the feedback
+- "cancel": stop at the decision and drop the remaining specialists
+
+Only a FAIL can be decided early: more issues never turn a FAIL into a
+pass, while a pass is only known once every specialist has reported.
+Specialists are synchronous agents, so a cancelled one cannot be
+interrupted mid-call; its thread finishes in the background, its LLM call
+is still billed, and its result is discarded. The threads come from a
+dedicated pool so that asyncio.run() in the orchestrators does not wait for
+them on shutdown.
+
+Large generated codebases are reviewed in shards: shard_generated_code
+splits the files into token-bounded batches grouped by component, every
+specialist reviews every shard in parallel (the LLM client's rate limiter
+bounds the calls actually in flight), and each specialist's shard results
+are concatenated before the orchestrator deduplicates them.
+
+When the enclosing run budget (asp.utils.llm_budget.RunBudget) is tight,
+only the orchestrator's core specialists are run; the others are reported
+as skipped.
+
+Environment Variables:
+    ASP_REVIEW_EARLY_EXIT: Early-exit policy ("off", "background" or
+        "cancel", default: "off")
+
+Example:
+    shards = shard_generated_code(generated_code, max_tokens=30000)
+    results = await fan_out(specialists, shards, decided, "cancel")
+    print(results.verdict_seconds, results.skipped)
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+# pylint: disable=logging-fstring-interpolation
+
+import asyncio
+import contextvars
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import PurePosixPath
+from typing import Any
+
+from asp.models.code import GeneratedCode, GeneratedFile
+from asp.utils.llm_budget import check_run_budget, run_budget_tight
+
+logger = logging.getLogger(__name__)
+
+EARLY_EXIT_POLICIES = ("off", "background", "cancel")
+
+# Worker threads shared by all review fan-outs
+_MAX_WORKERS = 32
+
+_FINDINGS = ("issues_found", "improvement_suggestions")
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+class SpecialistResults(dict):
+    """
+    Specialist name -> review result, in specialist order.
+
+    Attributes:
+        verdict_seconds: Time until the gate outcome was decided (None when
+            the policy is "off")
+        skipped: Specialists cancelled once the outcome was decided
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.verdict_seconds: float | None = None
+        self.skipped: list[str] = []
+
+
+def resolve_early_exit(policy: str | None = None) -> str:
+    """
+    Resolve the early-exit policy: explicit value > env var > "off".
+
+    Raises:
+        ValueError: If the policy is not one of EARLY_EXIT_POLICIES
+    """
+    if policy is None:
+        policy = os.getenv("ASP_REVIEW_EARLY_EXIT", "off")
+    policy = policy.strip().lower()
+    if policy not in EARLY_EXIT_POLICIES:
+        raise ValueError(
+            f"Invalid review early-exit policy {policy!r}; "
+            f"expected one of {', '.join(EARLY_EXIT_POLICIES)}"
+        )
+    return policy
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor  # pylint: disable=global-statement
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_MAX_WORKERS, thread_name_prefix="asp-review"
+            )
+        return _executor
+
+
+def _merge(results: list[dict[str, Any]]) -> dict[str, Any]:
+    """Combine one specialist's results over several shards."""
+    merged = dict(results[0])
+    for field in _FINDINGS:
+        merged[field] = [finding for r in results for finding in r.get(field, [])]
+    return merged
+
+
+async def fan_out(
+    specialists: dict[str, Any],
+    payloads: list[Any],
+    decided: Callable[[dict[str, dict[str, Any]]], bool] | None = None,
+    policy: str = "off",
+    core: tuple[str, ...] = (),
+) -> SpecialistResults:
+    """
+    Run every specialist's execute() on every payload concurrently.
+
+    A call that raises contributes empty results, so one failure does not
+    block the others; an exhausted run budget raises RunBudgetExceededError
+    instead. A specialist's results over several payloads (shards) are
+    merged by concatenating their findings.
+
+    Args:
+        specialists: Specialist name -> agent
+        payloads: Inputs passed to each agent's execute() (at least one)
+        decided: Returns True when the results so far decide the outcome
+        policy: Early-exit policy (see module docstring)
+        core: Specialists still run when the run budget is tight (empty:
+            always run every specialist)
+
+    Returns:
+        SpecialistResults for the specialists with at least one finished call
+    """
+    if not payloads:
+        raise ValueError("fan_out needs at least one payload")
+    dropped: list[str] = []
+    if core and run_budget_tight():
+        dropped = [name for name in specialists if name not in core]
+        specialists = {n: a for n, a in specialists.items() if n in core}
+        logger.info(f"Run budget tight: skipping specialists {dropped}")
+    loop = asyncio.get_running_loop()
+    start = time.monotonic()
+
+    async def run_call(name: str, agent: Any, index: int) -> tuple[tuple, dict]:
+        try:
+            # copy_context carries the LLM budget scope into the worker thread
+            result = await loop.run_in_executor(
+                _get_executor(),
+                contextvars.copy_context().run,
+                agent.execute,
+                payloads[index],
+            )
+            return ((name, index), result)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # An exhausted run budget ends the review instead of emptying it
+            check_run_budget()
+            shard = f" on shard {index + 1}" if len(payloads) > 1 else ""
+            logger.warning(f"{name} specialist failed{shard}: {e}")
+            return ((name, index), {field: [] for field in _FINDINGS})
+
+    tasks = {
+        (name, index): asyncio.create_task(run_call(name, agent, index))
+        for name, agent in specialists.items()
+        for index in range(len(payloads))
+    }
+    completed: dict[tuple, dict[str, Any]] = {}
+    verdict_seconds = None
+
+    def by_specialist() -> dict[str, dict[str, Any]]:
+        merged = {}
+        for name in specialists:
+            calls = [
+                completed[(name, i)]
+                for i in range(len(payloads))
+                if (name, i) in completed
+            ]
+            if calls:
+                merged[name] = _merge(calls)
+        return merged
+
+    if policy == "off" or decided is None:
+        completed.update(await asyncio.gather(*tasks.values()))
+    else:
+        for next_result in asyncio.as_completed(tasks.values()):
+            key, result = await next_result
+            completed[key] = result
+            if verdict_seconds is None and decided(by_specialist()):
+                verdict_seconds = time.monotonic() - start
+                logger.info(
+                    f"Review outcome decided after {len(completed)}/"
+                    f"{len(tasks)} specialist calls ({verdict_seconds:.1f}s)"
+                )
+                if policy == "cancel":
+                    pending = [t for k, t in tasks.items() if k not in completed]
+                    for task in pending:
+                        task.cancel()
+                    # Keep results that arrived before the cancellation
+                    for outcome in await asyncio.gather(
+                        *pending, return_exceptions=True
+                    ):
+                        if isinstance(outcome, tuple):
+                            completed[outcome[0]] = outcome[1]
+                    break
+        if verdict_seconds is None:
+            verdict_seconds = time.monotonic() - start
+
+    results = SpecialistResults(by_specialist())
+    results.verdict_seconds = verdict_seconds
+    results.skipped = dropped + [
+        name
+        for name in specialists
+        if any((name, i) not in completed for i in range(len(payloads)))
+    ]
+    if results.skipped:
+        logger.info(f"Skipped specialists after early exit: {results.skipped}")
+    return results
+
+
+def shard_generated_code(
+    generated_code: GeneratedCode, max_tokens: int
+) -> list[GeneratedCode]:
+    """
+    Split generated code into token-bounded shards for review.
+
+    Files are grouped by component (component_id, else semantic_unit_id,
+    else directory) so related files are reviewed together; groups are
+    packed first-fit into shards of at most max_tokens estimated tokens
+    (4 characters per token), and only a group larger than max_tokens is
+    split. Every shard keeps the full file_structure and the code-level
+    context, so specialists still see the project layout.
+
+    Args:
+        generated_code: Code to review
+        max_tokens: Token budget per shard (0 or less: no sharding)
+
+    Returns:
+        Shards in file order ([generated_code] when it fits in one)
+    """
+    sizes = {
+        file.file_path: len(file.model_dump_json(indent=2)) // 4
+        for file in generated_code.files
+    }
+    if max_tokens <= 0 or sum(sizes.values()) <= max_tokens:
+        return [generated_code]
+
+    groups: dict[str, list[GeneratedFile]] = {}
+    for file in generated_code.files:
+        key = (
+            file.component_id
+            or file.semantic_unit_id
+            or str(PurePosixPath(file.file_path).parent)
+        )
+        groups.setdefault(key, []).append(file)
+
+    shards: list[list[GeneratedFile]] = []
+    shard_tokens: list[int] = []
+
+    def place(files: list[GeneratedFile], tokens: int) -> None:
+        for i, used in enumerate(shard_tokens):
+            if used + tokens <= max_tokens:
+                shards[i].extend(files)
+                shard_tokens[i] += tokens
+                return
+        shards.append(list(files))
+        shard_tokens.append(tokens)
+
+    for files in groups.values():
+        tokens = sum(sizes[file.file_path] for file in files)
+        if tokens <= max_tokens:
+            place(files, tokens)
+        else:
+            for file in files:
+                place([file], sizes[file.file_path])
+
+    order = {file.file_path: i for i, file in enumerate(generated_code.files)}
+    return [
+        generated_code.model_copy(
+            update={
+                "files": sorted(files, key=lambda f: order[f.file_path]),
+                "total_files": len(files),
+            }
+        )
+        for files in sorted(shards, key=lambda fs: min(order[f.file_path] for f in fs))
+    ]
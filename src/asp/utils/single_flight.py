@@ -0,0 +1,229 @@
+"""
+Single-Flight Coalescing of Identical In-Flight LLM Calls
+
+When several tasks run in parallel (web UI submissions, bootstrap scripts),
+identical deterministic requests - the same specialist prompt over the same
+design, the same planning prompt for a retried task - are often in flight at
+the same time, and each one is billed. The response cache only helps once
+the first call has finished. This module coalesces concurrent calls that
+share a request key (the LLM response cache key): the first caller issues
+the request and later callers wait for its result instead of issuing their
+own.
+
+Synchronous calls are coalesced across threads. Asynchronous calls are
+coalesced within an event loop; the shared request runs as its own task, so
+cancelling one waiting caller does not cancel the request for the others.
+Once every caller waiting on it has been cancelled, the request itself is
+cancelled, so early exits and deadlines still stop the API call.
+Every follower receives a deep copy of the leader's response, and an error
+raised by the leader is raised to all of its followers.
+
+Environment Variables:
+    ASP_LLM_SINGLE_FLIGHT: Coalesce identical in-flight deterministic calls
+        ("true"/"false", default: "true")
+
+Example:
+    flight = get_single_flight()
+    response, shared = flight.do(key, lambda: client.call_with_retry(prompt))
+    response, shared = await flight.do_async(key, lambda: client.call_async(...))
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import asyncio
+import copy
+import logging
+import os
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _Call:
+    """A synchronous call in flight, awaited by followers."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.followers = 0
+
+
+class _Flight:
+    """An asynchronous call in flight, with the number of callers awaiting it."""
+
+    def __init__(self, task: asyncio.Task) -> None:
+        self.task = task
+        self.waiters = 1
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one execution.
+
+    Attributes:
+        stats: Counts of executed ("leaders") and coalesced ("coalesced") calls
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self._tasks: dict[tuple[int, str], _Flight] = {}
+        self.stats = {"leaders": 0, "coalesced": 0}
+
+    def in_flight(self) -> int:
+        """Number of distinct requests currently in flight."""
+        with self._lock:
+            return len(self._calls) + len(self._tasks)
+
+    def do(self, key: str, fn: Callable[[], T]) -> tuple[T, bool]:
+        """
+        Run fn, or wait for an identical call already in flight.
+
+        Args:
+            key: Request key (identical requests share a key)
+            fn: Function issuing the request
+
+        Returns:
+            Tuple of (result, shared). shared is True when the result came
+            from another caller's in-flight request.
+
+        Raises:
+            Exception: Whatever fn (or the leader's fn) raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.followers += 1
+                self.stats["coalesced"] += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.stats["leaders"] += 1
+                leader = True
+
+        if not leader:
+            logger.info(f"Coalescing identical in-flight LLM call ({key[:12]})")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result), True
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.error = e
+            self._finish(key, call)
+            raise
+        if self._finish(key, call):
+            # Followers copy from a private snapshot the leader cannot mutate
+            call.result = copy.deepcopy(result)
+        call.done.set()
+        return result, False
+
+    def _finish(self, key: str, call: _Call) -> int:
+        """Stop accepting followers for a call; returns how many joined."""
+        with self._lock:
+            self._calls.pop(key, None)
+        if call.error is not None:
+            call.done.set()
+        elif call.followers:
+            logger.debug(f"Shared LLM call with {call.followers} followers")
+        return call.followers
+
+    async def do_async(
+        self, key: str, fn: Callable[[], Awaitable[T]]
+    ) -> tuple[T, bool]:
+        """
+        Await fn(), or an identical call already in flight on this loop.
+
+        Args:
+            key: Request key (identical requests share a key)
+            fn: Function returning the awaitable that issues the request
+
+        Returns:
+            Tuple of (result, shared). shared is True when the result came
+            from another caller's in-flight request.
+
+        Raises:
+            Exception: Whatever the shared request raised
+            asyncio.CancelledError: If this caller is cancelled; the shared
+                request is cancelled too when no other caller awaits it
+        """
+        task_key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            flight = self._tasks.get(task_key)
+            shared = flight is not None
+            if shared:
+                flight.waiters += 1
+                self.stats["coalesced"] += 1
+            else:
+                task = asyncio.ensure_future(self._run_with_snapshot(fn))
+                flight = self._tasks[task_key] = _Flight(task)
+                self.stats["leaders"] += 1
+                task.add_done_callback(lambda _: self._forget(task_key, task))
+
+        try:
+            result, snapshot = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            self._leave(task_key, flight)
+            raise
+        if shared:
+            logger.info(f"Coalesced identical in-flight async LLM call ({key[:12]})")
+            return copy.deepcopy(snapshot), True
+        return result, False
+
+    @staticmethod
+    async def _run_with_snapshot(fn: Callable[[], Awaitable[T]]) -> tuple[T, T]:
+        """Await fn() and keep a private copy of the result for followers."""
+        result = await fn()
+        return result, copy.deepcopy(result)
+
+    def _leave(self, task_key: tuple[int, str], flight: _Flight) -> None:
+        """Withdraw a cancelled caller; cancel the request if it was the last."""
+        with self._lock:
+            flight.waiters -= 1
+            abandoned = flight.waiters == 0 and not flight.task.done()
+            if abandoned and self._tasks.get(task_key) is flight:
+                # Later identical calls start a fresh request
+                del self._tasks[task_key]
+        if abandoned:
+            logger.debug("Cancelling in-flight LLM call abandoned by all callers")
+            flight.task.cancel()
+
+    def _forget(self, task_key: tuple[int, str], task: asyncio.Task) -> None:
+        """Drop a finished task; retrieve its exception if nobody awaited it."""
+        with self._lock:
+            flight = self._tasks.get(task_key)
+            if flight is not None and flight.task is task:
+                del self._tasks[task_key]
+        if not task.cancelled():
+            task.exception()
+
+    def reset_stats(self) -> None:
+        """Zero the leader/coalesced counters."""
+        with self._lock:
+            self.stats = {"leaders": 0, "coalesced": 0}
+
+
+_default_flight = SingleFlight()
+
+
+def single_flight_enabled() -> bool:
+    """Whether ASP_LLM_SINGLE_FLIGHT enables call coalescing."""
+    return os.getenv("ASP_LLM_SINGLE_FLIGHT", "true").lower() == "true"
+
+
+def get_single_flight() -> SingleFlight | None:
+    """
+    Get the process-wide single-flight group.
+
+    Returns:
+        SingleFlight instance, or None when coalescing is disabled
+    """
+    return _default_flight if single_flight_enabled() else None
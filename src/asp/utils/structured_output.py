@@ -0,0 +1,186 @@
+"""
+Schema-Constrained Structured Output for ASP Agents
+
+Agents historically asked for JSON in the prompt and scraped it out of the
+response text (see asp.utils.json_extraction), so malformed or fenced JSON
+surfaced as AgentExecutionError and triggered whole-call retries. This module
+derives a JSON schema from the Pydantic model an agent expects and turns it
+into provider request parameters that constrain the model's output:
+
+- Anthropic: a single tool whose input_schema is the model schema, with
+  tool_choice forcing the model to call it. The tool input is the output.
+- OpenAI-compatible providers: response_format with a json_schema.
+
+The raw response text is then validated in one step with
+model_validate_json(), without regex extraction.
+
+Environment Variables:
+    ASP_STRUCTURED_OUTPUT: Enable structured output for agent calls that
+        declare a response model ("true"/"false", default: "false")
+
+Example:
+    kwargs = structured_output_kwargs(ProjectPlan, provider="anthropic")
+    response = client.call_with_retry(prompt, **kwargs)
+    plan = parse_structured_output(response["raw_content"], ProjectPlan)
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import logging
+import os
+import re
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+
+from asp.utils.json_extraction import JSONExtractionError
+
+logger = logging.getLogger(__name__)
+
+ANTHROPIC_PROVIDERS = frozenset({"anthropic"})
+
+
+class StructuredOutputError(JSONExtractionError):
+    """Raised when a structured response does not match its schema."""
+
+
+def structured_output_enabled() -> bool:
+    """Whether ASP_STRUCTURED_OUTPUT enables structured output."""
+    return os.getenv("ASP_STRUCTURED_OUTPUT", "false").lower() == "true"
+
+
+def schema_name(model_class: type[BaseModel]) -> str:
+    """
+    Tool / schema name for a model (snake_case of the class name).
+
+    Both Anthropic tool names and OpenAI schema names must match
+    ^[a-zA-Z0-9_-]{1,64}$.
+    """
+    name = re.sub(r"(?<!^)(?=[A-Z])", "_", model_class.__name__).lower()
+    return name[:64]
+
+
+def response_schema(model_class: type[BaseModel]) -> dict[str, Any]:
+    """
+    JSON schema describing valid input for a Pydantic model.
+
+    Args:
+        model_class: Pydantic model the response must validate against
+
+    Returns:
+        JSON schema dict (validation mode, with $defs for nested models)
+    """
+    return model_class.model_json_schema(mode="validation")
+
+
+def anthropic_tool_params(model_class: type[BaseModel]) -> dict[str, Any]:
+    """
+    Anthropic request parameters forcing a schema-shaped tool call.
+
+    Args:
+        model_class: Pydantic model describing the expected output
+
+    Returns:
+        Dict with "tools" and "tool_choice" messages.create() parameters
+    """
+    name = schema_name(model_class)
+    description = (model_class.__doc__ or "").strip().split("\n\n")[0]
+    return {
+        "tools": [
+            {
+                "name": name,
+                "description": description
+                or f"Return the {model_class.__name__} result.",
+                "input_schema": response_schema(model_class),
+            }
+        ],
+        "tool_choice": {"type": "tool", "name": name},
+    }
+
+
+def openai_response_format(model_class: type[BaseModel]) -> dict[str, Any]:
+    """
+    OpenAI-compatible response_format constraining output to a schema.
+
+    Args:
+        model_class: Pydantic model describing the expected output
+
+    Returns:
+        Dict with the "response_format" chat.completions parameter
+    """
+    return {
+        "response_format": {
+            "type": "json_schema",
+            "json_schema": {
+                "name": schema_name(model_class),
+                "schema": response_schema(model_class),
+            },
+        }
+    }
+
+
+def structured_output_kwargs(
+    model_class: type[BaseModel], provider: str = "anthropic"
+) -> dict[str, Any]:
+    """
+    Request parameters constraining a provider's output to a model schema.
+
+    Args:
+        model_class: Pydantic model describing the expected output
+        provider: Provider name ("anthropic" uses forced tool use; all other
+            providers are treated as OpenAI-compatible)
+
+    Returns:
+        Keyword arguments to pass through to the LLM call
+    """
+    if provider in ANTHROPIC_PROVIDERS:
+        return anthropic_tool_params(model_class)
+    return openai_response_format(model_class)
+
+
+def tool_use_input(content_blocks: list[Any]) -> dict[str, Any] | None:
+    """
+    Input of the first tool_use block in an Anthropic response, if any.
+
+    Args:
+        content_blocks: response.content from the Anthropic SDK
+
+    Returns:
+        The tool input dict, or None for plain-text responses
+    """
+    for block in content_blocks or []:
+        if getattr(block, "type", None) == "tool_use":
+            tool_input = getattr(block, "input", None)
+            return tool_input if isinstance(tool_input, dict) else None
+    return None
+
+
+def parse_structured_output[ModelT: BaseModel](
+    raw: str | bytes | None, model_class: type[ModelT]
+) -> ModelT:
+    """
+    Validate a raw structured response against its model.
+
+    Args:
+        raw: Raw response text (tool input or response_format JSON)
+        model_class: Pydantic model to validate against
+
+    Returns:
+        Validated model instance
+
+    Raises:
+        StructuredOutputError: If the text is not valid JSON for the schema
+    """
+    if not raw:
+        raise StructuredOutputError(
+            f"Empty structured response for {model_class.__name__}"
+        )
+    try:
+        return model_class.model_validate_json(raw)
+    except ValidationError as e:
+        preview = raw if isinstance(raw, str) else raw.decode(errors="replace")
+        raise StructuredOutputError(
+            f"Structured response does not match {model_class.__name__}: "
+            f"{e.error_count()} error(s)\n{e}\nResponse preview: {preview[:500]}..."
+        ) from e
@@ -16,6 +16,8 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from asp.web.rollups import has_rollups, totals_by_role
+
 logger = logging.getLogger(__name__)
 
 # Database path (same as telemetry module)
@@ -37,6 +39,14 @@ def get_db_connection(db_path: Path | None = None):
     return conn
 
 
+def _has_agent_execution(conn: sqlite3.Connection) -> bool:
+    """Whether the DB has the wide agent_execution table (migration 016)."""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'agent_execution'"
+    ).fetchone()
+    return row is not None
+
+
 def get_recent_agent_activity(limit: int = 10) -> list[dict[str, Any]]:
     """
     Get recent agent activity from telemetry.
@@ -49,24 +59,34 @@ def get_recent_agent_activity(limit: int = 10) -> list[dict[str, Any]]:
 
     try:
         cursor = conn.cursor()
-        cursor.execute(
+        if _has_agent_execution(conn):
+            query = """
+                SELECT
+                    timestamp,
+                    task_id,
+                    agent_role,
+                    latency_ms AS metric_value,
+                    user_id,
+                    llm_model
+                FROM agent_execution
+                ORDER BY timestamp DESC
+                LIMIT ?
             """
-            SELECT
-                timestamp,
-                task_id,
-                agent_role,
-                metric_type,
-                metric_value,
-                metric_unit,
-                user_id,
-                llm_model
-            FROM agent_cost_vector
-            WHERE metric_type = 'Latency'
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """,
-            (limit,),
-        )
+        else:
+            query = """
+                SELECT
+                    timestamp,
+                    task_id,
+                    agent_role,
+                    metric_value,
+                    user_id,
+                    llm_model
+                FROM agent_cost_vector
+                WHERE metric_type = 'Latency'
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """
+        cursor.execute(query, (limit,))
 
         results = []
         for row in cursor.fetchall():
@@ -149,7 +169,13 @@ def get_cost_summary(days: int = 7) -> dict[str, Any]:
 
     try:
         cursor = conn.cursor()
-        cutoff = (datetime.now(UTC) - timedelta(days=days)).isoformat()
+        start = datetime.now(UTC) - timedelta(days=days)
+        cutoff = start.isoformat()
+
+        if has_rollups(conn):
+            return _get_cost_summary_from_rollups(conn, start)
+        if _has_agent_execution(conn):
+            return _get_cost_summary_from_executions(cursor, cutoff)
 
         # Total cost
         cursor.execute(
@@ -202,6 +228,49 @@ def get_cost_summary(days: int = 7) -> dict[str, Any]:
         conn.close()
 
 
+def _get_cost_summary_from_rollups(
+    conn: sqlite3.Connection, start: datetime
+) -> dict[str, Any]:
+    """get_cost_summary over the hourly/daily agent_execution rollups."""
+    rows = totals_by_role(conn, start)
+    return {
+        "total_usd": round(sum(row["cost"] for row in rows), 4),
+        "by_role": {row["agent_role"]: row["cost"] for row in rows if row["cost"] > 0},
+        "token_usage": {
+            "input": sum(row["tokens_in"] for row in rows),
+            "output": sum(row["tokens_out"] for row in rows),
+        },
+    }
+
+
+def _get_cost_summary_from_executions(
+    cursor: sqlite3.Cursor, cutoff: str
+) -> dict[str, Any]:
+    """get_cost_summary over agent_execution: one grouped pass, no pivot."""
+    cursor.execute(
+        """
+        SELECT
+            agent_role,
+            SUM(api_cost_usd) as cost,
+            SUM(tokens_in) as input_tokens,
+            SUM(tokens_out) as output_tokens
+        FROM agent_execution
+        WHERE timestamp > ?
+        GROUP BY agent_role
+    """,
+        (cutoff,),
+    )
+    rows = cursor.fetchall()
+    return {
+        "total_usd": round(sum(row["cost"] for row in rows), 4),
+        "by_role": {row["agent_role"]: row["cost"] for row in rows if row["cost"] > 0},
+        "token_usage": {
+            "input": int(sum(row["input_tokens"] for row in rows)),
+            "output": int(sum(row["output_tokens"] for row in rows)),
+        },
+    }
+
+
 def get_user_performance(user_id: str | None = None) -> list[dict[str, Any]]:
     """
     Get performance metrics grouped by user.
@@ -215,15 +284,26 @@ def get_user_performance(user_id: str | None = None) -> list[dict[str, Any]]:
     try:
         cursor = conn.cursor()
 
-        query = """
-            SELECT
-                user_id,
-                COUNT(DISTINCT task_id) as task_count,
-                AVG(CASE WHEN metric_type = 'Latency' THEN metric_value END) as avg_latency,
-                COUNT(*) as execution_count
-            FROM agent_cost_vector
-            WHERE user_id IS NOT NULL
-        """
+        if _has_agent_execution(conn):
+            query = """
+                SELECT
+                    user_id,
+                    COUNT(DISTINCT task_id) as task_count,
+                    AVG(latency_ms) as avg_latency,
+                    COUNT(*) as execution_count
+                FROM agent_execution
+                WHERE user_id IS NOT NULL
+            """
+        else:
+            query = """
+                SELECT
+                    user_id,
+                    COUNT(DISTINCT task_id) as task_count,
+                    AVG(CASE WHEN metric_type = 'Latency' THEN metric_value END) as avg_latency,
+                    COUNT(*) as execution_count
+                FROM agent_cost_vector
+                WHERE user_id IS NOT NULL
+            """
         params = []
 
         if user_id:
@@ -428,7 +508,8 @@ def get_project_progress() -> dict[str, Any]:
         cursor = conn.cursor()
 
         # Count distinct tasks
-        cursor.execute("SELECT COUNT(DISTINCT task_id) as total FROM agent_cost_vector")
+        table = "agent_execution" if _has_agent_execution(conn) else "agent_cost_vector"
+        cursor.execute(f"SELECT COUNT(DISTINCT task_id) as total FROM {table}")
         total = cursor.fetchone()["total"]
 
         return {
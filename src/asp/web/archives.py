@@ -0,0 +1,133 @@
+"""
+Archive Readers for ASP Web Dashboards
+
+`asp-cli telemetry compact` (asp.telemetry.retention) moves raw
+agent_execution and agent_cost_vector rows older than its retention window
+into one SQLite file per month, listed in the telemetry_archive table
+(migration 018). Their hourly/daily rollups stay in the live database, so
+most dashboard queries never touch the archives.
+
+raw_source() returns what a query should read raw rows of a table from:
+the live table itself, unless the requested range starts before the
+archive horizon, in which case the archives for the months in range are
+attached and a temporary view spans them and the live table.
+"""
+
+import logging
+import sqlite3
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def archive_horizon(conn: sqlite3.Connection) -> str | None:
+    """
+    Upper bound of the archived rows, or None if nothing was archived.
+
+    Rows with a timestamp before the horizon ('YYYY-MM-DD') may be in an
+    archive; everything from the horizon on is in the live database.
+    """
+    row = conn.execute(
+        "SELECT 1 FROM main.sqlite_master "
+        "WHERE type = 'table' AND name = 'telemetry_archive'"
+    ).fetchone()
+    if row is None:
+        return None
+    row = conn.execute("SELECT MAX(archived_until) FROM telemetry_archive").fetchone()
+    return row[0]
+
+
+def _database_dir(conn: sqlite3.Connection) -> Path:
+    """Directory of the live database file; archive paths are relative to it."""
+    for _, name, file in conn.execute("PRAGMA database_list"):
+        if name == "main":
+            return Path(file).parent
+    return Path(".")
+
+
+def attach_archives(
+    conn: sqlite3.Connection, start: str | None = None, end: str | None = None
+) -> list[str]:
+    """
+    Attach the archives of the months between start and end.
+
+    Args:
+        conn: Connection to the live telemetry database
+        start: ISO timestamp; archives of earlier months are skipped
+        end: Exclusive ISO timestamp; archives of later months are skipped
+
+    Returns:
+        Schema names of the attached archives, newest month first. SQLite
+        caps attached databases (10 by default); older months beyond the
+        cap are left out with a warning.
+    """
+    rows = conn.execute(
+        """
+        SELECT month, path FROM telemetry_archive
+        WHERE month >= substr(?, 1, 7) AND month <= substr(?, 1, 7)
+        ORDER BY month DESC
+        """,
+        (start or "", end or "9999"),
+    ).fetchall()
+
+    attached = {row[1] for row in conn.execute("PRAGMA database_list")}
+    in_use = len(attached - {"main", "temp"})
+    available = conn.getlimit(sqlite3.SQLITE_LIMIT_ATTACHED) - in_use
+    base = _database_dir(conn)
+    schemas = []
+    for month, path in rows:
+        schema = f"archive_{month.replace('-', '_')}"
+        if schema in attached:
+            schemas.append(schema)
+            continue
+        if len(schemas) >= available:
+            logger.warning(
+                f"Not attaching telemetry archives before {month}: SQLite limit "
+                f"of {available} attached databases reached"
+            )
+            break
+        file = base / path
+        if not file.exists():
+            logger.warning(f"Telemetry archive missing: {file}")
+            continue
+        conn.execute(f"ATTACH DATABASE ? AS {schema}", (str(file),))
+        schemas.append(schema)
+    return schemas
+
+
+def raw_source(
+    conn: sqlite3.Connection,
+    table: str,
+    start: str | None = None,
+    end: str | None = None,
+) -> str:
+    """
+    Table or view holding the raw `table` rows between start and end.
+
+    Args:
+        conn: Connection to the live telemetry database
+        table: agent_execution or agent_cost_vector
+        start: ISO timestamp the query reads from (None = all time)
+        end: Exclusive ISO timestamp the query reads up to (None = now)
+
+    Returns:
+        `table` when the live database covers the range, otherwise the name
+        of a temporary view over the live table and the attached archives
+    """
+    horizon = archive_horizon(conn)
+    if horizon is None or (start is not None and start >= horizon):
+        return table
+    schemas = attach_archives(conn, start, end)
+    if not schemas:
+        return table
+
+    columns = ", ".join(
+        f'"{row[1]}"' for row in conn.execute(f"PRAGMA main.table_info({table})")
+    )
+    view = f"{table}_span"
+    selects = [f"SELECT {columns} FROM main.{table}"] + [
+        f"SELECT {columns} FROM {schema}.{table}" for schema in schemas
+    ]
+    conn.execute(f"DROP VIEW IF EXISTS temp.{view}")
+    conn.execute(f"CREATE TEMP VIEW {view} AS {' UNION ALL '.join(selects)}")
+    return view
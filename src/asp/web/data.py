@@ -15,6 +15,9 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from asp.web.archives import archive_horizon, raw_source
+from asp.web.rollups import daily_totals, has_rollups, totals_by_role
+
 
 def _sanitize_text(text: str) -> str:
     """
@@ -53,6 +56,19 @@ def _get_db_connection() -> sqlite3.Connection | None:
     return conn
 
 
+def _has_agent_execution(conn: sqlite3.Connection) -> bool:
+    """
+    Whether the DB has the wide agent_execution table (migration 016).
+
+    Dashboards read one row per execution from it; older databases only have
+    the per-metric agent_cost_vector rows, which are pivoted instead.
+    """
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'agent_execution'"
+    ).fetchone()
+    return row is not None
+
+
 def get_tasks() -> list[dict[str, Any]]:
     """
     Get all tasks from bootstrap results and telemetry.
@@ -243,22 +259,25 @@ def get_task_telemetry(task_id: str) -> dict[str, Any] | None:
 
     try:
         cursor = conn.cursor()
-        cursor.execute(
-            """
+        query = """
             SELECT
                 agent_role,
                 metric_type,
                 metric_value,
                 metric_unit,
                 timestamp
-            FROM agent_cost_vector
+            FROM {table}
             WHERE task_id = ?
             ORDER BY timestamp DESC
-            """,
-            (task_id,),
-        )
+        """
+        cursor.execute(query.format(table="agent_cost_vector"), (task_id,))
 
         rows = cursor.fetchall()
+        if not rows and archive_horizon(conn) is not None:
+            # Older tasks may have been compacted into the monthly archives
+            table = raw_source(conn, "agent_cost_vector")
+            cursor.execute(query.format(table=table), (task_id,))
+            rows = cursor.fetchall()
         if not rows:
             return None
 
@@ -312,21 +331,32 @@ def get_recent_activity(limit: int = 10) -> list[dict[str, Any]]:
     if conn:
         try:
             cursor = conn.cursor()
-            cursor.execute(
+            if _has_agent_execution(conn):
+                query = """
+                    SELECT
+                        timestamp,
+                        task_id,
+                        agent_role,
+                        latency_ms AS metric_value,
+                        status
+                    FROM agent_execution
+                    ORDER BY timestamp DESC
+                    LIMIT ?
                 """
-                SELECT
-                    timestamp,
-                    task_id,
-                    agent_role,
-                    metric_type,
-                    metric_value
-                FROM agent_cost_vector
-                WHERE metric_type = 'Latency'
-                ORDER BY timestamp DESC
-                LIMIT ?
-                """,
-                (limit,),
-            )
+            else:
+                query = """
+                    SELECT
+                        timestamp,
+                        task_id,
+                        agent_role,
+                        metric_value,
+                        'success' AS status
+                    FROM agent_cost_vector
+                    WHERE metric_type = 'Latency'
+                    ORDER BY timestamp DESC
+                    LIMIT ?
+                """
+            cursor.execute(query, (limit,))
 
             for row in cursor.fetchall():
                 try:
@@ -339,7 +369,7 @@ def get_recent_activity(limit: int = 10) -> list[dict[str, Any]]:
                         "time": ts.strftime("%H:%M"),
                         "date": ts.strftime("%Y-%m-%d"),
                         "action": f"{row['agent_role']} executed for {row['task_id']}",
-                        "status": "Success",
+                        "status": "Error" if row["status"] == "error" else "Success",
                         "task_id": row["task_id"],
                         "agent": row["agent_role"],
                         "metric": f"{row['metric_value']:.0f}ms",
@@ -425,25 +455,46 @@ def get_agent_stats() -> dict[str, Any]:
         try:
             cursor = conn.cursor()
 
-            # Get total cost
-            cursor.execute(
-                """
-                SELECT COALESCE(SUM(metric_value), 0) as total
-                FROM agent_cost_vector
-                WHERE metric_type = 'API_Cost'
-                """
-            )
-            stats["total_cost_usd"] = round(cursor.fetchone()["total"], 4)
-
-            # Get total tokens
-            cursor.execute(
-                """
-                SELECT COALESCE(SUM(metric_value), 0) as total
-                FROM agent_cost_vector
-                WHERE metric_type IN ('Tokens_In', 'Tokens_Out')
-                """
-            )
-            stats["total_tokens"] = int(cursor.fetchone()["total"])
+            if has_rollups(conn):
+                # All-time totals from the daily rollup, a few rows per day
+                rows = totals_by_role(conn)
+                stats["total_cost_usd"] = round(sum(r["cost"] for r in rows), 4)
+                stats["total_tokens"] = sum(
+                    r["tokens_in"] + r["tokens_out"] for r in rows
+                )
+            elif _has_agent_execution(conn):
+                # Total cost and tokens in one pass over execution rows
+                cursor.execute(
+                    """
+                    SELECT
+                        COALESCE(SUM(api_cost_usd), 0) as cost,
+                        COALESCE(SUM(tokens_in + tokens_out), 0) as tokens
+                    FROM agent_execution
+                    """
+                )
+                row = cursor.fetchone()
+                stats["total_cost_usd"] = round(row["cost"], 4)
+                stats["total_tokens"] = int(row["tokens"])
+            else:
+                # Get total cost
+                cursor.execute(
+                    """
+                    SELECT COALESCE(SUM(metric_value), 0) as total
+                    FROM agent_cost_vector
+                    WHERE metric_type = 'API_Cost'
+                    """
+                )
+                stats["total_cost_usd"] = round(cursor.fetchone()["total"], 4)
+
+                # Get total tokens
+                cursor.execute(
+                    """
+                    SELECT COALESCE(SUM(metric_value), 0) as total
+                    FROM agent_cost_vector
+                    WHERE metric_type IN ('Tokens_In', 'Tokens_Out')
+                    """
+                )
+                stats["total_tokens"] = int(cursor.fetchone()["total"])
 
         except sqlite3.Error:
             pass
@@ -555,20 +606,45 @@ def get_agent_health() -> list[dict[str, Any]]:
         cursor = conn.cursor()
         cutoff = (datetime.now(UTC) - timedelta(hours=24)).isoformat()
 
-        results = []
-        for agent in agents:
-            # Get last execution and stats for this agent
-            cursor.execute(
-                """
+        if has_rollups(conn):
+            # Counts from the daily rollup cover compacted history too; the
+            # last hour bucket stands in when the raw rows are archived
+            query = """
+                SELECT
+                    COALESCE(
+                        (SELECT MAX(timestamp) FROM agent_execution
+                         WHERE agent_role = :role),
+                        (SELECT MAX(bucket) || ':00:00+00:00'
+                         FROM agent_execution_hourly WHERE agent_role = :role)
+                    ) as last_active,
+                    SUM(executions) as executions,
+                    SUM(latency_ms_sum) / SUM(executions) as avg_latency
+                FROM agent_execution_daily
+                WHERE agent_role = :role
+            """
+        elif _has_agent_execution(conn):
+            query = """
+                SELECT
+                    MAX(timestamp) as last_active,
+                    COUNT(*) as executions,
+                    AVG(latency_ms) as avg_latency
+                FROM agent_execution
+                WHERE agent_role = :role
+            """
+        else:
+            query = """
                 SELECT
                     MAX(timestamp) as last_active,
                     COUNT(*) as executions,
                     AVG(CASE WHEN metric_type = 'Latency' THEN metric_value END) as avg_latency
                 FROM agent_cost_vector
-                WHERE agent_role = ?
-                """,
-                (agent["role"],),
-            )
+                WHERE agent_role = :role
+            """
+
+        results = []
+        for agent in agents:
+            # Get last execution and stats for this agent
+            cursor.execute(query, {"role": agent["role"]})
             row = cursor.fetchone()
 
             if row["last_active"]:
@@ -635,7 +711,13 @@ def get_cost_breakdown(days: int = 7) -> dict[str, Any]:
 
     try:
         cursor = conn.cursor()
-        cutoff = (datetime.now(UTC) - timedelta(days=days)).isoformat()
+        start = datetime.now(UTC) - timedelta(days=days)
+        cutoff = start.isoformat()
+
+        if has_rollups(conn):
+            return _get_cost_breakdown_from_rollups(conn, start, result)
+        if _has_agent_execution(conn):
+            return _get_cost_breakdown_from_executions(cursor, cutoff, result)
 
         # Total cost
         cursor.execute(
@@ -686,6 +768,51 @@ def get_cost_breakdown(days: int = 7) -> dict[str, Any]:
         conn.close()
 
 
+def _get_cost_breakdown_from_executions(
+    cursor: sqlite3.Cursor, cutoff: str, result: dict[str, Any]
+) -> dict[str, Any]:
+    """get_cost_breakdown over agent_execution: one grouped pass, no pivot."""
+    cursor.execute(
+        """
+        SELECT
+            agent_role,
+            SUM(api_cost_usd) as cost,
+            SUM(tokens_in) as input_tokens,
+            SUM(tokens_out) as output_tokens
+        FROM agent_execution
+        WHERE timestamp > ?
+        GROUP BY agent_role
+        """,
+        (cutoff,),
+    )
+    rows = cursor.fetchall()
+    result["total_usd"] = round(sum(row["cost"] for row in rows), 4)
+    result["by_role"] = {
+        row["agent_role"]: row["cost"] for row in rows if row["cost"] > 0
+    }
+    result["token_usage"] = {
+        "input": int(sum(row["input_tokens"] for row in rows)),
+        "output": int(sum(row["output_tokens"] for row in rows)),
+    }
+    return result
+
+
+def _get_cost_breakdown_from_rollups(
+    conn: sqlite3.Connection, start: datetime, result: dict[str, Any]
+) -> dict[str, Any]:
+    """get_cost_breakdown over the hourly/daily agent_execution rollups."""
+    rows = totals_by_role(conn, start)
+    result["total_usd"] = round(sum(row["cost"] for row in rows), 4)
+    result["by_role"] = {
+        row["agent_role"]: row["cost"] for row in rows if row["cost"] > 0
+    }
+    result["token_usage"] = {
+        "input": sum(row["tokens_in"] for row in rows),
+        "output": sum(row["tokens_out"] for row in rows),
+    }
+    return result
+
+
 def get_daily_metrics(days: int = 7) -> dict[str, list[float]]:
     """
     Get daily aggregated metrics for sparkline charts.
@@ -710,23 +837,42 @@ def get_daily_metrics(days: int = 7) -> dict[str, list[float]]:
 
     try:
         cursor = conn.cursor()
-        cutoff = (datetime.now(UTC) - timedelta(days=days)).isoformat()
+        start = datetime.now(UTC) - timedelta(days=days)
+        cutoff = start.isoformat()
 
         # Get daily cost totals
-        cursor.execute(
+        if has_rollups(conn):
+            for day in daily_totals(conn, start):
+                result["dates"].append(day["day"])
+                result["cost"].append(day["cost"])
+                result["tokens"].append(day["tokens"])
+                result["tasks"].append(day["tasks"])
+            return result if result["dates"] else _get_placeholder_metrics(days)
+        if _has_agent_execution(conn):
+            query = """
+                SELECT
+                    DATE(timestamp) as day,
+                    SUM(api_cost_usd) as cost,
+                    SUM(tokens_in + tokens_out) as tokens,
+                    COUNT(DISTINCT task_id) as tasks
+                FROM agent_execution
+                WHERE timestamp > ?
+                GROUP BY DATE(timestamp)
+                ORDER BY day
             """
-            SELECT
-                DATE(timestamp) as day,
-                SUM(CASE WHEN metric_type = 'API_Cost' THEN metric_value ELSE 0 END) as cost,
-                SUM(CASE WHEN metric_type IN ('Tokens_In', 'Tokens_Out') THEN metric_value ELSE 0 END) as tokens,
-                COUNT(DISTINCT task_id) as tasks
-            FROM agent_cost_vector
-            WHERE timestamp > ?
-            GROUP BY DATE(timestamp)
-            ORDER BY day
-            """,
-            (cutoff,),
-        )
+        else:
+            query = """
+                SELECT
+                    DATE(timestamp) as day,
+                    SUM(CASE WHEN metric_type = 'API_Cost' THEN metric_value ELSE 0 END) as cost,
+                    SUM(CASE WHEN metric_type IN ('Tokens_In', 'Tokens_Out') THEN metric_value ELSE 0 END) as tokens,
+                    COUNT(DISTINCT task_id) as tasks
+                FROM agent_cost_vector
+                WHERE timestamp > ?
+                GROUP BY DATE(timestamp)
+                ORDER BY day
+            """
+        cursor.execute(query, (cutoff,))
 
         for row in cursor.fetchall():
             result["dates"].append(row["day"])
@@ -11,6 +11,8 @@ Three personas:
 
 from fasthtml.common import *
 
+from asp.utils.client_pool import aclose_client_pool
+
 from .components import theme_toggle
 from .developer import developer_routes
 from .kanban import kanban_routes
@@ -165,6 +167,7 @@ def create_app():
             """
             ),
         ),
+        on_shutdown=[aclose_client_pool],  # Close pooled LLM HTTP connections
     )
 
     @rt("/")
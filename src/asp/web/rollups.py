@@ -0,0 +1,195 @@
+"""
+Rollup Readers for ASP Web Dashboards
+
+Reads the agent_execution_hourly / agent_execution_daily rollups
+(migration 017) instead of scanning raw agent_execution rows. The rollups
+are kept current by the trg_agent_execution_rollup trigger, in the same
+transaction as each execution insert, so they already include the current
+hour and day.
+
+A range "since start" is assembled from three segments:
+- raw agent_execution rows in the partial hour containing start, read
+  from the month's archive when compaction has moved them
+  (asp.web.archives)
+- hourly buckets for the rest of start's day
+- daily buckets for every later day
+
+Buckets use the trigger's keys: 'YYYY-MM-DDTHH' for hours and 'YYYY-MM-DD'
+for days, both taken from the stored UTC ISO timestamp.
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Any
+
+from asp.web.archives import raw_source
+
+ROLLUP_TABLES = (
+    "agent_execution_hourly",
+    "agent_execution_daily",
+    "agent_execution_daily_tasks",
+)
+
+# Same bucket expressions as trg_agent_execution_rollup
+_HOUR_BUCKET = "replace(substr(timestamp, 1, 13), ' ', 'T')"
+_DAY_BUCKET = "substr(timestamp, 1, 10)"
+
+
+def has_rollups(conn: sqlite3.Connection) -> bool:
+    """Whether the DB has the agent_execution rollup tables (migration 017)."""
+    placeholders = ", ".join("?" for _ in ROLLUP_TABLES)
+    row = conn.execute(
+        f"SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' "
+        f"AND name IN ({placeholders})",
+        ROLLUP_TABLES,
+    ).fetchone()
+    return row[0] == len(ROLLUP_TABLES)
+
+
+def _buckets(start: datetime) -> tuple[str, str, str]:
+    """(start timestamp, hour bucket, day bucket) for a range start."""
+    timestamp = start.isoformat()
+    return timestamp, timestamp[:13], timestamp[:10]
+
+
+def _next_bucket(start: datetime, step: timedelta) -> str:
+    """
+    Key of the bucket after start's, as an upper bound for raw timestamps.
+
+    Every timestamp inside that bucket starts with the key, so it sorts at
+    or after it; `timestamp < key` keeps the raw scan inside start's bucket.
+    """
+    width = 13 if step == timedelta(hours=1) else 10
+    return (start + step).isoformat()[:width]
+
+
+def totals_by_role(
+    conn: sqlite3.Connection, start: datetime | None = None
+) -> list[dict[str, Any]]:
+    """
+    Cost, token and execution totals per agent_role since start.
+
+    Args:
+        conn: Connection to a DB with the rollup tables
+        start: Exclusive UTC range start (None = all time)
+
+    Returns:
+        One dict per agent_role with cost, tokens_in, tokens_out, executions
+    """
+    columns = "agent_role, api_cost_usd AS cost, tokens_in, tokens_out, executions"
+    if start is None:
+        query = f"SELECT {columns} FROM agent_execution_daily"
+        params: tuple = ()
+    else:
+        timestamp, hour, day = _buckets(start)
+        next_hour = _next_bucket(start, timedelta(hours=1))
+        raw = raw_source(conn, "agent_execution", timestamp, next_hour)
+        query = f"""
+            SELECT
+                agent_role,
+                COALESCE(api_cost_usd, 0) AS cost,
+                COALESCE(tokens_in, 0) AS tokens_in,
+                COALESCE(tokens_out, 0) AS tokens_out,
+                1 AS executions
+            FROM {raw}
+            WHERE timestamp > ? AND timestamp < ? AND {_HOUR_BUCKET} = ?
+            UNION ALL
+            SELECT {columns} FROM agent_execution_hourly
+            WHERE bucket > ? AND bucket < ?
+            UNION ALL
+            SELECT {columns} FROM agent_execution_daily
+            WHERE bucket > ?
+        """
+        # The hour buckets of start's day run up to 'YYYY-MM-DDT23'
+        params = (
+            timestamp,
+            next_hour,
+            hour,
+            hour,
+            f"{day}T24",
+            day,
+        )
+
+    rows = conn.execute(
+        f"""
+        SELECT
+            agent_role,
+            SUM(cost) AS cost,
+            SUM(tokens_in) AS tokens_in,
+            SUM(tokens_out) AS tokens_out,
+            SUM(executions) AS executions
+        FROM ({query})
+        GROUP BY agent_role
+        ORDER BY agent_role
+        """,
+        params,
+    ).fetchall()
+    return [
+        {
+            "agent_role": row[0],
+            "cost": row[1] or 0,
+            "tokens_in": int(row[2] or 0),
+            "tokens_out": int(row[3] or 0),
+            "executions": int(row[4] or 0),
+        }
+        for row in rows
+    ]
+
+
+def daily_totals(conn: sqlite3.Connection, start: datetime) -> list[dict[str, Any]]:
+    """
+    Per-day cost, tokens and distinct task count since start.
+
+    The partial first day is read from raw rows (distinct task counts
+    cannot be split by hour); every later day comes from
+    agent_execution_daily and agent_execution_daily_tasks.
+
+    Args:
+        conn: Connection to a DB with the rollup tables
+        start: Exclusive UTC range start
+
+    Returns:
+        One dict per day with data (day, cost, tokens, tasks), oldest first
+    """
+    timestamp, _, day = _buckets(start)
+    next_day = _next_bucket(start, timedelta(days=1))
+    raw = raw_source(conn, "agent_execution", timestamp, next_day)
+    rows = conn.execute(
+        f"""
+        SELECT
+            {_DAY_BUCKET} AS day,
+            SUM(api_cost_usd) AS cost,
+            SUM(tokens_in + tokens_out) AS tokens,
+            COUNT(DISTINCT task_id) AS tasks
+        FROM {raw}
+        WHERE timestamp > ? AND timestamp < ? AND {_DAY_BUCKET} = ?
+        GROUP BY day
+        UNION ALL
+        SELECT
+            d.bucket AS day,
+            d.cost,
+            d.tokens,
+            (SELECT COUNT(*) FROM agent_execution_daily_tasks t
+             WHERE t.bucket = d.bucket) AS tasks
+        FROM (
+            SELECT
+                bucket,
+                SUM(api_cost_usd) AS cost,
+                SUM(tokens_in + tokens_out) AS tokens
+            FROM agent_execution_daily
+            WHERE bucket > ?
+            GROUP BY bucket
+        ) d
+        ORDER BY day
+        """,
+        (timestamp, next_day, day, day),
+    ).fetchall()
+    return [
+        {
+            "day": row[0],
+            "cost": row[1] or 0,
+            "tokens": int(row[2] or 0),
+            "tasks": int(row[3] or 0),
+        }
+        for row in rows
+    ]
@@ -384,6 +384,92 @@ class TestAnthropicProvider:
         assert response.usage["input_tokens"] == 100
         assert response.usage["output_tokens"] == 50
 
+    @pytest.mark.asyncio
+    async def test_call_async_with_cached_prefix(self):
+        """Test cached_prefix is sent with a cache_control breakpoint."""
+        from asp.providers.anthropic_provider import AnthropicProvider
+
+        provider = AnthropicProvider(ProviderConfig(api_key="test-key"))
+
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text="ok")]
+        mock_response.usage.input_tokens = 10
+        mock_response.usage.output_tokens = 5
+        mock_response.usage.cache_creation_input_tokens = 3000
+        mock_response.usage.cache_read_input_tokens = 0
+        mock_response.model = "claude-haiku-4-5"
+        mock_response.stop_reason = "end_turn"
+
+        mock_client = AsyncMock()
+        mock_client.messages.create = AsyncMock(return_value=mock_response)
+        provider._async_client_impl = mock_client
+
+        response = await provider.call_async(
+            prompt="Per-file task", cached_prefix="Shared design spec"
+        )
+
+        content = mock_client.messages.create.call_args[1]["messages"][0]["content"]
+        assert content[0]["text"] == "Shared design spec"
+        assert content[0]["cache_control"] == {"type": "ephemeral"}
+        assert content[1]["text"] == "Per-file task"
+        assert response.usage["cache_creation_input_tokens"] == 3000
+        assert response.cost > provider.estimate_cost("claude-haiku-4-5", 10, 5)
+
+    @pytest.mark.asyncio
+    async def test_stream_async_yields_text_deltas(self):
+        """Test stream_async forwards text deltas from messages.stream."""
+        from asp.providers.anthropic_provider import AnthropicProvider
+
+        provider = AnthropicProvider(ProviderConfig(api_key="test-key"))
+
+        async def text_stream():
+            for delta in ['{"files"', ": []}"]:
+                yield delta
+
+        stream = MagicMock()
+        stream.text_stream = text_stream()
+        stream_manager = MagicMock()
+        stream_manager.__aenter__ = AsyncMock(return_value=stream)
+        stream_manager.__aexit__ = AsyncMock(return_value=False)
+
+        mock_client = MagicMock()
+        mock_client.messages.stream = MagicMock(return_value=stream_manager)
+        provider._async_client_impl = mock_client
+
+        deltas = [d async for d in provider.stream_async("Test prompt")]
+
+        assert deltas == ['{"files"', ": []}"]
+        assert mock_client.messages.stream.call_args[1]["messages"][0]["role"] == "user"
+
+    @pytest.mark.asyncio
+    async def test_stream_async_default_yields_full_response(self):
+        """Test the base stream_async falls back to a single call_async chunk."""
+        from asp.providers.anthropic_provider import AnthropicProvider
+        from asp.providers.base import LLMProvider
+
+        provider = AnthropicProvider(ProviderConfig(api_key="test-key"))
+        provider.call_async = AsyncMock(
+            return_value=LLMResponse(
+                content="whole",
+                raw_content="whole",
+                usage={"input_tokens": 1, "output_tokens": 1},
+                cost=0.0,
+                model="m",
+                provider="anthropic",
+            )
+        )
+
+        deltas = [d async for d in LLMProvider.stream_async(provider, "Test prompt")]
+
+        assert deltas == ["whole"]
+
+    def test_join_cached_prefix(self):
+        """Test prefix joining used by providers without cache breakpoints."""
+        from asp.providers.base import LLMProvider
+
+        assert LLMProvider.join_cached_prefix("task", None) == "task"
+        assert LLMProvider.join_cached_prefix("task", "spec") == "spec\n\ntask"
+
 
 class TestOpenRouterProvider:
     """Tests for OpenRouterProvider."""
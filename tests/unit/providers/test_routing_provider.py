@@ -0,0 +1,363 @@
+"""
+Unit tests for the latency-aware RoutingProvider.
+
+Tests cover:
+- Rolling latency/error statistics
+- Target ranking and failover
+- Hedged requests and loser cancellation
+- Environment/registry configuration
+- Routing statistics telemetry
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import asyncio
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from asp.providers import (
+    LLMProvider,
+    LLMResponse,
+    ProviderConfig,
+    ProviderRegistry,
+    RouteTarget,
+    RoutingProvider,
+)
+from asp.providers.errors import ProviderError, RateLimitError
+from asp.providers.routing_provider import RouteStats, parse_target_specs
+from asp.telemetry.writer import flush_telemetry
+
+SCHEMA = Path(__file__).parents[3] / "database" / "sqlite" / "create_tables.sql"
+
+
+class StubProvider(LLMProvider):
+    """Local provider answering after a fixed delay, optionally failing."""
+
+    def __init__(self, config=None, name="stub", delay=0.0, error=None, models=None):
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.models = models or [f"{name}-model"]
+        self._default_model = self.models[0]
+        self.calls: list[str | None] = []
+        self.cancelled = 0
+
+    def _response(self, model):
+        text = f"from {self.name}"
+        return LLMResponse(
+            content=text,
+            raw_content=text,
+            usage={"input_tokens": 1, "output_tokens": 1},
+            cost=0.0,
+            model=model or self._default_model,
+            provider=self.name,
+        )
+
+    def call(self, prompt, model=None, **kwargs):
+        self.calls.append(model)
+        if self.error:
+            raise self.error
+        return self._response(model)
+
+    async def call_async(self, prompt, model=None, **kwargs):
+        self.calls.append(model)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error:
+            raise self.error
+        return self._response(model)
+
+    def estimate_cost(self, model, input_tokens, output_tokens):
+        return 0.0
+
+    @property
+    def available_models(self):
+        return list(self.models)
+
+
+def _router(*providers, **kwargs):
+    kwargs.setdefault("hedge", False)
+    kwargs.setdefault("hedge_min_delay", 0.0)
+    return RoutingProvider(targets=list(providers), **kwargs)
+
+
+class TestRouteStats:
+    """Tests for rolling statistics."""
+
+    def test_percentiles_and_error_rate(self):
+        stats = RouteStats(window=10)
+        for latency in (0.1, 0.2, 0.3, 0.4):
+            stats.record(latency, ok=True)
+        stats.record(5.0, ok=False)
+
+        assert stats.percentile(50) == 0.2
+        assert stats.percentile(95) == 0.4
+        assert stats.error_rate == pytest.approx(0.2)
+        assert stats.to_dict()["p50_ms"] == 200.0
+
+    def test_window_drops_old_samples(self):
+        stats = RouteStats(window=2)
+        for latency in (9.0, 0.1, 0.2):
+            stats.record(latency, ok=True)
+        assert stats.percentile(100) == 0.2
+        assert stats.calls == 3
+
+    def test_untried_target_scores_best(self):
+        stats = RouteStats()
+        assert stats.score() == 0.0
+        stats.record(0.5, ok=False)
+        assert stats.score() > 0.5
+
+    def test_parse_target_specs(self):
+        assert parse_target_specs("anthropic, groq:llama-3.1-8b-instant,,") == [
+            ("anthropic", None),
+            ("groq", "llama-3.1-8b-instant"),
+        ]
+
+
+class TestRouting:
+    """Tests for ranking, model selection and failover."""
+
+    def test_routes_to_fastest_observed_target(self):
+        slow = StubProvider(name="slow", delay=0.05)
+        fast = StubProvider(name="fast", delay=0.0)
+        router = _router(slow, fast)
+
+        async def run():
+            # First two calls probe each untried target in order
+            await router.call_async("a")
+            await router.call_async("b")
+            return await router.call_async("c")
+
+        response = asyncio.run(run())
+
+        assert response.provider == "fast"
+        assert response.metadata["routing"]["route"] == "fast:fast-model"
+        assert [t.provider.name for t in router.ranked_targets()] == ["fast", "slow"]
+
+    def test_sync_call_fails_over(self):
+        broken = StubProvider(name="broken", error=ProviderError("boom"))
+        healthy = StubProvider(name="healthy")
+        router = _router(broken, healthy)
+
+        response = router.call("prompt")
+
+        assert response.provider == "healthy"
+        assert response.metadata["routing"]["attempts"] == 2
+        assert router.routing_stats()["broken:broken-model"]["errors"] == 1
+
+    def test_all_targets_failing_raises(self):
+        router = _router(
+            StubProvider(name="a", error=ProviderError("down")),
+            StubProvider(name="b", error=ProviderError("down")),
+        )
+        with pytest.raises(ProviderError, match="All 2 routes failed") as exc:
+            asyncio.run(router.call_async("prompt"))
+        assert len(exc.value.details["errors"]) == 2
+
+    def test_rate_limited_target_tried_last(self):
+        limited = StubProvider(
+            name="limited", error=RateLimitError("429", retry_after=60)
+        )
+        other = StubProvider(name="other")
+        router = _router(limited, other)
+
+        router.call("one")
+        limited.error = None
+        response = router.call("two")
+
+        assert response.provider == "other"
+        assert len(limited.calls) == 1
+
+    def test_model_pinning_and_passthrough(self):
+        provider = StubProvider(name="p", models=["small", "large"])
+        pinned = _router(RouteTarget(provider, model="large"))
+        unpinned = _router(provider)
+
+        pinned.call("x", model="small")
+        unpinned.call("x", model="large")
+        unpinned.call("x", model="unknown-model")
+
+        assert provider.calls == ["large", "large", None]
+        assert "large" in pinned.available_models
+
+    def test_stream_fails_over_before_first_delta(self):
+        broken = StubProvider(name="broken", error=ProviderError("boom"))
+        router = _router(broken, StubProvider(name="healthy"))
+
+        async def run():
+            return [delta async for delta in router.stream_async("prompt")]
+
+        assert asyncio.run(run()) == ["from healthy"]
+
+
+class TestHedging:
+    """Tests for hedged duplicate requests."""
+
+    def test_hedge_wins_and_cancels_slow_primary(self):
+        slow = StubProvider(name="slow", delay=5.0)
+        fast = StubProvider(name="fast", delay=0.01)
+        router = _router(slow, fast, hedge=True, hedge_initial_delay=0.05)
+
+        response = asyncio.run(asyncio.wait_for(router.call_async("p"), timeout=2))
+
+        assert response.provider == "fast"
+        assert response.metadata["routing"]["hedged"] is True
+        assert slow.cancelled == 1
+        stats = router.routing_stats()["slow:slow-model"]
+        assert stats["hedges_fired"] == 1
+        assert stats["hedges_won"] == 1
+        # Loser is a censored sample: ranked by it, but kept out of p50/p95
+        assert stats["cancelled"] == 1
+        assert stats["p50_ms"] is None
+        assert router.ranked_targets()[0].provider is fast
+
+    def test_no_hedge_when_primary_is_fast(self):
+        primary = StubProvider(name="primary", delay=0.0)
+        backup = StubProvider(name="backup", delay=0.0)
+        router = _router(primary, backup, hedge=True, hedge_initial_delay=1.0)
+
+        response = asyncio.run(router.call_async("p"))
+
+        assert response.provider == "primary"
+        assert response.metadata["routing"]["hedged"] is False
+        assert backup.calls == []
+
+    def test_hedge_delay_follows_percentile(self):
+        provider = StubProvider(name="p")
+        router = _router(
+            provider, StubProvider(name="q"), hedge=True, hedge_min_delay=0.01
+        )
+        target = router.targets[0]
+        for latency in (0.1, 0.2, 0.3, 0.4, 2.0):
+            router._stats[target.name].record(latency, ok=True)
+
+        assert router._hedge_delay(target) == 2.0
+        router.hedge_percentile = 50
+        assert router._hedge_delay(target) == 0.3
+
+    def test_primary_wins_when_hedge_fails(self):
+        slowish = StubProvider(name="slowish", delay=0.1)
+        broken = StubProvider(name="broken", error=ProviderError("boom"))
+        router = _router(slowish, broken, hedge=True, hedge_initial_delay=0.01)
+
+        response = asyncio.run(router.call_async("p"))
+
+        assert response.provider == "slowish"
+        assert router.routing_stats()["slowish:slowish-model"]["hedges_won"] == 0
+
+
+class TestConfiguration:
+    """Tests for environment and registry configuration."""
+
+    def test_registry_builds_router_from_env(self, monkeypatch):
+        fast = StubProvider(name="fast")
+        monkeypatch.setattr(
+            ProviderRegistry, "_instances", dict(ProviderRegistry._instances)
+        )
+        monkeypatch.setitem(ProviderRegistry._instances, "stubfast:default", fast)
+        ProviderRegistry._ensure_builtin_providers()
+        monkeypatch.setitem(ProviderRegistry._providers, "stubfast", StubProvider)
+        monkeypatch.setenv("ASP_ROUTER_PROVIDERS", "stubfast:pinned")
+        monkeypatch.setenv("ASP_ROUTER_HEDGE", "true")
+
+        router = ProviderRegistry.get("router", force_new=True)
+
+        assert isinstance(router, RoutingProvider)
+        assert router.hedge is True
+        assert router.targets[0].provider is fast
+        assert router.targets[0].model == "pinned"
+
+    def test_config_extra_overrides_env(self, monkeypatch):
+        monkeypatch.setenv("ASP_ROUTER_HEDGE", "true")
+        router = RoutingProvider(
+            ProviderConfig(extra={"hedge": False, "window": 3}),
+            targets=[StubProvider()],
+        )
+        assert router.hedge is False
+
+    def test_router_cannot_target_itself(self):
+        with pytest.raises(ProviderError, match="itself"):
+            RoutingProvider(ProviderConfig(extra={"targets": "router"}))
+
+
+class TestTelemetry:
+    """Tests for persisting routing statistics."""
+
+    def test_log_routing_stats(self, tmp_path):
+        db_path = tmp_path / "telemetry.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.executescript(SCHEMA.read_text())
+
+        slow = StubProvider(name="slow", delay=5.0)
+        router = _router(
+            slow, StubProvider(name="fast"), hedge=True, hedge_initial_delay=0.01
+        )
+        asyncio.run(router.call_async("p"))
+        router.log_routing_stats("TASK-1", "Code", db_path=db_path)
+        flush_telemetry()
+
+        with sqlite3.connect(db_path) as conn:
+            rows = dict(
+                conn.execute(
+                    "SELECT metric_type || ':' || llm_provider, metric_value "
+                    "FROM agent_cost_vector"
+                ).fetchall()
+            )
+
+        assert rows["Hedges_Fired:slow"] == 1
+        assert rows["Hedges_Won:slow"] == 1
+        assert "Route_Latency_P50:fast" in rows
+        assert "Route_Latency_P95:slow" not in rows  # Only a cancelled call
+
+    def test_counts_are_logged_once(self, tmp_path):
+        db_path = tmp_path / "telemetry.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.executescript(SCHEMA.read_text())
+        router = _router(StubProvider(name="ok"), StubProvider(name="spare"))
+
+        router.call("p")
+        router.log_routing_stats("TASK-1", "Code", db_path=db_path)
+        router.log_routing_stats("TASK-1", "Code", db_path=db_path)
+        router.call("p")
+        router.log_routing_stats("TASK-2", "Code", db_path=db_path)
+        flush_telemetry()
+
+        with sqlite3.connect(db_path) as conn:
+            tasks = conn.execute(
+                "SELECT task_id FROM agent_cost_vector "
+                "WHERE metric_type = 'Route_Errors' ORDER BY id"
+            ).fetchall()
+
+        assert tasks == [("TASK-1",), ("TASK-2",)]
+
+    def test_tracked_execution_logs_routing_stats(self, tmp_path, monkeypatch):
+        from asp.telemetry import telemetry
+
+        db_path = tmp_path / "telemetry.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.executescript(SCHEMA.read_text())
+        monkeypatch.setattr(telemetry, "DEFAULT_DB_PATH", db_path)
+        monkeypatch.setenv("ASP_TELEMETRY_WRITER", "sync")
+        router = _router(StubProvider(name="routed"))
+
+        @telemetry.track_agent_cost(agent_role="Code", task_id_param="task_id")
+        def execute(task_id):
+            return router.call("p")
+
+        execute(task_id="TASK-9")
+
+        with sqlite3.connect(db_path) as conn:
+            rows = conn.execute(
+                "SELECT task_id, agent_role FROM agent_cost_vector "
+                "WHERE metric_type = 'Route_Latency_P50' "
+                "AND llm_provider = 'routed'"
+            ).fetchall()
+
+        assert rows == [("TASK-9", "Code")]
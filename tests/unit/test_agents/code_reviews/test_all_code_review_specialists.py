@@ -656,3 +656,33 @@ class TestAllSpecialists:
         assert "improvement_suggestions" in result
         assert isinstance(result["issues_found"], list)
         assert isinstance(result["improvement_suggestions"], list)
+
+    def test_all_agents_share_cached_code_prefix(self):
+        """Test that all specialists send the same code prefix for prompt caching."""
+        generated_code = create_test_generated_code_with_issues()
+        prefixes = set()
+        prompts = set()
+
+        for agent_class in [
+            CodeQualityReviewAgent,
+            CodeSecurityReviewAgent,
+            CodePerformanceReviewAgent,
+            TestCoverageReviewAgent,
+            DocumentationReviewAgent,
+            BestPracticesReviewAgent,
+        ]:
+            mock_llm = Mock()
+            mock_llm.call_with_retry.return_value = create_mock_llm_response(
+                issues_found=[],
+                suggestions=[],
+            )
+            agent_class(llm_client=mock_llm).execute(generated_code)
+
+            call_kwargs = mock_llm.call_with_retry.call_args[1]
+            prefixes.add(call_kwargs["cached_prefix"])
+            prompts.add(call_kwargs["prompt"])
+
+        assert len(prefixes) == 1
+        assert "hardcoded_secret_123" in prefixes.pop()
+        assert len(prompts) == 6
+        assert all("hardcoded_secret_123" not in p for p in prompts)
@@ -8,13 +8,15 @@ Tests the BaseAgent abstract class functionality including:
 - Error handling
 """
 
+import asyncio
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from pydantic import BaseModel, ValidationError
 
 from asp.agents.base_agent import AgentExecutionError, BaseAgent
+from asp.utils.json_extraction import JSONExtractionError
 
 
 # Test data models
@@ -262,6 +264,22 @@ class TestCallLLM:
             custom_param="custom_value",
         )
 
+    def test_call_llm_counts_continuations(self):
+        """Test continuation calls are accumulated for telemetry."""
+        agent = ConcreteAgent()
+        mock_client = Mock()
+        mock_client.call_with_retry.return_value = {
+            "content": "long output",
+            "usage": {"input_tokens": 100, "output_tokens": 50},
+            "continuations": 2,
+        }
+        agent._llm_client = mock_client
+
+        agent.call_llm(prompt="Test prompt")
+        agent.call_llm(prompt="Test prompt", temperature=0.5)
+
+        assert agent._last_llm_usage["continuations"] == 4
+
     def test_call_llm_handles_exception(self):
         """Test call_llm raises AgentExecutionError on failure."""
         agent = ConcreteAgent()
@@ -289,6 +307,108 @@ class TestCallLLM:
         assert exc_info.value.__cause__ == original_error
 
 
+class TestStructuredOutput:
+    """Test the opt-in structured output mode of call_llm."""
+
+    def _agent(self, response, structured=True):
+        agent = ConcreteAgent()
+        agent.structured_output = structured
+        mock_client = Mock(spec=["call_with_retry"])
+        mock_client.call_with_retry.return_value = response
+        agent._llm_client = mock_client
+        return agent, mock_client
+
+    def test_disabled_sends_no_schema(self):
+        agent, client = self._agent({"content": "x"}, structured=False)
+
+        agent.call_llm(prompt="p", response_model=TestOutputModel)
+
+        assert "tools" not in client.call_with_retry.call_args.kwargs
+        assert "response_format" not in client.call_with_retry.call_args.kwargs
+
+    def test_enabled_validates_raw_content(self):
+        raw = '{"result": "ok", "status": "done"}'
+        agent, client = self._agent({"content": {}, "raw_content": raw})
+
+        result = agent.call_llm(prompt="p", response_model=TestOutputModel)
+
+        assert result["content"] == {"result": "ok", "status": "done"}
+        assert "tools" in client.call_with_retry.call_args.kwargs
+        assert agent._last_llm_usage["structured_output"] is True
+
+    def test_schema_mismatch_counts_parse_failure(self):
+        agent, _ = self._agent({"content": {}, "raw_content": '{"result": 1}'})
+
+        with pytest.raises(AgentExecutionError, match="TestOutputModel"):
+            agent.call_llm(prompt="p", response_model=TestOutputModel)
+
+        assert agent._llm_call_stats["parse_failures"] == 1
+        assert agent._last_llm_usage["parse_failures"] == 1
+
+    def test_parse_json_response_counts_failures(self):
+        agent, _ = self._agent({"content": "not json"}, structured=False)
+        response = agent.call_llm(prompt="p")
+
+        with pytest.raises(JSONExtractionError):
+            agent.parse_json_response(response)
+        agent.record_retry()
+
+        assert agent._last_llm_usage["parse_failures"] == 1
+        assert agent._last_llm_usage["retries"] == 1
+
+
+class TestCallLLMStreaming:
+    """Test call_llm_streaming_async method."""
+
+    def test_streams_deltas_from_client(self):
+        """Test text deltas are forwarded and the final response returned."""
+        agent = ConcreteAgent()
+        mock_client = Mock()
+        final = {"content": "hello world", "raw_content": "hello world", "usage": {}}
+
+        async def fake_stream(prompt, on_text, **kwargs):
+            on_text("hello ")
+            on_text("world")
+            return final
+
+        mock_client.call_streaming_async = fake_stream
+        agent._llm_client = mock_client
+        deltas = []
+
+        result = asyncio.run(
+            agent.call_llm_streaming_async("Test prompt", on_text=deltas.append)
+        )
+
+        assert result == final
+        assert deltas == ["hello ", "world"]
+
+    def test_falls_back_to_non_streaming_client(self):
+        """Test clients without streaming deliver the full text once."""
+        agent = ConcreteAgent()
+        mock_client = Mock(spec=["call_with_retry_async"])
+        mock_client.call_with_retry_async = AsyncMock(
+            return_value={"content": "full", "raw_content": "full", "usage": {}}
+        )
+        agent._llm_client = mock_client
+        deltas = []
+
+        asyncio.run(
+            agent.call_llm_streaming_async("Test prompt", on_text=deltas.append)
+        )
+
+        assert deltas == ["full"]
+
+    def test_wraps_errors(self):
+        """Test streaming failures raise AgentExecutionError."""
+        agent = ConcreteAgent()
+        mock_client = Mock()
+        mock_client.call_streaming_async = AsyncMock(side_effect=Exception("boom"))
+        agent._llm_client = mock_client
+
+        with pytest.raises(AgentExecutionError, match="streaming LLM call: boom"):
+            asyncio.run(agent.call_llm_streaming_async("Test prompt", on_text=print))
+
+
 class TestValidateOutput:
     """Test validate_output method."""
 
@@ -12,8 +12,9 @@ Author: ASP Development Team
 Date: November 20, 2025
 """
 
+import asyncio
 import json
-from unittest.mock import patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from pydantic import ValidationError
@@ -22,6 +23,7 @@ from asp.agents.base_agent import AgentExecutionError
 from asp.agents.code_agent import CodeAgent
 from asp.models.code import CodeInput, FileManifest, FileMetadata
 from asp.models.design import APIContract, ComponentLogic, DesignSpecification
+from asp.utils.llm_cache import LLMResponseCache
 
 # =============================================================================
 # Test Fixtures
@@ -379,6 +381,163 @@ def test_generate_file_manifest_handles_malformed_json_fence(
     assert "Failed to parse manifest JSON" in str(exc_info.value)
 
 
+def test_build_file_generation_prompts_splits_shared_context():
+    """Test design context is shared across files and file prompt is per-file."""
+    agent = CodeAgent()
+    input_data = create_test_code_input()
+    files = [
+        FileMetadata(
+            file_path=path,
+            file_type="source",
+            description="File generated from the shared design specification",
+            estimated_lines=50,
+        )
+        for path in ("main.py", "tests/test_main.py")
+    ]
+
+    context_a, prompt_a = agent._build_file_generation_prompts(files[0], input_data)
+    context_b, prompt_b = agent._build_file_generation_prompts(files[1], input_data)
+
+    assert context_a == context_b
+    assert "Follow PEP 8" in context_a
+    assert "HELLO-WORLD-001" in context_a
+    # Design spec JSON is inserted verbatim (no doubled braces)
+    assert "{{" not in context_a.split("# DESIGN CONTEXT")[1]
+    assert "main.py" in prompt_a
+    assert "tests/test_main.py" in prompt_b
+    assert "HELLO-WORLD-001" not in prompt_a
+
+
+def test_streaming_manifest_starts_files_before_manifest_completes():
+    """Test streamed manifest entries start file generation early."""
+    agent = CodeAgent(use_multi_stage=True, use_streaming=True)
+    input_data = create_test_code_input()
+    manifest_text = json.dumps(create_mock_manifest_response())
+    events = []
+
+    async def fake_streaming_call(prompt, on_text, **kwargs):
+        midpoint = manifest_text.index("tests/test_main.py")
+        on_text(manifest_text[:midpoint])
+        events.append("manifest-half")
+        await asyncio.sleep(0)
+        on_text(manifest_text[midpoint:])
+        events.append("manifest-done")
+        return {"content": json.loads(manifest_text)}
+
+    async def fake_file_content(file_meta, input_data):
+        events.append(f"file:{file_meta.file_path}")
+        return f"# {file_meta.file_path}\nprint('generated')\n"
+
+    with (
+        patch.object(agent, "load_prompt", return_value="Manifest for {task_id}"),
+        patch.object(
+            agent, "call_llm_streaming_async", side_effect=fake_streaming_call
+        ),
+        patch.object(
+            agent, "_generate_file_content_async", side_effect=fake_file_content
+        ),
+    ):
+        result = asyncio.run(agent._generate_code_multi_stage_async(input_data))
+
+    assert [f.file_path for f in result.files] == [
+        "main.py",
+        "tests/test_main.py",
+        "requirements.txt",
+        "README.md",
+    ]
+    assert events.index("file:main.py") < events.index("manifest-done")
+
+
+def test_streaming_manifest_cancels_files_dropped_from_final_manifest():
+    """Test files absent from the validated manifest are not returned."""
+    agent = CodeAgent(use_multi_stage=True, use_streaming=True)
+    input_data = create_test_code_input()
+    final_manifest = create_mock_manifest_response()
+
+    async def fake_streaming_call(prompt, on_text, **kwargs):
+        on_text('{"files": [{"file_path": "stale.py", "file_type": "source", ')
+        on_text('"description": "File that the final manifest drops", ')
+        on_text('"estimated_lines": 10}')
+        return {"content": final_manifest}
+
+    async def fake_file_content(file_meta, input_data):
+        return f"# {file_meta.file_path}\nprint('generated')\n"
+
+    with (
+        patch.object(agent, "load_prompt", return_value="Manifest for {task_id}"),
+        patch.object(
+            agent, "call_llm_streaming_async", side_effect=fake_streaming_call
+        ),
+        patch.object(
+            agent, "_generate_file_content_async", side_effect=fake_file_content
+        ),
+    ):
+        result = asyncio.run(agent._generate_code_multi_stage_async(input_data))
+
+    assert "stale.py" not in [f.file_path for f in result.files]
+    assert result.total_files == 4
+
+
+@pytest.mark.parametrize("use_streaming", [False, True])
+def test_failed_file_does_not_cancel_other_files(use_streaming):
+    """Test one failing file is reported after the other files finish."""
+    agent = CodeAgent(use_multi_stage=True, use_streaming=use_streaming)
+    input_data = create_test_code_input()
+    manifest = create_mock_manifest_response()
+    finished = []
+
+    async def fake_streaming_call(prompt, on_text, **kwargs):
+        on_text(json.dumps(manifest))
+        return {"content": manifest}
+
+    async def fake_file_content(file_meta, input_data):
+        if file_meta.file_path == "main.py":
+            raise AgentExecutionError("Failed to generate content for main.py")
+        await asyncio.sleep(0.01)
+        finished.append(file_meta.file_path)
+        return f"# {file_meta.file_path}\n"
+
+    with (
+        patch.object(agent, "load_prompt", return_value="Manifest for {task_id}"),
+        patch.object(
+            agent, "call_llm_streaming_async", side_effect=fake_streaming_call
+        ),
+        patch.object(
+            agent, "call_llm_async", AsyncMock(return_value={"content": manifest})
+        ),
+        patch.object(
+            agent, "_generate_file_content_async", side_effect=fake_file_content
+        ),
+    ):
+        with pytest.raises(AgentExecutionError, match="Failed to generate 1 files"):
+            asyncio.run(agent._generate_code_multi_stage_async(input_data))
+
+    assert sorted(finished) == ["README.md", "requirements.txt", "tests/test_main.py"]
+
+
+def test_rejected_file_content_is_not_replayed_from_cache(tmp_path):
+    """Test a deterministic retry reaches the LLM instead of the cached reject."""
+    client = Mock()
+    client.call_with_retry.side_effect = [
+        {"raw_content": "short"},
+        {"raw_content": "print('Hello World')\n"},
+    ]
+    agent = CodeAgent(llm_client=client, use_multi_stage=True)
+    agent._llm_cache = LLMResponseCache(tmp_path / "cache.db")
+    file_meta = FileMetadata(
+        file_path="main.py",
+        file_type="source",
+        description="FastAPI application with the /hello endpoint",
+        estimated_lines=10,
+    )
+
+    content = agent._generate_file_content(file_meta, create_test_code_input())
+
+    assert content == "print('Hello World')"
+    assert client.call_with_retry.call_count == 2
+    assert agent._llm_cache.stats()["entries"] == 1
+
+
 def test_file_metadata_validation():
     """Test FileMetadata Pydantic model validation."""
     # Valid metadata
@@ -459,3 +618,92 @@ def test_file_manifest_validation():
             setup_instructions="Test",
             total_files=0,  # Must be > 0
         )
+
+
+def _generated_code_for_regeneration():
+    """GeneratedCode with two files for targeted regeneration tests."""
+    from asp.models.code import GeneratedCode, GeneratedFile
+
+    files = [
+        GeneratedFile(
+            file_path=path,
+            content=f"# {path}\nprint('original')\n",
+            file_type="source",
+            description="File generated from the shared design specification",
+        )
+        for path in ("main.py", "tests/test_main.py")
+    ]
+    return GeneratedCode(
+        task_id="HELLO-WORLD-001",
+        files=files,
+        file_structure={".": ["main.py"], "tests": ["test_main.py"]},
+        implementation_notes=(
+            "Hello World API with a single endpoint and a pytest suite for it"
+        ),
+        total_files=2,
+        total_lines_of_code=4,
+    )
+
+
+def test_regenerate_files_revises_only_files_with_feedback():
+    """Test regenerate_files sends feedback and previous content for one file."""
+    agent = CodeAgent(use_multi_stage=True)
+    input_data = create_test_code_input()
+    generated_code = _generated_code_for_regeneration()
+    prompts = []
+
+    def fake_call_llm(prompt, **kwargs):
+        prompts.append(prompt)
+        return {"raw_content": "# main.py\nprint('fixed')\nprint('done')\n"}
+
+    with (
+        patch.object(agent, "call_llm", side_effect=fake_call_llm),
+        patch.object(agent, "_write_artifacts"),
+    ):
+        result = agent.regenerate_files(
+            input_data, generated_code, {"main.py": "- SEC-001: unsafe print"}
+        )
+
+    assert len(prompts) == 1
+    assert "**File Path:** main.py" in prompts[0]
+    assert "SEC-001: unsafe print" in prompts[0]
+    assert "print('original')" in prompts[0]
+    assert "print('fixed')" in result.files[0].content
+    assert result.files[1] == generated_code.files[1]
+    assert result.total_lines_of_code == 5
+
+
+def test_regenerate_files_rejects_unknown_paths():
+    """Test feedback for a file that was never generated is an error."""
+    agent = CodeAgent(use_multi_stage=True)
+
+    with pytest.raises(AgentExecutionError, match="not in the generated code"):
+        agent.regenerate_files(
+            create_test_code_input(),
+            _generated_code_for_regeneration(),
+            {"missing.py": "- Missing module"},
+        )
+
+
+def test_regenerate_files_async():
+    """Test async regeneration splices revised files in manifest order."""
+    agent = CodeAgent(use_multi_stage=True)
+    generated_code = _generated_code_for_regeneration()
+
+    async def fake_file_content(file_meta, input_data, **kwargs):
+        assert kwargs["previous_content"].startswith(f"# {file_meta.file_path}")
+        return f"# {file_meta.file_path}\nprint('fixed')\n"
+
+    with patch.object(
+        agent, "_generate_file_content_async", side_effect=fake_file_content
+    ):
+        result = asyncio.run(
+            agent.regenerate_files_async(
+                create_test_code_input(),
+                generated_code,
+                {"tests/test_main.py": "- TEST-001", "main.py": "- QUAL-001"},
+            )
+        )
+
+    assert [f.file_path for f in result.files] == ["main.py", "tests/test_main.py"]
+    assert all("print('fixed')" in f.content for f in result.files)
@@ -698,3 +698,28 @@ def test_orchestrator_end_to_end_with_mocked_specialists():
     # Verify all specialists were called
     for specialist in orchestrator.specialists.values():
         specialist.execute.assert_called_once()
+
+
+@patch.object(CodeReviewOrchestrator, "_dispatch_specialists")
+def test_review_changed_files_merges_with_previous_report(mock_dispatch):
+    """Test only changed files are re-reviewed and other issues carry over."""
+    orchestrator = CodeReviewOrchestrator()
+    generated_code = create_test_generated_code()
+    mock_dispatch.return_value = create_mock_specialist_results()
+    previous_report = orchestrator.execute(generated_code)
+
+    # The regenerated auth.py is clean; tests/test_auth.py keeps its High issue
+    mock_dispatch.reset_mock()
+    mock_dispatch.return_value = {}
+    report = orchestrator.review_changed_files(
+        generated_code, previous_report, {"src/api/auth.py"}
+    )
+
+    reviewed_code = mock_dispatch.call_args.args[0]
+    assert [f.file_path for f in reviewed_code.files] == ["src/api/auth.py"]
+    assert [issue.file_path for issue in report.issues_found] == ["tests/test_auth.py"]
+    assert report.critical_issues == 0
+    assert report.high_issues == 1
+    assert report.review_status == "CONDITIONAL_PASS"
+    assert report.files_reviewed == 2
+    assert all(s.file_path != "src/api/auth.py" for s in report.improvement_suggestions)
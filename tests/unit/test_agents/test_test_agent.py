@@ -26,7 +26,7 @@ from asp.models.design import (
     DesignReviewChecklistItem,
     DesignSpecification,
 )
-from asp.models.test import TestInput, TestReport
+from asp.models.test import TestDefect, TestInput, TestReport
 
 # =============================================================================
 # Fixtures
@@ -1127,3 +1127,153 @@ class TestTestAgentEdgeCases:
 
         assert result.test_summary["skipped"] == 2
         assert result.test_status == "PASS"  # Skipped tests don't cause failure
+
+
+# =============================================================================
+# Targeted Re-test Tests
+# =============================================================================
+
+
+class TestTestAgentTargetedRetest:
+    """Tests for resolve_defect_files and retest_files."""
+
+    @pytest.fixture
+    def code(self, mock_generated_code):
+        def file(path, file_type, content, component_id="COMP-001"):
+            return GeneratedFile(
+                file_path=path,
+                content=content,
+                file_type=file_type,
+                component_id=component_id,
+                description="Generated file for targeted re-test tests",
+            )
+
+        return mock_generated_code.model_copy(
+            update={
+                "files": [
+                    file("src/calculator.py", "source", "def add(a, b): ..."),
+                    file("src/utils.py", "source", "def clamp(x): ...", "COMP-002"),
+                    file(
+                        "tests/test_calculator.py",
+                        "test",
+                        "from src.calculator import add",
+                    ),
+                    file(
+                        "tests/test_utils.py",
+                        "test",
+                        "from src.utils import clamp",
+                        "COMP-002",
+                    ),
+                ],
+                "total_files": 4,
+            }
+        )
+
+    @staticmethod
+    def _defect(defect_id, **fields):
+        return TestDefect(
+            defect_id=defect_id,
+            defect_type="6_Conventional_Code_Bug",
+            severity="High",
+            description=fields.pop("description", "Function returns a wrong result"),
+            evidence=fields.pop("evidence", "AssertionError: expected 3, got 4"),
+            phase_injected="Code",
+            **fields,
+        )
+
+    @staticmethod
+    def _report(*defects, failed=0, total=6):
+        return TestReport(
+            task_id="TEST-001",
+            test_status="FAIL" if defects or failed else "PASS",
+            build_successful=True,
+            test_summary={
+                "total_tests": total,
+                "passed": total - failed,
+                "failed": failed,
+                "skipped": 0,
+            },
+            defects_found=list(defects),
+            test_files_created=["tests/test_calculator.py"],
+            test_timestamp="2026-10-16T12:00:00Z",
+        )
+
+    def test_resolve_defect_files(self, code):
+        resolve = TestAgent.resolve_defect_files
+        assert resolve(
+            self._defect("TEST-DEFECT-001", file_path="./src/utils.py"), code
+        ) == {"src/utils.py"}
+        assert resolve(
+            self._defect(
+                "TEST-DEFECT-002",
+                evidence='File "src/calculator.py", line 1, in add',
+            ),
+            code,
+        ) == {"src/calculator.py"}
+        assert resolve(
+            self._defect("TEST-DEFECT-003", description="utils.py clamps wrongly"),
+            code,
+        ) == {"src/utils.py"}
+        assert resolve(
+            self._defect("TEST-DEFECT-004", component_id="COMP-002"), code
+        ) == {"src/utils.py", "tests/test_utils.py"}
+        assert resolve(self._defect("TEST-DEFECT-005"), code) == set()
+
+    @patch.object(TestAgent, "_write_artifacts")
+    @patch.object(TestAgent, "_generate_and_execute_tests")
+    def test_retest_files_scopes_and_merges(
+        self, mock_generate, mock_write, mock_test_input, code
+    ):
+        previous = self._report(
+            self._defect("TEST-DEFECT-001", file_path="src/calculator.py"),
+            self._defect("TEST-DEFECT-002", file_path="src/utils.py"),
+            failed=2,
+        )
+        mock_generate.return_value = self._report(
+            self._defect("TEST-DEFECT-001", file_path="src/calculator.py"),
+            failed=1,
+            total=3,
+        )
+        test_input = mock_test_input.model_copy(update={"generated_code": code})
+
+        report = TestAgent(llm_client=Mock()).retest_files(
+            test_input, previous, {"src/calculator.py"}
+        )
+
+        scoped_code = mock_generate.call_args.args[0].generated_code
+        assert [file.file_path for file in scoped_code.files] == [
+            "src/calculator.py",
+            "tests/test_calculator.py",
+        ]
+        assert scoped_code.total_files == 2
+        assert [(d.defect_id, d.file_path) for d in report.defects_found] == [
+            ("TEST-DEFECT-001", "src/utils.py"),
+            ("TEST-DEFECT-002", "src/calculator.py"),
+        ]
+        assert report.test_status == "FAIL"
+        assert report.test_summary == {
+            "total_tests": 6,
+            "passed": 5,
+            "failed": 1,
+            "skipped": 0,
+        }
+        mock_write.assert_called_once_with(report)
+
+    @pytest.mark.asyncio
+    @patch.object(TestAgent, "_generate_and_execute_tests_async")
+    async def test_retest_files_async_clears_fixed_defects(
+        self, mock_generate, mock_test_input, code
+    ):
+        previous = self._report(
+            self._defect("TEST-DEFECT-001", file_path="src/utils.py"), failed=1
+        )
+        mock_generate.return_value = self._report(total=2)
+        test_input = mock_test_input.model_copy(update={"generated_code": code})
+
+        report = await TestAgent(llm_client=Mock()).retest_files_async(
+            test_input, previous, {"src/utils.py"}
+        )
+
+        assert report.test_status == "PASS"
+        assert report.defects_found == []
+        assert report.test_summary["passed"] == 6
@@ -0,0 +1,106 @@
+"""Tests for asp.cli.telemetry_commands module."""
+
+import argparse
+import sqlite3
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+CREATE_TABLES = (
+    Path(__file__).resolve().parents[3] / "database" / "sqlite" / "create_tables.sql"
+)
+
+
+def compact_args(db_path, **overrides):
+    """Namespace as parsed for `telemetry compact`."""
+    values = {
+        "db_path": str(db_path),
+        "raw_days": 30,
+        "metadata_days": 7,
+        "keep_metadata": False,
+        "archive_dir": None,
+        "no_vacuum": False,
+        "dry_run": False,
+    }
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Telemetry DB with one execution 60 days ago and one today."""
+    path = tmp_path / "asp_telemetry.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(CREATE_TABLES.read_text())
+    now = datetime.now(UTC)
+    for timestamp in (now - timedelta(days=60), now):
+        conn.execute(
+            """
+            INSERT INTO agent_execution (timestamp, task_id, agent_role, latency_ms)
+            VALUES (?, 'TASK-001', 'Code', 100.0)
+            """,
+            (timestamp.isoformat(),),
+        )
+    conn.commit()
+    conn.close()
+    return path
+
+
+class TestTelemetryCompact:
+    """Tests for telemetry compact command."""
+
+    def test_compact_archives_old_rows(self, db_path, capsys):
+        """Compact moves old executions and reports the archive."""
+        from asp.cli.telemetry_commands import cmd_telemetry_compact
+
+        cmd_telemetry_compact(compact_args(db_path))
+
+        captured = capsys.readouterr()
+        assert "Archived" in captured.out
+        assert "1 executions" in captured.out
+        assert "Database size:" in captured.out
+        assert list((db_path.parent / "archive").glob("asp_telemetry-*.db"))
+
+    def test_dry_run(self, db_path, capsys):
+        """Dry run reports without creating archives."""
+        from asp.cli.telemetry_commands import cmd_telemetry_compact
+
+        cmd_telemetry_compact(compact_args(db_path, dry_run=True))
+
+        captured = capsys.readouterr()
+        assert "[Dry Run] Would archive" in captured.out
+        assert not (db_path.parent / "archive").exists()
+
+    def test_missing_database(self, tmp_path, capsys):
+        """Missing database exits with an error."""
+        from asp.cli.telemetry_commands import cmd_telemetry_compact
+
+        with pytest.raises(SystemExit) as exc_info:
+            cmd_telemetry_compact(compact_args(tmp_path / "missing.db"))
+
+        assert exc_info.value.code == 1
+        assert "not found" in capsys.readouterr().err
+
+    def test_invalid_policy(self, db_path, capsys):
+        """Invalid retention window exits with an error."""
+        from asp.cli.telemetry_commands import cmd_telemetry_compact
+
+        with pytest.raises(SystemExit) as exc_info:
+            cmd_telemetry_compact(compact_args(db_path, raw_days=0))
+
+        assert exc_info.value.code == 1
+        assert "raw_days" in capsys.readouterr().err
+
+    def test_parser_wiring(self):
+        """Main parser routes `telemetry compact` to the command."""
+        from asp.cli.main import create_parser
+        from asp.cli.telemetry_commands import cmd_telemetry_compact
+
+        args = create_parser().parse_args(
+            ["telemetry", "compact", "--raw-days", "90", "--dry-run"]
+        )
+
+        assert args.func is cmd_telemetry_compact
+        assert args.raw_days == 90
+        assert args.dry_run
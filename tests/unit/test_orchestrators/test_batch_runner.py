@@ -0,0 +1,148 @@
+"""
+Unit tests for TSPBatchRunner.
+
+Tests cover:
+- Loading JSONL task files
+- Priority order, result stream and throughput summary
+- Budget-exceeded and failed tasks
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from asp.agents.base_agent import AgentExecutionError
+from asp.models.planning import TaskRequirements
+from asp.orchestrators import BatchTask, TSPBatchRunner
+from asp.utils.llm_budget import LLMBudget, budgeted_call_async
+
+
+def _task(task_id: str, priority: int = 2, **options) -> BatchTask:
+    return BatchTask(
+        requirements=TaskRequirements(
+            task_id=task_id,
+            description="Add a calculator module",
+            requirements="Provide add and multiply functions with tests",
+        ),
+        priority=priority,
+        **options,
+    )
+
+
+class _FakeOrchestrator:
+    """Stands in for TSPOrchestrator: two budgeted LLM calls per run."""
+
+    started: list[str] = []
+
+    async def execute_async(self, requirements, **kwargs):
+        self.started.append(requirements.task_id)
+
+        async def llm_call():
+            if requirements.task_id.endswith("ERR"):
+                raise RuntimeError("provider outage")
+            await asyncio.sleep(0)
+            return {
+                "usage": {"input_tokens": 1000, "output_tokens": 200},
+                "cost": 0.05,
+            }
+
+        try:
+            await budgeted_call_async(llm_call)
+            await budgeted_call_async(llm_call)
+        except Exception as e:
+            raise AgentExecutionError(f"Planning failed: {e}") from e
+        return SimpleNamespace(overall_status="PASS")
+
+
+@pytest.fixture
+def runner(tmp_path):
+    _FakeOrchestrator.started = []
+    return TSPBatchRunner(
+        max_concurrent_tasks=1,
+        budget=LLMBudget(max_concurrent_calls=2),
+        results_path=tmp_path / "results.jsonl",
+        orchestrator_factory=_FakeOrchestrator,
+    )
+
+
+class TestBatchRunner:
+    """Tests for TSPBatchRunner.run."""
+
+    def test_runs_by_priority_and_streams_results(self, runner, tmp_path):
+        summary = runner.run(
+            [_task("TASK-LOW", 4), _task("TASK-HIGH", 0), _task("TASK-MID")]
+        )
+
+        assert _FakeOrchestrator.started == ["TASK-HIGH", "TASK-MID", "TASK-LOW"]
+        lines = (tmp_path / "results.jsonl").read_text().splitlines()
+        records = [json.loads(line) for line in lines]
+        assert [r["task_id"] for r in records] == _FakeOrchestrator.started
+        assert records[0]["overall_status"] == "PASS"
+        assert records[0]["llm_calls"] == 2
+        assert summary.count("COMPLETED") == 3
+        assert summary.total_tokens == 7200
+        assert summary.total_cost_usd == pytest.approx(0.3)
+        assert summary.tasks_per_hour > 0
+        assert summary.tokens_per_second > 0
+
+    def test_cost_cap_and_failures_are_reported(self, runner):
+        runner.max_concurrent_tasks = 3
+        summary = runner.run(
+            [
+                _task("TASK-CAP", cost_cap_usd=0.05),
+                _task("TASK-ERR"),
+                _task("TASK-OK"),
+            ]
+        )
+
+        results = {result.task_id: result for result in summary.results}
+        assert results["TASK-CAP"].status == "BUDGET_EXCEEDED"
+        assert results["TASK-CAP"].llm_calls == 1
+        assert results["TASK-ERR"].status == "FAILED"
+        assert "provider outage" in results["TASK-ERR"].error
+        assert results["TASK-OK"].status == "COMPLETED"
+        assert summary.count("COMPLETED") == 1
+
+    def test_duplicate_task_ids_are_rejected(self, runner):
+        with pytest.raises(ValueError, match="Duplicate"):
+            runner.run([_task("TASK-001"), _task("TASK-001")])
+
+
+class TestLoadTasks:
+    """Tests for TSPBatchRunner.load_tasks."""
+
+    def test_load_tasks(self, tmp_path):
+        path = tmp_path / "tasks.jsonl"
+        first = {
+            "task_id": "TASK-001",
+            "description": "Add a calculator module",
+            "requirements": "Provide add and multiply functions",
+            "priority": 0,
+            "cost_cap_usd": 1.5,
+        }
+        second = {
+            "task_id": "TASK-002",
+            "description": "Add a logger module",
+            "requirements": "Provide info and error log functions",
+            "coding_standards": "PEP 8",
+        }
+        path.write_text(
+            f"# nightly batch\n{json.dumps(first)}\n\n{json.dumps(second)}\n"
+        )
+
+        tasks = TSPBatchRunner.load_tasks(path)
+
+        assert [task.task_id for task in tasks] == ["TASK-001", "TASK-002"]
+        assert (tasks[0].priority, tasks[0].cost_cap_usd) == (0, 1.5)
+        assert tasks[1].coding_standards == "PEP 8"
+
+    def test_invalid_line(self, tmp_path):
+        path = tmp_path / "tasks.jsonl"
+        path.write_text('{"task_id": "TASK-001"}\n')
+        with pytest.raises(ValueError, match="tasks.jsonl:1"):
+            TSPBatchRunner.load_tasks(path)
@@ -0,0 +1,235 @@
+"""
+Unit tests for TSP phase checkpoints and pipeline resume.
+
+Tests cover:
+- CheckpointStore round-trips and invalidation
+- Input hashing
+- TSPOrchestrator.execute/execute_async skipping checkpointed phases
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from asp.models.planning import ProjectPlan, TaskRequirements
+from asp.models.test import TestReport
+from asp.orchestrators import CheckpointStore, TSPOrchestrator, compute_input_hash
+
+
+@pytest.fixture
+def requirements():
+    return TaskRequirements(
+        task_id="TASK-001",
+        description="Add a calculator module",
+        requirements="Provide add and multiply functions with tests",
+    )
+
+
+@pytest.fixture
+def test_report():
+    return TestReport(
+        task_id="TASK-001",
+        test_status="PASS",
+        build_successful=True,
+        build_errors=[],
+        test_summary={"total_tests": 2, "passed": 2, "failed": 0, "skipped": 0},
+        defects_found=[],
+        test_timestamp="2026-10-16T12:00:00Z",
+    )
+
+
+@pytest.fixture
+def artifacts(
+    sample_project_plan,
+    make_design_specification,
+    make_component_logic,
+    make_design_review_report,
+    make_generated_code,
+    sample_code_review_report,
+    test_report,
+):
+    design_spec = make_design_specification(
+        component_logic=[make_component_logic(semantic_unit_id="SU-001")]
+    )
+    return {
+        "plan": sample_project_plan,
+        "design": (
+            design_spec,
+            make_design_review_report(review_id="REVIEW-TASK001-20261016-120000"),
+        ),
+        "code": (
+            make_generated_code(total_lines_of_code=10),
+            sample_code_review_report,
+        ),
+        "test": test_report,
+    }
+
+
+def _sync_orchestrator(artifacts):
+    """TSPOrchestrator whose phase methods return fixed artifacts."""
+    orchestrator = TSPOrchestrator()
+    orchestrator._execute_planning = Mock(return_value=artifacts["plan"])
+    orchestrator._execute_design_with_review = Mock(return_value=artifacts["design"])
+    orchestrator._execute_code_with_review = Mock(return_value=artifacts["code"])
+    orchestrator._execute_testing_with_retry = Mock(
+        return_value=(artifacts["code"][0], artifacts["test"])
+    )
+    orchestrator._execute_postmortem = Mock(return_value=Mock())
+    return orchestrator
+
+
+def _async_orchestrator(artifacts):
+    """Async twin of _sync_orchestrator."""
+    orchestrator = TSPOrchestrator()
+    orchestrator._execute_planning_async = AsyncMock(return_value=artifacts["plan"])
+    orchestrator._execute_design_with_review_async = AsyncMock(
+        return_value=artifacts["design"]
+    )
+    orchestrator._execute_code_with_review_async = AsyncMock(
+        return_value=artifacts["code"]
+    )
+    orchestrator._execute_testing_with_retry_async = AsyncMock(
+        return_value=(artifacts["code"][0], artifacts["test"])
+    )
+    orchestrator._execute_postmortem_async = AsyncMock(return_value=Mock())
+    return orchestrator
+
+
+class TestCheckpointStore:
+    """Tests for CheckpointStore."""
+
+    def test_round_trip(self, tmp_path, sample_project_plan):
+        store = CheckpointStore("TASK-001", base_path=tmp_path)
+        path = store.save(
+            "planning",
+            "abc",
+            {"project_plan": sample_project_plan},
+            [{"gate_name": "DesignReview"}],
+        )
+
+        assert path == tmp_path / "artifacts/TASK-001/checkpoints/planning.json"
+        checkpoint = store.load("planning", "abc", {"project_plan": ProjectPlan})
+        assert checkpoint.artifacts["project_plan"] == sample_project_plan
+        assert checkpoint.hitl_overrides == [{"gate_name": "DesignReview"}]
+
+    def test_rejects_missing_stale_and_corrupt(self, tmp_path, sample_project_plan):
+        store = CheckpointStore("TASK-001", base_path=tmp_path)
+        schema = {"project_plan": ProjectPlan}
+        assert store.load("planning", "abc", schema) is None
+
+        store.save("planning", "abc", {"project_plan": sample_project_plan})
+        assert store.load("planning", "other", schema) is None
+
+        path = store.path_for("planning")
+        record = json.loads(path.read_text())
+        record["artifacts"]["project_plan"]["semantic_units"] = []
+        path.write_text(json.dumps(record))
+        assert store.load("planning", "abc", schema) is None
+
+        path.write_text("{not json")
+        assert store.load("planning", "abc", schema) is None
+
+    def test_save_failure_is_not_raised(self, tmp_path):
+        store = CheckpointStore("TASK-001", base_path=tmp_path)
+        assert store.save("planning", "abc", {"project_plan": Mock()}) is None
+        assert not store.path_for("planning").exists()
+
+    def test_clear(self, tmp_path, sample_project_plan):
+        store = CheckpointStore("TASK-001", base_path=tmp_path)
+        assert store.clear() == 0
+        store.save("planning", "abc", {"project_plan": sample_project_plan})
+        assert store.clear() == 1
+        assert store.load("planning", "abc", {"project_plan": ProjectPlan}) is None
+
+    def test_input_hash(self, requirements):
+        copy = TaskRequirements(**requirements.model_dump())
+        assert compute_input_hash(requirements) == compute_input_hash(copy)
+        assert compute_input_hash(requirements, None) != compute_input_hash(
+            requirements, "PEP 8"
+        )
+
+
+class TestTSPResume:
+    """Tests for TSPOrchestrator resume=True."""
+
+    def test_resume_skips_checkpointed_phases(
+        self, tmp_path, monkeypatch, requirements, artifacts
+    ):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("ASP_CHECKPOINTS", raising=False)
+        first = _sync_orchestrator(artifacts)
+        first._execute_postmortem.side_effect = RuntimeError("timeout")
+        with pytest.raises(RuntimeError):
+            first.execute(requirements)
+
+        checkpoints = tmp_path / "artifacts/TASK-001/checkpoints"
+        assert sorted(p.name for p in checkpoints.iterdir()) == [
+            "code.json",
+            "design.json",
+            "planning.json",
+            "test.json",
+        ]
+
+        second = _sync_orchestrator(artifacts)
+        result = second.execute(requirements, resume=True)
+
+        second._execute_planning.assert_not_called()
+        second._execute_design_with_review.assert_not_called()
+        second._execute_code_with_review.assert_not_called()
+        second._execute_testing_with_retry.assert_not_called()
+        second._execute_postmortem.assert_called_once()
+        assert result.project_plan == artifacts["plan"]
+        assert result.test_report == artifacts["test"]
+        assert [e["status"] for e in result.execution_log[:6]] == ["RESUMED"] * 6
+
+    def test_changed_inputs_recompute_downstream(
+        self, tmp_path, monkeypatch, requirements, artifacts
+    ):
+        monkeypatch.chdir(tmp_path)
+        _sync_orchestrator(artifacts).execute(requirements)
+
+        orchestrator = _sync_orchestrator(artifacts)
+        orchestrator.execute(requirements, coding_standards="PEP 8", resume=True)
+
+        orchestrator._execute_planning.assert_not_called()
+        orchestrator._execute_design_with_review.assert_not_called()
+        orchestrator._execute_code_with_review.assert_called_once()
+        orchestrator._execute_testing_with_retry.assert_called_once()
+
+    def test_without_resume_every_phase_runs(
+        self, tmp_path, monkeypatch, requirements, artifacts
+    ):
+        monkeypatch.chdir(tmp_path)
+        _sync_orchestrator(artifacts).execute(requirements)
+
+        orchestrator = _sync_orchestrator(artifacts)
+        orchestrator.execute(requirements)
+
+        orchestrator._execute_planning.assert_called_once()
+        orchestrator._execute_testing_with_retry.assert_called_once()
+
+    def test_checkpoints_disabled(self, tmp_path, monkeypatch, requirements, artifacts):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("ASP_CHECKPOINTS", "off")
+        _sync_orchestrator(artifacts).execute(requirements)
+
+        assert not (tmp_path / "artifacts").exists()
+
+    def test_async_resume(self, tmp_path, monkeypatch, requirements, artifacts):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("ASP_CHECKPOINTS", raising=False)
+        asyncio.run(_async_orchestrator(artifacts).execute_async(requirements))
+
+        orchestrator = _async_orchestrator(artifacts)
+        result = asyncio.run(orchestrator.execute_async(requirements, resume=True))
+
+        orchestrator._execute_planning_async.assert_not_called()
+        orchestrator._execute_design_with_review_async.assert_not_called()
+        orchestrator._execute_code_with_review_async.assert_not_called()
+        orchestrator._execute_testing_with_retry_async.assert_not_called()
+        assert result.code_review == artifacts["code"][1]
@@ -0,0 +1,350 @@
+"""
+Unit tests for the pipelined DAG phase scheduler.
+
+Tests cover:
+- PhaseGraph scheduling, failure propagation and critical-path report
+- Semantic unit dependencies from the design
+- Per-unit code generation and review gates in PipelinedTSPOrchestrator
+- Run budgets stopping the per-unit correction loop
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from asp.agents.code_agent import CodeAgent
+from asp.agents.code_review_orchestrator import CodeReviewOrchestrator
+from asp.models.code import FileManifest, FileMetadata, GeneratedFile
+from asp.models.code_review import CodeIssue, CodeReviewReport
+from asp.models.planning import TaskRequirements
+from asp.orchestrators import (
+    PhaseGraph,
+    PipelinedTSPOrchestrator,
+    semantic_unit_dependencies,
+)
+from asp.orchestrators.tsp_orchestrator import QualityGateFailure
+from asp.utils.id_generation import generate_code_issue_id
+from asp.utils.llm_budget import RunBudget, budgeted_call
+
+
+def _sleeper(seconds: float, value: str):
+    async def run(_results):
+        await asyncio.sleep(seconds)
+        return value
+
+    return run
+
+
+class TestPhaseGraph:
+    """Tests for PhaseGraph."""
+
+    def test_runs_independent_nodes_concurrently(self):
+        graph = PhaseGraph()
+        graph.add("a", _sleeper(0.02, "A"))
+        graph.add("b", _sleeper(0.08, "B"))
+
+        async def join(results):
+            return results["a"] + results["b"]
+
+        graph.add("c", join, depends_on=["a", "b"])
+        results = asyncio.run(graph.run_async())
+        report = graph.report()
+
+        assert results["c"] == "AB"
+        assert report.critical_path == ["b", "c"]
+        assert report.total_work_seconds > report.critical_path_seconds
+        assert report.parallelism > 1.0
+        assert report.wall_seconds < 0.1 + 0.05
+
+    def test_nodes_can_be_added_after_a_run(self):
+        graph = PhaseGraph()
+        graph.add("a", _sleeper(0, "A"))
+        asyncio.run(graph.run_async())
+
+        async def after(results):
+            return results["a"] * 2
+
+        graph.add("b", after, depends_on=["a"])
+        results = asyncio.run(graph.run_async())
+
+        assert results == {"a": "A", "b": "AA"}
+        assert graph.report().critical_path == ["a", "b"]
+
+    def test_failure_cancels_running_nodes(self):
+        graph = PhaseGraph()
+        started = []
+
+        async def fail(_results):
+            raise RuntimeError("boom")
+
+        async def slow(_results):
+            started.append("slow")
+            await asyncio.sleep(10)
+
+        graph.add("fail", fail)
+        graph.add("slow", slow)
+        graph.add("after", _sleeper(0, "never"), depends_on=["fail"])
+
+        with pytest.raises(RuntimeError, match="boom"):
+            asyncio.run(graph.run_async())
+        assert started == ["slow"]
+        assert "after" not in graph.results
+
+    def test_unknown_dependency(self):
+        graph = PhaseGraph()
+        with pytest.raises(ValueError, match="unknown nodes"):
+            graph.add("b", _sleeper(0, "B"), depends_on=["a"])
+
+
+class TestSemanticUnitDependencies:
+    """Tests for semantic_unit_dependencies."""
+
+    def test_orders_units_and_breaks_cycles(
+        self, make_design_specification, make_component_logic
+    ):
+        design_spec = make_design_specification(
+            component_logic=[
+                make_component_logic("Api", "SU-003", dependencies=["Service"]),
+                make_component_logic(
+                    "Service", "SU-002", dependencies=["Store", "requests"]
+                ),
+                make_component_logic("Store", "SU-001", dependencies=["Service"]),
+                make_component_logic("Cache", "SU-001"),
+            ]
+        )
+
+        assert semantic_unit_dependencies(design_spec) == {
+            "SU-001": [],
+            "SU-002": ["SU-001"],
+            "SU-003": ["SU-002"],
+        }
+
+
+# =============================================================================
+# PipelinedTSPOrchestrator
+# =============================================================================
+
+
+def _file_meta(path: str, unit: str | None) -> FileMetadata:
+    return FileMetadata(
+        file_path=path,
+        file_type="source",
+        semantic_unit_id=unit,
+        description="Module implementing part of the design",
+        estimated_lines=20,
+    )
+
+
+def _review(files, critical_path: str | None = None) -> CodeReviewReport:
+    issues = []
+    if critical_path:
+        issues.append(
+            CodeIssue(
+                issue_id=generate_code_issue_id(),
+                category="Security",
+                severity="Critical",
+                description="User input is concatenated into a SQL query string",
+                evidence=f"query built at {critical_path}:10",
+                impact="Attackers can run arbitrary SQL against the database",
+                affected_phase="Code",
+                file_path=critical_path,
+            )
+        )
+    return CodeReviewReport(
+        review_id="CODE-REVIEW-TASK001-20261016-120000",
+        task_id="TASK-001",
+        review_status="FAIL" if issues else "PASS",
+        issues_found=issues,
+        checklist_review=[],
+        files_reviewed=len(files),
+        review_timestamp="2026-10-16T12:00:00",
+    )
+
+
+@pytest.fixture
+def requirements():
+    return TaskRequirements(
+        task_id="TASK-001",
+        description="Add a notes service",
+        requirements="Store notes and expose them through an HTTP API",
+    )
+
+
+@pytest.fixture
+def orchestrator(make_design_specification, make_component_logic):
+    design_spec = make_design_specification(
+        component_logic=[
+            make_component_logic("Api", "SU-002", dependencies=["Store"]),
+            make_component_logic("Store", "SU-001"),
+        ]
+    )
+    manifest = FileManifest(
+        task_id="TASK-001",
+        files=[
+            _file_meta("src/api.py", "SU-002"),
+            _file_meta("src/store.py", "SU-001"),
+            _file_meta("README.md", None),
+        ],
+        setup_instructions="pip install -r requirements.txt",
+        total_files=3,
+    )
+    events = []
+
+    async def generate_files(_code_input, file_metas):
+        paths = [meta.file_path for meta in file_metas]
+        events.append(("code", paths))
+        await asyncio.sleep(0.01)
+        return [
+            GeneratedFile(
+                file_path=meta.file_path,
+                content="pass\n",
+                file_type=meta.file_type,
+                semantic_unit_id=meta.semantic_unit_id,
+                description=meta.description,
+            )
+            for meta in file_metas
+        ]
+
+    async def review(unit_code):
+        paths = [file.file_path for file in unit_code.files]
+        events.append(("review", paths))
+        return _review(paths)
+
+    code_agent = CodeAgent(llm_client=Mock(), use_multi_stage=True)
+    code_agent.generate_manifest_async = AsyncMock(return_value=manifest)
+    code_agent.generate_files_async = AsyncMock(side_effect=generate_files)
+    reviewer = CodeReviewOrchestrator(llm_client=Mock())
+    reviewer.execute_async = AsyncMock(side_effect=review)
+
+    orchestrator = PipelinedTSPOrchestrator(max_concurrent_units=4)
+    orchestrator._code_agent = code_agent
+    orchestrator._code_review_orchestrator = reviewer
+    orchestrator._execute_planning_async = AsyncMock(return_value=Mock())
+    orchestrator._execute_design_with_review_async = AsyncMock(
+        return_value=(design_spec, SimpleNamespace(overall_assessment="PASS"))
+    )
+
+    async def testing(**kwargs):
+        return kwargs["generated_code"], SimpleNamespace(test_status="PASS")
+
+    orchestrator._execute_testing_with_retry_async = AsyncMock(side_effect=testing)
+    orchestrator._execute_postmortem_async = AsyncMock(return_value=Mock())
+    orchestrator.events = events
+    return orchestrator
+
+
+class TestPipelinedTSPOrchestrator:
+    """Tests for PipelinedTSPOrchestrator."""
+
+    def test_units_wait_only_for_their_dependencies(self, orchestrator, requirements):
+        result = orchestrator.execute(requirements)
+
+        events = orchestrator.events
+        assert events.index(("review", ["src/store.py"])) < events.index(
+            ("code", ["src/api.py"])
+        )
+        # The shared unit does not wait for any review
+        assert events.index(("code", ["README.md"])) < events.index(
+            ("review", ["src/store.py"])
+        )
+        assert [f.file_path for f in result.generated_code.files] == [
+            "src/api.py",
+            "src/store.py",
+            "README.md",
+        ]
+        assert result.code_review.review_status == "PASS"
+        assert result.code_review.files_reviewed == 3
+        assert result.overall_status == "PASS"
+
+        schedule = result.schedule
+        assert schedule.critical_path[:4] == [
+            "planning",
+            "design",
+            "manifest",
+            "code:SU-001",
+        ]
+        assert schedule.critical_path.index("review:SU-001") < (
+            schedule.critical_path.index("code:SU-002")
+        )
+        assert schedule.total_work_seconds > schedule.critical_path_seconds
+
+    def test_failed_unit_gate_halts_dependents(self, orchestrator, requirements):
+        orchestrator.MAX_CODE_ITERATIONS = 1
+
+        async def review(unit_code):
+            paths = [file.file_path for file in unit_code.files]
+            orchestrator.events.append(("review", paths))
+            return _review(paths, "src/store.py" if "src/store.py" in paths else None)
+
+        orchestrator.code_review_orchestrator.execute_async.side_effect = review
+
+        with pytest.raises(QualityGateFailure, match="SU-001"):
+            orchestrator.execute(requirements)
+        assert ("code", ["src/api.py"]) not in orchestrator.events
+        orchestrator._execute_testing_with_retry_async.assert_not_called()
+
+    def test_failed_unit_regenerates_only_its_failing_files(
+        self, orchestrator, requirements
+    ):
+        code_agent = orchestrator.code_agent
+        reviewer = orchestrator.code_review_orchestrator
+        first = {}
+
+        async def review(unit_code):
+            paths = [file.file_path for file in unit_code.files]
+            if "src/store.py" in paths and not first:
+                first["store"] = _review(paths, "src/store.py")
+                return first["store"]
+            return _review(paths)
+
+        reviewer.execute_async.side_effect = review
+        code_agent.regenerate_files_async = AsyncMock(
+            side_effect=lambda _input, unit_code, _feedback: unit_code
+        )
+        reviewer.review_changed_files = Mock(
+            side_effect=lambda unit_code, *_: _review(unit_code.files)
+        )
+
+        result = orchestrator.execute(requirements)
+
+        feedback = code_agent.regenerate_files_async.call_args.args[2]
+        assert list(feedback) == ["src/store.py"]
+        assert reviewer.review_changed_files.call_args.args[1] is first["store"]
+        assert result.code_review.review_status == "PASS"
+
+    def test_tight_budget_stops_unit_correction_loop(
+        self, orchestrator, requirements, monkeypatch
+    ):
+        monkeypatch.setenv("ASP_CHECKPOINTS", "off")
+        orchestrator.run_budget = RunBudget(max_tokens=1000)
+        code_agent = orchestrator.code_agent
+        generate_files = code_agent.generate_files_async.side_effect
+
+        async def billed_generate_files(code_input, file_metas):
+            budgeted_call(lambda: {"usage": {"input_tokens": 400, "output_tokens": 0}})
+            return await generate_files(code_input, file_metas)
+
+        async def review(unit_code):
+            paths = [file.file_path for file in unit_code.files]
+            return _review(paths, "src/store.py" if "src/store.py" in paths else None)
+
+        code_agent.generate_files_async.side_effect = billed_generate_files
+        code_agent.regenerate_files_async = AsyncMock()
+        orchestrator.code_review_orchestrator.execute_async.side_effect = review
+
+        result = orchestrator.execute(requirements)
+
+        assert result.overall_status == "BUDGET_EXCEEDED"
+        code_agent.regenerate_files_async.assert_not_called()
+        assert [
+            e["status"] for e in result.execution_log if e["phase"] == "Pipeline"
+        ] == ["BUDGET_EXCEEDED"]
+
+    def test_resume_is_not_supported(self, orchestrator, requirements):
+        with pytest.raises(ValueError, match="resume"):
+            orchestrator.execute(requirements, resume=True)
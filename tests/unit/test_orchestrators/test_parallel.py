@@ -396,43 +396,34 @@ class TestRateLimiter:
                 pass  # Both should succeed quickly
 
     @pytest.mark.asyncio
-    async def test_task_tracking(self):
-        """Test that background tasks are tracked."""
+    async def test_no_background_tasks(self):
+        """Test that acquiring tokens does not spawn refill tasks."""
         limiter = RateLimiter(requests_per_minute=1000, burst_size=10)
+        tasks_before = len(asyncio.all_tasks())
 
-        # Initially no tasks
-        assert len(limiter._tasks) == 0
-
-        # After acquire, task is tracked
-        await limiter.acquire()
-        assert len(limiter._tasks) == 1
+        for _ in range(5):
+            await limiter.acquire()
 
-        # After delay, task should be removed (auto-cleanup via callback)
-        await asyncio.sleep(limiter._refill_rate + 0.1)
-        assert len(limiter._tasks) == 0
+        assert len(asyncio.all_tasks()) == tasks_before
 
     @pytest.mark.asyncio
-    async def test_close_cancels_pending_tasks(self):
-        """Test that close() cancels pending tasks."""
-        # Slow refill rate so tasks are still pending when we close
-        limiter = RateLimiter(requests_per_minute=1, burst_size=10)
+    async def test_waits_for_refill_after_burst(self):
+        """Test that acquiring beyond the burst waits for refill."""
+        limiter = RateLimiter(requests_per_minute=600, burst_size=1)  # 0.1s/token
 
-        # Acquire several tokens
-        for _ in range(3):
-            await limiter.acquire()
-
-        # Tasks should be pending
-        assert len(limiter._tasks) == 3
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await limiter.acquire()
+        await limiter.acquire()
+        await limiter.acquire()
 
-        # Close should cancel and clear
-        await limiter.close()
-        assert len(limiter._tasks) == 0
+        assert loop.time() - start >= 0.15
 
     @pytest.mark.asyncio
-    async def test_close_on_empty(self):
-        """Test that close() works when no tasks are pending."""
+    async def test_close_is_safe(self):
+        """Test that close() works before and after use."""
         limiter = RateLimiter(requests_per_minute=1000)
+        await limiter.close()
 
-        # Close without any acquires should not raise
+        await limiter.acquire()
         await limiter.close()
-        assert len(limiter._tasks) == 0
@@ -0,0 +1,509 @@
+"""
+Unit tests for TSPOrchestrator correction loops.
+
+Tests cover:
+- Targeted per-file regeneration after a failed code review
+- Targeted regeneration and re-testing after test failures
+- Fallback to full regeneration when issues cannot be mapped to files
+- Speculative code generation during design review
+- Run budgets: partial results and no retries once the budget is tight
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from asp.agents.code_agent import CodeAgent
+from asp.agents.test_agent import TestAgent
+from asp.models.code_review import CodeIssue, CodeReviewReport
+from asp.models.planning import TaskRequirements
+from asp.models.test import TestDefect, TestReport
+from asp.orchestrators import TSPOrchestrator
+from asp.orchestrators.tsp_orchestrator import QualityGateFailure
+from asp.utils.id_generation import generate_code_issue_id
+from asp.utils.llm_budget import (
+    RunBudget,
+    RunBudgetExceededError,
+    budgeted_call,
+    budgeted_call_async,
+    run_budget_scope,
+)
+from asp.utils.llm_cache import cache_refresh_active
+
+
+@pytest.fixture
+def requirements():
+    return TaskRequirements(
+        task_id="TASK-001",
+        description="Add a calculator module",
+        requirements="Provide add and multiply functions with tests",
+    )
+
+
+@pytest.fixture
+def design_spec(make_design_specification, make_component_logic):
+    return make_design_specification(
+        component_logic=[make_component_logic(semantic_unit_id="SU-001")]
+    )
+
+
+@pytest.fixture
+def generated_code(make_generated_code, make_generated_file):
+    return make_generated_code(
+        files=[
+            make_generated_file(file_path="src/main.py"),
+            make_generated_file(file_path="src/utils.py"),
+            make_generated_file(file_path="tests/test_main.py", file_type="test"),
+        ],
+        total_lines_of_code=30,
+    )
+
+
+def _issue(file_path: str, severity: str = "Critical") -> CodeIssue:
+    return CodeIssue(
+        issue_id=generate_code_issue_id(),
+        category="Security",
+        severity=severity,
+        description="User input is concatenated into a SQL query string",
+        evidence=f"query built at {file_path}:10",
+        impact="Attackers can run arbitrary SQL against the database",
+        affected_phase="Code",
+        file_path=file_path,
+    )
+
+
+def _review(*issues: CodeIssue) -> CodeReviewReport:
+    critical = sum(1 for issue in issues if issue.severity == "Critical")
+    return CodeReviewReport(
+        review_id="CODE-REVIEW-TASK001-20261016-120000",
+        task_id="TASK-001",
+        review_status="FAIL" if critical else "PASS",
+        issues_found=list(issues),
+        checklist_review=[],
+        review_timestamp="2026-10-16T12:00:00",
+    )
+
+
+def _orchestrator(generated_code, first_review, second_review):
+    """TSPOrchestrator with mocked code agent and code review orchestrator."""
+    orchestrator = TSPOrchestrator()
+    code_agent = Mock()
+    code_agent.format_review_feedback = CodeAgent.format_review_feedback
+    code_agent.execute.return_value = generated_code
+    code_agent.execute_async = AsyncMock(return_value=generated_code)
+    code_agent.regenerate_files.return_value = generated_code
+    code_agent.regenerate_files_async = AsyncMock(return_value=generated_code)
+    reviewer = Mock()
+    reviewer.execute.return_value = first_review
+    reviewer.execute_async = AsyncMock(return_value=first_review)
+    reviewer.review_changed_files.return_value = second_review
+    orchestrator._code_agent = code_agent
+    orchestrator._code_review_orchestrator = reviewer
+    return orchestrator
+
+
+class TestCodeReviewCorrectionLoop:
+    """Tests for _execute_code_with_review targeted regeneration."""
+
+    def test_regenerates_and_rereviews_only_failing_files(
+        self, requirements, design_spec, generated_code
+    ):
+        first_review = _review(
+            _issue("src/main.py"),
+            _issue("src/main.py", "Low"),
+            _issue("src/utils.py", "Low"),
+        )
+        orchestrator = _orchestrator(generated_code, first_review, _review())
+
+        _, review = orchestrator._execute_code_with_review(
+            requirements, design_spec, None, hitl_approver=None
+        )
+
+        code_agent = orchestrator.code_agent
+        code_agent.execute.assert_called_once()
+        _, previous_code, feedback = code_agent.regenerate_files.call_args.args
+        assert previous_code is generated_code
+        assert list(feedback) == ["src/main.py"]
+        assert feedback["src/main.py"].count("[") == 2
+        reviewer = orchestrator.code_review_orchestrator
+        reviewer.review_changed_files.assert_called_once_with(
+            generated_code, first_review, {"src/main.py"}
+        )
+        assert review.review_status == "PASS"
+
+    def test_unmapped_issue_regenerates_everything(
+        self, requirements, design_spec, generated_code
+    ):
+        first_review = _review(_issue("src/missing_module.py"))
+        orchestrator = _orchestrator(generated_code, first_review, _review())
+        orchestrator.code_review_orchestrator.execute.side_effect = [
+            first_review,
+            _review(),
+        ]
+        refreshed = []
+        orchestrator.code_agent.execute.side_effect = lambda _input: (
+            refreshed.append(cache_refresh_active()) or generated_code
+        )
+
+        orchestrator._execute_code_with_review(
+            requirements, design_spec, None, hitl_approver=None
+        )
+
+        # The unchanged prompts must not be answered from the response cache
+        assert refreshed == [False, True]
+        orchestrator.code_agent.regenerate_files.assert_not_called()
+        orchestrator.code_review_orchestrator.review_changed_files.assert_not_called()
+
+    def test_async_regenerates_only_failing_files(
+        self, requirements, design_spec, generated_code
+    ):
+        first_review = _review(_issue("tests/test_main.py"))
+        orchestrator = _orchestrator(generated_code, first_review, _review())
+
+        _, review = asyncio.run(
+            orchestrator._execute_code_with_review_async(
+                requirements, design_spec, None, hitl_approver=None
+            )
+        )
+
+        orchestrator.code_agent.execute_async.assert_awaited_once()
+        feedback = orchestrator.code_agent.regenerate_files_async.call_args.args[2]
+        assert list(feedback) == ["tests/test_main.py"]
+        assert review.review_status == "PASS"
+
+
+def _defect(file_path: str | None) -> TestDefect:
+    return TestDefect(
+        defect_id="TEST-DEFECT-001",
+        defect_type="6_Conventional_Code_Bug",
+        severity="High",
+        description="multiply returns the sum of its arguments",
+        evidence="AssertionError: assert multiply(2, 3) == 6",
+        phase_injected="Code",
+        file_path=file_path,
+    )
+
+
+def _test_report(*defects: TestDefect) -> TestReport:
+    return TestReport(
+        task_id="TASK-001",
+        test_status="FAIL" if defects else "PASS",
+        build_successful=True,
+        test_summary={
+            "total_tests": 4,
+            "passed": 4 - len(defects),
+            "failed": len(defects),
+            "skipped": 0,
+        },
+        defects_found=list(defects),
+        test_timestamp="2026-10-16T12:00:00Z",
+    )
+
+
+def _test_orchestrator(generated_code, revised_code, first_report, second_report):
+    """TSPOrchestrator with mocked code and test agents."""
+    orchestrator = TSPOrchestrator()
+    code_agent = Mock()
+    code_agent.format_test_feedback = CodeAgent.format_test_feedback
+    code_agent.execute.return_value = revised_code
+    code_agent.execute_async = AsyncMock(return_value=revised_code)
+    code_agent.regenerate_files.return_value = revised_code
+    code_agent.regenerate_files_async = AsyncMock(return_value=revised_code)
+    test_agent = Mock()
+    test_agent.resolve_defect_files = TestAgent.resolve_defect_files
+    test_agent.execute.side_effect = [first_report, second_report]
+    test_agent.execute_async = AsyncMock(side_effect=[first_report, second_report])
+    test_agent.retest_files.return_value = second_report
+    test_agent.retest_files_async = AsyncMock(return_value=second_report)
+    orchestrator._code_agent = code_agent
+    orchestrator._test_agent = test_agent
+    return orchestrator
+
+
+class TestTestCorrectionLoop:
+    """Tests for _execute_testing_with_retry targeted regeneration."""
+
+    def test_regenerates_and_retests_only_defective_files(
+        self, requirements, design_spec, generated_code
+    ):
+        revised_code = generated_code.model_copy()
+        first_report = _test_report(_defect("src/utils.py"))
+        orchestrator = _test_orchestrator(
+            generated_code, revised_code, first_report, _test_report()
+        )
+
+        code, report = orchestrator._execute_testing_with_retry(
+            requirements, design_spec, generated_code, None
+        )
+
+        code_agent = orchestrator.code_agent
+        code_agent.execute.assert_not_called()
+        _, previous_code, feedback = code_agent.regenerate_files.call_args.args
+        assert previous_code is generated_code
+        assert list(feedback) == ["src/utils.py"]
+        assert "TEST-DEFECT-001" in feedback["src/utils.py"]
+        test_input, previous_report, changed = (
+            orchestrator.test_agent.retest_files.call_args.args
+        )
+        assert test_input.generated_code is revised_code
+        assert previous_report is first_report
+        assert changed == {"src/utils.py"}
+        assert code is revised_code
+        assert report.test_status == "PASS"
+
+    def test_unresolved_defect_regenerates_everything(
+        self, requirements, design_spec, generated_code
+    ):
+        orchestrator = _test_orchestrator(
+            generated_code,
+            generated_code,
+            _test_report(_defect(None)),
+            _test_report(),
+        )
+        refreshed = []
+        orchestrator.code_agent.execute.side_effect = lambda _input: (
+            refreshed.append(cache_refresh_active()) or generated_code
+        )
+
+        orchestrator._execute_testing_with_retry(
+            requirements, design_spec, generated_code, None
+        )
+
+        assert refreshed == [True]
+        orchestrator.code_agent.regenerate_files.assert_not_called()
+        assert orchestrator.test_agent.execute.call_count == 2
+        orchestrator.test_agent.retest_files.assert_not_called()
+
+    def test_async_regenerates_only_defective_files(
+        self, requirements, design_spec, generated_code
+    ):
+        revised_code = generated_code.model_copy()
+        orchestrator = _test_orchestrator(
+            generated_code,
+            revised_code,
+            _test_report(_defect("./src/main.py")),
+            _test_report(),
+        )
+
+        code, report = asyncio.run(
+            orchestrator._execute_testing_with_retry_async(
+                requirements, design_spec, generated_code, None
+            )
+        )
+
+        orchestrator.code_agent.execute_async.assert_not_called()
+        feedback = orchestrator.code_agent.regenerate_files_async.call_args.args[2]
+        assert list(feedback) == ["src/main.py"]
+        orchestrator.test_agent.retest_files_async.assert_awaited_once()
+        assert code is revised_code
+        assert report.test_status == "PASS"
+
+
+def _design_review(assessment: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        overall_assessment=assessment,
+        critical_issue_count=int(assessment == "FAIL"),
+        high_issue_count=0,
+        medium_issue_count=0,
+        low_issue_count=0,
+    )
+
+
+def _speculating_orchestrator(designs, reviews, generated_code, speculative=True):
+    """TSPOrchestrator whose code generation blocks for the first design."""
+    orchestrator = TSPOrchestrator(speculative_codegen=speculative)
+    started = []
+
+    async def generate(code_input):
+        started.append(code_input.design_specification)
+        await budgeted_call_async(
+            AsyncMock(
+                return_value={
+                    "usage": {"input_tokens": 1000, "output_tokens": 500},
+                    "cost": 0.03,
+                }
+            )
+        )
+        if code_input.design_specification is designs[0] and len(designs) > 1:
+            await asyncio.Event().wait()  # still running when the review fails
+        return generated_code
+
+    async def review(_design_spec):
+        for _ in range(5):
+            await asyncio.sleep(0)
+        return reviews.pop(0)
+
+    design_agent = Mock()
+    design_agent.execute_async = AsyncMock(side_effect=list(designs))
+    code_agent = Mock()
+    code_agent.execute_async = AsyncMock(side_effect=generate)
+    design_reviewer = Mock()
+    design_reviewer.execute_async = AsyncMock(side_effect=review)
+    code_reviewer = Mock()
+    code_reviewer.execute_async = AsyncMock(return_value=_review())
+    orchestrator._design_agent = design_agent
+    orchestrator._code_agent = code_agent
+    orchestrator._design_review_orchestrator = design_reviewer
+    orchestrator._code_review_orchestrator = code_reviewer
+    orchestrator.started = started
+    return orchestrator
+
+
+def _design_and_code(orchestrator, requirements, project_plan):
+    async def run():
+        design_spec, _ = await orchestrator._execute_design_with_review_async(
+            requirements, project_plan, None, hitl_approver=None
+        )
+        return await orchestrator._execute_code_with_review_async(
+            requirements, design_spec, None, hitl_approver=None
+        )
+
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    log = Mock()
+    monkeypatch.setattr("asp.orchestrators.tsp_orchestrator.log_agent_metric", log)
+    return log
+
+
+def _logged(metrics) -> dict[str, float]:
+    return {
+        call.kwargs["metric_type"]: call.kwargs["metric_value"]
+        for call in metrics.call_args_list
+    }
+
+
+class TestSpeculativeCodegen:
+    """Tests for speculative code generation during design review."""
+
+    def test_revised_design_discards_speculation(
+        self, requirements, design_spec, generated_code, metrics, sample_project_plan
+    ):
+        revised_spec = design_spec.model_copy()
+        orchestrator = _speculating_orchestrator(
+            [design_spec, revised_spec],
+            [_design_review("FAIL"), _design_review("PASS")],
+            generated_code,
+        )
+
+        code, review = _design_and_code(orchestrator, requirements, sample_project_plan)
+
+        assert orchestrator.started == [design_spec, revised_spec]
+        assert orchestrator.code_agent.execute_async.call_count == 2
+        assert code is generated_code
+        assert review.review_status == "PASS"
+        assert _logged(metrics) == {
+            "Speculation_Misses": 1,
+            "Speculation_Wasted_Tokens": 1500,
+            "Speculation_Wasted_Cost": pytest.approx(0.03),
+            "Speculation_Hits": 1,
+        }
+
+    def test_failed_gate_cancels_speculation(
+        self, requirements, design_spec, generated_code, metrics, sample_project_plan
+    ):
+        orchestrator = _speculating_orchestrator(
+            [design_spec, design_spec.model_copy()],
+            [_design_review("FAIL")],
+            generated_code,
+        )
+        orchestrator.MAX_DESIGN_ITERATIONS = 1
+
+        with pytest.raises(QualityGateFailure):
+            _design_and_code(orchestrator, requirements, sample_project_plan)
+        assert orchestrator._speculation is None
+        assert _logged(metrics)["Speculation_Misses"] == 1
+
+    def test_disabled_generates_after_review(
+        self, requirements, design_spec, generated_code, metrics, sample_project_plan
+    ):
+        orchestrator = _speculating_orchestrator(
+            [design_spec], [_design_review("PASS")], generated_code, False
+        )
+
+        code, _ = _design_and_code(orchestrator, requirements, sample_project_plan)
+
+        assert code is generated_code
+        orchestrator.code_agent.execute_async.assert_awaited_once()
+        metrics.assert_not_called()
+
+
+def _billed(result, tokens=1000, cost=0.5):
+    """Agent stub that makes one billed LLM call before returning result."""
+
+    def execute(*_args):
+        budgeted_call(
+            lambda: {
+                "usage": {"input_tokens": tokens, "output_tokens": 0},
+                "cost": cost,
+            }
+        )
+        return result
+
+    return execute
+
+
+class TestRunBudget:
+    """Tests for run budgets in TSPOrchestrator."""
+
+    def test_exhausted_budget_returns_completed_phases(
+        self, requirements, design_spec, sample_project_plan, monkeypatch
+    ):
+        monkeypatch.setenv("ASP_CHECKPOINTS", "off")
+        orchestrator = TSPOrchestrator(run_budget=RunBudget(max_cost_usd=1.0))
+        orchestrator._planning_agent = Mock(
+            execute=Mock(side_effect=_billed(sample_project_plan, cost=1.0))
+        )
+        orchestrator._design_agent = Mock(
+            execute=Mock(side_effect=_billed(design_spec))
+        )
+
+        result = orchestrator.execute(requirements)
+
+        assert result.overall_status == "BUDGET_EXCEEDED"
+        assert result.project_plan is sample_project_plan
+        assert result.design_specification is None
+        # The design agent's LLM call was refused before reaching the provider
+        assert result.budget_summary["calls"] == 1
+        assert "cost limit" in result.budget_summary["exhausted"]
+        assert result.execution_log[-1]["status"] == "BUDGET_EXCEEDED"
+
+    def test_tight_budget_stops_correction_loop(
+        self, requirements, design_spec, generated_code
+    ):
+        orchestrator = _orchestrator(
+            generated_code, _review(_issue("src/main.py")), _review()
+        )
+        orchestrator.code_agent.execute.side_effect = _billed(
+            generated_code, tokens=800
+        )
+
+        with run_budget_scope(RunBudget(max_tokens=1000)):
+            with pytest.raises(RunBudgetExceededError, match="too tight"):
+                orchestrator._execute_code_with_review(
+                    requirements, design_spec, None, hitl_approver=None
+                )
+
+        orchestrator.code_agent.regenerate_files.assert_not_called()
+
+    def test_async_deadline_cancels_the_run(self, requirements, monkeypatch):
+        monkeypatch.setenv("ASP_CHECKPOINTS", "off")
+        orchestrator = TSPOrchestrator(run_budget=RunBudget(deadline_seconds=0.1))
+
+        async def plan(_requirements):
+            await asyncio.Event().wait()
+
+        orchestrator._planning_agent = Mock(execute_async=AsyncMock(side_effect=plan))
+
+        result = asyncio.run(orchestrator.execute_async(requirements))
+
+        assert result.overall_status == "BUDGET_EXCEEDED"
+        assert result.project_plan is None
+        assert "deadline" in result.budget_summary["exhausted"]
@@ -0,0 +1,105 @@
+"""
+Unit tests for the incremental streaming parsers.
+
+Tests IncrementalJSONArrayParser and IncrementalMarkdownSectionParser,
+which surface completed structures while an LLM response is streaming.
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import json
+
+import pytest
+
+from asp.parsers.design_markdown_parser import DesignMarkdownParser
+from asp.parsers.incremental import (
+    IncrementalJSONArrayParser,
+    IncrementalMarkdownSectionParser,
+)
+
+MANIFEST = {
+    "task_id": "T-001",
+    "files": [
+        {"file_path": "src/a.py", "description": 'uses {braces} and "quotes"'},
+        {"file_path": "src/b.py", "dependencies": ["src/a.py"], "meta": {"x": [1]}},
+        {"file_path": "README.md", "description": "ends with backslash \\"},
+    ],
+    "dependencies": ["fastapi"],
+}
+
+
+def _feed_all(parser, text, chunk_size):
+    items = []
+    for i in range(0, len(text), chunk_size):
+        items.extend(parser.feed(text[i : i + chunk_size]))
+    return items
+
+
+class TestIncrementalJSONArrayParser:
+    """Test streaming extraction of JSON array items."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 10_000])
+    def test_items_match_full_parse(self, chunk_size):
+        text = json.dumps(MANIFEST, indent=2)
+        parser = IncrementalJSONArrayParser("files")
+
+        items = _feed_all(parser, text, chunk_size)
+
+        assert items == MANIFEST["files"]
+        assert parser.items == MANIFEST["files"]
+
+    def test_item_surfaces_before_array_closes(self):
+        parser = IncrementalJSONArrayParser("files")
+        completed = parser.feed('{"files": [{"file_path": "a.py"}, {"file_pa')
+        assert completed == [{"file_path": "a.py"}]
+        assert parser.feed('th": "b.py"}') == [{"file_path": "b.py"}]
+
+    def test_markdown_fence_is_ignored(self):
+        text = "```json\n" + json.dumps(MANIFEST) + "\n```"
+        parser = IncrementalJSONArrayParser("files")
+        assert _feed_all(parser, text, 5) == MANIFEST["files"]
+
+    def test_nested_array_with_same_key_is_ignored(self):
+        text = json.dumps(
+            {
+                "other": {"files": [{"file_path": "nested"}]},
+                "files": [{"file_path": "x"}],
+            }
+        )
+        parser = IncrementalJSONArrayParser("files")
+        assert parser.feed(text) == [{"file_path": "x"}]
+
+    def test_stops_after_array_closes(self):
+        parser = IncrementalJSONArrayParser("files")
+        parser.feed('{"files": [{"a": 1}], "more": [{"b": 2}]}')
+        assert parser.items == [{"a": 1}]
+        assert parser.feed('{"files": [{"c": 3}]}') == []
+
+
+class TestIncrementalMarkdownSectionParser:
+    """Test streaming extraction of markdown sections."""
+
+    MARKDOWN = (
+        "# Design Specification: T-001\n\n"
+        "## Architecture Overview\n\nLayered API.\n\n"
+        "## Technology Stack\n\n- Python\n- FastAPI\n\n"
+        "### Nested heading stays in section\n\n"
+        "## Component Logic\n\nDetails"
+    )
+
+    @pytest.mark.parametrize("chunk_size", [1, 13, 10_000])
+    def test_sections_match_design_parser(self, chunk_size):
+        parser = IncrementalMarkdownSectionParser()
+        completed = _feed_all(parser, self.MARKDOWN, chunk_size)
+        completed.extend(parser.finish())
+
+        expected = DesignMarkdownParser()._extract_sections(self.MARKDOWN)
+        assert dict(completed) == expected
+        assert parser.sections == expected
+
+    def test_section_completes_when_next_header_arrives(self):
+        parser = IncrementalMarkdownSectionParser()
+        assert parser.feed("## One\nbody\n") == []
+        assert parser.feed("## Two\n") == [("One", "body")]
+        assert parser.finish() == [("Two", "")]
@@ -0,0 +1,240 @@
+"""
+Unit tests for telemetry retention and compaction.
+
+Tests cover:
+- Moving raw rows older than the retention window into monthly archives
+- The telemetry_archive catalogue and the rollups that keep history
+- Metadata pruning, dry runs, re-runs and VACUUM
+- Refusing databases without the rollup and catalogue migrations
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import json
+import sqlite3
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from asp.telemetry.retention import (
+    RetentionPolicy,
+    archive_path,
+    compact_telemetry,
+    retention_cutoff,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+CREATE_TABLES = REPO_ROOT / "database" / "sqlite" / "create_tables.sql"
+
+NOW = datetime(2026, 10, 16, 12, 0, tzinfo=UTC)
+
+# (days before NOW, task_id) -> cutoff at 30 days is 2026-09-16
+EXECUTIONS = [
+    (1, "TASK-NEW"),
+    (10, "TASK-NEW"),
+    (40, "TASK-SEP"),
+    (50, "TASK-AUG"),
+    (75, "TASK-AUG"),
+]
+
+
+def insert_execution(conn: sqlite3.Connection, timestamp: str, task_id: str) -> None:
+    """One agent_execution row and its agent_cost_vector metric row."""
+    metadata = json.dumps({"status": "success", "payload": "x" * 200})
+    conn.execute(
+        """
+        INSERT INTO agent_execution (
+            timestamp, task_id, agent_role, latency_ms, tokens_in,
+            api_cost_usd, metadata
+        ) VALUES (?, ?, 'Code', 100.0, 10, 0.01, ?)
+        """,
+        (timestamp, task_id, metadata),
+    )
+    conn.execute(
+        """
+        INSERT INTO agent_cost_vector (
+            timestamp, task_id, agent_role, metric_type, metric_value,
+            metric_unit, metadata
+        ) VALUES (?, ?, 'Code', 'Latency', 100.0, 'ms', ?)
+        """,
+        (timestamp, task_id, metadata),
+    )
+
+
+def count(db_path: Path, sql: str, params: tuple = ()) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(sql, params).fetchone()[0]
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Live telemetry DB with the full schema and EXECUTIONS."""
+    path = tmp_path / "telemetry.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(CREATE_TABLES.read_text())
+    for days, task_id in EXECUTIONS:
+        insert_execution(conn, (NOW - timedelta(days=days)).isoformat(), task_id)
+    conn.commit()
+    conn.close()
+    return path
+
+
+class TestRetentionPolicy:
+    """Test policy validation and the retention cutoff."""
+
+    def test_defaults(self):
+        """Test the default policy keeps 30 days of raw rows."""
+        policy = RetentionPolicy()
+
+        assert policy.raw_days == 30
+        assert policy.metadata_days == 7
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"raw_days": 0}, {"raw_days": 30, "metadata_days": -1}]
+    )
+    def test_rejects_invalid_windows(self, kwargs):
+        """Test empty or negative retention windows are rejected."""
+        with pytest.raises(ValueError):
+            RetentionPolicy(**kwargs)
+
+    def test_cutoff_is_utc_day(self):
+        """Test the cutoff is the UTC day boundary raw_days before now."""
+        assert retention_cutoff(NOW, 30) == "2026-09-16"
+
+
+class TestCompactTelemetry:
+    """Test compact_telemetry() on a live database."""
+
+    def test_moves_old_rows_to_monthly_archives(self, db_path):
+        """Test rows before the cutoff end up in one file per month."""
+        report = compact_telemetry(db_path, RetentionPolicy(), now=NOW)
+
+        assert [m.month for m in report.months] == ["2026-08", "2026-09"]
+        assert report.rows_archived == 6
+        assert count(db_path, "SELECT COUNT(*) FROM agent_execution") == 2
+        assert count(db_path, "SELECT COUNT(*) FROM agent_cost_vector") == 2
+
+        august = archive_path(db_path, "2026-08")
+        assert august == db_path.parent / "archive" / "telemetry-2026-08.db"
+        assert count(august, "SELECT COUNT(*) FROM agent_execution") == 2
+        assert count(august, "SELECT COUNT(*) FROM agent_cost_vector") == 2
+
+    def test_records_catalogue(self, db_path):
+        """Test telemetry_archive lists each month with its bounds."""
+        compact_telemetry(db_path, RetentionPolicy(), now=NOW)
+
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute(
+            """
+            SELECT month, path, archived_until, agent_execution_rows,
+                   agent_cost_vector_rows
+            FROM telemetry_archive ORDER BY month
+            """
+        ).fetchall()
+        conn.close()
+
+        assert rows == [
+            ("2026-08", "archive/telemetry-2026-08.db", "2026-09-01", 2, 2),
+            ("2026-09", "archive/telemetry-2026-09.db", "2026-09-16", 1, 1),
+        ]
+
+    def test_rollups_keep_archived_history(self, db_path):
+        """Test the daily rollup still counts every execution."""
+        compact_telemetry(db_path, RetentionPolicy(), now=NOW)
+
+        executions = count(db_path, "SELECT SUM(executions) FROM agent_execution_daily")
+
+        assert executions == len(EXECUTIONS)
+
+    def test_prunes_metadata_before_archiving(self, db_path):
+        """Test payloads older than metadata_days are dropped everywhere."""
+        report = compact_telemetry(db_path, RetentionPolicy(), now=NOW)
+
+        assert report.metadata_pruned == 8
+        live = "SELECT COUNT(*) FROM agent_execution WHERE metadata IS NOT NULL"
+        assert count(db_path, live) == 1
+        archived = "SELECT COUNT(*) FROM agent_execution WHERE metadata IS NOT NULL"
+        assert count(archive_path(db_path, "2026-08"), archived) == 0
+
+    def test_keep_metadata(self, db_path):
+        """Test metadata_days=None leaves payloads alone."""
+        report = compact_telemetry(
+            db_path, RetentionPolicy(metadata_days=None), now=NOW
+        )
+
+        assert report.metadata_pruned == 0
+        archived = "SELECT COUNT(*) FROM agent_execution WHERE metadata IS NOT NULL"
+        assert count(archive_path(db_path, "2026-08"), archived) == 2
+
+    def test_dry_run_changes_nothing(self, db_path):
+        """Test a dry run only reports what would be archived."""
+        report = compact_telemetry(db_path, RetentionPolicy(), now=NOW, dry_run=True)
+
+        assert report.rows_archived == 6
+        assert report.metadata_pruned == 8
+        assert count(db_path, "SELECT COUNT(*) FROM agent_execution") == 5
+        assert not (db_path.parent / "archive").exists()
+
+    def test_rerun_appends_late_rows(self, db_path):
+        """Test re-running archives only new old rows into the same file."""
+        compact_telemetry(db_path, RetentionPolicy(), now=NOW)
+        conn = sqlite3.connect(db_path)
+        insert_execution(conn, "2026-08-20T08:00:00+00:00", "TASK-LATE")
+        conn.commit()
+        conn.close()
+
+        report = compact_telemetry(db_path, RetentionPolicy(), now=NOW)
+
+        assert [(m.month, m.rows) for m in report.months] == [("2026-08", 2)]
+        august = archive_path(db_path, "2026-08")
+        assert count(august, "SELECT COUNT(*) FROM agent_execution") == 3
+        catalogued = count(
+            db_path,
+            "SELECT agent_execution_rows FROM telemetry_archive WHERE month = ?",
+            ("2026-08",),
+        )
+        assert catalogued == 3
+
+    def test_nothing_to_archive(self, db_path):
+        """Test a long retention window leaves the live rows in place."""
+        report = compact_telemetry(db_path, RetentionPolicy(raw_days=365), now=NOW)
+
+        assert report.months == []
+        assert count(db_path, "SELECT COUNT(*) FROM agent_execution") == 5
+
+    def test_vacuum_shrinks_file(self, db_path):
+        """Test the live file shrinks once old rows are archived."""
+        conn = sqlite3.connect(db_path)
+        for i in range(2000):
+            timestamp = (NOW - timedelta(days=60, minutes=i)).isoformat()
+            insert_execution(conn, timestamp, f"TASK-{i}")
+        conn.commit()
+        conn.close()
+
+        report = compact_telemetry(db_path, RetentionPolicy(), now=NOW)
+
+        assert report.size_after < report.size_before
+        assert report.size_after == db_path.stat().st_size
+
+    def test_requires_rollups(self, tmp_path):
+        """Test databases without migration 017 are refused."""
+        path = tmp_path / "old.db"
+        script = CREATE_TABLES.read_text()
+        start = script.index("-- Tables 6-8")
+        end = script.index("-- Table 9")
+        conn = sqlite3.connect(path)
+        conn.executescript(script[:start] + script[end:])
+        conn.close()
+
+        with pytest.raises(RuntimeError, match="017_add_agent_execution_rollups"):
+            compact_telemetry(path, RetentionPolicy(), now=NOW)
+
+    def test_missing_database(self, tmp_path):
+        """Test a missing database raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            compact_telemetry(tmp_path / "missing.db", RetentionPolicy(), now=NOW)
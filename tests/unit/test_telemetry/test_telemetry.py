@@ -25,7 +25,9 @@ from asp.telemetry.telemetry import (
     get_langfuse_client,
     get_user_id,
     insert_agent_cost,
+    insert_agent_execution,
     insert_defect,
+    invalidate_user_id_cache,
     track_agent_cost,
 )
 
@@ -93,6 +95,36 @@ def temp_db():
     """
     )
 
+    # Create agent_execution table (one row per execution)
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS agent_execution (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp TEXT NOT NULL,
+            execution_date TEXT NOT NULL DEFAULT (date('now')),
+            task_id TEXT NOT NULL,
+            subtask_id TEXT,
+            project_id TEXT,
+            user_id TEXT,
+            agent_role TEXT NOT NULL,
+            agent_version TEXT,
+            agent_iteration INTEGER DEFAULT 1,
+            function_name TEXT,
+            status TEXT NOT NULL,
+            error_type TEXT,
+            latency_ms REAL NOT NULL,
+            tokens_in INTEGER NOT NULL DEFAULT 0,
+            tokens_out INTEGER NOT NULL DEFAULT 0,
+            api_cost_usd REAL NOT NULL DEFAULT 0,
+            cache_read_tokens INTEGER NOT NULL DEFAULT 0,
+            cache_write_tokens INTEGER NOT NULL DEFAULT 0,
+            llm_model TEXT,
+            llm_provider TEXT,
+            metadata TEXT
+        )
+    """
+    )
+
     conn.commit()
     conn.close()
 
@@ -299,6 +331,39 @@ class TestInsertAgentCost:
 # =============================================================================
 
 
+class TestInsertAgentExecution:
+    """Test insert_agent_execution function."""
+
+    def test_insert_agent_execution(self, temp_db):
+        """Test one wide row holds all metrics of an execution."""
+        record_id = insert_agent_execution(
+            task_id="TEST-001",
+            agent_role="Code",
+            latency_ms=1234.5,
+            tokens_in=1000,
+            tokens_out=250,
+            api_cost_usd=0.012,
+            cache_read_tokens=800,
+            function_name="execute",
+            llm_model="claude-sonnet-4",
+            user_id="test-user",
+            db_path=temp_db,
+        )
+
+        assert record_id == 1
+        conn = sqlite3.connect(str(temp_db))
+        conn.row_factory = sqlite3.Row
+        row = conn.execute("SELECT * FROM agent_execution").fetchone()
+        conn.close()
+
+        assert row["status"] == "success"
+        assert row["latency_ms"] == 1234.5
+        assert (row["tokens_in"], row["tokens_out"]) == (1000, 250)
+        assert row["api_cost_usd"] == 0.012
+        assert (row["cache_read_tokens"], row["cache_write_tokens"]) == (800, 0)
+        assert row["function_name"] == "execute"
+
+
 class TestInsertDefect:
     """Test insert_defect function."""
 
@@ -402,8 +467,8 @@ class TestTrackAgentCostDecorator:
             time.sleep(0.01)  # Simulate work
             return value * 2
 
-        # Patch insert_agent_cost to capture calls
-        with patch("asp.telemetry.telemetry.insert_agent_cost") as mock_insert:
+        # Patch record_agent_cost to capture calls
+        with patch("asp.telemetry.telemetry.record_agent_cost") as mock_insert:
             result = test_function("TEST-001", 5)
 
             assert result == 10
@@ -422,7 +487,7 @@ class TestTrackAgentCostDecorator:
         def test_function(custom_task_id: str, data: str):
             return data.upper()
 
-        with patch("asp.telemetry.telemetry.insert_agent_cost") as mock_insert:
+        with patch("asp.telemetry.telemetry.record_agent_cost") as mock_insert:
             result = test_function("CUSTOM-001", "hello")
 
             assert result == "HELLO"
@@ -437,7 +502,7 @@ class TestTrackAgentCostDecorator:
             time.sleep(0.05)  # Sleep for 50ms
             return "done"
 
-        with patch("asp.telemetry.telemetry.insert_agent_cost") as mock_insert:
+        with patch("asp.telemetry.telemetry.record_agent_cost") as mock_insert:
             slow_function("TEST-001")
 
             call_args = mock_insert.call_args[1]
@@ -463,7 +528,7 @@ class TestTrackAgentCostDecorator:
         def failing_function(task_id: str):
             raise ValueError("Test error")
 
-        with patch("asp.telemetry.telemetry.insert_agent_cost"):
+        with patch("asp.telemetry.telemetry.record_agent_cost"):
             with pytest.raises(ValueError, match="Test error"):
                 failing_function("TEST-001")
 
@@ -476,12 +541,139 @@ class TestTrackAgentCostDecorator:
                 return value + 10
 
         obj = TestClass()
-        with patch("asp.telemetry.telemetry.insert_agent_cost") as mock_insert:
+        with patch("asp.telemetry.telemetry.record_agent_cost") as mock_insert:
             result = obj.method("TEST-001", 5)
 
             assert result == 15
             assert mock_insert.called
 
+    def test_decorator_logs_llm_cache_metrics(self, temp_db):
+        """Test that LLM cache hits/misses and saved tokens are logged."""
+
+        class CachingAgent:
+            def __init__(self):
+                self.reset_llm_call_stats()
+
+            def reset_llm_call_stats(self):
+                self._llm_call_stats = {
+                    "cache_hits": 0,
+                    "cache_misses": 0,
+                    "tokens_saved": 0,
+                }
+
+            @track_agent_cost(agent_role="Code")
+            def execute(self, task_id: str):
+                self._llm_call_stats["cache_hits"] += 1
+                self._last_llm_usage = {"model": "m", **self._llm_call_stats}
+                self._last_llm_usage["tokens_saved"] = 150
+                return "done"
+
+        agent = CachingAgent()
+        agent._llm_call_stats["cache_hits"] = 5  # stale, reset by decorator
+        with patch("asp.telemetry.telemetry.record_agent_cost") as mock_insert:
+            agent.execute("TEST-001")
+
+        logged = {
+            c[1]["metric_type"]: c[1]["metric_value"]
+            for c in mock_insert.call_args_list
+        }
+        assert logged["Cache_Hits"] == 1
+        assert logged["Tokens_Saved"] == 150
+        assert "Cache_Misses" not in logged
+
+    def test_decorator_logs_agent_execution(self, temp_db):
+        """Test one agent_execution record is logged per call."""
+
+        class Agent:
+            @track_agent_cost(agent_role="Code", llm_provider="anthropic")
+            def execute(self, task_id: str, fail: bool = False):
+                self._last_llm_usage = {
+                    "input_tokens": 100,
+                    "output_tokens": 20,
+                    "cost": 0.002,
+                    "prompt_cache_read_tokens": 64,
+                    "model": "claude-haiku-4-5",
+                }
+                if fail:
+                    raise ValueError("boom")
+
+        agent = Agent()
+        with (
+            patch("asp.telemetry.telemetry.record_agent_cost"),
+            patch("asp.telemetry.telemetry.record_agent_execution") as mock_record,
+        ):
+            agent.execute("TEST-001")
+            with pytest.raises(ValueError):
+                agent.execute("TEST-002", fail=True)
+
+        ok, failed = (c[1] for c in mock_record.call_args_list)
+        assert ok["status"] == "success"
+        assert (ok["tokens_in"], ok["tokens_out"], ok["api_cost_usd"]) == (
+            100,
+            20,
+            0.002,
+        )
+        assert ok["cache_read_tokens"] == 64
+        assert ok["llm_model"] == "claude-haiku-4-5"
+        assert ok["function_name"] == "execute"
+        assert failed["status"] == "error"
+        assert failed["error_type"] == "ValueError"
+
+    def test_decorator_dot_notation_task_id(self, temp_db):
+        """Test task_id_param dot notation with positional and keyword args."""
+
+        class InputData:
+            task_id = "DOT-001"
+
+        @track_agent_cost(agent_role="TestAgent", task_id_param="input_data.task_id")
+        def test_function(input_data: InputData):
+            return "ok"
+
+        with patch("asp.telemetry.telemetry.record_agent_cost") as mock_insert:
+            test_function(InputData())
+            test_function(input_data=InputData())
+
+        task_ids = {c[1]["task_id"] for c in mock_insert.call_args_list}
+        assert task_ids == {"DOT-001"}
+
+    def test_decorator_resolves_signature_once(self, temp_db):
+        """Test the function signature is inspected at decoration, not per call."""
+        import inspect
+
+        with patch(
+            "asp.telemetry.telemetry.inspect.signature", wraps=inspect.signature
+        ) as mock_signature:
+
+            @track_agent_cost(agent_role="TestAgent")
+            def test_function(task_id: str):
+                return task_id
+
+            with patch("asp.telemetry.telemetry.record_agent_cost"):
+                for i in range(5):
+                    test_function(f"TEST-{i}")
+
+        assert mock_signature.call_count == 1
+
+    def test_decorator_overhead_budget(self, temp_db):
+        """Test decorator overhead (excluding the SQLite write) stays small."""
+        budget_us = 200
+
+        @track_agent_cost(agent_role="TestAgent")
+        def test_function(task_id: str):
+            return task_id
+
+        calls = 2000
+        env = {"ASP_TELEMETRY_PROVIDER": "none", "ASP_USER_ID": "bench-user"}
+        with patch.dict(os.environ, env):
+            with patch("asp.telemetry.telemetry.record_agent_cost"):
+                test_function("WARMUP")
+                start = time.perf_counter()
+                for _ in range(calls):
+                    test_function("TEST-001")
+                elapsed_us = (time.perf_counter() - start) / calls * 1e6
+
+        assert elapsed_us < budget_us
+
 
 # =============================================================================
 # Langfuse Integration Tests
@@ -521,6 +713,13 @@ class TestLangfuseIntegration:
 class TestUserIdResolution:
     """Test get_user_id resolution logic."""
 
+    @pytest.fixture(autouse=True)
+    def fresh_user_id_cache(self):
+        """Resolve the git/system user ID anew in every test."""
+        invalidate_user_id_cache()
+        yield
+        invalidate_user_id_cache()
+
     def test_get_user_id_env_var(self):
         """Test resolution from environment variable."""
         with patch.dict(os.environ, {"ASP_USER_ID": "env-user"}):
@@ -550,6 +749,31 @@ class TestUserIdResolution:
                 with patch("os.getlogin", side_effect=Exception("No system user")):
                     assert get_user_id() == "unknown-user"
 
+    def test_get_user_id_caches_git_lookup(self):
+        """Test the git subprocess runs once until the cache is invalidated."""
+        with patch.dict(os.environ, {}, clear=True):
+            with patch("subprocess.run") as mock_run:
+                mock_run.return_value.returncode = 0
+                mock_run.return_value.stdout = "git-user@example.com"
+
+                assert get_user_id() == "git-user@example.com"
+                assert get_user_id() == "git-user@example.com"
+                assert mock_run.call_count == 1
+
+                mock_run.return_value.stdout = "new-user@example.com"
+                invalidate_user_id_cache()
+                assert get_user_id() == "new-user@example.com"
+                assert mock_run.call_count == 2
+
+    def test_get_user_id_env_var_overrides_cache(self):
+        """Test ASP_USER_ID is honoured even after the fallback is cached."""
+        with patch.dict(os.environ, {}, clear=True):
+            with patch("subprocess.run", side_effect=Exception("No git")):
+                with patch("os.getlogin", return_value="system-user"):
+                    assert get_user_id() == "system-user"
+            os.environ["ASP_USER_ID"] = "env-user"
+            assert get_user_id() == "env-user"
+
 
 # =============================================================================
 # Error Handling and Edge Cases
@@ -597,7 +821,7 @@ class TestErrorHandling:
         def test_function(task_id: str):
             return "result"
 
-        with patch("asp.telemetry.telemetry.insert_agent_cost") as mock_insert:
+        with patch("asp.telemetry.telemetry.record_agent_cost") as mock_insert:
             result = test_function("TEST-001")
             assert result == "result"
             assert mock_insert.called
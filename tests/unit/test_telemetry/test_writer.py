@@ -0,0 +1,222 @@
+"""
+Unit tests for the background telemetry writer.
+
+Tests cover:
+- Batched writes on flush, batch size and flush interval
+- WAL mode, failed batches and draining on close
+- record_agent_cost/record_defect in background and sync mode
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import sqlite3
+import time
+
+import pytest
+
+from asp.telemetry import flush_telemetry, record_agent_cost, record_defect
+from asp.telemetry import writer as writer_module
+from asp.telemetry.writer import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_FLUSH_INTERVAL,
+    TelemetryWriter,
+    get_telemetry_writer,
+    telemetry_writer_mode,
+)
+
+INSERT = "INSERT INTO events (name) VALUES (?)"
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "telemetry.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def writer():
+    writer = TelemetryWriter(batch_size=3, flush_interval=60)
+    yield writer
+    writer.close()
+
+
+def _count(db_path, table="events") -> int:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def _wait_for(condition, timeout=2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestTelemetryWriter:
+    """Tests for TelemetryWriter."""
+
+    def test_flush_writes_queued_records(self, writer, db_path):
+        writer.submit(INSERT, ("a",), db_path)
+        writer.submit(INSERT, ("b",), db_path)
+
+        assert writer.flush()
+        assert _count(db_path) == 2
+        assert writer.written == 2
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_full_batch_is_written_without_flush(self, writer, db_path):
+        for name in "abc":
+            writer.submit(INSERT, (name,), db_path)
+        writer.submit(INSERT, ("d",), db_path)
+
+        assert _wait_for(lambda: _count(db_path) == 3)
+        assert writer.written == 3
+
+    def test_interval_flushes_partial_batch(self, db_path):
+        writer = TelemetryWriter(batch_size=100, flush_interval=0.05)
+        writer.submit(INSERT, ("a",), db_path)
+
+        assert _wait_for(lambda: _count(db_path) == 1)
+        writer.close()
+
+    def test_failed_batch_is_dropped(self, writer, db_path, tmp_path):
+        writer.submit(INSERT, ("a",), tmp_path / "empty.db")
+        writer.submit(INSERT, ("b",), db_path)
+
+        assert writer.flush()
+        assert (writer.written, writer.dropped) == (1, 1)
+
+    def test_failed_statement_keeps_rest_of_batch(self, writer, db_path):
+        writer.submit(INSERT, ("a",), db_path)
+        writer.submit("INSERT INTO missing (name) VALUES (?)", ("b",), db_path)
+        writer.submit(INSERT, ("c",), db_path)
+
+        assert writer.flush()
+        assert _count(db_path) == 2
+        assert (writer.written, writer.dropped) == (2, 1)
+
+    def test_failed_row_keeps_rest_of_statement(self, writer, db_path):
+        insert_with_id = "INSERT INTO events (id, name) VALUES (?, ?)"
+        writer.submit(insert_with_id, (1, "a"), db_path)
+        writer.submit(insert_with_id, (1, "duplicate"), db_path)
+        writer.submit(insert_with_id, (2, "b"), db_path)
+
+        assert writer.flush()
+        with sqlite3.connect(db_path) as conn:
+            names = [row[0] for row in conn.execute("SELECT name FROM events")]
+        assert names == ["a", "b"]
+        assert (writer.written, writer.dropped) == (2, 1)
+
+    def test_close_drains_the_queue(self, db_path):
+        writer = TelemetryWriter(batch_size=100, flush_interval=60)
+        writer.submit(INSERT, ("a",), db_path)
+        writer.close()
+
+        assert _count(db_path) == 1
+        with pytest.raises(RuntimeError, match="closed"):
+            writer.submit(INSERT, ("b",), db_path)
+
+
+@pytest.fixture
+def telemetry_db(tmp_path):
+    path = tmp_path / "asp_telemetry.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE agent_cost_vector (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp TEXT, task_id TEXT, subtask_id TEXT, project_id TEXT,
+            user_id TEXT, agent_role TEXT, agent_version TEXT,
+            agent_iteration INTEGER, metric_type TEXT, metric_value REAL,
+            metric_unit TEXT, llm_model TEXT, llm_provider TEXT, metadata TEXT
+        );
+        CREATE TABLE defect_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            defect_id TEXT, created_at TEXT, task_id TEXT, project_id TEXT,
+            user_id TEXT, defect_type TEXT, severity TEXT, description TEXT,
+            phase_injected TEXT, phase_removed TEXT, component_path TEXT,
+            function_name TEXT, line_number INTEGER, root_cause TEXT,
+            resolution_notes TEXT, flagged_by_agent INTEGER, metadata TEXT
+        );
+        """
+    )
+    conn.close()
+    return path
+
+
+class TestRecordFunctions:
+    """Tests for record_agent_cost and record_defect."""
+
+    def test_background_records_are_visible_after_flush(
+        self, telemetry_db, monkeypatch
+    ):
+        monkeypatch.setenv("ASP_USER_ID", "tester")
+        record_agent_cost(
+            task_id="TASK-001",
+            agent_role="Code",
+            metric_type="Latency",
+            metric_value=12.5,
+            metric_unit="ms",
+            metadata={"function": "execute"},
+            db_path=telemetry_db,
+        )
+        defect_id = record_defect(
+            task_id="TASK-001",
+            defect_type="80_Function",
+            severity="High",
+            phase_injected="Code",
+            phase_removed="Test",
+            description="Off-by-one in pagination",
+            db_path=telemetry_db,
+        )
+
+        assert flush_telemetry()
+        with sqlite3.connect(telemetry_db) as conn:
+            row = conn.execute(
+                "SELECT user_id, metric_value, metadata FROM agent_cost_vector"
+            ).fetchone()
+            defect = conn.execute("SELECT defect_id FROM defect_log").fetchone()
+        assert row == ("tester", 12.5, '{"function": "execute"}')
+        assert defect == (defect_id,)
+
+    def test_sync_mode_inserts_immediately(self, telemetry_db, monkeypatch):
+        monkeypatch.setenv("ASP_TELEMETRY_WRITER", "sync")
+        record_agent_cost(
+            task_id="TASK-001",
+            agent_role="Code",
+            metric_type="Latency",
+            metric_value=1.0,
+            metric_unit="ms",
+            user_id="tester",
+            db_path=telemetry_db,
+        )
+        # No flush: the row was written on the calling thread
+        assert _count(telemetry_db, "agent_cost_vector") == 1
+        assert telemetry_writer_mode() == "sync"
+        with pytest.raises(ValueError, match="writer mode"):
+            telemetry_writer_mode("eventually")
+
+
+class TestGetTelemetryWriter:
+    """Tests for the process-wide writer configuration."""
+
+    @pytest.mark.parametrize("batch_size", ["200 rows", "0"])
+    def test_malformed_settings_use_defaults(self, monkeypatch, batch_size):
+        monkeypatch.setenv("ASP_TELEMETRY_WRITER", "background")
+        monkeypatch.setenv("ASP_TELEMETRY_BATCH_SIZE", batch_size)
+        monkeypatch.setenv("ASP_TELEMETRY_FLUSH_INTERVAL", "fast")
+        monkeypatch.setattr(writer_module, "_writer", None)
+
+        writer = get_telemetry_writer()
+
+        assert writer.batch_size == DEFAULT_BATCH_SIZE
+        assert writer.flush_interval == DEFAULT_FLUSH_INTERVAL
+        writer.close()
@@ -0,0 +1,150 @@
+"""
+Unit tests for client_pool.py
+
+Tests the process-wide pooled SDK clients including:
+- Client sharing by SDK, API key, endpoint and headers
+- Per-event-loop async clients
+- Pool configuration from the environment
+- close/aclose lifecycle
+- LLMClient and provider integration
+"""
+
+import asyncio
+
+import pytest
+
+from asp.utils.client_pool import (
+    PoolConfig,
+    aclose_client_pool,
+    client_pool_stats,
+    close_client_pool,
+    get_anthropic_client,
+    get_async_anthropic_client,
+    get_async_openai_client,
+    get_openai_client,
+)
+from asp.utils.llm_client import LLMClient
+
+
+@pytest.fixture(autouse=True)
+def clean_pool():
+    close_client_pool()
+    yield
+    close_client_pool()
+
+
+class TestSyncClients:
+    """Test sharing of synchronous clients."""
+
+    def test_same_key_returns_same_client(self):
+        assert get_anthropic_client("key") is get_anthropic_client("key")
+        assert client_pool_stats()["created"] == 1
+        assert client_pool_stats()["reused"] == 1
+
+    def test_different_keys_get_different_clients(self):
+        assert get_anthropic_client("a") is not get_anthropic_client("b")
+        assert get_anthropic_client("a") is not get_anthropic_client(
+            "a", base_url="http://localhost:9999"
+        )
+
+    def test_openai_clients_keyed_by_headers(self):
+        base = "https://openrouter.ai/api/v1"
+        first = get_openai_client("k", base, {"X-Title": "ASP"})
+        assert get_openai_client("k", base, {"X-Title": "ASP"}) is first
+        assert get_openai_client("k", base, {"X-Title": "Other"}) is not first
+        assert str(first.base_url).startswith(base)
+
+    def test_close_resets_pool(self):
+        client = get_anthropic_client("key")
+        close_client_pool()
+        assert client.is_closed()
+        assert get_anthropic_client("key") is not client
+
+
+class TestAsyncClients:
+    """Test per-event-loop async clients."""
+
+    def test_shared_within_loop(self):
+        async def fetch_twice():
+            return get_async_anthropic_client("key"), get_async_anthropic_client("key")
+
+        first, second = asyncio.run(fetch_twice())
+        assert first is second
+
+    def test_not_shared_across_loops(self):
+        async def fetch():
+            return get_async_openai_client("key", "http://localhost:1/v1")
+
+        assert asyncio.run(fetch()) is not asyncio.run(fetch())
+
+    def test_aclose_closes_loop_clients(self):
+        async def run():
+            client = get_async_anthropic_client("key")
+            await aclose_client_pool()
+            return client
+
+        client = asyncio.run(run())
+        assert client.is_closed()
+        assert client_pool_stats()["async_clients"] == 0
+
+
+class TestPoolConfig:
+    """Test environment-based pool configuration."""
+
+    def test_defaults(self, monkeypatch):
+        for var in (
+            "ASP_HTTP_MAX_CONNECTIONS",
+            "ASP_HTTP_MAX_KEEPALIVE",
+            "ASP_HTTP_KEEPALIVE_EXPIRY",
+            "ASP_HTTP2",
+        ):
+            monkeypatch.delenv(var, raising=False)
+        assert PoolConfig.from_env() == PoolConfig()
+
+    def test_env_overrides(self, monkeypatch):
+        monkeypatch.setenv("ASP_HTTP_MAX_CONNECTIONS", "50")
+        monkeypatch.setenv("ASP_HTTP_MAX_KEEPALIVE", "5")
+        monkeypatch.setenv("ASP_HTTP_KEEPALIVE_EXPIRY", "12.5")
+        limits = PoolConfig.from_env().limits
+        assert limits.max_connections == 50
+        assert limits.max_keepalive_connections == 5
+        assert limits.keepalive_expiry == 12.5
+
+    def test_malformed_env_uses_defaults(self, monkeypatch):
+        monkeypatch.setenv("ASP_HTTP_MAX_CONNECTIONS", "fifty")
+        monkeypatch.setenv("ASP_HTTP_MAX_KEEPALIVE", "5.5")
+        monkeypatch.setenv("ASP_HTTP_KEEPALIVE_EXPIRY", "30s")
+        monkeypatch.delenv("ASP_HTTP2", raising=False)
+        assert PoolConfig.from_env() == PoolConfig()
+
+    def test_http2_requires_h2(self, monkeypatch):
+        monkeypatch.setenv("ASP_HTTP2", "true")
+        try:
+            import h2  # noqa: F401
+
+            expected = True
+        except ImportError:
+            expected = False
+        assert PoolConfig.from_env().http2 is expected
+
+
+class TestIntegration:
+    """Test that agents' clients and providers share pooled clients."""
+
+    def test_llm_clients_share_sdk_client(self):
+        assert LLMClient(api_key="key").client is LLMClient(api_key="key").client
+
+    def test_llm_client_async_override_respected(self):
+        client = LLMClient(api_key="key")
+        sentinel = object()
+        client._async_client = sentinel
+        assert client.async_client is sentinel
+
+    def test_providers_share_sdk_client(self):
+        from asp.providers import ProviderConfig
+        from asp.providers.anthropic_provider import AnthropicProvider
+
+        first = AnthropicProvider(ProviderConfig(api_key="key"))
+        second = AnthropicProvider(ProviderConfig(api_key="key"))
+        assert first._sync_client is second._sync_client
+        assert first._sync_client is LLMClient(api_key="key").client
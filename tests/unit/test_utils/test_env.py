@@ -0,0 +1,31 @@
+"""
+Unit tests for tolerant parsing of numeric environment settings.
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import logging
+
+from asp.utils.env import env_float, env_int
+
+
+class TestEnvNumbers:
+    """Test env_int / env_float."""
+
+    def test_unset_returns_default(self, monkeypatch):
+        monkeypatch.delenv("ASP_TEST_SETTING", raising=False)
+        assert env_int("ASP_TEST_SETTING", 7) == 7
+        assert env_float("ASP_TEST_SETTING", 1.5) == 1.5
+
+    def test_parses_value(self, monkeypatch):
+        monkeypatch.setenv("ASP_TEST_SETTING", "42")
+        assert env_int("ASP_TEST_SETTING", 7) == 42
+        assert env_float("ASP_TEST_SETTING", 1.5) == 42.0
+
+    def test_malformed_value_falls_back_with_warning(self, monkeypatch, caplog):
+        monkeypatch.setenv("ASP_TEST_SETTING", "4.2k")
+        with caplog.at_level(logging.WARNING, logger="asp.utils.env"):
+            assert env_int("ASP_TEST_SETTING", 7) == 7
+            assert env_float("ASP_TEST_SETTING", 1.5) == 1.5
+        assert "ASP_TEST_SETTING='4.2k'" in caplog.text
@@ -0,0 +1,301 @@
+"""
+Unit tests for the shared LLM call budget.
+
+Tests cover:
+- Global and per-task concurrency limits
+- Fair slot hand-off between tasks
+- Cost caps and the batch token budget
+- Budget scopes and BaseAgent integration
+- Usage meters
+- Run budgets: limits, tightness and the fallback model
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from asp.agents.base_agent import AgentExecutionError, BaseAgent
+from asp.utils.llm_budget import (
+    BudgetExceededError,
+    LLMBudget,
+    RunBudget,
+    RunBudgetExceededError,
+    budget_scope,
+    budgeted_call,
+    budgeted_call_async,
+    current_budget,
+    is_budget_exceeded,
+    run_budget_scope,
+    usage_meter,
+)
+
+
+class _Agent(BaseAgent):
+    def execute(self, input_data):
+        return input_data
+
+
+async def _settle():
+    """Let woken waiters run (wake-ups go through call_soon_threadsafe)."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def _response(input_tokens=100, output_tokens=50, cost=0.01):
+    return {
+        "content": "ok",
+        "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens},
+        "cost": cost,
+    }
+
+
+class TestSlots:
+    """Tests for concurrency limits and fairness."""
+
+    def test_freed_slot_goes_to_task_with_fewest_calls_in_flight(self):
+        async def run():
+            budget = LLMBudget(max_concurrent_calls=2)
+            order = []
+
+            async def call(task_id):
+                await budget.acquire_async(task_id)
+                order.append(task_id)
+
+            await budget.acquire_async("BIG")
+            await budget.acquire_async("BIG")
+            waiting = [asyncio.create_task(call("BIG")) for _ in range(3)]
+            await asyncio.sleep(0)
+            waiting.append(asyncio.create_task(call("SMALL")))
+            await asyncio.sleep(0)
+
+            budget.release("BIG")
+            await _settle()
+            budget.release("BIG")
+            await _settle()
+            for task in waiting:
+                task.cancel()
+            return order, budget.in_flight
+
+        order, in_flight = asyncio.run(run())
+        assert order == ["SMALL", "BIG"]
+        assert in_flight == 2
+
+    def test_priority_breaks_ties(self):
+        async def run():
+            budget = LLMBudget(max_concurrent_calls=1)
+            budget.register_task("LOW", priority=4)
+            budget.register_task("HIGH", priority=0)
+            order = []
+
+            async def call(task_id):
+                await budget.acquire_async(task_id)
+                order.append(task_id)
+                budget.release(task_id)
+
+            await budget.acquire_async("OTHER")
+            tasks = [asyncio.create_task(call(t)) for t in ("LOW", "HIGH")]
+            await asyncio.sleep(0)
+            budget.release("OTHER")
+            await asyncio.gather(*tasks)
+            return order
+
+        assert asyncio.run(run()) == ["HIGH", "LOW"]
+
+    def test_per_task_cap(self):
+        async def run():
+            budget = LLMBudget(max_concurrent_calls=4, max_calls_per_task=1)
+            await budget.acquire_async("A")
+            blocked = asyncio.create_task(budget.acquire_async("A"))
+            await budget.acquire_async("B")
+            await asyncio.sleep(0)
+            assert not blocked.done()
+            budget.release("A")
+            await blocked
+            return budget.usage("A").calls, budget.in_flight
+
+        assert asyncio.run(run()) == (2, 2)
+
+    def test_cancelled_waiter_frees_its_slot(self):
+        async def run():
+            budget = LLMBudget(max_concurrent_calls=1)
+            await budget.acquire_async("A")
+            waiter = asyncio.create_task(budget.acquire_async("B"))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            budget.release("A")
+            return budget.in_flight
+
+        assert asyncio.run(run()) == 0
+
+
+class TestSpend:
+    """Tests for cost caps and the token budget."""
+
+    def test_cost_cap(self):
+        budget = LLMBudget()
+        budget.register_task("TASK-001", cost_cap_usd=0.015)
+        with budget_scope(budget, "TASK-001"):
+            budgeted_call(_response)
+            budgeted_call(_response)
+            with pytest.raises(BudgetExceededError, match="cost cap"):
+                budgeted_call(_response)
+
+        usage = budget.usage("TASK-001")
+        assert (usage.calls, usage.total_tokens, usage.in_flight) == (2, 300, 0)
+        assert usage.cost_usd == pytest.approx(0.02)
+
+    def test_batch_token_budget(self):
+        budget = LLMBudget(max_total_tokens=200)
+        with budget_scope(budget, "A"):
+            budgeted_call(_response)
+        with budget_scope(budget, "B"):
+            budgeted_call(_response)
+            with pytest.raises(BudgetExceededError, match="token budget"):
+                budgeted_call(_response)
+        assert budget.total_tokens == 300
+
+
+class TestScopes:
+    """Tests for budget_scope and agent integration."""
+
+    def test_no_scope_passes_through(self):
+        fn = Mock(return_value=_response())
+        assert budgeted_call(fn) is fn.return_value
+        assert current_budget() is None
+
+    def test_scope_follows_tasks_and_threads(self):
+        budget = LLMBudget()
+
+        async def run():
+            with budget_scope(budget, "TASK-001"):
+                await asyncio.gather(
+                    budgeted_call_async(AsyncMock(return_value=_response())),
+                    asyncio.to_thread(budgeted_call, _response),
+                )
+
+        asyncio.run(run())
+        assert budget.usage("TASK-001").calls == 2
+
+    def test_agent_calls_are_charged_and_capped(self):
+        client = Mock()
+        client.call_with_retry.return_value = _response(cost=0.5)
+        agent = _Agent(llm_client=client)
+        agent._llm_cache = Mock(get=Mock(return_value=None))
+        budget = LLMBudget()
+        budget.register_task("TASK-001", cost_cap_usd=0.5)
+
+        with budget_scope(budget, "TASK-001"):
+            agent.call_llm("Plan", temperature=0.5)
+            with pytest.raises(AgentExecutionError) as excinfo:
+                agent.call_llm("Design", temperature=0.5)
+
+        assert isinstance(excinfo.value.__cause__, BudgetExceededError)
+        assert client.call_with_retry.call_count == 1
+        assert budget.usage("TASK-001").total_tokens == 150
+
+
+class TestUsageMeter:
+    """Tests for usage_meter."""
+
+    def test_meters_nest_and_follow_tasks(self):
+        budget = LLMBudget()
+
+        async def run():
+            with usage_meter() as outer:
+                with usage_meter() as inner:
+                    task = asyncio.create_task(
+                        budgeted_call_async(AsyncMock(return_value=_response()))
+                    )
+                await task
+                with budget_scope(budget, "TASK-001"):
+                    await asyncio.to_thread(budgeted_call, _response)
+            budgeted_call(_response)
+            return outer, inner
+
+        outer, inner = asyncio.run(run())
+        assert (inner.calls, inner.total_tokens) == (1, 150)
+        assert (outer.calls, outer.total_tokens) == (2, 300)
+        assert outer.cost_usd == pytest.approx(0.02)
+        assert budget.usage("TASK-001").calls == 1
+
+
+class TestIsBudgetExceeded:
+    """Tests for recognising wrapped budget errors."""
+
+    def test_follows_wrapped_errors(self):
+        run_error = AgentExecutionError("Design agent failed")
+        run_error.__cause__ = RunBudgetExceededError("deadline")
+        task_error = AgentExecutionError("Code agent failed")
+        task_error.__cause__ = BudgetExceededError("task cost cap")
+
+        assert is_budget_exceeded(run_error, RunBudgetExceededError)
+        assert is_budget_exceeded(task_error)
+        assert not is_budget_exceeded(task_error, RunBudgetExceededError)
+        assert not is_budget_exceeded(AgentExecutionError("timeout"))
+
+    def test_cyclic_context_terminates(self):
+        first, second = ValueError("a"), ValueError("b")
+        first.__context__, second.__context__ = second, first
+        assert not is_budget_exceeded(first)
+
+
+class TestRunBudget:
+    """Tests for RunBudget."""
+
+    def test_agent_falls_back_to_cheaper_model_then_stops(self):
+        client = Mock()
+        client.call_with_retry.return_value = _response()
+        agent = _Agent(llm_client=client)
+        agent._llm_cache = Mock(get=Mock(return_value=None))
+        run_budget = RunBudget(max_tokens=400, fallback_model="small-model")
+
+        with run_budget_scope(run_budget):
+            for _ in range(3):
+                agent.call_llm("Plan", model="large-model", temperature=0.5)
+            with pytest.raises(AgentExecutionError) as excinfo:
+                agent.call_llm("Design", model="large-model", temperature=0.5)
+
+        models = [call.kwargs["model"] for call in client.call_with_retry.mock_calls]
+        assert models == ["large-model", "large-model", "small-model"]
+        assert isinstance(excinfo.value.__cause__, RunBudgetExceededError)
+        assert isinstance(excinfo.value.__cause__, BudgetExceededError)
+        assert run_budget.summary()["total_tokens"] == 450
+
+    def test_limits_and_tightness(self):
+        run_budget = RunBudget(max_cost_usd=0.03, deadline_seconds=60)
+        run_budget.start()
+        assert not run_budget.tight
+        run_budget.charge(_response(cost=0.021))
+        assert run_budget.tight
+        assert run_budget.exhausted_reason() is None
+        run_budget.charge(_response(cost=0.01))
+        with run_budget_scope(run_budget):
+            with pytest.raises(RunBudgetExceededError, match="cost limit"):
+                budgeted_call(_response)
+
+        run_budget.start()
+        assert run_budget.cost_usd == 0
+        assert RunBudget().remaining_fraction() == 1.0
+
+    def test_from_env(self, monkeypatch):
+        for var in (
+            "ASP_RUN_DEADLINE_SECONDS",
+            "ASP_RUN_MAX_TOKENS",
+            "ASP_RUN_MAX_COST_USD",
+        ):
+            monkeypatch.delenv(var, raising=False)
+        assert RunBudget.from_env() is None
+
+        monkeypatch.setenv("ASP_RUN_DEADLINE_SECONDS", "600")
+        monkeypatch.setenv("ASP_RUN_MAX_COST_USD", "2")
+        monkeypatch.setenv("ASP_RUN_FALLBACK_MODEL", "small-model")
+        run_budget = RunBudget.from_env()
+        assert (run_budget.deadline_seconds, run_budget.max_cost_usd) == (600, 2)
+        assert run_budget.max_tokens is None
+        assert run_budget.fallback_model == "small-model"
@@ -0,0 +1,297 @@
+"""
+Unit tests for llm_cache.py
+
+Tests the LLM response cache including:
+- Cache key derivation
+- Get/set round trips, TTL expiry and LRU eviction
+- Environment-based configuration
+- BaseAgent.call_llm / call_llm_async integration
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pydantic import BaseModel
+
+from asp.agents.base_agent import BaseAgent
+from asp.utils.llm_cache import (
+    DEFAULT_MAX_ENTRIES,
+    DEFAULT_TTL_SECONDS,
+    LLMResponseCache,
+    cache_refresh,
+    get_cache_mode,
+    get_llm_cache,
+    is_cacheable,
+    make_cache_key,
+)
+
+
+class CachedAgent(BaseAgent):
+    """Minimal agent for cache integration tests."""
+
+    def execute(self, input_data: BaseModel) -> BaseModel:
+        return input_data
+
+
+def _response(text="ok", input_tokens=100, output_tokens=50):
+    return {
+        "content": text,
+        "raw_content": text,
+        "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens},
+        "cost": 0.001,
+        "model": "claude-haiku-4-5",
+        "stop_reason": "end_turn",
+    }
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LLMResponseCache(tmp_path / "cache.db", max_entries=10, ttl_seconds=0)
+
+
+class TestMakeCacheKey:
+    """Test cache key derivation."""
+
+    def test_key_is_deterministic(self):
+        key1 = make_cache_key("anthropic", "m", None, "prompt", 0.0, 100)
+        key2 = make_cache_key("anthropic", "m", None, "prompt", 0.0, 100)
+        assert key1 == key2
+        assert len(key1) == 64
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"provider": "groq"},
+            {"model": "other"},
+            {"system": "be terse"},
+            {"prompt": "different"},
+            {"max_tokens": 200},
+            {"extra": {"top_p": 0.5}},
+        ],
+    )
+    def test_key_changes_with_inputs(self, overrides):
+        base = {
+            "provider": "anthropic",
+            "model": "m",
+            "system": None,
+            "prompt": "prompt",
+            "temperature": 0.0,
+            "max_tokens": 100,
+        }
+        assert make_cache_key(**base) != make_cache_key(**{**base, **overrides})
+
+    def test_only_deterministic_requests_cacheable(self):
+        assert is_cacheable(0.0)
+        assert not is_cacheable(0.7)
+
+
+class TestLLMResponseCache:
+    """Test the SQLite-backed cache."""
+
+    def test_miss_returns_none(self, cache):
+        assert cache.get("missing") is None
+
+    def test_set_then_get(self, cache):
+        assert cache.set("k", _response("hello"))
+        assert cache.get("k")["content"] == "hello"
+        assert cache.stats() == {"entries": 1, "total_hits": 1, "tokens": 150}
+
+    def test_refresh_mode_skips_reads(self, tmp_path):
+        cache = LLMResponseCache(tmp_path / "cache.db", mode="refresh")
+        cache.set("k", _response())
+        assert cache.get("k") is None
+        assert cache.stats()["entries"] == 1
+
+    def test_ttl_expiry(self, tmp_path):
+        cache = LLMResponseCache(tmp_path / "cache.db", ttl_seconds=1)
+        cache.set("k", _response())
+        time.sleep(1.1)
+        assert cache.get("k") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction(self, tmp_path):
+        cache = LLMResponseCache(tmp_path / "cache.db", max_entries=2, ttl_seconds=0)
+        cache.set("a", _response("a"))
+        time.sleep(0.01)
+        cache.set("b", _response("b"))
+        time.sleep(0.01)
+        cache.get("a")  # "a" becomes most recently used
+        time.sleep(0.01)
+        cache.set("c", _response("c"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_unserializable_response_not_stored(self, cache):
+        assert not cache.set("k", {"content": object()})
+        assert cache.get("k") is None
+
+    def test_delete(self, cache):
+        cache.set("k", _response())
+        assert cache.delete("k")
+        assert not cache.delete("k")
+        assert cache.get("k") is None
+
+    def test_clear(self, cache):
+        cache.set("k", _response())
+        cache.clear()
+        assert cache.stats()["entries"] == 0
+
+    def test_invalid_mode_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="Invalid cache mode"):
+            LLMResponseCache(tmp_path / "cache.db", mode="off")
+
+
+class TestEnvironmentConfig:
+    """Test environment-based configuration."""
+
+    def test_off_by_default(self, monkeypatch):
+        monkeypatch.delenv("ASP_LLM_CACHE", raising=False)
+        assert get_cache_mode() == "off"
+        assert get_llm_cache() is None
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [("on", "on"), ("TRUE", "on"), ("refresh", "refresh"), ("bogus", "off")],
+    )
+    def test_mode_parsing(self, monkeypatch, value, expected):
+        monkeypatch.setenv("ASP_LLM_CACHE", value)
+        assert get_cache_mode() == expected
+
+    def test_get_llm_cache_uses_env_path(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("ASP_LLM_CACHE", "on")
+        monkeypatch.setenv("ASP_LLM_CACHE_PATH", str(tmp_path / "env_cache.db"))
+        cache = get_llm_cache()
+        assert cache.db_path == tmp_path / "env_cache.db"
+        assert get_llm_cache() is cache
+
+        monkeypatch.setenv("ASP_LLM_CACHE", "refresh")
+        assert get_llm_cache().mode == "refresh"
+
+    def test_malformed_limits_fall_back_to_defaults(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("ASP_LLM_CACHE", "on")
+        monkeypatch.setenv("ASP_LLM_CACHE_PATH", str(tmp_path / "env_cache.db"))
+        monkeypatch.setenv("ASP_LLM_CACHE_MAX_ENTRIES", "lots")
+        monkeypatch.setenv("ASP_LLM_CACHE_TTL_SECONDS", "1d")
+        cache = get_llm_cache()
+        assert cache.max_entries == DEFAULT_MAX_ENTRIES
+        assert cache.ttl_seconds == DEFAULT_TTL_SECONDS
+
+
+class TestBaseAgentIntegration:
+    """Test cache integration in BaseAgent.call_llm / call_llm_async."""
+
+    def _agent(self, cache):
+        client = Mock()
+        client.call_with_retry.return_value = _response("fresh")
+        client.call_with_retry_async = AsyncMock(return_value=_response("fresh"))
+        agent = CachedAgent(llm_client=client)
+        agent._llm_cache = cache
+        return agent, client
+
+    def test_second_identical_call_is_served_from_cache(self, cache):
+        agent, client = self._agent(cache)
+
+        first = agent.call_llm("prompt")
+        second = agent.call_llm("prompt")
+
+        assert client.call_with_retry.call_count == 1
+        assert first["content"] == second["content"] == "fresh"
+        assert second["cached"] is True
+        assert agent._last_llm_usage["cost"] == 0.0
+        assert agent._last_llm_usage["input_tokens"] == 0
+        assert agent._last_llm_usage["cache_hits"] == 1
+        assert agent._last_llm_usage["cache_misses"] == 1
+        assert agent._last_llm_usage["tokens_saved"] == 150
+
+    def test_rejected_response_is_not_served_again(self, cache):
+        agent, client = self._agent(cache)
+        client.call_with_retry.side_effect = [_response("bad"), _response("good")]
+
+        assert agent.call_llm("prompt")["content"] == "bad"
+        agent.record_retry()
+        retried = agent.call_llm("prompt")
+
+        assert client.call_with_retry.call_count == 2
+        assert retried["content"] == "good"
+        assert agent.call_llm("prompt")["content"] == "good"
+        assert client.call_with_retry.call_count == 2
+
+    def test_retry_of_another_agent_keeps_response(self, cache):
+        agent, client = self._agent(cache)
+        other, _ = self._agent(cache)
+
+        agent.call_llm("prompt")
+        other.record_retry()
+        agent.call_llm("prompt")
+
+        assert client.call_with_retry.call_count == 1
+
+    def test_cache_refresh_skips_lookup_but_stores(self, cache):
+        agent, client = self._agent(cache)
+        client.call_with_retry.side_effect = [_response("old"), _response("new")]
+
+        agent.call_llm("prompt")
+        with cache_refresh():
+            assert agent.call_llm("prompt")["content"] == "new"
+        assert agent.call_llm("prompt")["content"] == "new"
+
+        assert client.call_with_retry.call_count == 2
+
+    def test_temperature_above_zero_bypasses_cache(self, cache):
+        agent, client = self._agent(cache)
+
+        agent.call_llm("prompt", temperature=0.7)
+        agent.call_llm("prompt", temperature=0.7)
+
+        assert client.call_with_retry.call_count == 2
+        assert cache.stats()["entries"] == 0
+        assert agent._last_llm_usage["cache_misses"] == 0
+
+    def test_different_system_prompt_misses(self, cache):
+        agent, client = self._agent(cache)
+
+        agent.call_llm("prompt", system="a")
+        agent.call_llm("prompt", system="b")
+
+        assert client.call_with_retry.call_count == 2
+
+    def test_no_cache_configured(self, monkeypatch):
+        monkeypatch.delenv("ASP_LLM_CACHE", raising=False)
+        agent, client = self._agent(None)
+
+        agent.call_llm("prompt")
+        agent.call_llm("prompt")
+
+        assert client.call_with_retry.call_count == 2
+
+    def test_async_call_uses_cache(self, cache):
+        agent, client = self._agent(cache)
+
+        async def run():
+            await agent.call_llm_async("prompt")
+            return await agent.call_llm_async("prompt")
+
+        result = asyncio.run(run())
+
+        assert client.call_with_retry_async.await_count == 1
+        assert result["cached"] is True
+
+    def test_reset_llm_call_stats(self, cache):
+        agent, _ = self._agent(cache)
+        agent.call_llm("prompt")
+        agent.reset_llm_call_stats()
+        assert agent._llm_call_stats == {
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "tokens_saved": 0,
+            "prompt_cache_read_tokens": 0,
+            "prompt_cache_write_tokens": 0,
+            "continuations": 0,
+            "parse_failures": 0,
+            "retries": 0,
+            "coalesced_calls": 0,
+        }
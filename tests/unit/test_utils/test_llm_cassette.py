@@ -0,0 +1,171 @@
+"""
+Unit tests for LLM cassette record/replay.
+
+Tests cover:
+- Recording calls through an inner client and replaying them offline
+- Replay order, misses and prompt scrubbing
+- Simulated latency models and BaseAgent integration
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import asyncio
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from asp.agents.base_agent import BaseAgent
+from asp.utils import llm_cassette
+from asp.utils.llm_cassette import (
+    Cassette,
+    CassetteError,
+    CassetteLLMClient,
+    CassetteMissError,
+    LatencyModel,
+)
+
+
+class _Agent(BaseAgent):
+    def execute(self, input_data):
+        return input_data
+
+
+def _inner(*contents):
+    """Mock LLM client answering successive calls with the given contents."""
+    inner = Mock(spec=["call_with_retry", "call_with_retry_async"])
+    inner.call_with_retry.side_effect = [
+        {"content": content, "raw_content": content, "usage": {}}
+        for content in contents
+    ]
+    return inner
+
+
+class TestRecordReplay:
+    """Tests for recording and replaying cassettes."""
+
+    def test_record_then_replay(self, tmp_path):
+        path = tmp_path / "run.json"
+        recorder = CassetteLLMClient(
+            Cassette(path), mode="record", inner=_inner("plan", "design")
+        )
+        recorder.call_with_retry(prompt="Plan", max_tokens=100)
+        recorder.call_with_retry(prompt="Design", max_tokens=100)
+
+        data = json.loads(path.read_text())
+        assert data["version"] == 1
+        assert [i["request"]["prompt_head"] for i in data["interactions"]] == [
+            "Plan",
+            "Design",
+        ]
+
+        player = CassetteLLMClient(Cassette(path))
+        design = player.call_with_retry(prompt="Design", max_tokens=100)
+        plan = player.call_with_retry(prompt="Plan", max_tokens=100)
+        assert (plan["content"], design["content"]) == ("plan", "design")
+
+    def test_repeated_requests_replay_in_order(self, tmp_path):
+        path = tmp_path / "run.json"
+        recorder = CassetteLLMClient(
+            Cassette(path), mode="record", inner=_inner("first", "second")
+        )
+        recorder.call_with_retry(prompt="Review")
+        recorder.call_with_retry(prompt="Review")
+
+        cassette = Cassette(path)
+        player = CassetteLLMClient(cassette)
+        replies = [player.call_with_retry(prompt="Review")["content"] for _ in "abc"]
+        assert replies == ["first", "second", "second"]
+
+        cassette.rewind()
+        assert player.call_with_retry(prompt="Review")["content"] == "first"
+
+    def test_replay_miss_raises(self, tmp_path):
+        player = CassetteLLMClient(Cassette(tmp_path / "empty.json"))
+
+        with pytest.raises(CassetteMissError, match="re-record"):
+            player.call_with_retry(prompt="Never recorded")
+        with pytest.raises(CassetteMissError):
+            player.call_with_retry(prompt="Plan", temperature=0.5)
+
+    def test_scrub_matches_volatile_prompts(self, tmp_path):
+        path = tmp_path / "run.json"
+        scrub = [(r"\d+\.\d+s", "<duration>")]
+        CassetteLLMClient(
+            Cassette(path), mode="record", inner=_inner("fix"), scrub=scrub
+        ).call_with_retry(prompt="1 failed in 0.42s")
+
+        player = CassetteLLMClient(Cassette(path), scrub=scrub)
+        assert player.call_with_retry(prompt="1 failed in 0.57s")["content"] == "fix"
+
+    def test_async_replay(self, tmp_path):
+        path = tmp_path / "run.json"
+        CassetteLLMClient(
+            Cassette(path), mode="record", inner=_inner("plan")
+        ).call_with_retry(prompt="Plan")
+        player = CassetteLLMClient(Cassette(path))
+        chunks = []
+
+        async def run():
+            first = await player.call_with_retry_async(prompt="Plan")
+            second = await player.call_streaming_async(
+                prompt="Plan", on_text=chunks.append
+            )
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first["content"] == second["content"] == "plan"
+        assert chunks == ["plan"]
+
+    def test_invalid_cassette_raises(self, tmp_path):
+        path = tmp_path / "bad.json"
+        path.write_text('{"version": 99, "interactions": []}')
+        with pytest.raises(CassetteError, match="version"):
+            Cassette(path)
+
+    def test_record_mode_requires_inner_client(self, tmp_path):
+        with pytest.raises(ValueError, match="inner client"):
+            CassetteLLMClient(Cassette(tmp_path / "run.json"), mode="record")
+
+
+class TestLatencyModel:
+    """Tests for simulated replay latency."""
+
+    def test_models(self):
+        assert LatencyModel("none").delay_ms(250.0) == 0.0
+        assert LatencyModel("recorded").delay_ms(250.0) == 250.0
+        assert LatencyModel("fixed:40").delay_ms(250.0) == 40.0
+
+    def test_lognormal_is_seeded(self):
+        first = LatencyModel("lognormal:800,0.5", seed=7)
+        second = LatencyModel("lognormal:800,0.5", seed=7)
+        samples = [first.delay_ms(0) for _ in range(5)]
+
+        assert samples == [second.delay_ms(0) for _ in range(5)]
+        assert all(sample > 0 for sample in samples)
+
+    @pytest.mark.parametrize("spec", ["fixed", "lognormal:800", "jitter:5"])
+    def test_invalid_spec(self, spec):
+        with pytest.raises(ValueError, match="latency spec"):
+            LatencyModel(spec)
+
+
+class TestBaseAgentIntegration:
+    """Tests for ASP_LLM_CASSETTE in BaseAgent."""
+
+    def test_agent_replays_from_env_cassette(self, tmp_path, monkeypatch):
+        path = tmp_path / "run.json"
+        CassetteLLMClient(
+            Cassette(path), mode="record", inner=_inner("answer")
+        ).call_with_retry(prompt="Question", max_tokens=4096, temperature=0.0)
+        monkeypatch.setattr(llm_cassette, "_clients", {})
+        monkeypatch.setenv("ASP_LLM_CASSETTE", str(path))
+        monkeypatch.delenv("ASP_LLM_CASSETTE_MODE", raising=False)
+
+        agent = _Agent()
+        agent._llm_cache = None
+
+        assert isinstance(agent.llm_client, CassetteLLMClient)
+        assert agent.llm_client is _Agent().llm_client
+        assert agent.call_llm("Question")["content"] == "answer"
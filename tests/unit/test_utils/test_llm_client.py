@@ -8,8 +8,9 @@ Tests the LLMClient wrapper including:
 - Error handling for various API errors
 """
 
+import asyncio
 import os
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import httpx
 import pytest
@@ -149,6 +150,65 @@ class TestCallWithRetry:
         ) * client.COST_PER_MILLION_OUTPUT_TOKENS
         assert result["cost"] == pytest.approx(expected_cost, rel=1e-9)
 
+    def test_cached_prefix_adds_cache_control_block(self):
+        """Test that cached_prefix is sent as a cache_control content block."""
+        client = LLMClient(api_key="test-key")
+
+        mock_response = Mock()
+        mock_response.content = [Mock(text="Response")]
+        mock_response.usage = Mock(
+            input_tokens=50,
+            output_tokens=25,
+            cache_creation_input_tokens=0,
+            cache_read_input_tokens=2000,
+        )
+        mock_response.model = "claude-haiku-4-5"
+        mock_response.stop_reason = "end_turn"
+
+        with patch.object(
+            client.client.messages, "create", return_value=mock_response
+        ) as mock_create:
+            result = client.call_with_retry(
+                prompt="Review for security", cached_prefix="## Code\n..."
+            )
+
+        content = mock_create.call_args[1]["messages"][0]["content"]
+        assert content[0] == {
+            "type": "text",
+            "text": "## Code\n...",
+            "cache_control": {"type": "ephemeral"},
+        }
+        assert content[1] == {"type": "text", "text": "Review for security"}
+        assert result["usage"]["cache_read_input_tokens"] == 2000
+        assert result["usage"]["cache_creation_input_tokens"] == 0
+
+        expected_cost = (
+            50 + 2000 * client.CACHE_READ_COST_MULTIPLIER
+        ) / 1_000_000 * client.COST_PER_MILLION_INPUT_TOKENS + (
+            25 / 1_000_000
+        ) * client.COST_PER_MILLION_OUTPUT_TOKENS
+        assert result["cost"] == pytest.approx(expected_cost, rel=1e-9)
+
+    def test_without_cached_prefix_sends_plain_prompt(self):
+        """Test that prompts without a prefix are sent as a plain string."""
+        client = LLMClient(api_key="test-key")
+
+        mock_response = Mock()
+        mock_response.content = [Mock(text="Response")]
+        mock_response.usage = Mock(input_tokens=50, output_tokens=25)
+        mock_response.model = "claude-haiku-4-5"
+        mock_response.stop_reason = "end_turn"
+
+        with patch.object(
+            client.client.messages, "create", return_value=mock_response
+        ) as mock_create:
+            result = client.call_with_retry(prompt="Test")
+
+        assert mock_create.call_args[1]["messages"] == [
+            {"role": "user", "content": "Test"}
+        ]
+        assert result["usage"]["cache_read_input_tokens"] == 0
+
     def test_with_system_prompt(self):
         """Test call with system prompt."""
         client = LLMClient(api_key="test-key")
@@ -386,6 +446,172 @@ class TestRetryLogic:
         assert result["content"] == "Success after server error"
 
 
+class TestCallStreamingAsync:
+    """Test call_streaming_async method."""
+
+    @staticmethod
+    def _stream_client(deltas, final_message=None, error=None):
+        async def text_stream():
+            for delta in deltas:
+                yield delta
+            if error is not None:
+                raise error
+
+        stream = MagicMock()
+        stream.text_stream = text_stream()
+        stream.get_final_message = AsyncMock(return_value=final_message)
+        manager = MagicMock()
+        manager.__aenter__ = AsyncMock(return_value=stream)
+        manager.__aexit__ = AsyncMock(return_value=False)
+        async_client = MagicMock()
+        async_client.messages.stream = MagicMock(return_value=manager)
+        return async_client
+
+    def test_forwards_deltas_and_returns_final_response(self):
+        """Test deltas reach on_text and the final message is processed."""
+        client = LLMClient(api_key="test-key")
+        final_message = Mock()
+        final_message.content = [Mock(text='{"files": []}')]
+        final_message.usage = Mock(input_tokens=10, output_tokens=5)
+        final_message.model = "claude-haiku-4-5"
+        final_message.stop_reason = "end_turn"
+        client._async_client = self._stream_client(['{"files"', ": []}"], final_message)
+        deltas = []
+
+        result = asyncio.run(
+            client.call_streaming_async(prompt="Test", on_text=deltas.append)
+        )
+
+        assert deltas == ['{"files"', ": []}"]
+        assert result["content"] == {"files": []}
+        assert result["usage"]["output_tokens"] == 5
+
+    def test_no_retry_after_text_emitted(self):
+        """Test a mid-stream failure is raised rather than replayed."""
+        client = LLMClient(api_key="test-key")
+        client._async_client = self._stream_client(
+            ["partial"], error=create_api_connection_error()
+        )
+        deltas = []
+
+        with pytest.raises(APIConnectionError):
+            asyncio.run(
+                client.call_streaming_async(prompt="Test", on_text=deltas.append)
+            )
+
+        assert deltas == ["partial"]
+        assert client._async_client.messages.stream.call_count == 1
+
+
+def _message(text, stop_reason="end_turn", input_tokens=10, output_tokens=5):
+    """Create a mock Anthropic message."""
+    message = Mock()
+    message.content = [Mock(text=text)]
+    message.usage = Mock(input_tokens=input_tokens, output_tokens=output_tokens)
+    message.model = "claude-haiku-4-5"
+    message.stop_reason = stop_reason
+    return message
+
+
+class TestContinuation:
+    """Test continuation of responses truncated at max_tokens."""
+
+    def test_truncated_response_is_continued_and_stitched(self):
+        """Test a max_tokens response is continued with an assistant prefill."""
+        client = LLMClient(api_key="test-key", max_continuations=3)
+        responses = [
+            _message('{"files": [1, \n', "max_tokens"),
+            _message("\n2]}", "end_turn"),
+        ]
+
+        with patch.object(
+            client.client.messages, "create", side_effect=responses
+        ) as mock_create:
+            result = client.call_with_retry(prompt="Generate")
+
+        assert result["content"] == {"files": [1, 2]}
+        assert result["stop_reason"] == "end_turn"
+        assert result["continuations"] == 1
+        assert result["usage"]["input_tokens"] == 20
+        assert result["usage"]["output_tokens"] == 10
+        messages = mock_create.call_args_list[1][1]["messages"]
+        assert messages[-1] == {"role": "assistant", "content": '{"files": [1,'}
+
+    def test_continuation_budget(self):
+        """Test continuation stops after max_continuations calls."""
+        client = LLMClient(api_key="test-key", max_continuations=2)
+        responses = [_message(f"part{i} ", "max_tokens") for i in range(5)]
+
+        with patch.object(
+            client.client.messages, "create", side_effect=responses
+        ) as mock_create:
+            result = client.call_with_retry(prompt="Generate")
+
+        assert mock_create.call_count == 3
+        assert result["raw_content"] == "part0part1part2 "
+        assert result["stop_reason"] == "max_tokens"
+        assert result["continuations"] == 2
+
+    def test_disabled_via_environment(self):
+        """Test ASP_LLM_MAX_CONTINUATIONS=0 disables continuation."""
+        with patch.dict(os.environ, {"ASP_LLM_MAX_CONTINUATIONS": "0"}):
+            client = LLMClient(api_key="test-key")
+
+        with patch.object(
+            client.client.messages,
+            "create",
+            return_value=_message("cut off", "max_tokens"),
+        ) as mock_create:
+            result = client.call_with_retry(prompt="Generate")
+
+        assert mock_create.call_count == 1
+        assert result["continuations"] == 0
+
+    def test_malformed_environment_uses_default(self):
+        """Test a malformed ASP_LLM_MAX_CONTINUATIONS falls back to the default."""
+        with patch.dict(os.environ, {"ASP_LLM_MAX_CONTINUATIONS": "three"}):
+            client = LLMClient(api_key="test-key")
+
+        assert client.max_continuations == LLMClient.DEFAULT_MAX_CONTINUATIONS
+
+    def test_async_continuation(self):
+        """Test call_with_retry_async continues truncated responses."""
+        client = LLMClient(api_key="test-key")
+        async_client = MagicMock()
+        async_client.messages.create = AsyncMock(
+            side_effect=[_message("def f():", "max_tokens"), _message("\n    pass")]
+        )
+        client._async_client = async_client
+
+        result = asyncio.run(client.call_with_retry_async(prompt="Generate"))
+
+        assert result["raw_content"] == "def f():\n    pass"
+        assert result["continuations"] == 1
+        assert async_client.messages.create.await_count == 2
+
+    def test_streaming_continuation_does_not_repeat_whitespace(self):
+        """Test streamed deltas match the stitched text across a continuation."""
+        client = LLMClient(api_key="test-key")
+        managers = []
+        for deltas, final in (
+            (["line one", "\n"], _message("line one\n", "max_tokens")),
+            (["\nline two"], _message("\nline two")),
+        ):
+            async_client = TestCallStreamingAsync._stream_client(deltas, final)
+            managers.append(async_client.messages.stream.return_value)
+        async_client.messages.stream = MagicMock(side_effect=managers)
+        client._async_client = async_client
+        deltas = []
+
+        result = asyncio.run(
+            client.call_streaming_async(prompt="Test", on_text=deltas.append)
+        )
+
+        assert result["raw_content"] == "line one\nline two"
+        assert "".join(deltas) == result["raw_content"]
+        assert result["continuations"] == 1
+
+
 class TestEstimateCost:
     """Test estimate_cost method."""
 
@@ -0,0 +1,314 @@
+"""
+Unit tests for rate_limiter.py
+
+Tests the adaptive rate limiter including:
+- Timer-based token bucket reservations
+- Anthropic and OpenAI rate-limit header parsing
+- AIMD concurrency control and congestion pauses
+- Process-wide limiter configuration
+- Client pool response hooks and LLMClient retry waits
+"""
+
+import asyncio
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from asp.utils.client_pool import _rate_limit_hooks
+from asp.utils.llm_client import wait_for_retry
+from asp.utils.rate_limiter import (
+    DEFAULT_INITIAL_CONCURRENCY,
+    AdaptiveRateLimiter,
+    TokenBucket,
+    _waker,
+    get_rate_limiter,
+    parse_rate_limit_headers,
+    reset_rate_limiters,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiters():
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
+
+
+class TestTokenBucket:
+    """Test the timer-based token bucket."""
+
+    def test_unlimited_never_waits(self):
+        bucket = TokenBucket(0)
+        assert all(bucket.reserve(1000) == 0.0 for _ in range(10))
+
+    def test_reserve_beyond_capacity_returns_delay(self):
+        bucket = TokenBucket(per_minute=60)  # 1 token/second
+        for _ in range(60):
+            assert bucket.reserve(1) == 0.0
+        assert bucket.reserve(1) == pytest.approx(1.0, abs=0.05)
+        assert bucket.reserve(1) == pytest.approx(2.0, abs=0.05)
+
+    def test_observe_drains_to_remaining_and_blocks_when_exhausted(self):
+        bucket = TokenBucket(per_minute=100)
+        bucket.observe(remaining=10, reset_in=None)
+        assert bucket.available == pytest.approx(10, abs=0.1)
+
+        bucket.observe(remaining=0, reset_in=5)
+        assert bucket.reserve(1) >= 4.9
+
+    def test_configure_keeps_fill_fraction(self):
+        bucket = TokenBucket(per_minute=100)
+        bucket.reserve(50)
+        bucket.configure(1000)
+        assert bucket.capacity == 1000
+        assert bucket.available == pytest.approx(500, abs=5)
+
+    def test_refund_returns_reservation(self):
+        bucket = TokenBucket(per_minute=60)
+        bucket.reserve(90)
+        bucket.refund(90)
+        assert bucket.available == pytest.approx(60, abs=0.1)
+
+
+class TestParseRateLimitHeaders:
+    """Test provider header parsing."""
+
+    def test_anthropic_headers(self):
+        reset = (datetime.now(UTC) + timedelta(seconds=30)).isoformat()
+        state = parse_rate_limit_headers(
+            {
+                "anthropic-ratelimit-requests-limit": "50",
+                "anthropic-ratelimit-requests-remaining": "49",
+                "anthropic-ratelimit-requests-reset": reset,
+                "anthropic-ratelimit-tokens-limit": "40000",
+                "anthropic-ratelimit-tokens-remaining": "39000",
+                "retry-after": "7",
+            }
+        )
+        assert state["requests"]["limit"] == 50
+        assert state["requests"]["remaining"] == 49
+        assert state["requests"]["reset_in"] == pytest.approx(30, abs=2)
+        assert state["tokens"]["remaining"] == 39000
+        assert state["retry_after"] == 7
+
+    def test_openai_headers(self):
+        state = parse_rate_limit_headers(
+            httpx.Headers(
+                {
+                    "X-RateLimit-Limit-Requests": "500",
+                    "X-RateLimit-Remaining-Requests": "499",
+                    "X-RateLimit-Reset-Requests": "120ms",
+                    "X-RateLimit-Limit-Tokens": "30000",
+                    "X-RateLimit-Remaining-Tokens": "29000",
+                    "X-RateLimit-Reset-Tokens": "6m0s",
+                }
+            )
+        )
+        assert state["requests"]["reset_in"] == pytest.approx(0.12)
+        assert state["tokens"]["limit"] == 30000
+        assert state["tokens"]["reset_in"] == 360
+
+    def test_missing_headers(self):
+        assert parse_rate_limit_headers({}) == {
+            "requests": None,
+            "tokens": None,
+            "retry_after": None,
+        }
+
+
+class TestAdaptiveRateLimiter:
+    """Test AIMD concurrency control and budgets."""
+
+    def test_concurrency_limit_enforced(self):
+        limiter = AdaptiveRateLimiter("test", initial_concurrency=2)
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            async with limiter.slot_async():
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        async def run():
+            await asyncio.gather(*(call() for _ in range(6)))
+
+        asyncio.run(run())
+        assert peak == 2
+        assert limiter.in_flight == 0
+        assert limiter.stats["acquired"] == 6
+
+    def test_successes_increase_and_congestion_halves_concurrency(self):
+        limiter = AdaptiveRateLimiter("test", initial_concurrency=4, max_concurrency=8)
+        for _ in range(5):
+            limiter.on_response(200, {})
+        assert limiter.concurrency_limit == 5
+
+        limiter.on_response(429, {"retry-after": "0"})
+        assert limiter.concurrency_limit == 2
+        assert limiter.stats["rate_limited"] == 1
+
+        for _ in range(10):
+            limiter.on_response(529, {})
+        assert limiter.concurrency_limit == 1
+
+    def test_rate_limited_response_pauses_new_calls(self):
+        limiter = AdaptiveRateLimiter("test")
+        limiter.on_response(429, {"retry-after": "0.2"})
+
+        start = time.monotonic()
+        with limiter.slot():
+            pass
+        assert time.monotonic() - start >= 0.15
+
+    def test_headers_resize_request_budget(self):
+        limiter = AdaptiveRateLimiter("test")
+        limiter.on_response(
+            200,
+            {
+                "anthropic-ratelimit-requests-limit": "60",
+                "anthropic-ratelimit-requests-remaining": "0",
+                "anthropic-ratelimit-requests-reset": "0.5",
+            },
+        )
+        assert limiter.requests.per_minute == 60
+        assert limiter.requests.reserve(1) >= 0.4
+
+    def test_charge_tokens_delays_next_caller(self):
+        limiter = AdaptiveRateLimiter("test", tokens_per_minute=6000)  # 100/s
+        limiter.charge_tokens(6100)
+        assert limiter.tokens.reserve(0.0001) == pytest.approx(1.0, abs=0.05)
+
+    def test_sync_waiter_woken_by_release(self):
+        limiter = AdaptiveRateLimiter("test", initial_concurrency=1)
+        limiter.acquire_sync()
+        entered = threading.Event()
+
+        def worker():
+            with limiter.slot():
+                entered.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        assert not entered.wait(0.05)
+        limiter.release()
+        assert entered.wait(1.0)
+        thread.join()
+
+    def test_sync_acquire_on_loop_thread_does_not_sleep(self, monkeypatch):
+        limiter = AdaptiveRateLimiter("test", tokens_per_minute=6000)
+        sleeps = []
+        monkeypatch.setattr(time, "sleep", sleeps.append)
+
+        async def acquire_on_loop():
+            limiter.acquire_sync(estimated_tokens=9000)
+
+        asyncio.run(acquire_on_loop())
+        assert sleeps == []
+        assert limiter.in_flight == 1
+
+    def test_cancelled_waiter_is_withdrawn(self):
+        limiter = AdaptiveRateLimiter("test", initial_concurrency=1)
+        limiter.acquire_sync()
+
+        async def cancel_waiter():
+            task = asyncio.create_task(limiter.acquire_async())
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel_waiter())
+        assert limiter._waiters == []
+        limiter.release()
+        assert limiter.in_flight == 0
+
+    def test_release_skips_waiters_of_closed_loops(self):
+        limiter = AdaptiveRateLimiter("test", initial_concurrency=1)
+        limiter.acquire_sync()
+        woken = threading.Event()
+        loop = asyncio.new_event_loop()
+        limiter._waiters.append(_waker(loop, loop.create_future()))
+        limiter._waiters.append(woken.set)
+        loop.close()
+
+        limiter.release()
+
+        assert woken.is_set()
+        assert limiter.in_flight == 0
+
+    def test_cancel_during_budget_wait_refunds_reservation(self):
+        limiter = AdaptiveRateLimiter(
+            "test", requests_per_minute=60, tokens_per_minute=6000
+        )
+
+        async def cancel_while_waiting():
+            task = asyncio.create_task(limiter.acquire_async(estimated_tokens=9000))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel_while_waiting())
+        assert limiter.in_flight == 0
+        assert limiter.stats["acquired"] == 0
+        assert limiter.requests.available == pytest.approx(60, abs=0.1)
+        assert limiter.tokens.available == pytest.approx(6000, abs=10)
+
+    def test_invalid_bounds(self):
+        with pytest.raises(ValueError, match="Invalid concurrency bounds"):
+            AdaptiveRateLimiter("test", min_concurrency=4, max_concurrency=2)
+
+
+class TestProcessWideLimiters:
+    """Test environment configuration and sharing."""
+
+    def test_shared_by_name(self):
+        assert get_rate_limiter("anthropic") is get_rate_limiter("anthropic")
+        assert get_rate_limiter("anthropic") is not get_rate_limiter("openai")
+
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setenv("ASP_RATE_LIMIT", "off")
+        assert get_rate_limiter("anthropic") is None
+
+    def test_env_configuration(self, monkeypatch):
+        monkeypatch.setenv("ASP_RATE_LIMIT_RPM", "50")
+        monkeypatch.setenv("ASP_RATE_LIMIT_TPM", "40000")
+        monkeypatch.setenv("ASP_RATE_LIMIT_CONCURRENCY", "3")
+        limiter = get_rate_limiter("anthropic")
+        assert limiter.requests.per_minute == 50
+        assert limiter.tokens.per_minute == 40000
+        assert limiter.concurrency_limit == 3
+
+    def test_malformed_env_uses_defaults(self, monkeypatch):
+        monkeypatch.setenv("ASP_RATE_LIMIT_RPM", "50/min")
+        monkeypatch.setenv("ASP_RATE_LIMIT_TPM", "40k")
+        monkeypatch.setenv("ASP_RATE_LIMIT_CONCURRENCY", "three")
+        monkeypatch.setenv("ASP_RATE_LIMIT_MAX_CONCURRENCY", "")
+        limiter = get_rate_limiter("anthropic")
+        assert limiter.requests.unlimited
+        assert limiter.tokens.unlimited
+        assert limiter.concurrency_limit == DEFAULT_INITIAL_CONCURRENCY
+
+    def test_pool_hook_feeds_limiter(self):
+        (hook,) = _rate_limit_hooks("anthropic", is_async=False)["response"]
+        request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+        hook(httpx.Response(429, headers={"retry-after": "0"}, request=request))
+        assert get_rate_limiter("anthropic").stats["rate_limited"] == 1
+
+    def test_rate_limit_retry_skips_backoff_when_limiter_active(self, monkeypatch):
+        from anthropic import RateLimitError
+
+        request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+        error = RateLimitError(
+            "limited", response=httpx.Response(429, request=request), body=None
+        )
+        retry_state = Mock(attempt_number=1)
+        retry_state.outcome.exception.return_value = error
+
+        assert wait_for_retry(retry_state) == 0.0
+        monkeypatch.setenv("ASP_RATE_LIMIT", "off")
+        assert wait_for_retry(retry_state) == 2
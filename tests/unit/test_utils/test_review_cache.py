@@ -0,0 +1,194 @@
+"""
+Unit tests for the per-file code review results cache.
+
+Tests cover:
+- Only changed files are sent to a specialist
+- Cache keys (context, agent version) and failed reviews
+- Cached findings in CodeReviewOrchestrator reports
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from asp.agents.code_review_orchestrator import CodeReviewOrchestrator
+from asp.models.code import GeneratedCode, GeneratedFile
+from asp.utils.review_cache import CachedSpecialist, ReviewResultsCache
+
+
+def _issue(file_path: str) -> dict:
+    return {
+        "issue_id": "QUAL-001",
+        "category": "Code Quality",
+        "severity": "Critical",
+        "description": "Function mixes parsing, validation and persistence",
+        "evidence": f"{file_path}:1 handles three responsibilities",
+        "impact": "Changes to one concern risk breaking the others",
+        "affected_phase": "Code",
+        "file_path": file_path,
+        "line_number": 1,
+    }
+
+
+class _Specialist:
+    """Records the files it reviews and flags every file under src/."""
+
+    agent_version = "1.0.0"
+
+    def __init__(self):
+        self.reviewed = []
+
+    def execute(self, generated_code):
+        paths = [file.file_path for file in generated_code.files]
+        self.reviewed.append(paths)
+        return {
+            "issues_found": [_issue(path) for path in paths if path.startswith("src/")],
+            "improvement_suggestions": [],
+        }
+
+
+@pytest.fixture
+def generated_code():
+    return GeneratedCode(
+        task_id="TASK-001",
+        files=[
+            GeneratedFile(
+                file_path=path,
+                content="x = 1\n",
+                file_type=file_type,
+                description="Module generated for the review cache tests",
+            )
+            for path, file_type in (
+                ("src/app.py", "source"),
+                ("tests/test_app.py", "test"),
+            )
+        ],
+        file_structure={"src": ["app.py"], "tests": ["test_app.py"]},
+        implementation_notes="Single module with its unit tests, following the design",
+        total_files=2,
+    )
+
+
+def _change(generated_code, path, content):
+    files = [
+        file.model_copy(update={"content": content}) if file.file_path == path else file
+        for file in generated_code.files
+    ]
+    return generated_code.model_copy(update={"files": files})
+
+
+class TestCachedSpecialist:
+    """Tests for CachedSpecialist."""
+
+    def test_only_changed_files_are_reviewed(self, generated_code):
+        agent = _Specialist()
+        specialist = CachedSpecialist("code_quality", agent, ReviewResultsCache())
+
+        specialist.execute(generated_code)
+        result = specialist.execute(_change(generated_code, "tests/test_app.py", "z\n"))
+
+        assert agent.reviewed == [
+            ["src/app.py", "tests/test_app.py"],
+            ["tests/test_app.py"],
+        ]
+        assert [i["file_path"] for i in result["issues_found"]] == ["src/app.py"]
+        assert specialist.cache.hits == 1
+
+    def test_context_and_version_are_part_of_the_key(self, generated_code):
+        agent = _Specialist()
+        cache = ReviewResultsCache()
+        specialist = CachedSpecialist("code_quality", agent, cache)
+
+        specialist.execute(generated_code)
+        specialist.execute(
+            generated_code.model_copy(update={"dependencies": ["requests==2.31.0"]})
+        )
+        agent.agent_version = "1.1.0"
+        specialist.execute(generated_code)
+
+        assert len(agent.reviewed) == 3
+        assert all(len(paths) == 2 for paths in agent.reviewed)
+
+    def test_failed_review_is_not_cached(self, generated_code):
+        agent = Mock(agent_version="1.0.0")
+        agent.execute.side_effect = [RuntimeError("timeout"), {"issues_found": []}]
+        specialist = CachedSpecialist("code_quality", agent, ReviewResultsCache())
+
+        with pytest.raises(RuntimeError):
+            specialist.execute(generated_code)
+        specialist.execute(generated_code)
+
+        assert agent.execute.call_count == 2
+        assert len(specialist.cache) == 3  # Two files and the submission
+
+    def test_unattributed_findings_survive_full_cache_hit(self, generated_code):
+        agent = _Specialist()
+        cross_file = {**_issue("unknown"), "issue_id": "QUAL-002"}
+        review = agent.execute
+        agent.execute = lambda code: {
+            **review(code),
+            "improvement_suggestions": [cross_file],
+        }
+        specialist = CachedSpecialist("code_quality", agent, ReviewResultsCache())
+
+        specialist.execute(generated_code)
+        result = specialist.execute(generated_code)
+
+        assert len(agent.reviewed) == 1
+        assert result["improvement_suggestions"] == [cross_file]
+
+    def test_unreviewed_submission_of_cached_files_is_reviewed(self, generated_code):
+        agent = _Specialist()
+        specialist = CachedSpecialist("code_quality", agent, ReviewResultsCache())
+        rewritten = _change(
+            _change(generated_code, "src/app.py", "y = 2\n"), "tests/test_app.py", "z\n"
+        )
+        specialist.execute(generated_code)
+        specialist.execute(rewritten)
+
+        # Each file is cached, but the two were never reviewed together
+        mixed = _change(generated_code, "tests/test_app.py", "z\n")
+        specialist.execute(mixed)
+
+        assert agent.reviewed[-1] == ["src/app.py", "tests/test_app.py"]
+
+    def test_partial_review_is_not_cached_for_whole_submission(self, generated_code):
+        agent = _Specialist()
+        specialist = CachedSpecialist("code_quality", agent, ReviewResultsCache())
+        changed = _change(generated_code, "tests/test_app.py", "z\n")
+
+        specialist.execute(generated_code)
+        specialist.execute(changed)
+        # Only the test file was reviewed, so cross-file findings are unknown
+        specialist.execute(changed)
+        specialist.execute(changed)
+
+        assert agent.reviewed == [
+            ["src/app.py", "tests/test_app.py"],
+            ["tests/test_app.py"],
+            ["src/app.py", "tests/test_app.py"],
+        ]
+
+
+class TestOrchestratorReviewCache:
+    """Tests for the review cache in CodeReviewOrchestrator."""
+
+    def test_second_review_reuses_findings_for_unchanged_files(self, generated_code):
+        orchestrator = CodeReviewOrchestrator(llm_client=Mock(), review_cache=True)
+        specialists = {name: _Specialist() for name in orchestrator.specialists}
+        orchestrator.specialists = specialists
+
+        first = orchestrator.execute(generated_code)
+        changed = _change(generated_code, "tests/test_app.py", "z\n")
+        second = orchestrator.execute(changed)
+
+        assert specialists["code_security"].reviewed[1] == ["tests/test_app.py"]
+        assert [i.file_path for i in second.issues_found] == ["src/app.py"]
+        assert second.review_status == first.review_status == "FAIL"
+
+    def test_cache_can_be_disabled(self, monkeypatch):
+        monkeypatch.setenv("ASP_REVIEW_CACHE", "false")
+        assert CodeReviewOrchestrator(llm_client=Mock()).review_cache is None
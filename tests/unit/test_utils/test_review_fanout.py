@@ -0,0 +1,315 @@
+"""
+Unit tests for the review specialist fan-out and early-exit policies.
+
+Tests cover:
+- Policy resolution from parameter and environment
+- Cancel and background early exit in fan_out
+- Early exit in the code and design review orchestrators
+- Sharding generated code and merging shard results
+- Core specialists only under a tight run budget
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from asp.agents.code_review_orchestrator import CodeReviewOrchestrator
+from asp.agents.design_review_orchestrator import DesignReviewOrchestrator
+from asp.models.code import GeneratedCode, GeneratedFile
+from asp.utils.llm_budget import RunBudget, RunBudgetExceededError, run_budget_scope
+from asp.utils.review_fanout import (
+    fan_out,
+    resolve_early_exit,
+    shard_generated_code,
+)
+
+CRITICAL = {
+    "issues_found": [
+        {
+            "issue_id": "SEC-001",
+            "category": "Security",
+            "severity": "Critical",
+            "description": "User input is concatenated into a SQL query string",
+            "evidence": "src/app.py:10 builds the query with an f-string",
+            "impact": "Attackers can run arbitrary SQL against the database",
+            "affected_phase": "Code",
+            "file_path": "src/app.py",
+            "line_number": 10,
+        }
+    ],
+    "improvement_suggestions": [],
+}
+CLEAN = {"issues_found": [], "improvement_suggestions": []}
+
+
+@pytest.fixture
+def release():
+    """Event that blocked specialists wait on; set at teardown."""
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def _blocked(event: threading.Event, result: dict):
+    def execute(_payload):
+        event.wait(5)
+        return result
+
+    return Mock(execute=Mock(side_effect=execute))
+
+
+def _decided(results):
+    return any(result["issues_found"] for result in results.values())
+
+
+class TestResolveEarlyExit:
+    """Tests for resolve_early_exit."""
+
+    def test_parameter_overrides_environment(self, monkeypatch):
+        monkeypatch.setenv("ASP_REVIEW_EARLY_EXIT", "Cancel")
+        assert resolve_early_exit() == "cancel"
+        assert resolve_early_exit("background") == "background"
+        monkeypatch.delenv("ASP_REVIEW_EARLY_EXIT")
+        assert resolve_early_exit() == "off"
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError, match="early-exit policy"):
+            resolve_early_exit("sometimes")
+
+
+class TestFanOut:
+    """Tests for fan_out."""
+
+    def test_cancel_returns_at_the_verdict(self, release):
+        specialists = {
+            "slow": _blocked(release, CLEAN),
+            "security": Mock(execute=Mock(return_value=CRITICAL)),
+        }
+
+        start = time.monotonic()
+        results = asyncio.run(fan_out(specialists, ["payload"], _decided, "cancel"))
+
+        assert time.monotonic() - start < 2
+        assert list(results) == ["security"]
+        assert results.skipped == ["slow"]
+        assert results.verdict_seconds is not None
+
+    def test_background_waits_for_remaining_specialists(self, release):
+        specialists = {
+            "slow": _blocked(release, CLEAN),
+            "security": Mock(execute=Mock(return_value=CRITICAL)),
+        }
+        threading.Timer(0.2, release.set).start()
+
+        start = time.monotonic()
+        results = asyncio.run(fan_out(specialists, ["payload"], _decided, "background"))
+
+        assert list(results) == ["slow", "security"]
+        assert results.skipped == []
+        assert results.verdict_seconds < 0.2 <= time.monotonic() - start
+
+    def test_off_and_undecided_wait_for_everyone(self):
+        specialists = {
+            "a": Mock(execute=Mock(return_value=CLEAN)),
+            "b": Mock(execute=Mock(side_effect=RuntimeError("timeout"))),
+        }
+
+        off = asyncio.run(fan_out(specialists, ["payload"], _decided, "off"))
+        cancel = asyncio.run(fan_out(specialists, ["payload"], _decided, "cancel"))
+
+        assert off == cancel == {"a": CLEAN, "b": CLEAN}
+        assert off.verdict_seconds is None
+        assert cancel.verdict_seconds is not None
+        assert cancel.skipped == []
+
+    def test_tight_run_budget_runs_core_specialists_only(self):
+        specialists = {
+            "security": Mock(execute=Mock(return_value=CRITICAL)),
+            "style": Mock(execute=Mock(return_value=CLEAN)),
+        }
+        run_budget = RunBudget(max_tokens=100)
+        run_budget.charge({"usage": {"input_tokens": 90}})
+
+        async def run():
+            with run_budget_scope(run_budget):
+                return await fan_out(
+                    specialists, ["payload"], _decided, "off", core=("security",)
+                )
+
+        results = asyncio.run(run())
+
+        assert list(results) == ["security"]
+        assert results.skipped == ["style"]
+        specialists["style"].execute.assert_not_called()
+
+    def test_exhausted_run_budget_is_not_an_empty_review(self):
+        specialists = {
+            "security": Mock(execute=Mock(side_effect=RuntimeError("no budget")))
+        }
+        run_budget = RunBudget(max_tokens=100)
+        run_budget.charge({"usage": {"input_tokens": 100}})
+
+        async def run():
+            with run_budget_scope(run_budget):
+                return await fan_out(specialists, ["payload"])
+
+        with pytest.raises(RunBudgetExceededError):
+            asyncio.run(run())
+
+
+def _code(*files: tuple[str, str | None, int]) -> GeneratedCode:
+    """GeneratedCode from (path, component_id, content size) triples."""
+    return GeneratedCode(
+        task_id="TASK-001",
+        files=[
+            GeneratedFile(
+                file_path=path,
+                content="x" * size,
+                file_type="source",
+                component_id=component,
+                description="Module generated for the review fan-out tests",
+            )
+            for path, component, size in files
+        ],
+        file_structure={"src": [path for path, _, _ in files]},
+        implementation_notes=(
+            "Modules implementing the components of the design, one per file"
+        ),
+        total_files=len(files),
+    )
+
+
+class TestSharding:
+    """Tests for shard_generated_code and sharded fan-out."""
+
+    def test_shards_group_files_by_component(self):
+        code = _code(
+            ("src/a1.py", "A", 2000),
+            ("src/b1.py", "B", 2000),
+            ("src/a2.py", "A", 2000),
+            ("src/c1.py", "C", 2000),
+            ("src/huge.py", "D", 12000),
+        )
+
+        shards = shard_generated_code(code, max_tokens=1200)
+
+        assert [[f.file_path for f in shard.files] for shard in shards] == [
+            ["src/a1.py", "src/a2.py"],
+            ["src/b1.py", "src/c1.py"],
+            ["src/huge.py"],
+        ]
+        assert all(shard.file_structure == code.file_structure for shard in shards)
+        assert shards[0].total_files == 2
+        assert shard_generated_code(code, max_tokens=0) == [code]
+        assert shard_generated_code(code, max_tokens=100000) == [code]
+
+    def test_specialist_results_are_merged_over_shards(self):
+        def execute(shard):
+            return {
+                "issues_found": [file.file_path for file in shard.files],
+                "improvement_suggestions": [],
+            }
+
+        specialists = {"quality": Mock(execute=Mock(side_effect=execute))}
+        shards = shard_generated_code(
+            _code(("src/a.py", "A", 2000), ("src/b.py", "B", 2000)), max_tokens=800
+        )
+
+        results = asyncio.run(fan_out(specialists, shards, _decided, "cancel"))
+
+        assert specialists["quality"].execute.call_count == 2
+        assert results["quality"]["issues_found"] == ["src/a.py", "src/b.py"]
+
+    def test_code_review_is_sharded(self):
+        orchestrator = CodeReviewOrchestrator(
+            llm_client=Mock(), review_cache=False, max_shard_tokens=800
+        )
+        reviewed = []
+
+        def execute(shard):
+            reviewed.append([file.file_path for file in shard.files])
+            return CRITICAL
+
+        for name in orchestrator.specialists:
+            orchestrator.specialists[name] = Mock(execute=Mock(side_effect=execute))
+
+        report = orchestrator.execute(
+            _code(("src/a.py", "A", 2000), ("src/b.py", "B", 2000))
+        )
+
+        assert sorted(reviewed) == [["src/a.py"]] * 6 + [["src/b.py"]] * 6
+        # The same finding from every specialist and shard is deduplicated
+        assert report.critical_issues == 1
+        assert report.files_reviewed == 2
+
+
+class TestOrchestratorEarlyExit:
+    """Tests for early exit in the review orchestrators."""
+
+    def test_code_review_fails_without_waiting(self, release):
+        orchestrator = CodeReviewOrchestrator(llm_client=Mock(), early_exit="cancel")
+        for name in orchestrator.specialists:
+            orchestrator.specialists[name] = _blocked(release, CLEAN)
+        orchestrator.specialists["code_security"] = Mock(
+            execute=Mock(return_value=CRITICAL)
+        )
+        generated_code = GeneratedCode(
+            task_id="TASK-001",
+            files=[
+                GeneratedFile(
+                    file_path="src/app.py",
+                    content="query = f'SELECT * FROM users WHERE id = {user_id}'\n",
+                    file_type="source",
+                    description="Application module with the user query",
+                )
+            ],
+            file_structure={"src": ["app.py"]},
+            implementation_notes=(
+                "Single module implementing the user lookup query for the API"
+            ),
+            total_files=1,
+        )
+
+        report = orchestrator.execute(generated_code)
+
+        assert report.review_status == "FAIL"
+        assert report.critical_issues == 1
+        assert len(report.skipped_specialists) == 5
+        assert report.verdict_duration_seconds <= report.review_duration_seconds
+
+    def test_design_review_fails_on_first_high_issue(
+        self, release, make_design_specification, make_component_logic
+    ):
+        orchestrator = DesignReviewOrchestrator(llm_client=Mock(), early_exit="cancel")
+        for name in orchestrator.specialists:
+            orchestrator.specialists[name] = _blocked(release, CLEAN)
+        high = dict(
+            CRITICAL["issues_found"][0], severity="High", affected_phase="Design"
+        )
+        orchestrator.specialists["security"] = Mock(
+            execute=Mock(
+                return_value={"issues_found": [high], "improvement_suggestions": []}
+            )
+        )
+
+        design_spec = make_design_specification(
+            component_logic=[make_component_logic(semantic_unit_id="SU-001")]
+        )
+
+        report = orchestrator.execute(design_spec)
+
+        assert report.overall_assessment == "FAIL"
+        assert report.skipped_specialists == [
+            "performance",
+            "data_integrity",
+            "maintainability",
+            "architecture",
+            "api_design",
+        ]
+        assert report.verdict_duration_ms is not None
@@ -0,0 +1,220 @@
+"""
+Unit tests for single-flight coalescing of identical in-flight LLM calls.
+
+Tests cover:
+- Coalescing concurrent sync (threaded) and async calls
+- Error propagation and follower isolation
+- BaseAgent integration and telemetry counters
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from asp.agents.base_agent import AgentExecutionError, BaseAgent
+from asp.utils.single_flight import SingleFlight, get_single_flight
+
+
+class _Agent(BaseAgent):
+    def execute(self, input_data):
+        return input_data
+
+
+class TestSingleFlight:
+    """Tests for the SingleFlight group."""
+
+    def test_concurrent_sync_calls_share_one_execution(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            release.wait(timeout=5)
+            return {"content": "answer"}
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(flight.do, "key", fn) for _ in range(3)]
+            while flight.stats["coalesced"] < 2:
+                threading.Event().wait(0.01)
+            release.set()
+            results = [f.result(timeout=5) for f in futures]
+
+        assert len(calls) == 1
+        assert sorted(shared for _, shared in results) == [False, True, True]
+        assert all(response == {"content": "answer"} for response, _ in results)
+        assert len({id(response) for response, _ in results}) == 3
+        assert flight.in_flight() == 0
+
+    def test_sequential_calls_are_not_coalesced(self):
+        flight = SingleFlight()
+        flight.do("key", lambda: 1)
+        assert flight.do("key", lambda: 2) == (2, False)
+
+    def test_async_calls_coalesce_and_share_errors(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def fail():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        async def run():
+            return await asyncio.gather(
+                flight.do_async("key", fail),
+                flight.do_async("key", fail),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert all(isinstance(r, ValueError) for r in results)
+
+    def test_cancelled_follower_does_not_cancel_leader(self):
+        flight = SingleFlight()
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        async def run():
+            leader = asyncio.ensure_future(flight.do_async("key", slow))
+            follower = asyncio.ensure_future(flight.do_async("key", slow))
+            await asyncio.sleep(0)
+            follower.cancel()
+            return await leader
+
+        assert asyncio.run(run()) == ("done", False)
+
+    def test_cancelling_every_caller_cancels_request(self):
+        flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "done"
+
+        async def fresh():
+            return "fresh"
+
+        async def run():
+            callers = [
+                asyncio.ensure_future(flight.do_async("key", slow)) for _ in range(2)
+            ]
+            await asyncio.sleep(0)
+            callers[0].cancel()
+            await asyncio.sleep(0.01)
+            assert not cancelled.is_set()
+            callers[1].cancel()
+            await asyncio.wait_for(cancelled.wait(), timeout=1)
+            assert flight.in_flight() == 0
+            # A later identical call issues a fresh request
+            assert await flight.do_async("key", fresh) == ("fresh", False)
+
+        asyncio.run(run())
+
+    def test_disabled_by_env(self, monkeypatch):
+        monkeypatch.setenv("ASP_LLM_SINGLE_FLIGHT", "false")
+        assert get_single_flight() is None
+
+
+class TestBaseAgentIntegration:
+    """Tests for coalescing in BaseAgent.call_llm_async."""
+
+    def _agent(self, client):
+        agent = _Agent(llm_client=client)
+        agent._llm_cache = None
+        return agent
+
+    def test_identical_async_calls_are_coalesced(self, monkeypatch):
+        monkeypatch.delenv("ASP_LLM_CACHE", raising=False)
+        started = []
+
+        async def call_with_retry_async(**kwargs):
+            started.append(kwargs["prompt"])
+            await asyncio.sleep(0.01)
+            return {
+                "content": "reply",
+                "usage": {"input_tokens": 100, "output_tokens": 20},
+                "cost": 0.5,
+            }
+
+        client = Mock(spec=["call_with_retry_async"])
+        client.call_with_retry_async = call_with_retry_async
+        first, second = self._agent(client), self._agent(client)
+
+        async def run():
+            return await asyncio.gather(
+                first.call_llm_async("same prompt"),
+                second.call_llm_async("same prompt"),
+                first.call_llm_async("same prompt", temperature=0.7),
+            )
+
+        responses = asyncio.run(run())
+
+        assert started == ["same prompt", "same prompt"]
+        assert responses[1]["coalesced"] is True
+        assert second._last_llm_usage["coalesced_calls"] == 1
+        assert second._last_llm_usage["cost"] == 0.0
+        assert first._llm_call_stats["coalesced_calls"] == 0
+
+    def test_leader_error_reaches_follower(self, monkeypatch):
+        flight = SingleFlight()
+        monkeypatch.setattr("asp.utils.single_flight._default_flight", flight)
+        release = threading.Event()
+
+        def call_with_retry(**kwargs):
+            release.wait(timeout=5)
+            raise RuntimeError("API down")
+
+        client = Mock(spec=["call_with_retry"])
+        client.call_with_retry.side_effect = call_with_retry
+        agents = [self._agent(client) for _ in range(2)]
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(a.call_llm, "same prompt") for a in agents]
+            while flight.stats["coalesced"] < 1:
+                threading.Event().wait(0.01)
+            release.set()
+            for future in futures:
+                with pytest.raises(AgentExecutionError, match="API down"):
+                    future.result(timeout=5)
+
+        assert client.call_with_retry.call_count == 1
+
+    def test_deadline_cancels_coalesced_api_call(self, monkeypatch):
+        monkeypatch.delenv("ASP_LLM_CACHE", raising=False)
+        cancelled = []
+
+        async def call_with_retry_async(**kwargs):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(kwargs["prompt"])
+                raise
+
+        client = Mock(spec=["call_with_retry_async"])
+        client.call_with_retry_async = call_with_retry_async
+        agent = self._agent(client)
+
+        async def run():
+            with pytest.raises(TimeoutError):
+                async with asyncio.timeout(0.05):
+                    await agent.call_llm_async("same prompt")
+            await asyncio.sleep(0.01)
+            # Cancelled before the loop shuts down, not by asyncio.run cleanup
+            assert cancelled == ["same prompt"]
+
+        asyncio.run(run())
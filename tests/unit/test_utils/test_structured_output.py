@@ -0,0 +1,125 @@
+"""
+Unit tests for schema-constrained structured output.
+
+Tests cover:
+- Schema and request parameter generation per provider
+- Tool-use response handling in LLMClient
+- Validation of raw structured responses
+
+Author: ASP Development Team
+Date: October 16, 2026
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from asp.models.design_review import SpecialistReviewOutput
+from asp.models.planning import SemanticUnitList
+from asp.utils.json_extraction import JSONExtractionError
+from asp.utils.llm_client import LLMClient
+from asp.utils.structured_output import (
+    StructuredOutputError,
+    parse_structured_output,
+    schema_name,
+    structured_output_enabled,
+    structured_output_kwargs,
+    tool_use_input,
+)
+
+UNIT = {
+    "unit_id": "SU-001",
+    "description": "Implement JWT token generation endpoint",
+    "api_interactions": 2,
+    "data_transformations": 3,
+    "logical_branches": 2,
+    "code_entities_modified": 3,
+    "novelty_multiplier": 1.0,
+    "est_complexity": 19,
+}
+
+
+def _tool_message(tool_input):
+    """Create a mock Anthropic message containing a forced tool call."""
+    block = Mock(type="tool_use", input=tool_input)
+    block.name = "semantic_unit_list"
+    message = Mock()
+    message.content = [block]
+    message.usage = Mock(input_tokens=10, output_tokens=5)
+    message.model = "claude-haiku-4-5"
+    message.stop_reason = "tool_use"
+    return message
+
+
+class TestRequestParameters:
+    """Tests for provider request parameters."""
+
+    def test_anthropic_forces_schema_tool(self):
+        kwargs = structured_output_kwargs(SemanticUnitList, provider="anthropic")
+
+        tool = kwargs["tools"][0]
+        assert tool["name"] == "semantic_unit_list"
+        assert kwargs["tool_choice"] == {"type": "tool", "name": tool["name"]}
+        assert tool["input_schema"]["required"] == ["semantic_units"]
+        assert "SemanticUnit" in tool["input_schema"]["$defs"]
+
+    def test_openai_compatible_uses_response_format(self):
+        kwargs = structured_output_kwargs(SpecialistReviewOutput, provider="groq")
+
+        response_format = kwargs["response_format"]
+        assert response_format["type"] == "json_schema"
+        assert response_format["json_schema"]["name"] == "specialist_review_output"
+        assert "issues_found" in response_format["json_schema"]["schema"]["properties"]
+
+    def test_schema_name_is_snake_case(self):
+        assert schema_name(SpecialistReviewOutput) == "specialist_review_output"
+
+    def test_enabled_from_env(self, monkeypatch):
+        monkeypatch.delenv("ASP_STRUCTURED_OUTPUT", raising=False)
+        assert structured_output_enabled() is False
+        monkeypatch.setenv("ASP_STRUCTURED_OUTPUT", "true")
+        assert structured_output_enabled() is True
+
+
+class TestResponseHandling:
+    """Tests for tool-use responses and validation."""
+
+    def test_tool_use_input(self):
+        blocks = [Mock(type="text"), Mock(type="tool_use", input={"a": 1})]
+        assert tool_use_input(blocks) == {"a": 1}
+        assert tool_use_input([Mock(type="text", text="hi")]) is None
+
+    def test_llm_client_returns_tool_input_as_content(self):
+        client = LLMClient(api_key="test-key")
+        payload = {"semantic_units": [UNIT]}
+
+        with patch.object(
+            client.client.messages, "create", return_value=_tool_message(payload)
+        ):
+            result = client.call_with_retry(
+                prompt="Plan", **structured_output_kwargs(SemanticUnitList)
+            )
+
+        assert result["content"] == payload
+        plan = parse_structured_output(result["raw_content"], SemanticUnitList)
+        assert plan.semantic_units[0].unit_id == "SU-001"
+        assert result["continuations"] == 0
+
+    def test_invalid_response_raises(self):
+        with pytest.raises(StructuredOutputError, match="SemanticUnitList"):
+            parse_structured_output('{"semantic_units": [{}]}', SemanticUnitList)
+        with pytest.raises(JSONExtractionError):
+            parse_structured_output("", SemanticUnitList)
+
+    def test_specialist_output_keeps_extra_fields(self):
+        raw = (
+            '{"issues_found": [{"issue_id": "SEC-001", "category": "Security", '
+            '"severity": "High", "description": "d", "evidence": "e", '
+            '"impact": "i", "cwe": "CWE-89"}]}'
+        )
+        findings = parse_structured_output(raw, SpecialistReviewOutput)
+
+        dumped = findings.model_dump()
+        assert dumped["issues_found"][0]["cwe"] == "CWE-89"
+        assert dumped["issues_found"][0]["affected_phase"] == "Design"
+        assert dumped["improvement_suggestions"] == []
@@ -844,3 +844,91 @@ class TestGetProjectProgress:
 
         progress = get_project_progress()
         assert progress == {"completed": 0, "in_progress": 0, "total": 0}
+
+
+@pytest.fixture
+def execution_db(populated_db):
+    """Add the wide agent_execution table, one row per execution."""
+    tmp_path = populated_db
+    db_path = tmp_path / "telemetry.db"
+    now = datetime.now(UTC)
+
+    conn = sqlite3.connect(str(db_path))
+    conn.execute(
+        """
+        CREATE TABLE agent_execution (
+            timestamp TEXT,
+            task_id TEXT,
+            agent_role TEXT,
+            user_id TEXT,
+            status TEXT,
+            latency_ms REAL,
+            tokens_in INTEGER,
+            tokens_out INTEGER,
+            api_cost_usd REAL,
+            llm_model TEXT
+        )
+    """
+    )
+    # (hours ago, task_id, agent_role, user_id, status, latency, in, out, cost)
+    executions = [
+        (0, "TASK-001", "design", "user1", "success", 1500.0, 5000, 2000, 0.05),
+        (1, "TASK-002", "code", "user2", "success", 2500.0, 8000, 3000, 0.08),
+        (2, "TASK-002", "code", "user2", "error", 500.0, 0, 0, 0.0),
+    ]
+    conn.executemany(
+        """
+        INSERT INTO agent_execution
+        (timestamp, task_id, agent_role, user_id, status, latency_ms,
+         tokens_in, tokens_out, api_cost_usd, llm_model)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 'claude-3')
+    """,
+        [
+            ((now - timedelta(hours=hours)).isoformat(), *rest)
+            for hours, *rest in executions
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    return tmp_path
+
+
+class TestAgentExecutionTable:
+    """Test queries read agent_execution when the table exists."""
+
+    def test_cost_summary_matches_eav(self, execution_db):
+        """Test cost summary is the same as from agent_cost_vector."""
+        from asp.web.api import get_cost_summary
+
+        summary = get_cost_summary(days=7)
+
+        assert summary["total_usd"] == 0.13
+        assert summary["by_role"] == {"design": 0.05, "code": 0.08}
+        assert summary["token_usage"] == {"input": 13000, "output": 5000}
+
+    def test_user_performance_counts_executions(self, execution_db):
+        """Test execution_count counts invocations, not metric rows."""
+        from asp.web.api import get_user_performance
+
+        perf = {p["user_id"]: p for p in get_user_performance()}
+
+        assert perf["user1"]["execution_count"] == 1
+        assert perf["user2"]["execution_count"] == 2
+        assert perf["user2"]["avg_latency_ms"] == 1500.0
+
+    def test_recent_activity_reads_executions(self, execution_db):
+        """Test recent activity lists one entry per execution."""
+        from asp.web.api import get_recent_agent_activity
+
+        activity = get_recent_agent_activity()
+
+        assert [a["latency_ms"] for a in activity] == [1500.0, 2500.0, 500.0]
+
+    def test_falls_back_without_table(self, populated_db):
+        """Test databases without agent_execution still use agent_cost_vector."""
+        from asp.web.api import get_recent_agent_activity
+
+        activity = get_recent_agent_activity()
+
+        assert [a["latency_ms"] for a in activity] == [1500.0, 2500.0]
@@ -0,0 +1,192 @@
+"""
+Unit tests for dashboard queries over compacted telemetry.
+
+Compacts a real-schema database with asp.telemetry.retention and checks
+the web data layer gives the same answers afterwards, attaching the
+monthly archives only when a range reaches past the live data.
+"""
+
+import sqlite3
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from asp.telemetry.retention import RetentionPolicy, compact_telemetry
+from asp.web.archives import archive_horizon, attach_archives, raw_source
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+CREATE_TABLES = REPO_ROOT / "database" / "sqlite" / "create_tables.sql"
+
+NOW = datetime(2026, 10, 16, 12, 30, tzinfo=UTC)
+
+# (time before NOW, task_id, agent_role, cost); start of a 45-day range is
+# 2026-09-01T12:30, so the first two rows straddle it inside one hour
+EXECUTIONS = [
+    (timedelta(days=45, minutes=10), "TASK-EDGE", "Code", 0.50),
+    (timedelta(days=45, minutes=-5), "TASK-START", "Code", 0.25),
+    (timedelta(days=44, hours=3), "TASK-START", "Design", 0.10),
+    (timedelta(days=40), "TASK-OLD", "Test", 0.20),
+    (timedelta(days=2), "TASK-NEW", "Code", 0.05),
+    (timedelta(hours=1), "TASK-NEW", "Design", 0.02),
+]
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return NOW.astimezone(tz) if tz else NOW
+
+
+@pytest.fixture
+def live_db(tmp_path, monkeypatch):
+    """Telemetry DB with EXECUTIONS, with the dashboards pointed at it."""
+    import asp.web.data as data_module
+
+    db_path = tmp_path / "telemetry.db"
+    conn = sqlite3.connect(db_path)
+    conn.executescript(CREATE_TABLES.read_text())
+    for age, task_id, role, cost in EXECUTIONS:
+        timestamp = (NOW - age).isoformat()
+        conn.execute(
+            """
+            INSERT INTO agent_execution (
+                timestamp, task_id, agent_role, latency_ms, tokens_in,
+                tokens_out, api_cost_usd
+            ) VALUES (?, ?, ?, 100.0, 1000, 100, ?)
+            """,
+            (timestamp, task_id, role, cost),
+        )
+        conn.execute(
+            """
+            INSERT INTO agent_cost_vector (
+                timestamp, task_id, agent_role, metric_type, metric_value,
+                metric_unit
+            ) VALUES (?, ?, ?, 'API_Cost', ?, 'USD')
+            """,
+            (timestamp, task_id, role, cost),
+        )
+    conn.commit()
+    conn.close()
+
+    monkeypatch.setattr(data_module, "TELEMETRY_DB", db_path)
+    monkeypatch.setattr(data_module, "BOOTSTRAP_RESULTS", tmp_path / "none.json")
+    monkeypatch.setattr(data_module, "datetime", _FrozenDatetime)
+    return db_path
+
+
+def compact(db_path: Path) -> None:
+    compact_telemetry(db_path, RetentionPolicy(raw_days=30), now=NOW)
+
+
+def dashboards() -> dict:
+    from asp.web import data
+
+    return {
+        "cost": data.get_cost_breakdown(days=45),
+        "daily": data.get_daily_metrics(days=45),
+        "stats": data.get_agent_stats(),
+        # last_active of archived roles drops to hour precision
+        "health": [
+            {key: value for key, value in agent.items() if key != "last_active"}
+            for agent in data.get_agent_health()
+        ],
+        "task": data.get_task_telemetry("TASK-OLD"),
+    }
+
+
+class TestRawSource:
+    """Test archives are attached only for ranges that need them."""
+
+    def test_no_archives(self, live_db):
+        """Test an uncompacted DB always reads the live table."""
+        conn = sqlite3.connect(live_db)
+
+        assert archive_horizon(conn) is None
+        assert raw_source(conn, "agent_execution", "2020-01-01") == "agent_execution"
+
+    def test_range_inside_live_data(self, live_db):
+        """Test ranges after the horizon do not attach anything."""
+        compact(live_db)
+        conn = sqlite3.connect(live_db)
+
+        source = raw_source(
+            conn, "agent_execution", (NOW - timedelta(days=7)).isoformat()
+        )
+
+        assert source == "agent_execution"
+        assert len(conn.execute("PRAGMA database_list").fetchall()) == 1
+
+    def test_attaches_only_months_in_range(self, live_db):
+        """Test a range inside one archived month attaches that month only."""
+        compact(live_db)
+        conn = sqlite3.connect(live_db)
+
+        source = raw_source(
+            conn, "agent_execution", "2026-09-01T12:30", "2026-09-01T13"
+        )
+
+        attached = [row[1] for row in conn.execute("PRAGMA database_list")]
+        assert source == "agent_execution_span"
+        assert attached == ["main", "temp", "archive_2026_09"]
+        rows = conn.execute(f"SELECT task_id FROM {source} ORDER BY timestamp")
+        assert [row[0] for row in rows] == [
+            "TASK-EDGE",
+            "TASK-START",
+            "TASK-START",
+            "TASK-OLD",
+            "TASK-NEW",
+            "TASK-NEW",
+        ]
+
+    def test_missing_archive_file_is_skipped(self, live_db):
+        """Test a deleted archive file does not break the dashboards."""
+        compact(live_db)
+        for archive in (live_db.parent / "archive").iterdir():
+            archive.unlink()
+        conn = sqlite3.connect(live_db)
+
+        assert attach_archives(conn) == []
+
+
+class TestDashboardsAfterCompaction:
+    """Test dashboards give the same answers before and after compaction."""
+
+    def test_results_unchanged(self, live_db):
+        """Test every dashboard reading raw rows spans the archives."""
+        before = dashboards()
+
+        compact(live_db)
+
+        assert dashboards() == before
+
+    def test_range_start_reads_archive(self, live_db):
+        """Test the partial first hour comes from the archived rows."""
+        from asp.web.data import get_cost_breakdown
+
+        compact(live_db)
+        breakdown = get_cost_breakdown(days=45)
+
+        # TASK-EDGE is just before the range start; TASK-START just after
+        assert breakdown["total_usd"] == 0.62
+        assert breakdown["by_role"]["Code"] == 0.30
+
+    def test_task_telemetry_from_archive(self, live_db):
+        """Test a task whose rows were all archived is still found."""
+        from asp.web.data import get_task_telemetry
+
+        compact(live_db)
+        telemetry = get_task_telemetry("TASK-OLD")
+
+        assert telemetry["total_cost_usd"] == 0.20
+
+    def test_health_of_archived_role(self, live_db):
+        """Test a role with only archived rows is inactive, not never run."""
+        from asp.web.data import get_agent_health
+
+        compact(live_db)
+        health = {agent["role"]: agent for agent in get_agent_health()}
+
+        assert health["Test"]["status"] == "Inactive"
+        assert health["Test"]["executions"] == 1
+        assert health["Test"]["last_active"] == "2026-09-06 12:00"
@@ -0,0 +1,262 @@
+"""
+Unit tests for the agent_execution rollups and their web readers.
+
+Builds databases from the real schema (database/sqlite) so the
+trg_agent_execution_rollup trigger and migration 017 are exercised too.
+"""
+
+import sqlite3
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from asp.web.rollups import daily_totals, has_rollups, totals_by_role
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+CREATE_TABLES = REPO_ROOT / "database" / "sqlite" / "create_tables.sql"
+MIGRATION_017 = (
+    REPO_ROOT / "database" / "migrations" / "017_add_agent_execution_rollups.sql"
+)
+
+_INSERT = """
+    INSERT INTO agent_execution (
+        timestamp, task_id, agent_role, status, latency_ms,
+        tokens_in, tokens_out, api_cost_usd, llm_model, project_id
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+NOW = datetime(2026, 10, 16, 12, 30, tzinfo=UTC)
+
+# (hours before NOW, task_id, agent_role, status, cost, tokens_in, tokens_out)
+EXECUTIONS = [
+    (0.1, "TASK-1", "Code", "success", 0.05, 500, 100),
+    (1.2, "TASK-1", "Code", "error", 0.01, 100, 0),
+    (5.5, "TASK-2", "Design", "success", 0.02, 200, 50),
+    (13.0, "TASK-2", "Design", "success", 0.03, 300, 60),
+    (30.0, "TASK-3", "Planning", "success", 0.04, 400, 70),
+    (80.0, "TASK-4", "Code", "success", 0.06, 600, 80),
+    (200.0, "TASK-5", "Test", "success", 0.07, 700, 90),
+]
+
+
+def _rows(now: datetime = NOW) -> list[tuple]:
+    return [
+        (
+            (now - timedelta(hours=hours)).isoformat(),
+            task_id,
+            role,
+            status,
+            1000.0,
+            tokens_in,
+            tokens_out,
+            cost,
+            "claude-sonnet-4",
+            "proj" if role == "Code" else None,
+        )
+        for hours, task_id, role, status, cost, tokens_in, tokens_out in EXECUTIONS
+    ]
+
+
+def _schema(conn: sqlite3.Connection, with_rollups: bool = True) -> None:
+    script = CREATE_TABLES.read_text()
+    if not with_rollups:
+        start = script.index("-- Tables 6-8")
+        end = script.index("-- Enable Foreign Key Constraints")
+        script = script[:start] + script[end:]
+    conn.executescript(script)
+
+
+@pytest.fixture
+def conn():
+    """In-memory DB with the full schema and EXECUTIONS inserted."""
+    conn = sqlite3.connect(":memory:")
+    _schema(conn)
+    conn.executemany(_INSERT, _rows())
+    yield conn
+    conn.close()
+
+
+def _raw_totals(conn: sqlite3.Connection, start: datetime | None) -> list[tuple]:
+    where, params = ("WHERE timestamp > ?", (start.isoformat(),)) if start else ("", ())
+    return conn.execute(
+        f"""
+        SELECT agent_role, ROUND(SUM(api_cost_usd), 6), SUM(tokens_in),
+               SUM(tokens_out), COUNT(*)
+        FROM agent_execution {where}
+        GROUP BY agent_role ORDER BY agent_role
+        """,
+        params,
+    ).fetchall()
+
+
+def _as_tuples(rows: list[dict]) -> list[tuple]:
+    return [
+        (
+            r["agent_role"],
+            round(r["cost"], 6),
+            r["tokens_in"],
+            r["tokens_out"],
+            r["executions"],
+        )
+        for r in rows
+    ]
+
+
+class TestRollupTrigger:
+    """Test trg_agent_execution_rollup keeps the rollups current."""
+
+    def test_has_rollups(self, conn):
+        """Test the full schema has the rollup tables."""
+        assert has_rollups(conn)
+
+    def test_has_rollups_false_before_migration(self):
+        """Test databases without migration 017 are detected."""
+        conn = sqlite3.connect(":memory:")
+        _schema(conn, with_rollups=False)
+
+        assert not has_rollups(conn)
+
+    def test_hourly_bucket_aggregates(self, conn):
+        """Test executions in the same hour and dimensions share a row."""
+        conn.executemany(_INSERT, _rows()[:1])
+
+        row = conn.execute(
+            """
+            SELECT executions, errors, tokens_in, project_id
+            FROM agent_execution_hourly
+            WHERE bucket = ? AND agent_role = 'Code'
+            """,
+            (NOW.isoformat()[:13],),
+        ).fetchone()
+
+        assert row == (2, 0, 1000, "proj")
+
+    def test_daily_rollup_matches_raw(self, conn):
+        """Test daily buckets sum to the raw totals."""
+        rollup = conn.execute(
+            "SELECT SUM(executions), SUM(errors), SUM(tokens_in) "
+            "FROM agent_execution_daily"
+        ).fetchone()
+
+        assert rollup == (len(EXECUTIONS), 1, 2800)
+
+    def test_daily_tasks_are_distinct(self, conn):
+        """Test each task is recorded once per day."""
+        count = conn.execute(
+            "SELECT COUNT(*) FROM agent_execution_daily_tasks WHERE bucket = ?",
+            (NOW.isoformat()[:10],),
+        ).fetchone()[0]
+
+        assert count == 2
+
+    def test_migration_backfills_existing_rows(self):
+        """Test migration 017 rolls up rows inserted before it ran."""
+        conn = sqlite3.connect(":memory:")
+        _schema(conn, with_rollups=False)
+        conn.executemany(_INSERT, _rows())
+
+        conn.executescript(MIGRATION_017.read_text())
+        conn.executemany(_INSERT, _rows()[:1])
+
+        assert has_rollups(conn)
+        assert _as_tuples(totals_by_role(conn)) == _raw_totals(conn, None)
+
+
+class TestRollupReaders:
+    """Test the range readers agree with raw agent_execution queries."""
+
+    def test_totals_all_time(self, conn):
+        """Test all-time totals come out equal to the raw sums."""
+        assert _as_tuples(totals_by_role(conn)) == _raw_totals(conn, None)
+
+    @pytest.mark.parametrize("hours", [0.5, 2, 12.75, 24, 50, 24 * 7, 24 * 30])
+    def test_totals_since_start(self, conn, hours):
+        """Test partial-hour, hourly and daily segments add up exactly."""
+        start = NOW - timedelta(hours=hours)
+
+        assert _as_tuples(totals_by_role(conn, start)) == _raw_totals(conn, start)
+
+    @pytest.mark.parametrize("hours", [2, 20, 24 * 7])
+    def test_daily_totals_match_raw(self, conn, hours):
+        """Test per-day totals and distinct task counts match raw rows."""
+        start = NOW - timedelta(hours=hours)
+        raw = conn.execute(
+            """
+            SELECT DATE(timestamp), ROUND(SUM(api_cost_usd), 6),
+                   SUM(tokens_in + tokens_out), COUNT(DISTINCT task_id)
+            FROM agent_execution WHERE timestamp > ?
+            GROUP BY DATE(timestamp) ORDER BY 1
+            """,
+            (start.isoformat(),),
+        ).fetchall()
+
+        days = daily_totals(conn, start)
+
+        assert [
+            (d["day"], round(d["cost"], 6), d["tokens"], d["tasks"]) for d in days
+        ] == raw
+
+
+class TestDashboardsReadRollups:
+    """Test the web dashboards use the rollups when they exist."""
+
+    @pytest.fixture
+    def rollup_db(self, tmp_path, monkeypatch):
+        """Telemetry file with the full schema and recent executions."""
+        import asp.web.api as api_module
+        import asp.web.data as data_module
+
+        db_path = tmp_path / "telemetry.db"
+        conn = sqlite3.connect(db_path)
+        _schema(conn)
+        conn.executemany(_INSERT, _rows(datetime.now(UTC)))
+        conn.commit()
+        conn.close()
+
+        monkeypatch.setattr(data_module, "TELEMETRY_DB", db_path)
+        monkeypatch.setattr(data_module, "BOOTSTRAP_RESULTS", tmp_path / "none")
+        monkeypatch.setattr(api_module, "DEFAULT_DB_PATH", db_path)
+        return db_path
+
+    def test_cost_breakdown(self, rollup_db):
+        """Test get_cost_breakdown totals over the last day."""
+        from asp.web.data import get_cost_breakdown
+
+        breakdown = get_cost_breakdown(days=1)
+
+        assert breakdown["total_usd"] == 0.11
+        assert breakdown["token_usage"] == {"input": 1100, "output": 210}
+
+    def test_cost_summary_skips_raw_scan(self, rollup_db):
+        """Test get_cost_summary reads rollups instead of the raw path."""
+        from asp.web import api
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(
+                api,
+                "_get_cost_summary_from_executions",
+                lambda *args: pytest.fail("raw agent_execution path used"),
+            )
+            summary = api.get_cost_summary(days=30)
+
+        assert summary["total_usd"] == 0.28
+        assert summary["by_role"]["Test"] == 0.07
+
+    def test_agent_stats(self, rollup_db):
+        """Test get_agent_stats all-time totals."""
+        from asp.web.data import get_agent_stats
+
+        stats = get_agent_stats()
+
+        assert stats["total_cost_usd"] == 0.28
+        assert stats["total_tokens"] == 2800 + 450
+
+    def test_daily_metrics(self, rollup_db):
+        """Test get_daily_metrics covers every day with executions."""
+        from asp.web.data import get_daily_metrics
+
+        metrics = get_daily_metrics(days=30)
+
+        assert sum(metrics["tokens"]) == 2800 + 450
+        assert metrics["dates"] == sorted(metrics["dates"])